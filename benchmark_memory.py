@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Measure memory held by Dialux room and compliance records per 100k rooms
+"""
+import sys
+import random
+import tracemalloc
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from analyzers.dialux_analyzer import DialuxRoom
+from standards.standards_processor import ComplianceResult, ComplianceTable, RoomType, StandardType
+
+STANDARDS = [StandardType.EN_12464_1, StandardType.BREEAM, StandardType.IES]
+PARAMETERS = [("illuminance", "lux", "Minimum requirement check"),
+              ("uniformity", "", "Minimum requirement check"),
+              ("ugr", "", "Maximum requirement check")]
+
+# Record layout before slotted records: per-instance __dict__ and every
+# standard's results kept as objects on each room
+@dataclass
+class LegacyComplianceResult:
+    parameter: str
+    required_value: float
+    actual_value: float
+    unit: str
+    is_compliant: bool
+    compliance_percentage: float
+    deviation: float
+    room_type: RoomType
+    standard: StandardType
+    notes: str = ""
+
+@dataclass
+class LegacyDialuxRoom:
+    name: str
+    area: float
+    room_type: RoomType
+    illuminance_avg: Optional[float] = None
+    illuminance_min: Optional[float] = None
+    illuminance_max: Optional[float] = None
+    uniformity: Optional[float] = None
+    ugr: Optional[float] = None
+    power_density: Optional[float] = None
+    color_temperature: Optional[float] = None
+    color_rendering_index: Optional[float] = None
+    luminous_efficacy: Optional[float] = None
+    mounting_height: Optional[float] = None
+    data_completeness: float = 0.0
+    confidence_score: float = 0.0
+    compliance_results: List[LegacyComplianceResult] = None
+    compliance_by_standard: Dict[str, List[LegacyComplianceResult]] = None
+
+def room_values(rng: random.Random, index: int) -> dict:
+    """Random room values"""
+    return dict(
+        name=f"Room {index}",
+        area=rng.uniform(5, 200),
+        room_type=rng.choice(list(RoomType)),
+        illuminance_avg=rng.uniform(100, 1000),
+        uniformity=rng.uniform(0.3, 0.9),
+        ugr=rng.uniform(13, 28),
+        power_density=rng.uniform(2, 15),
+        data_completeness=0.5,
+        confidence_score=0.5
+    )
+
+def results_for(result_class, rng: random.Random, room_type: RoomType, standard: StandardType) -> list:
+    """Random compliance results of one room against one standard"""
+    return [
+        result_class(parameter=parameter, required_value=rng.uniform(0, 500), actual_value=rng.uniform(0, 500),
+                     unit=unit, is_compliant=rng.random() > 0.3, compliance_percentage=rng.uniform(50, 150),
+                     deviation=rng.uniform(-100, 100), room_type=room_type, standard=standard, notes=notes)
+        for parameter, unit, notes in PARAMETERS
+    ]
+
+def build_legacy(rooms: int):
+    rng = random.Random(42)
+    records = []
+    for index in range(rooms):
+        room = LegacyDialuxRoom(**room_values(rng, index))
+        room.compliance_by_standard = {
+            standard.value: results_for(LegacyComplianceResult, rng, room.room_type, standard)
+            for standard in STANDARDS
+        }
+        room.compliance_results = room.compliance_by_standard[STANDARDS[0].value]
+        records.append(room)
+    return records
+
+def build_current(rooms: int, materialize: bool = True):
+    rng = random.Random(42)
+    records = []
+    table = ComplianceTable()
+    for index in range(rooms):
+        room = DialuxRoom(**room_values(rng, index))
+        for standard in STANDARDS:
+            table.add_results(index, standard, results_for(ComplianceResult, rng, room.room_type, standard))
+        records.append(room)
+    if materialize:
+        # Selected standard materialized on the rooms, as after analysis
+        for index, room in enumerate(records):
+            room.compliance_results = table.results(index, STANDARDS[0])
+    return records, table
+
+def measure(build, rooms: int) -> int:
+    """Bytes still allocated after building the records"""
+    tracemalloc.start()
+    records = build(rooms)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return current
+
+def main(rooms: int = 100_000):
+    checks = len(STANDARDS) * len(PARAMETERS)
+    print(f"🧮 {rooms:,} rooms, {len(STANDARDS)} standards × {len(PARAMETERS)} checks per room")
+    slotted = not hasattr(DialuxRoom(name='', area=0.0, room_type=RoomType.OFFICE), '__dict__')
+    print(f"  slotted records: {'yes' if slotted else 'no (Python < 3.10)'}")
+    
+    legacy = measure(build_legacy, rooms)
+    current = measure(build_current, rooms)
+    compact = measure(lambda count: build_current(count, materialize=False), rooms)
+    _, table = build_current(1000, materialize=False)
+    
+    print(f"  {'dict-based rooms + result objects':<44} {legacy / 2**20:8.1f} MB  ({legacy / rooms:6.0f} B/room)")
+    print(f"  {'slotted rooms + table + selected results':<44} {current / 2**20:8.1f} MB  ({current / rooms:6.0f} B/room)")
+    print(f"  {'slotted rooms + table only':<44} {compact / 2**20:8.1f} MB  ({compact / rooms:6.0f} B/room)")
+    print(f"📉 Saved per 100k rooms: {(legacy - current) / rooms * 100_000 / 2**20:.1f} MB "
+          f"({1 - current / legacy:.0%}), table only {1 - compact / legacy:.0%}; "
+          f"the table holds {checks} checks/room in {table.nbytes / 1000:.0f} B of arrays")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark scan throughput of the shared pattern registry
+"""
+import re
+import sys
+import time
+import random
+from pathlib import Path
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from core.patterns import registry
+
+def generate_room_sections(rooms: int = 500, seed: int = 42) -> list:
+    """Generate synthetic Dialux-like room sections"""
+    rng = random.Random(seed)
+    room_names = ["Office", "Meeting Room", "Corridor", "Storage", "Workshop", "Classroom"]
+    sections = []
+    for i in range(rooms):
+        sections.append(
+            f"Room {i + 1}: {rng.choice(room_names)}\n"
+            f"Area: {rng.uniform(5, 200):.1f} m²\n"
+            f"Average illuminance: {rng.randint(100, 1000)} lux\n"
+            f"E min: {rng.randint(50, 500)} lx\n"
+            f"Uniformity U0: {rng.uniform(0.3, 0.9):.2f}\n"
+            f"UGR: {rng.randint(13, 28)}\n"
+            f"Power density: {rng.uniform(2, 15):.1f} W/m²\n"
+            f"Color temperature: {rng.choice([3000, 4000, 6500])} K, CRI: {rng.choice([80, 90])}\n"
+            f"Luminous efficacy: {rng.randint(80, 160)} lm/W, mounting height 2.8 m\n"
+            f"Manufacturer: {rng.choice(['Philips', 'Osram', 'Signify', 'Tridonic'])}\n"
+        )
+    return sections
+
+def generate_report_text(rooms: int = 500, seed: int = 42) -> str:
+    """Generate synthetic Dialux-like report text"""
+    return "\n".join(generate_room_sections(rooms, seed))
+
+def time_scan(label: str, scan, texts: list, repeats: int = 3) -> float:
+    """Run a scan over all texts several times and print the best throughput"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        matches = sum(scan(text) for text in texts)
+        best = min(best, time.perf_counter() - start)
+    mb = sum(len(text.encode('utf-8')) for text in texts) / (1024 * 1024)
+    throughput = mb / best if best > 0 else float('inf')
+    print(f"  {label:<32} {best * 1000:8.1f} ms  {throughput:8.2f} MB/s  ({matches} matches)")
+    return throughput
+
+def main():
+    sections = generate_room_sections()
+    text = "\n".join(sections)
+    families = [registry.family(name) for name in registry.names()]
+    size_mb = len(text.encode('utf-8')) / (1024 * 1024)
+    
+    print(f"📄 Synthetic report: {size_mb:.2f} MB, {len(families)} pattern families, "
+          f"{sum(len(f) for f in families)} patterns")
+    
+    def raw_strings(text):
+        # Previous behaviour: raw strings and flags passed on every call
+        return sum(1 for f in families for source in f.sources
+                   for _ in re.finditer(source, text, f.flags))
+    
+    def raw_strings_cold(text):
+        re.purge()
+        return raw_strings(text)
+    
+    def compiled_patterns(text):
+        return sum(1 for f in families for pattern in f for _ in pattern.finditer(text))
+    
+    def combined_families(text):
+        return sum(1 for f in families for _ in f.finditer(text))
+    
+    print("⏱️ Whole-document scan (all families):")
+    time_scan("raw strings, cold re cache", raw_strings_cold, [text])
+    time_scan("raw strings, warm re cache", raw_strings, [text])
+    time_scan("precompiled, per pattern", compiled_patterns, [text])
+    time_scan("combined, per family", combined_families, [text])
+    
+    print(f"⏱️ Per-room-section scan ({len(sections)} sections, all families):")
+    time_scan("raw strings, warm re cache", raw_strings, sections)
+    time_scan("precompiled, per pattern", compiled_patterns, sections)
+    time_scan("combined, per family", combined_families, sections)
+    
+    rooms = [registry.family(name) for name in registry.names() if '.room.' in name]
+    
+    def room_regex(text):
+        return sum(1 for f in rooms if any(pattern.search(text) for pattern in f))
+    
+    def room_contains(text):
+        return sum(1 for f in rooms if f.contains(text))
+    
+    print(f"⏱️ Room type detection ({len(rooms)} room families, per section):")
+    time_scan("regex search, per pattern", room_regex, sections)
+    time_scan("keyword contains", room_contains, sections)
+
+if __name__ == "__main__":
+    main()
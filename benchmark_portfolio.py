@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark portfolio group-by statistics over many rooms
+"""
+import sys
+import time
+import random
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from analyzers.portfolio_store import PortfolioStore
+
+ROOM_TYPES = ["office", "meeting_room", "corridor", "storage", "workshop", "classroom"]
+STANDARDS = ["EN_12464_1", "BREEAM", "IES", "ASHRAE"]
+MANUFACTURERS = ["Philips", "Osram", "Signify", "Tridonic", None]
+
+def generate_report(index: int, rooms: int, rng: random.Random) -> dict:
+    """Generate a synthetic report in batch result form"""
+    standard = rng.choice(STANDARDS)
+    return {
+        'project_name': f"Project {index // 4}",
+        'luminaire_manufacturer': rng.choice(MANUFACTURERS),
+        'best_matching_standard': standard,
+        'rooms': [
+            {
+                'name': f"Room {i}",
+                'room_type': rng.choice(ROOM_TYPES),
+                'area': rng.uniform(5, 200),
+                'illuminance_avg': rng.uniform(100, 1000) if rng.random() > 0.05 else None,
+                'uniformity': rng.uniform(0.3, 0.9),
+                'ugr': rng.uniform(13, 28),
+                'compliance_results': [
+                    {'parameter': 'illuminance', 'standard': standard, 'required_value': 500.0,
+                     'actual_value': 450.0, 'compliance_percentage': 90.0, 'is_compliant': rng.random() > 0.3}
+                ]
+            }
+            for i in range(rooms)
+        ]
+    }
+
+def main(reports: int = 2000, rooms_per_report: int = 500):
+    rng = random.Random(42)
+    
+    with tempfile.TemporaryDirectory() as store_dir:
+        store = PortfolioStore(store_dir)
+        
+        start = time.perf_counter()
+        for index in range(reports):
+            store.add_report(generate_report(index, rooms_per_report, rng), report_id=f"report-{index}")
+            if (index + 1) % 200 == 0:
+                store.flush()
+        store.flush()
+        ingest = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        rooms = store.table('rooms')
+        load = time.perf_counter() - start
+        print(f"📦 {reports} reports, {len(rooms['area']):,} rooms: ingest {ingest:.1f}s, load {load * 1000:.0f} ms")
+        
+        queries = [
+            ("median illuminance by room type", lambda: store.room_statistics('illuminance_avg', 'room_type')),
+            ("illuminance by standard, p10/p90", lambda: store.room_statistics(
+                'illuminance_avg', 'standard', ('count', 'mean', 'std', 'p10', 'p90'))),
+            ("UGR by manufacturer and room type", lambda: store.room_statistics('ugr', ['manufacturer', 'room_type'])),
+            ("illuminance by project (500 groups)", lambda: store.room_statistics('illuminance_avg', 'project')),
+            ("compliance by standard", lambda: store.compliance_statistics('standard')),
+        ]
+        
+        print("⏱️ Queries:")
+        for label, query in queries:
+            best = float('inf')
+            for _ in range(3):
+                start = time.perf_counter()
+                result = query()
+                best = min(best, time.perf_counter() - start)
+            print(f"  {label:<38} {best * 1000:7.1f} ms  ({len(result)} groups)")
+        
+        # Cross-check against pandas
+        frame = pd.DataFrame({
+            'room_type': np.asarray(store.vocabularies['room_type'], dtype=object)[rooms['room_type']],
+            'illuminance_avg': rooms['illuminance_avg']
+        })
+        start = time.perf_counter()
+        expected = frame.groupby('room_type')['illuminance_avg'].median()
+        pandas_time = time.perf_counter() - start
+        result = store.room_statistics('illuminance_avg', 'room_type').set_index('room_type')['median']
+        matches = np.allclose(expected.sort_index().to_numpy(), result.sort_index().to_numpy())
+        print(f"✅ Medians match pandas groupby: {matches} (pandas {pandas_time * 1000:.1f} ms on decoded labels)")
+        print(store.room_statistics('illuminance_avg', 'room_type').round(1).to_string(index=False))
+
+if __name__ == "__main__":
+    main()
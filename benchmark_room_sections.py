@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Check that Dialux room sectioning scales linearly with report size
+"""
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from analyzers.dialux_analyzer import DialuxAnalyzer
+from benchmark_patterns import generate_report_text
+
+# Per-line header patterns used before the single-pass sectioner
+LEGACY_HEADER_PATTERNS = [
+    r'(?:room|space|area|zone)[:\s]+([^\n\r]+)',
+    r'([^\n\r]+)\s*\([^)]*room[^)]*\)',
+    r'([^\n\r]+)\s*\([^)]*space[^)]*\)',
+    r'building[:\s]+([^\n\r]+)',
+    r'floor[:\s]+([^\n\r]+)'
+]
+
+def time_call(func, *args, repeats: int = 3) -> float:
+    """Best wall time of several calls, in seconds"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def legacy_line_scan(line: str):
+    """Header check of one line as done by the previous sectioner"""
+    for pattern in LEGACY_HEADER_PATTERNS:
+        if re.search(pattern, line, re.IGNORECASE):
+            return True
+    return False
+
+def main():
+    analyzer = DialuxAnalyzer.__new__(DialuxAnalyzer)
+    
+    print("⏱️ Room sectioning vs report size:")
+    per_room = []
+    for rooms in (125, 250, 500, 1000):
+        text = generate_report_text(rooms)
+        elapsed = time_call(analyzer._find_room_sections, text)
+        sections = len(analyzer._find_room_sections(text))
+        per_room.append(elapsed / rooms)
+        print(f"  {rooms:5d} rooms  {len(text) / 1024:7.1f} KB  {elapsed * 1000:7.2f} ms  "
+              f"{elapsed / rooms * 1e6:6.1f} µs/room  ({sections} sections)")
+    
+    ratio = per_room[-1] / per_room[0]
+    print(f"📈 Time per room, 1000 vs 125 rooms: {ratio:.2f}x ({'linear' if ratio < 1.5 else 'NOT linear'})")
+    
+    print("⏱️ Single long line with unbalanced parentheses:")
+    for length in (200, 400, 800):
+        line = "Luminaire (" + "x (" * (length // 3)
+        legacy = time_call(legacy_line_scan, line, repeats=1)
+        current = time_call(analyzer._find_room_sections, line)
+        print(f"  {len(line):5d} chars  legacy {legacy * 1000:9.2f} ms  current {current * 1000:7.3f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -171,6 +171,8 @@ def process_standards(input: str, output: Optional[str], verbose: bool):
         click.echo(f"🌐 Language: {standards_doc.language}")
         click.echo(f"📊 Requirements found: {len(standards_doc.requirements)}")
         click.echo(f"📋 Tables extracted: {len(standards_doc.tables)}")
+        if standards_doc.pages_total:
+            click.echo(f"♻️ Pages reused: {standards_doc.pages_reused}/{standards_doc.pages_total}")
         click.echo(f"💾 Results saved to: {output_file}")
         
     except Exception as e:
@@ -182,12 +184,16 @@ def process_standards(input: str, output: Optional[str], verbose: bool):
 @click.option('--input', '-i', required=True, help='Input Dialux PDF file path')
 @click.option('--output', '-o', help='Output directory (default: data/outputs)')
 @click.option('--standards', help='Comma-separated list of standards to check')
+@click.option('--compact-json', is_flag=True, help='Write the JSON export without indentation')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
-def analyze_dialux(input: str, output: Optional[str], standards: Optional[str], verbose: bool):
+def analyze_dialux(input: str, output: Optional[str], standards: Optional[str], compact_json: bool, verbose: bool):
     """Analyze Dialux reports with compliance checking"""
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    if compact_json:
+        config.dialux.compact_json_export = True
+    
     input_path = Path(input)
     if not input_path.exists():
         click.echo(f"Error: Input file {input} does not exist", err=True)
@@ -198,13 +204,18 @@ def analyze_dialux(input: str, output: Optional[str], standards: Optional[str],
     
     click.echo(f"🔍 Analyzing Dialux report: {input_path}")
     
+    standards_list = []
     if standards:
         standards_list = [s.strip() for s in standards.split(',')]
         click.echo(f"📋 Standards to check: {', '.join(standards_list)}")
     
     try:
+        from src.standards.standards_processor import StandardType
+        
         analyzer = DialuxAnalyzer()
-        analysis_result = analyzer.analyze_dialux_report(input_path)
+        analysis_result = analyzer.analyze_dialux_report(
+            input_path, standards=[StandardType(s) for s in standards_list]
+        )
         
         report = analysis_result.report
         
@@ -216,6 +227,14 @@ def analyze_dialux(input: str, output: Optional[str], standards: Optional[str],
         click.echo(f"📊 Data quality: {report.data_quality_score:.1%}")
         click.echo(f"📋 Best matching standard: {report.best_matching_standard.value if report.best_matching_standard else 'N/A'}")
         
+        # Per-standard compliance
+        if len(report.compliance_by_standard) > 1:
+            click.echo(f"\n📏 Compliance by standard:")
+            for standard_name, room_rates in report.compliance_by_standard.items():
+                rate = sum(room_rates.values()) / len(room_rates) if room_rates else 0.0
+                score = report.standard_scores.get(standard_name, 0.0)
+                click.echo(f"  • {standard_name}: {rate:.1%} compliant (match score {score:.2f})")
+        
         # Room summary
         click.echo(f"\n🏠 Room Summary:")
         for room in report.rooms:
@@ -234,6 +253,7 @@ def analyze_dialux(input: str, output: Optional[str], standards: Optional[str],
             for issue in analysis_result.critical_issues:
                 click.echo(f"  • {issue}")
         
+        analyzer.wait_for_exports()
         click.echo(f"\n💾 Results saved to: {output_dir}")
         for key, path in analysis_result.export_paths.items():
             click.echo(f"  📄 {key}: {path}")
@@ -247,19 +267,28 @@ def analyze_dialux(input: str, output: Optional[str], standards: Optional[str],
 @click.option('--input', '-i', required=True, help='Input Dialux PDF file path')
 @click.option('--output', '-o', help='Output directory (default: data/outputs)')
 @click.option('--api-key', help='OpenAI API key (or set OPENAI_API_KEY env var)')
+@click.option('--offline', is_flag=True, help='Answer LLM prompts from the response cache only')
+@click.option('--compact-json', is_flag=True, help='Write the JSON export without indentation')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
-def analyze_dialux_enhanced(input: str, output: Optional[str], api_key: Optional[str], verbose: bool):
+def analyze_dialux_enhanced(input: str, output: Optional[str], api_key: Optional[str], compact_json: bool,
+                            offline: bool, verbose: bool):
     """Analyze Dialux reports using OpenAI for intelligent extraction + standards comparison"""
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    if compact_json:
+        config.dialux.compact_json_export = True
+    
+    if offline:
+        config.llm.offline = True
+    
     input_path = Path(input)
     if not input_path.exists():
         click.echo(f"Error: Input file {input} does not exist", err=True)
         sys.exit(1)
     
     # Check for OpenAI API key
-    if not api_key and not os.getenv("OPENAI_API_KEY"):
+    if not api_key and not os.getenv("OPENAI_API_KEY") and not config.llm.offline:
         click.echo("Error: OpenAI API key is required. Set OPENAI_API_KEY environment variable or use --api-key", err=True)
         sys.exit(1)
     
@@ -334,12 +363,21 @@ def analyze_dialux_enhanced(input: str, output: Optional[str], api_key: Optional
 @click.option('--input', '-i', required=True, help='Input Dialux PDF file path')
 @click.option('--output', '-o', help='Output directory (default: data/outputs)')
 @click.option('--api-key', help='OpenAI API key (or set OPENAI_API_KEY env var)')
+@click.option('--offline', is_flag=True, help='Answer LLM prompts from the response cache only')
+@click.option('--compact-json', is_flag=True, help='Write the JSON export without indentation')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
-def analyze_dialux_fast(input: str, output: Optional[str], api_key: Optional[str], verbose: bool):
+def analyze_dialux_fast(input: str, output: Optional[str], api_key: Optional[str], compact_json: bool,
+                        offline: bool, verbose: bool):
     """Fast Dialux analysis using focused extraction + standards comparison"""
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    if compact_json:
+        config.dialux.compact_json_export = True
+    
+    if offline:
+        config.llm.offline = True
+    
     input_path = Path(input)
     if not input_path.exists():
         click.echo(f"Error: Input file {input} does not exist", err=True)
@@ -411,6 +449,116 @@ def analyze_dialux_fast(input: str, output: Optional[str], api_key: Optional[str
         logger.error(f"Fast Dialux analysis failed: {e}")
         sys.exit(1)
 
+@cli.command()
+@click.option('--input', '-i', required=True, help='Directory or glob pattern of Dialux PDF reports')
+@click.option('--output', '-o', help='Output directory (default: data/outputs)')
+@click.option('--analyzer', type=click.Choice(['standard', 'fast', 'enhanced']), default='standard',
+              help='Analyzer to run on each report')
+@click.option('--workers', type=int, help='Worker processes (default: one per CPU core)')
+@click.option('--api-key', help='OpenAI API key (or set OPENAI_API_KEY env var)')
+@click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
+def batch(input: str, output: Optional[str], analyzer: str, workers: Optional[int],
+          api_key: Optional[str], verbose: bool):
+    """Analyze many Dialux reports in parallel, resuming interrupted runs"""
+    from src.analyzers.batch_analyzer import BatchAnalyzer, collect_pdf_paths
+    
+    if verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
+    pdf_paths = collect_pdf_paths(input)
+    if not pdf_paths:
+        click.echo(f"Error: No PDF files found for {input}", err=True)
+        sys.exit(1)
+    
+    if api_key:
+        os.environ["OPENAI_API_KEY"] = api_key
+    
+    output_dir = Path(output) if output else config.outputs_dir
+    output_dir.mkdir(exist_ok=True)
+    results_path = output_dir / "batch_results.jsonl"
+    manifest_path = output_dir / "batch_manifest.json"
+    
+    try:
+        batch_analyzer = BatchAnalyzer(analyzer, workers=workers, api_key=api_key)
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    
+    click.echo(f"📦 Batch analysis of {len(pdf_paths)} reports with up to {batch_analyzer.workers} workers")
+    
+    counts = {'completed': 0, 'failed': 0, 'skipped': 0, 'duplicate': 0}
+    for outcome in batch_analyzer.run(pdf_paths, results_path, manifest_path):
+        counts[outcome.status] += 1
+        if outcome.status == 'completed':
+            summary = outcome.summary
+            click.echo(f"  ✅ {outcome.file}: {summary['total_rooms']} rooms, "
+                       f"{summary['overall_compliance_rate']:.1%} compliant")
+        elif outcome.status == 'failed':
+            click.echo(f"  ❌ {outcome.file}: {outcome.error}")
+        elif verbose:
+            click.echo(f"  ⏭️ {outcome.file}: {outcome.status}")
+    
+    click.echo(f"\n📊 Completed: {counts['completed']}, failed: {counts['failed']}, "
+               f"already done: {counts['skipped']}, duplicates: {counts['duplicate']}")
+    click.echo(f"💾 Results: {results_path}")
+    click.echo(f"📋 Manifest: {manifest_path}")
+    
+    if counts['failed']:
+        sys.exit(1)
+
+@cli.command()
+@click.option('--store', help='Portfolio store directory (default: data/portfolio)')
+@click.option('--add', 'add_paths', multiple=True, help='Batch results JSONL file to add (repeatable)')
+@click.option('--value', default='illuminance_avg', help='Room value to aggregate')
+@click.option('--by', default='room_type', help='Comma-separated grouping: project, room_type, manufacturer, standard')
+@click.option('--stats', default='count,mean,median,min,max', help='Comma-separated statistics (e.g. mean,median,p90)')
+@click.option('--compliance', is_flag=True, help='Show compliance rates instead of room values')
+def portfolio(store: Optional[str], add_paths, value: str, by: str, stats: str, compliance: bool):
+    """Aggregate rooms and compliance across many analyzed reports"""
+    from src.analyzers.portfolio_store import PortfolioStore
+    
+    portfolio_store = PortfolioStore(store or config.dialux.portfolio_dir)
+    
+    for add_path in add_paths:
+        added = portfolio_store.add_results_file(add_path)
+        click.echo(f"📥 Added {added} reports from {add_path}")
+    
+    group_by = [column.strip() for column in by.split(',') if column.strip()]
+    try:
+        if compliance:
+            result = portfolio_store.compliance_statistics(group_by)
+        else:
+            result = portfolio_store.room_statistics(value, group_by, [s.strip() for s in stats.split(',')])
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    
+    rooms = len(portfolio_store.table('rooms')['area'])
+    reports = len(portfolio_store.vocabularies.get('report', []))
+    click.echo(f"📊 Portfolio: {reports} reports, {rooms} rooms")
+    if result.empty:
+        click.echo("No data in portfolio")
+    else:
+        click.echo(result.round(3).to_string(index=False))
+
+@cli.command()
+@click.option('--clear', is_flag=True, help='Remove all cached LLM responses')
+def llm_cache(clear: bool):
+    """Show or clear the LLM response cache"""
+    from src.extractors.llm_cache import get_response_cache
+    
+    response_cache = get_response_cache()
+    if clear:
+        removed = response_cache.clear()
+        click.echo(f"🗑️ Removed {removed} cached LLM responses")
+    
+    usage = response_cache.usage()
+    click.echo(f"🤖 LLM response cache: {response_cache.cache_dir}")
+    click.echo(f"  Entries: {usage['entries']}")
+    click.echo(f"  Size: {usage['bytes'] / 2**20:.1f} / {usage['max_bytes'] / 2**20:.0f} MB")
+    click.echo(f"  TTL: {config.llm.response_cache_ttl_days:g} days")
+    click.echo(f"  Offline mode: {'on' if response_cache.offline else 'off'}")
+
 @cli.command()
 @click.option('--standard-a', required=True, help='First standard to compare')
 @click.option('--standard-b', required=True, help='Second standard to compare')
@@ -491,6 +639,30 @@ def web(host: str, port: int, debug: bool):
         logger.error(f"Web interface failed: {e}")
         sys.exit(1)
 
+@cli.command()
+@click.option('--host', default=None, help='Host to bind to (default: web.api_host)')
+@click.option('--port', type=int, default=None, help='Port to bind to (default: web.api_port)')
+@click.option('--workers', type=int, help='Worker processes (default: one per CPU core)')
+@click.option('--debug', is_flag=True, help='Enable debug mode')
+def api(host: Optional[str], port: Optional[int], workers: Optional[int], debug: bool):
+    """Start the HTTP batch analysis API"""
+    if debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
+    try:
+        from src.web.api import run_api
+    except ImportError as e:
+        click.echo(f"❌ The API needs fastapi, uvicorn and python-multipart: {e}", err=True)
+        sys.exit(1)
+    
+    click.echo(f"🛰️ Starting batch API on {host or config.web.api_host}:{port or config.web.api_port}")
+    try:
+        run_api(host, port, workers)
+    except Exception as e:
+        click.echo(f"❌ Batch API failed to start: {e}", err=True)
+        logger.error(f"Batch API failed: {e}")
+        sys.exit(1)
+
 @cli.command()
 def demo():
     """Run a complete demo with sample data"""
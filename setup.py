@@ -61,6 +61,11 @@ setup(
             "streamlit>=1.28.0",
             "plotly>=5.17.0",
         ],
+        "api": [
+            "fastapi>=0.100.0",
+            "uvicorn>=0.20.0",
+            "python-multipart>=0.0.6",
+        ],
     },
     entry_points={
         "console_scripts": [
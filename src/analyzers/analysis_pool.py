@@ -0,0 +1,263 @@
+"""
+Analysis Worker Pool
+Pre-warmed worker processes and a content-addressed upload store for the HTTP batch API
+"""
+import os
+import re
+import json
+import time
+import asyncio
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    from .batch_analyzer import create_analyzer
+    from ..core.config import config
+    from ..utils.json_export import dumps_json
+except ImportError:
+    from analyzers.batch_analyzer import create_analyzer
+    from core.config import config
+    from utils.json_export import dumps_json
+
+logger = logging.getLogger(__name__)
+
+# Work a pool runs per document; "compliance" is the standard analysis reduced to its compliance data
+POOL_KINDS = ("pdf", "tables", "standard", "fast", "compliance")
+
+SHA256_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+@dataclass
+class PoolDocument:
+    """A stored upload to process"""
+    file: str
+    sha256: str
+    path: Path
+
+class UploadStore:
+    """Uploaded PDFs stored once by content hash"""
+    
+    def __init__(self, uploads_dir: Union[str, Path]):
+        self.uploads_dir = Path(uploads_dir)
+        self.uploads_dir.mkdir(parents=True, exist_ok=True)
+    
+    def put(self, data: bytes) -> str:
+        """Store an upload and return its content hash"""
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self.uploads_dir / f"{sha256}.pdf"
+        if path.exists():
+            os.utime(path)
+        else:
+            tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        return sha256
+    
+    def path(self, sha256: str) -> Optional[Path]:
+        """Path of a stored upload, None for unknown or malformed hashes"""
+        sha256 = sha256.strip().lower()
+        if not SHA256_PATTERN.match(sha256):
+            return None
+        path = self.uploads_dir / f"{sha256}.pdf"
+        if not path.exists():
+            return None
+        os.utime(path)  # mark as used, for pruning
+        return path
+    
+    def prune(self, max_age_seconds: float) -> int:
+        """Remove uploads not stored or used within max_age_seconds"""
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        for path in self.uploads_dir.glob("*.pdf"):
+            if path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+                removed += 1
+        if removed:
+            logger.info(f"Removed {removed} unused uploads from {self.uploads_dir}")
+        return removed
+
+# Components of the current worker process, by kind
+_worker_components: Dict[str, Any] = {}
+_worker_api_key: Optional[str] = None
+
+def _create_component(kind: str) -> Any:
+    """Create the extractor or analyzer doing one kind of work"""
+    if kind == "pdf":
+        try:
+            from ..extractors.pdf_extractor import PDFExtractor
+        except ImportError:
+            from extractors.pdf_extractor import PDFExtractor
+        return PDFExtractor()
+    if kind == "tables":
+        try:
+            from ..extractors.table_extractor import AdvancedTableExtractor
+        except ImportError:
+            from extractors.table_extractor import AdvancedTableExtractor
+        return AdvancedTableExtractor()
+    if kind == "compliance":
+        kind = "standard"
+    return create_analyzer(kind, _worker_api_key)
+
+def _worker_component(kind: str) -> Any:
+    """Component of the current worker, created on first use"""
+    kind = "standard" if kind == "compliance" else kind
+    component = _worker_components.get(kind)
+    if component is None:
+        component = _worker_components[kind] = _create_component(kind)
+    return component
+
+def _init_pool_worker(warm_kinds: Sequence[str], api_key: Optional[str], log_level: int):
+    """Create the configured components once per worker process"""
+    global _worker_api_key
+    logging.getLogger().setLevel(log_level)
+    _worker_api_key = api_key
+    # Results go back to the client, so export files would only pile up on the server
+    config.dialux.write_exports = config.web.api_write_exports
+    for kind in warm_kinds:
+        try:
+            _worker_component(kind)
+        except Exception as e:
+            logger.warning(f"Failed to pre-warm {kind} component: {e}")
+
+def _worker_pid() -> int:
+    return os.getpid()
+
+def compliance_view(result: Any) -> Dict[str, Any]:
+    """Compliance data of a standard analysis result"""
+    report = result.report
+    return {
+        'project_name': report.project_name,
+        'total_rooms': report.total_rooms,
+        'overall_compliance_rate': report.overall_compliance_rate,
+        'best_matching_standard': report.best_matching_standard,
+        'selected_standard': report.selected_standard,
+        'standards_compliance': report.standards_compliance,
+        'compliance_by_standard': report.compliance_by_standard,
+        'standard_scores': report.standard_scores,
+        'compliance_checks': report.compliance_checks,
+        'compliance_summary': result.compliance_summary,
+        'critical_issues': result.critical_issues,
+        'recommendations': result.recommendations
+    }
+
+def _process_document(kind: str, pdf_path: str, standards: Sequence[str]) -> str:
+    """Process one document in a worker and return its result as compact JSON"""
+    component = _worker_component(kind)
+    if kind == "pdf":
+        result = component.extract_from_pdf(pdf_path)
+    elif kind == "tables":
+        result = component.extract_tables_from_pdf(pdf_path)
+    elif kind == "fast":
+        result = component.analyze_dialux_report(pdf_path)
+    else:
+        try:
+            from ..standards.standards_processor import StandardType
+        except ImportError:
+            from standards.standards_processor import StandardType
+        result = component.analyze_dialux_report(pdf_path, standards=[StandardType(s) for s in standards])
+        if kind == "compliance":
+            result = compliance_view(result)
+    return dumps_json(result, compact=True)
+
+class AnalysisPool:
+    """
+    Process pool whose workers hold ready extractors and analyzers
+    
+    Every worker creates the configured components when it starts, so
+    requests do not pay for loading models, patterns and the standards
+    database. Results are encoded to JSON in the workers and streamed back
+    one line per document as they finish.
+    """
+    
+    def __init__(self, workers: Optional[int] = None, warm_kinds: Optional[Sequence[str]] = None,
+                 api_key: Optional[str] = None):
+        self.workers = workers or config.web.api_workers or os.cpu_count() or 1
+        self.warm_kinds = list(config.web.api_warm_kinds if warm_kinds is None else warm_kinds)
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self._executor: Optional[ProcessPoolExecutor] = None
+    
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_pool_worker,
+                                   initargs=(self.warm_kinds, self.api_key, logging.getLogger().level))
+    
+    def start(self):
+        """Start all workers and wait until they are warm"""
+        start = time.time()
+        self._executor = self._create_executor()
+        # One task per worker makes the pool start every process; each runs its initializer first
+        for task in [self._executor.submit(_worker_pid) for _ in range(self.workers)]:
+            task.result()
+        logger.info(f"Started {self.workers} analysis workers with {', '.join(self.warm_kinds) or 'no'} "
+                    f"components in {time.time() - start:.1f}s")
+    
+    def submit(self, kind: str, pdf_path: Union[str, Path], standards: Sequence[str] = ()) -> Future:
+        """
+        Process one document in a worker
+        
+        Args:
+            kind: One of POOL_KINDS
+            pdf_path: Stored upload
+            standards: Standards to check, for "standard" and "compliance"
+        
+        Returns:
+            Future of the result's compact JSON
+        """
+        if kind not in POOL_KINDS:
+            raise ValueError(f"Unknown pool kind: {kind}")
+        if self._executor is None:
+            self.start()
+        try:
+            return self._executor.submit(_process_document, kind, str(pdf_path), tuple(standards))
+        except BrokenProcessPool:
+            # A crashed worker breaks the whole pool; replace it so later requests are served
+            logger.error("Analysis worker pool broke, restarting it")
+            self._executor.shutdown(wait=False)
+            self._executor = self._create_executor()
+            return self._executor.submit(_process_document, kind, str(pdf_path), tuple(standards))
+    
+    async def stream(self, kind: str, documents: List[PoolDocument],
+                     standards: Sequence[str] = ()) -> AsyncIterator[str]:
+        """
+        Process documents in parallel and yield one NDJSON line per document as it finishes
+        
+        Lines carry file, sha256 and status ("completed" with the result or
+        "failed" with the error). Documents with the same content are
+        processed once. Documents still pending when the client goes away
+        are cancelled.
+        """
+        futures: Dict[str, Future] = {}
+        
+        async def run(document: PoolDocument) -> Tuple[PoolDocument, Optional[str], Optional[str]]:
+            try:
+                future = futures.get(document.sha256)
+                if future is None:
+                    future = futures[document.sha256] = self.submit(kind, document.path, standards)
+                return document, await asyncio.wrap_future(future), None
+            except Exception as e:
+                logger.error(f"{kind} of {document.file} failed: {e}")
+                return document, None, str(e) or type(e).__name__
+        
+        try:
+            for next_done in asyncio.as_completed([run(document) for document in documents]):
+                document, payload, error = await next_done
+                head = {'file': document.file, 'sha256': document.sha256, 'kind': kind}
+                if error is None:
+                    # The result is already JSON, so it is spliced in rather than decoded and re-encoded
+                    head['status'] = 'completed'
+                    yield json.dumps(head, ensure_ascii=False, separators=(',', ':'))[:-1] + ',"result":' + payload + '}\n'
+                else:
+                    head.update(status='failed', error=error)
+                    yield json.dumps(head, ensure_ascii=False, separators=(',', ':')) + '\n'
+        finally:
+            for future in futures.values():
+                future.cancel()
+    
+    def shutdown(self, wait: bool = True):
+        """Stop the workers"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
@@ -0,0 +1,293 @@
+"""
+Batch Dialux Report Analysis
+Analyzes many reports across a process pool with a resumable manifest
+"""
+import os
+import glob
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any, Union, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, Future, as_completed, wait, FIRST_COMPLETED
+
+try:
+    from .result_cache import file_sha256
+    from ..core.config import config
+    from ..utils.json_export import dumps_json
+except ImportError:
+    from analyzers.result_cache import file_sha256
+    from core.config import config
+    from utils.json_export import dumps_json
+
+logger = logging.getLogger(__name__)
+
+ANALYZER_TYPES = ("standard", "fast", "enhanced")
+
+@dataclass
+class BatchOutcome:
+    """Outcome of one document in a batch run"""
+    file: str
+    sha256: str
+    status: str  # completed, failed, skipped or duplicate
+    error: Optional[str] = None
+    summary: Optional[Dict[str, Any]] = None  # project, rooms and compliance of a completed document
+
+class BatchManifest:
+    """Completed documents of a batch run, keyed by content hash"""
+    
+    def __init__(self, manifest_path: Union[str, Path]):
+        self.manifest_path = Path(manifest_path)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.load()
+    
+    def load(self):
+        """Load the manifest from disk, if present"""
+        if not self.manifest_path.exists():
+            return
+        
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('documents', {})
+        except Exception as e:
+            logger.warning(f"Failed to load batch manifest {self.manifest_path}: {e}")
+            self.entries = {}
+    
+    def save(self):
+        """Write the manifest atomically so an interrupted run leaves it intact"""
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(self.manifest_path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'documents': self.entries}, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path)
+    
+    def is_completed(self, sha256: str, analyzer_type: str) -> bool:
+        """Check if a document was already analyzed with the given analyzer"""
+        entry = self.entries.get(sha256)
+        return bool(entry) and entry.get('status') == 'completed' and entry.get('analyzer') == analyzer_type
+    
+    def record(self, outcome: BatchOutcome, analyzer_type: str):
+        """Record a finished document and persist the manifest"""
+        self.entries[outcome.sha256] = {
+            'file': outcome.file,
+            'analyzer': analyzer_type,
+            'status': outcome.status,
+            'error': outcome.error,
+            'finished_at': datetime.now().isoformat()
+        }
+        self.save()
+
+def collect_pdf_paths(source: Union[str, Path]) -> List[Path]:
+    """
+    Resolve a batch input to PDF files
+    
+    Args:
+        source: Directory (searched recursively), glob pattern or single PDF
+    
+    Returns:
+        Sorted list of PDF paths
+    """
+    source_path = Path(source)
+    if source_path.is_dir():
+        paths = source_path.rglob('*')
+    elif source_path.is_file():
+        paths = [source_path]
+    else:
+        paths = (Path(p) for p in glob.glob(str(source), recursive=True))
+    
+    return sorted(p for p in paths if p.is_file() and p.suffix.lower() == '.pdf')
+
+# Analyzer of the current worker process, created once by _init_worker
+_worker_analyzer = None
+
+def create_analyzer(analyzer_type: str, api_key: Optional[str] = None):
+    """Create the analyzer for a batch run"""
+    if analyzer_type == "fast":
+        try:
+            from .fast_dialux_analyzer import FastDialuxAnalyzer
+        except ImportError:
+            from analyzers.fast_dialux_analyzer import FastDialuxAnalyzer
+        return FastDialuxAnalyzer(api_key)
+    if analyzer_type == "enhanced":
+        try:
+            from .enhanced_dialux_analyzer import EnhancedDialuxAnalyzer
+        except ImportError:
+            from analyzers.enhanced_dialux_analyzer import EnhancedDialuxAnalyzer
+        return EnhancedDialuxAnalyzer(api_key)
+    
+    try:
+        from .dialux_analyzer import DialuxAnalyzer
+    except ImportError:
+        from analyzers.dialux_analyzer import DialuxAnalyzer
+    return DialuxAnalyzer()
+
+def _init_worker(analyzer_type: str, api_key: Optional[str], log_level: int):
+    """Create the analyzer once per worker process"""
+    global _worker_analyzer
+    logging.getLogger().setLevel(log_level)
+    _worker_analyzer = create_analyzer(analyzer_type, api_key)
+
+def _extract_document(pdf_path: str):
+    """Run the focused extraction of one document in a worker, leaving company names pending"""
+    return _worker_analyzer.extract_for_batch(pdf_path)
+
+def _analyze_document(pdf_path: str, sha256: str, analyzer_type: str,
+                      extraction_result=None) -> Tuple[str, Dict[str, Any]]:
+    """Analyze one document in a worker and return its JSON line and a short summary"""
+    start = datetime.now()
+    if extraction_result is not None:
+        result = _worker_analyzer.analyze_dialux_report(pdf_path, extraction_result)
+    else:
+        result = _worker_analyzer.analyze_dialux_report(pdf_path)
+    if hasattr(_worker_analyzer, 'wait_for_exports'):
+        # Worker processes may exit right after their last document
+        _worker_analyzer.wait_for_exports()
+    
+    record = {
+        'file': pdf_path,
+        'sha256': sha256,
+        'analyzer': analyzer_type,
+        'processing_time': (datetime.now() - start).total_seconds(),
+        'report': result.report,
+        'recommendations': result.recommendations,
+        'critical_issues': result.critical_issues,
+        'export_paths': result.export_paths
+    }
+    summary = {
+        'project_name': result.report.project_name,
+        'total_rooms': result.report.total_rooms,
+        'overall_compliance_rate': result.report.overall_compliance_rate
+    }
+    return dumps_json(record, compact=True), summary
+
+class BatchAnalyzer:
+    """Analyze many Dialux reports in parallel, resuming from a manifest"""
+    
+    def __init__(self, analyzer_type: str = "standard", workers: Optional[int] = None,
+                 api_key: Optional[str] = None):
+        if analyzer_type not in ANALYZER_TYPES:
+            raise ValueError(f"Unknown analyzer type: {analyzer_type}")
+        
+        self.analyzer_type = analyzer_type
+        self.workers = workers or os.cpu_count() or 1
+        self.api_key = api_key
+    
+    @property
+    def batches_companies(self) -> bool:
+        """Whether fast analysis company names are extracted across documents"""
+        return (self.analyzer_type == "fast" and config.llm.company_batch_size > 1
+                and bool(self.api_key or os.getenv("OPENAI_API_KEY")))
+    
+    def run(self, pdf_paths: List[Path], results_path: Union[str, Path],
+            manifest_path: Union[str, Path]) -> Iterator[BatchOutcome]:
+        """
+        Analyze documents, yielding each outcome as soon as it is known
+        
+        Documents already completed in the manifest are skipped. Each result is
+        appended to the JSONL results file and recorded in the manifest as its
+        analysis finishes, so an interrupted run resumes where it stopped.
+        
+        Args:
+            pdf_paths: PDF files to analyze
+            results_path: JSONL file the analysis results are appended to
+            manifest_path: JSON manifest of finished documents
+        
+        Returns:
+            Iterator of batch outcomes
+        """
+        manifest = BatchManifest(manifest_path)
+        results_path = Path(results_path)
+        results_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        pending = {}
+        for pdf_path in pdf_paths:
+            sha256 = file_sha256(pdf_path)
+            if manifest.is_completed(sha256, self.analyzer_type):
+                yield BatchOutcome(str(pdf_path), sha256, 'skipped')
+            elif sha256 in pending:
+                yield BatchOutcome(str(pdf_path), sha256, 'duplicate')
+            else:
+                pending[sha256] = str(pdf_path)
+        
+        if not pending:
+            return
+        
+        workers = min(self.workers, len(pending))
+        logger.info(f"Analyzing {len(pending)} documents with {workers} workers")
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.analyzer_type, self.api_key,
+                                           logging.getLogger().level)) as executor, \
+                open(results_path, 'a', encoding='utf-8') as results_file:
+            if self.batches_companies:
+                finished = self._run_company_batches(executor, pending)
+            else:
+                futures = {
+                    executor.submit(_analyze_document, pdf_path, sha256, self.analyzer_type): sha256
+                    for sha256, pdf_path in pending.items()
+                }
+                finished = ((future, futures[future]) for future in as_completed(futures))
+            
+            for future, sha256 in finished:
+                try:
+                    line, summary = future.result()
+                except Exception as e:
+                    logger.error(f"Batch analysis failed for {pending[sha256]}: {e}")
+                    outcome = BatchOutcome(pending[sha256], sha256, 'failed', error=str(e))
+                else:
+                    results_file.write(line + '\n')
+                    results_file.flush()
+                    outcome = BatchOutcome(pending[sha256], sha256, 'completed', summary=summary)
+                
+                manifest.record(outcome, self.analyzer_type)
+                yield outcome
+    
+    def _run_company_batches(self, executor: ProcessPoolExecutor,
+                             pending: Dict[str, str]) -> Iterator[Tuple[Future, str]]:
+        """
+        Fast analysis in two stages, with company names extracted across documents
+        
+        Workers run the focused extractions; every llm.company_batch_size
+        finished extractions, the company names of the group are resolved here
+        with one LLM request and the group is handed back to the workers for
+        analysis. Failed extractions are yielded like failed analyses.
+        
+        Yields:
+            Finished future and content hash of each document
+        """
+        try:
+            from ..extractors.focused_extractor import FocusedExtractor
+        except ImportError:
+            from extractors.focused_extractor import FocusedExtractor
+        resolver = FocusedExtractor(self.api_key)
+        batch_size = config.llm.company_batch_size
+        
+        extractions = {executor.submit(_extract_document, pdf_path): sha256 for sha256, pdf_path in pending.items()}
+        analyses: Dict[Future, str] = {}
+        ready = []  # extracted documents awaiting company names
+        
+        def analyze(sha256: str, extraction_result=None):
+            future = executor.submit(_analyze_document, pending[sha256], sha256, self.analyzer_type, extraction_result)
+            analyses[future] = sha256
+        
+        while extractions or analyses:
+            done, _ = wait(list(extractions) + list(analyses), return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in analyses:
+                    yield future, analyses.pop(future)
+                    continue
+                
+                sha256 = extractions.pop(future)
+                if future.exception() is not None:
+                    yield future, sha256
+                elif future.result() is None:
+                    analyze(sha256)  # extraction cached by an earlier run
+                else:
+                    ready.append((sha256, future.result()))
+            
+            if ready and (len(ready) >= batch_size or not extractions):
+                resolver.resolve_companies_batch([extraction_result for _, extraction_result in ready])
+                for sha256, extraction_result in ready:
+                    analyze(sha256, extraction_result)
+                ready = []
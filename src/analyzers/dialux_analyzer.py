@@ -6,7 +6,7 @@ import re
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, List, Optional, Tuple, Any, Union, Callable
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from enum import Enum
@@ -16,14 +16,22 @@ import numpy as np
 
 try:
     from ..core.config import config
-    from ..extractors.pdf_extractor import PDFExtractor
+    from ..core.patterns import registry as pattern_registry
+    from ..extractors.pdf_extractor import PDFExtractor, PAGE_MARKER_PATTERN
     from ..extractors.table_extractor import AdvancedTableExtractor
-    from ..standards.standards_processor import StandardsProcessor, RoomType, StandardType, ComplianceResult
+    from ..standards.standards_processor import (StandardsProcessor, RoomType, StandardType, ComplianceResult,
+                                                 ComplianceTable, DATACLASS_SLOTS)
+    from .result_cache import AnalysisResultCache
+    from .report_exporter import ReportExporter
 except ImportError:
     from core.config import config
-    from extractors.pdf_extractor import PDFExtractor
+    from core.patterns import registry as pattern_registry
+    from extractors.pdf_extractor import PDFExtractor, PAGE_MARKER_PATTERN
     from extractors.table_extractor import AdvancedTableExtractor
-    from standards.standards_processor import StandardsProcessor, RoomType, StandardType, ComplianceResult
+    from standards.standards_processor import (StandardsProcessor, RoomType, StandardType, ComplianceResult,
+                                               ComplianceTable, DATACLASS_SLOTS)
+    from analyzers.result_cache import AnalysisResultCache
+    from analyzers.report_exporter import ReportExporter
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +54,7 @@ class DialuxParameter:
     page_number: int
     raw_text: str = ""
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DialuxRoom:
     """Dialux room analysis"""
     name: str
@@ -71,13 +79,20 @@ class DialuxRoom:
     data_completeness: float = 0.0
     confidence_score: float = 0.0
     
-    # Compliance results
+    # Compliance results for the selected standard
     compliance_results: List[ComplianceResult] = None
     
     def __post_init__(self):
         if self.compliance_results is None:
             self.compliance_results = []
 
+@dataclass
+class RoomSection:
+    """Room section of a report, as offsets into the report text"""
+    name: str
+    start: int
+    end: int
+
 @dataclass
 class DialuxReport:
     """Complete Dialux report analysis"""
@@ -102,7 +117,11 @@ class DialuxReport:
     # Standards analysis
     applicable_standards: List[StandardType] = None
     best_matching_standard: Optional[StandardType] = None
+    selected_standard: Optional[StandardType] = None
     standards_compliance: Dict[str, float] = None
+    compliance_by_standard: Dict[str, Dict[str, float]] = None
+    standard_scores: Dict[str, float] = None
+    compliance_checks: ComplianceTable = None  # results of every room against every evaluated standard
     
     # Analysis metadata
     processing_date: datetime = None
@@ -115,6 +134,12 @@ class DialuxReport:
             self.applicable_standards = []
         if self.standards_compliance is None:
             self.standards_compliance = {}
+        if self.compliance_by_standard is None:
+            self.compliance_by_standard = {}
+        if self.standard_scores is None:
+            self.standard_scores = {}
+        if self.compliance_checks is None:
+            self.compliance_checks = ComplianceTable()
         if self.processing_date is None:
             self.processing_date = datetime.now()
 
@@ -127,137 +152,181 @@ class DialuxAnalysisResult:
     critical_issues: List[str]
     export_paths: Dict[str, str]
 
+@dataclass(frozen=True)
+class ParameterRule:
+    """Rule resolving a numeric token to a Dialux parameter"""
+    parameter: str
+    labels: Tuple[Tuple[str, ...], ...] = ()  # label phrases directly before the number
+    suffixes: frozenset = frozenset()         # qualifier word directly after the number/unit
+    unit: Optional[str] = None                # required normalized unit
+
+def _rule(parameter: str, labels: Tuple[str, ...] = (), suffixes: Tuple[str, ...] = (),
+          unit: Optional[str] = None) -> ParameterRule:
+    """Build a rule; label phrases are stored closest word first"""
+    return ParameterRule(
+        parameter=parameter,
+        labels=tuple(tuple(reversed(label.split())) for label in labels),
+        suffixes=frozenset(suffixes),
+        unit=unit
+    )
+
+# Parameter rules in precedence order: for each parameter the first listed rule
+# that matches anywhere in the text wins, and within a rule the first occurrence wins.
+# Column headers take the first matching rule of any parameter, so the qualified
+# illuminance rules come before the bare 'illuminance' and 'e' labels.
+PARAMETER_RULES = [
+    _rule('illuminance_avg', labels=('average', 'avg', 'mean', 'em', 'eavg', 'eav'), unit='lux'),
+    _rule('illuminance_avg', suffixes=('average', 'avg', 'mean'), unit='lux'),
+    _rule('illuminance_min', labels=('minimum', 'min', 'emin'), unit='lux'),
+    _rule('illuminance_min', suffixes=('minimum', 'min'), unit='lux'),
+    _rule('illuminance_max', labels=('maximum', 'max', 'emax'), unit='lux'),
+    _rule('illuminance_max', suffixes=('maximum', 'max'), unit='lux'),
+    _rule('illuminance_avg', labels=('illuminance',), unit='lux'),
+    _rule('illuminance_avg', labels=('e',), unit='lux'),
+    _rule('illuminance_avg', unit='lux'),
+    _rule('uniformity', labels=('uniformity', 'uniform', 'u0')),
+    _rule('uniformity', suffixes=('uniformity', 'uniform')),
+    _rule('ugr', labels=('ugr', 'unified glare rating', 'glare')),
+    _rule('ugr', suffixes=('ugr', 'glare')),
+    _rule('power_density', unit='w/m2'),
+    _rule('power_density', labels=('power density',)),
+    _rule('color_temperature', unit='k'),
+    _rule('color_temperature', labels=('color temperature',)),
+    _rule('cri', labels=('cri', 'color rendering index', 'ra')),
+    _rule('cri', suffixes=('cri', 'ra')),
+    _rule('luminous_efficacy', unit='lm/w'),
+    _rule('luminous_efficacy', labels=('luminous efficacy', 'efficacy')),
+    _rule('area', unit='m2'),
+    _rule('area', labels=('area', 'surface')),
+    _rule('mounting_height', unit='m'),
+    _rule('mounting_height', labels=('height', 'mounting')),
+]
+
+# Parameters the rules resolve, in rule order
+PARAMETER_NAMES = tuple(dict.fromkeys(rule.parameter for rule in PARAMETER_RULES))
+
+# Tokenizer: numbers, unit symbols and words, in one pass
+PARAMETER_TOKEN_PATTERN = re.compile(
+    r'(?P<num>\d+(?:\.\d+)?)'
+    r'|(?P<unit>w/m[²2]|watt/m[²2]|lm/w|lumen/watt|m[²2])'
+    r'|(?P<word>[a-z]+\d*)',
+    re.IGNORECASE
+)
+LABEL_GAP_PATTERN = re.compile(r'[\s:=]*')
+SUFFIX_GAP_PATTERN = re.compile(r'\s*\(?\s*')
+
+UNIT_ALIASES = {
+    'lux': 'lux', 'lx': 'lux',
+    'w/m²': 'w/m2', 'w/m2': 'w/m2', 'watt/m²': 'w/m2', 'watt/m2': 'w/m2',
+    'lm/w': 'lm/w', 'lumen/watt': 'lm/w',
+    'm²': 'm2', 'm2': 'm2',
+    'k': 'k', 'kelvin': 'k',
+    'm': 'm', 'meter': 'm', 'meters': 'm'
+}
+
+# Room section headers, matched within one line. The separator run and the
+# paren-free lookahead stop at the first character that can end them, so every
+# character is scanned a bounded number of times without possessive quantifiers.
+ROOM_HEADER_PATTERN = re.compile(
+    r'(?P<keyword>room|space|area|zone|building|floor)[:\s]+(?=[^\s:])'
+    r'|\((?=(?P<paren>[^()\n]*)\))',
+    re.IGNORECASE
+)
+ROOM_HEADER_KEYWORD_RANKS = {'room': 0, 'space': 0, 'area': 0, 'zone': 0, 'building': 3, 'floor': 4}
+LINE_PATTERN = re.compile(r'\S[^\n]*')
+
+# Lighting values a room table page carries
+TABLE_PAGE_HINT_PATTERN = re.compile(r'\b(?:lux|lx|ugr|uniformity|u0|w/m)', re.IGNORECASE)
+
+# First number of a table cell, with a decimal point or comma
+TABLE_NUMBER_PATTERN = re.compile(r'(\d+(?:[.,]\d+)?)')
+
 class DialuxAnalyzer:
     """Comprehensive Dialux report analyzer"""
     
+    # Bump when room extraction changes so cached extractions are not reused
+    ANALYZER_VERSION = "1"
+    
     def __init__(self):
         self.config = config.dialux
         self.pdf_extractor = PDFExtractor()
         self.table_extractor = AdvancedTableExtractor()
         self.standards_processor = StandardsProcessor()
+        self.result_cache = AnalysisResultCache(self.config.result_cache_dir, self.config.result_cache_enabled)
+        self.exporter = ReportExporter(self.config.dialux_output_dir, self.config.export_workers)
         self._setup_dialux_patterns()
     
     def _setup_dialux_patterns(self):
-        """Setup regex patterns for Dialux parameter extraction"""
-        self.patterns = {
-            'illuminance_avg': [
-                r'(?:average|avg|mean|e\s*avg|em)[:\s]*(\d+(?:\.\d+)?)\s*(?:lux|lx)',
-                r'(\d+(?:\.\d+)?)\s*(?:lux|lx)\s*(?:average|avg|mean)',
-                r'illuminance[:\s]*(\d+(?:\.\d+)?)\s*(?:lux|lx)',
-                r'e[:\s]*(\d+(?:\.\d+)?)\s*(?:lux|lx)',
-                r'(\d+(?:\.\d+)?)\s*(?:lux|lx)(?:\s*\(avg\))?'
-            ],
-            'illuminance_min': [
-                r'(?:minimum|min|e\s*min)[:\s]*(\d+(?:\.\d+)?)\s*(?:lux|lx)',
-                r'(\d+(?:\.\d+)?)\s*(?:lux|lx)\s*(?:minimum|min)',
-                r'(\d+(?:\.\d+)?)\s*(?:lux|lx)\s*\(min\)'
-            ],
-            'illuminance_max': [
-                r'(?:maximum|max|e\s*max)[:\s]*(\d+(?:\.\d+)?)\s*(?:lux|lx)',
-                r'(\d+(?:\.\d+)?)\s*(?:lux|lx)\s*(?:maximum|max)',
-                r'(\d+(?:\.\d+)?)\s*(?:lux|lx)\s*\(max\)'
-            ],
-            'uniformity': [
-                r'(?:uniformity|uniform|u0)[:\s]*(\d+(?:\.\d+)?)',
-                r'(\d+(?:\.\d+)?)\s*(?:uniformity|uniform)',
-                r'(\d+(?:\.\d+)?)\s*\(uniformity\)',
-                r'u0[:\s]*(\d+(?:\.\d+)?)'
-            ],
-            'ugr': [
-                r'ugr[:\s]*(\d+(?:\.\d+)?)',
-                r'unified glare rating[:\s]*(\d+(?:\.\d+)?)',
-                r'glare[:\s]*(\d+(?:\.\d+)?)',
-                r'(\d+(?:\.\d+)?)\s*(?:ugr|glare)'
-            ],
-            'power_density': [
-                r'(\d+(?:\.\d+)?)\s*(?:w/m²|watt/m²|w/m2)',
-                r'power density[:\s]*(\d+(?:\.\d+)?)',
-                r'lighting power density[:\s]*(\d+(?:\.\d+)?)',
-                r'(\d+(?:\.\d+)?)\s*(?:w/m²|w/m2)'
-            ],
-            'color_temperature': [
-                r'(\d+(?:\.\d+)?)\s*(?:k|kelvin)',
-                r'color temperature[:\s]*(\d+(?:\.\d+)?)',
-                r'correlated color temperature[:\s]*(\d+(?:\.\d+)?)',
-                r'(\d+(?:\.\d+)?)\s*k'
-            ],
-            'cri': [
-                r'cri[:\s]*(\d+(?:\.\d+)?)',
-                r'color rendering index[:\s]*(\d+(?:\.\d+)?)',
-                r'ra[:\s]*(\d+(?:\.\d+)?)',
-                r'(\d+(?:\.\d+)?)\s*(?:cri|ra)'
-            ],
-            'luminous_efficacy': [
-                r'(\d+(?:\.\d+)?)\s*(?:lm/w|lumen/watt)',
-                r'luminous efficacy[:\s]*(\d+(?:\.\d+)?)',
-                r'efficacy[:\s]*(\d+(?:\.\d+)?)',
-                r'(\d+(?:\.\d+)?)\s*(?:lm/w)'
-            ],
-            'area': [
-                r'(\d+(?:\.\d+)?)\s*(?:m²|m2|square meter)',
-                r'area[:\s]*(\d+(?:\.\d+)?)',
-                r'surface[:\s]*(\d+(?:\.\d+)?)',
-                r'(\d+(?:\.\d+)?)\s*(?:m²|m2)'
-            ],
-            'mounting_height': [
-                r'(\d+(?:\.\d+)?)\s*(?:m|meter)',
-                r'height[:\s]*(\d+(?:\.\d+)?)',
-                r'mounting[:\s]*(\d+(?:\.\d+)?)',
-                r'(\d+(?:\.\d+)?)\s*m'
-            ]
-        }
+        """Setup Dialux parameter names and room patterns (compiled in the shared registry)"""
+        self.patterns = PARAMETER_NAMES
         
         # Room identification patterns
-        self.room_patterns = {
-            'office': [r'office', r'workplace', r'work\s+place', r'desk', r'workstation'],
-            'meeting_room': [r'meeting', r'conference', r'boardroom', r'seminar'],
-            'corridor': [r'corridor', r'passage', r'circulation', r'hallway', r'aisle'],
-            'storage': [r'storage', r'warehouse', r'archive', r'stock', r'depot'],
-            'industrial': [r'industrial', r'factory', r'manufacturing', r'production', r'workshop'],
-            'retail': [r'retail', r'shop', r'store', r'commercial', r'showroom'],
-            'educational': [r'classroom', r'school', r'education', r'teaching', r'lecture'],
-            'healthcare': [r'hospital', r'medical', r'healthcare', r'clinic', r'treatment'],
-            'residential': [r'residential', r'home', r'apartment', r'dwelling', r'living'],
-            'outdoor': [r'outdoor', r'exterior', r'external', r'street', r'parking']
-        }
+        self.room_patterns = pattern_registry.group('dialux.room')
+    
+    def _document_key(self, pdf_path: Path) -> str:
+        """Cache key of a document's room extraction, covering the text and table extraction settings"""
+        extraction = self.table_extractor.config
+        return self.result_cache.document_key(pdf_path, "standard", self.ANALYZER_VERSION,
+                                              self.config.lazy_table_extraction, self.config.flag_table_pages,
+                                              extraction.use_pdfplumber, extraction.use_pymupdf,
+                                              extraction.use_pdfminer, extraction.use_camelot,
+                                              extraction.camelot_flavors, extraction.use_ocr, extraction.ocr_dpi,
+                                              extraction.ocr_config, extraction.min_table_score,
+                                              extraction.min_rows, extraction.min_cols,
+                                              extraction.duplicate_similarity_threshold)
     
-    def analyze_dialux_report(self, pdf_path: Union[str, Path]) -> DialuxAnalysisResult:
+    def analyze_dialux_report(self, pdf_path: Union[str, Path],
+                              standards: Optional[List[StandardType]] = None,
+                              progress: Optional[Callable[[str], None]] = None) -> DialuxAnalysisResult:
         """
         Analyze a Dialux report comprehensively
         
         Args:
             pdf_path: Path to Dialux PDF report
+            standards: Additional standards to evaluate besides the applicable ones
+            progress: Called with each stage name as it starts (text_extraction,
+                tables, rooms, compliance, export)
             
         Returns:
             Complete analysis result
         """
         pdf_path = Path(pdf_path)
+        progress = progress or (lambda stage: None)
         logger.info(f"Starting Dialux analysis: {pdf_path}")
         
-        # Extract content from PDF
-        extraction_result = self.pdf_extractor.extract_from_pdf(pdf_path)
-        
-        # Extract tables
-        tables = self.table_extractor.extract_tables_from_pdf(pdf_path)
-        
-        # Identify report type
-        report_type = self._identify_report_type(extraction_result.text)
-        
-        # Extract project information
-        project_name = self._extract_project_name(extraction_result.text, pdf_path.name)
-        
-        # Extract room data
-        rooms = self._extract_room_data(extraction_result.text, tables)
+        # Complete results are reused until the document, the analyzer or the standards database change
+        document_key = self._document_key(pdf_path)
+        result_key = self.result_cache.result_key(document_key, self.standards_processor.database_revision,
+                                                  sorted(standard.value for standard in standards or []),
+                                                  self.config.compact_json_export)
+        cached_result = self.result_cache.load(AnalysisResultCache.RESULT, result_key)
+        if cached_result is not None:
+            export_paths = cached_result.export_paths
+            if not export_paths or not all(Path(path).exists() for path in export_paths.values()):
+                cached_result.export_paths = self._export_analysis_results(cached_result.report, pdf_path)
+            logger.info(f"Dialux analysis reused from cache: {cached_result.report.total_rooms} rooms")
+            return cached_result
+        
+        # Room extraction does not depend on the standards, so it survives database changes
+        extraction = self.result_cache.load(AnalysisResultCache.EXTRACTION, document_key)
+        if extraction is None:
+            extraction = self._extract_report_rooms(pdf_path, progress)
+            self.result_cache.store(AnalysisResultCache.EXTRACTION, document_key, extraction)
+        project_name, report_type, rooms, extraction_confidence = extraction
         
         # Calculate overall statistics
         overall_stats = self._calculate_overall_statistics(rooms)
         
         # Determine applicable standards
         applicable_standards = self._determine_applicable_standards(rooms)
-        best_standard = self._select_best_standard(rooms, applicable_standards)
         
-        # Check compliance
-        compliance_results = self._check_compliance(rooms, best_standard)
+        # Check compliance against every standard in one pass over the room values
+        progress("compliance")
+        evaluated_standards = self._standards_to_evaluate(applicable_standards, standards)
+        compliance_checks = ComplianceTable()
+        compliance_by_standard = self._check_compliance_all(rooms, evaluated_standards, compliance_checks)
+        standard_scores = self._score_standards(rooms, evaluated_standards, compliance_checks)
+        best_standard = self._select_best_standard(applicable_standards, standard_scores)
         
         # Create Dialux report
         dialux_report = DialuxReport(
@@ -274,16 +343,48 @@ class DialuxAnalyzer:
             rooms=rooms,
             applicable_standards=applicable_standards,
             best_matching_standard=best_standard,
-            standards_compliance=compliance_results,
-            extraction_confidence=extraction_result.confidence_score
+            compliance_by_standard=compliance_by_standard,
+            standard_scores=standard_scores,
+            compliance_checks=compliance_checks,
+            extraction_confidence=extraction_confidence
         )
         
+        self._apply_standard(dialux_report, best_standard)
+        
         # Generate analysis result
+        progress("export")
         analysis_result = self._generate_analysis_result(dialux_report, pdf_path)
+        self.result_cache.store(AnalysisResultCache.RESULT, result_key, analysis_result)
         
         logger.info(f"Dialux analysis completed: {len(rooms)} rooms, {overall_stats['compliance_rate']:.1%} compliance")
         return analysis_result
     
+    def _extract_report_rooms(self, pdf_path: Path, progress: Callable[[str], None]
+                              ) -> Tuple[str, DialuxReportType, List[DialuxRoom], float]:
+        """Extract project name, report type, rooms and extraction confidence from the PDF"""
+        # Extract content from PDF
+        progress("text_extraction")
+        extraction_result = self.pdf_extractor.extract_from_pdf(pdf_path)
+        
+        # Identify report type
+        report_type = self._identify_report_type(extraction_result.text)
+        
+        # Extract project information
+        project_name = self._extract_project_name(extraction_result.text, pdf_path.name)
+        
+        # Extract room data; tables are only extracted if the text yields no rooms
+        if self.config.lazy_table_extraction:
+            def tables():
+                progress("tables")
+                return self._extract_room_tables(pdf_path, extraction_result.text)
+        else:
+            progress("tables")
+            tables = self.table_extractor.extract_tables_from_pdf(pdf_path)
+        progress("rooms")
+        rooms = self._extract_room_data(extraction_result.text, tables)
+        
+        return project_name, report_type, rooms, extraction_result.confidence_score
+    
     def _identify_report_type(self, text: str) -> DialuxReportType:
         """Identify the type of Dialux report"""
         text_lower = text.lower()
@@ -300,31 +401,33 @@ class DialuxAnalyzer:
     def _extract_project_name(self, text: str, filename: str) -> str:
         """Extract project name from text or filename"""
         # Try to find project name in text
-        project_patterns = [
-            r'project[:\s]+([^\n\r]+)',
-            r'building[:\s]+([^\n\r]+)',
-            r'facility[:\s]+([^\n\r]+)',
-            r'title[:\s]+([^\n\r]+)'
-        ]
-        
-        for pattern in project_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in pattern_registry.family('dialux.project'):
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         
         # Fallback to filename
         return Path(filename).stem
     
-    def _extract_room_data(self, text: str, tables: List) -> List[DialuxRoom]:
-        """Extract room data from text and tables"""
+    def _extract_room_data(self, text: str, tables: Union[List, Callable[[], List]]) -> List[DialuxRoom]:
+        """
+        Extract room data from text and tables
+        
+        Args:
+            text: Report text
+            tables: Extracted tables, or a callable producing them on demand
+            
+        Returns:
+            Rooms found in the text, or in the tables if the text has none
+        """
         rooms = []
         
         # Find room sections in text
         room_sections = self._find_room_sections(text)
         
         for room_section in room_sections:
-            room_name = room_section['name']
-            room_text = room_section['text']
+            room_name = room_section.name
+            room_text = text[room_section.start:room_section.end]
             
             # Determine room type
             room_type = self._determine_room_type(room_name, room_text)
@@ -360,89 +463,184 @@ class DialuxAnalyzer:
         
         # If no rooms found, try to extract from tables
         if not rooms:
+            if callable(tables):
+                tables = tables()
             rooms = self._extract_rooms_from_tables(tables)
+        elif callable(tables):
+            logger.info(f"Found {len(rooms)} rooms in text, skipping table extraction")
         
         return rooms
     
-    def _find_room_sections(self, text: str) -> List[Dict[str, str]]:
-        """Find room sections in text"""
-        room_sections = []
+    def _extract_room_tables(self, pdf_path: Path, text: str) -> List:
+        """Extract tables from the pages likely to hold room data"""
+        pages = self._flag_room_table_pages(text) if self.config.flag_table_pages else None
+        if pages == []:
+            logger.info("No pages look like room tables, skipping table extraction")
+            return []
+        return self.table_extractor.extract_tables_from_pdf(pdf_path, pages=pages)
+    
+    def _flag_room_table_pages(self, text: str) -> Optional[List[int]]:
+        """
+        Flag pages whose text mentions a room-level lighting value
         
-        # Look for room headers
-        room_header_patterns = [
-            r'(?:room|space|area|zone)[:\s]+([^\n\r]+)',
-            r'([^\n\r]+)\s*\([^)]*room[^)]*\)',
-            r'([^\n\r]+)\s*\([^)]*space[^)]*\)',
-            r'building[:\s]+([^\n\r]+)',
-            r'floor[:\s]+([^\n\r]+)'
-        ]
+        Args:
+            text: Report text with PDFExtractor page markers
+            
+        Returns:
+            One-based page numbers, or None if the text has no page markers
+        """
+        markers = list(PAGE_MARKER_PATTERN.finditer(text))
+        if not markers:
+            return None
+        
+        pages = []
+        for i, marker in enumerate(markers):
+            end = markers[i + 1].start() if i + 1 < len(markers) else len(text)
+            if TABLE_PAGE_HINT_PATTERN.search(text, marker.end(), end):
+                pages.append(int(marker.group(1)))
+        return pages
+    
+    def _find_room_sections(self, text: str) -> List[RoomSection]:
+        """
+        Find room sections in text in one streaming pass over its lines
         
-        lines = text.split('\n')
-        current_room = None
-        current_text = []
+        Header precedence per line: a room/space/area/zone keyword (leftmost),
+        then a trailing "(... room ...)" parenthetical, then "(... space ...)"
+        (rightmost), then building, then floor. A section runs from its header
+        line to the next header line.
         
-        for line in lines:
-            line = line.strip()
-            if not line:
+        Args:
+            text: Report text
+            
+        Returns:
+            Room sections as name and offsets into text
+        """
+        room_sections = []
+        current_name = None
+        current_start = 0
+        
+        for line in LINE_PATTERN.finditer(text):
+            name = self._room_header_name(text, line.start(), line.end())
+            if name is None:
                 continue
             
-            # Check if this line is a room header
-            is_room_header = False
-            for pattern in room_header_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    # Save previous room if exists
-                    if current_room:
-                        room_sections.append({
-                            'name': current_room,
-                            'text': '\n'.join(current_text)
-                        })
-                    
-                    # Start new room
-                    current_room = match.group(1).strip()
-                    current_text = [line]
-                    is_room_header = True
-                    break
+            # Close previous room
+            if current_name:
+                room_sections.append(RoomSection(current_name, current_start, line.start()))
             
-            if not is_room_header and current_room:
-                current_text.append(line)
+            current_name = name
+            current_start = line.start()
         
         # Add last room
-        if current_room:
-            room_sections.append({
-                'name': current_room,
-                'text': '\n'.join(current_text)
-            })
+        if current_name:
+            room_sections.append(RoomSection(current_name, current_start, len(text)))
         
         return room_sections
     
+    def _room_header_name(self, text: str, line_start: int, line_end: int) -> Optional[str]:
+        """Get the room name if the line at the given offsets is a room header"""
+        best_rank = None
+        name = None
+        
+        for match in ROOM_HEADER_PATTERN.finditer(text, line_start, line_end):
+            keyword = match.group('keyword')
+            if keyword:
+                rank = ROOM_HEADER_KEYWORD_RANKS[keyword.lower()]
+                if best_rank is None or rank < best_rank:
+                    best_rank, name = rank, text[match.end():line_end]
+                    if rank == 0:
+                        break  # leftmost room/space/area/zone keyword wins outright
+            elif match.start() > line_start:
+                paren = match.group('paren').lower()
+                rank = 1 if 'room' in paren else 2 if 'space' in paren else None
+                # Rightmost parenthetical of the best paren rank
+                if rank is not None and (best_rank is None or rank <= best_rank):
+                    best_rank, name = rank, text[line_start:match.start()]
+        
+        if name is None:
+            return None
+        return name.strip() or None
+    
     def _determine_room_type(self, room_name: str, room_text: str) -> RoomType:
         """Determine room type from name and text"""
         text_to_check = f"{room_name} {room_text}".lower()
         
         for room_type, patterns in self.room_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text_to_check):
-                    return RoomType(room_type)
+            if patterns.contains(text_to_check):
+                return RoomType(room_type)
         
         return RoomType.OFFICE  # Default
     
     def _extract_parameters_from_text(self, text: str) -> Dict[str, float]:
-        """Extract lighting parameters from text"""
-        parameters = {}
+        """
+        Extract lighting parameters from text in a single scan
         
-        for param_name, patterns in self.patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    try:
-                        value = float(match.group(1))
-                        parameters[param_name] = value
-                        break  # Take first match
-                    except (ValueError, IndexError):
-                        continue
+        The text is tokenized once into numbers with their label words, unit
+        and trailing qualifier. Each parameter is resolved from PARAMETER_RULES:
+        the earliest listed matching rule wins, then the earliest occurrence.
         
-        return parameters
+        Args:
+            text: Room section text
+            
+        Returns:
+            Dictionary of parameter values
+        """
+        tokens = [
+            (match.lastgroup, match.group().lower(), match.start(), match.end())
+            for match in PARAMETER_TOKEN_PATTERN.finditer(text)
+        ]
+        
+        best = {}  # parameter -> (rule rank, value)
+        for i, (kind, value, start, end) in enumerate(tokens):
+            if kind != 'num':
+                continue
+            
+            # Label words directly before the number, closest first
+            labels = []
+            position = start
+            j = i - 1
+            while j >= 0 and len(labels) < 3 and tokens[j][0] == 'word':
+                gap = text[tokens[j][3]:position]
+                if not LABEL_GAP_PATTERN.fullmatch(gap):
+                    break
+                labels.append(tokens[j][1])
+                position = tokens[j][2]
+                j -= 1
+            labels = tuple(labels)
+            
+            # Unit directly after the number
+            unit = None
+            k = i + 1
+            if k < len(tokens) and not text[end:tokens[k][2]].strip():
+                unit = UNIT_ALIASES.get(tokens[k][1]) if tokens[k][0] != 'num' else None
+                if unit is None and tokens[k][1] == 'square' and k + 1 < len(tokens) \
+                        and tokens[k + 1][1] in ('meter', 'meters', 'm'):
+                    unit = 'm2'
+                    k += 1
+                if unit is not None:
+                    end = tokens[k][3]
+                    k += 1
+                else:
+                    k = i + 1
+            
+            # Qualifier word after the number/unit, e.g. "500 lux (min)"
+            suffix = None
+            if k < len(tokens) and tokens[k][0] == 'word' and SUFFIX_GAP_PATTERN.fullmatch(text[end:tokens[k][2]]):
+                suffix = tokens[k][1]
+            
+            number = float(value)
+            for rank, rule in enumerate(PARAMETER_RULES):
+                if rule.parameter in best and best[rule.parameter][0] <= rank:
+                    continue
+                if rule.unit and unit != rule.unit:
+                    continue
+                if rule.labels and not any(labels[:len(label)] == label for label in rule.labels):
+                    continue
+                if rule.suffixes and suffix not in rule.suffixes:
+                    continue
+                best[rule.parameter] = (rank, number)
+        
+        return {parameter: value for parameter, (_, value) in best.items()}
     
     def _extract_area(self, text: str, parameters: Dict[str, float]) -> float:
         """Extract room area"""
@@ -450,14 +648,8 @@ class DialuxAnalyzer:
             return parameters['area']
         
         # Try to find area in text
-        area_patterns = [
-            r'(\d+(?:\.\d+)?)\s*(?:m²|m2|square meter)',
-            r'area[:\s]*(\d+(?:\.\d+)?)',
-            r'surface[:\s]*(\d+(?:\.\d+)?)'
-        ]
-        
-        for pattern in area_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in pattern_registry.family('dialux.area'):
+            match = pattern.search(text)
             if match:
                 try:
                     return float(match.group(1))
@@ -482,48 +674,146 @@ class DialuxAnalyzer:
         return rooms
     
     def _extract_room_data_from_table(self, df: pd.DataFrame) -> List[DialuxRoom]:
-        """Extract room data from a single table"""
+        """
+        Extract room data from a single table in one pass
+        
+        Columns are mapped to parameters from their headers once; every room
+        row is then read from the mapped columns. Tables without recognizable
+        headers fall back to a single scan of the table text.
+        
+        Args:
+            df: Extracted table
+            
+        Returns:
+            One room per row that carries a name and at least one value
+        """
+        if df.empty:
+            return []
+        
+        column_parameters = self._map_table_columns(df.columns)
+        if not column_parameters and len(df) > 1:
+            # Header row left in the body (e.g. camelot tables)
+            column_parameters = self._map_table_columns(df.iloc[0])
+            if column_parameters:
+                df = df.iloc[1:]
+        
+        if not column_parameters:
+            return self._extract_room_data_from_table_text(df)
+        
+        # Room names come from the first column not mapped to a parameter
+        name_columns = [i for i in range(df.shape[1]) if i not in column_parameters]
+        names = df.iloc[:, name_columns[0]].astype(str).str.strip() if name_columns else None
+        
+        values = pd.DataFrame({
+            parameter: self._numeric_column(df.iloc[:, position])
+            for position, parameter in column_parameters.items()
+        })
+        has_values = values.notna().any(axis=1).to_numpy()
+        
         rooms = []
+        for row, parameters in enumerate(values.to_dict('records')):
+            room_name = names.iloc[row] if names is not None else f"Room {row + 1}"
+            if not has_values[row] or not room_name or room_name.lower() in ('nan', 'none'):
+                continue
+            parameters = {key: value for key, value in parameters.items() if pd.notna(value)}
+            rooms.append(self._room_from_table_parameters(room_name, parameters))
         
-        # Look for room names in first column or headers
-        room_names = []
-        if not df.empty:
-            # Check first column for room names
-            first_col = df.iloc[:, 0].astype(str)
-            for name in first_col:
-                if self._looks_like_room_name(name):
-                    room_names.append(name)
+        return rooms
+    
+    def _extract_room_data_from_table_text(self, df: pd.DataFrame) -> List[DialuxRoom]:
+        """Extract room data from a table without parameter headers"""
+        # Look for room names in first column
+        room_names = [name for name in df.iloc[:, 0].astype(str) if self._looks_like_room_name(name)]
         
         # If no room names found, create a generic room
         if not room_names:
             room_names = ["General Room"]
         
-        # Extract parameters for each room
-        for room_name in room_names:
-            parameters = self._extract_parameters_from_table(df, room_name)
-            
-            room = DialuxRoom(
-                name=room_name,
-                area=parameters.get('area', 0.0),
-                room_type=self._determine_room_type(room_name, ""),
-                illuminance_avg=parameters.get('illuminance_avg'),
-                illuminance_min=parameters.get('illuminance_min'),
-                illuminance_max=parameters.get('illuminance_max'),
-                uniformity=parameters.get('uniformity'),
-                ugr=parameters.get('ugr'),
-                power_density=parameters.get('power_density'),
-                color_temperature=parameters.get('color_temperature'),
-                color_rendering_index=parameters.get('cri'),
-                luminous_efficacy=parameters.get('luminous_efficacy'),
-                mounting_height=parameters.get('mounting_height')
-            )
-            
-            room.data_completeness = self._calculate_data_completeness(room)
-            room.confidence_score = self._calculate_confidence_score(parameters)
-            
-            rooms.append(room)
+        parameters = self._extract_parameters_from_table(df, room_names[0])
+        return [self._room_from_table_parameters(room_name, parameters) for room_name in room_names]
+    
+    def _room_from_table_parameters(self, room_name: str, parameters: Dict[str, float]) -> DialuxRoom:
+        """Build a room from parameters read from a table"""
+        room = DialuxRoom(
+            name=room_name,
+            area=parameters.get('area', 0.0),
+            room_type=self._determine_room_type(room_name, ""),
+            illuminance_avg=parameters.get('illuminance_avg'),
+            illuminance_min=parameters.get('illuminance_min'),
+            illuminance_max=parameters.get('illuminance_max'),
+            uniformity=parameters.get('uniformity'),
+            ugr=parameters.get('ugr'),
+            power_density=parameters.get('power_density'),
+            color_temperature=parameters.get('color_temperature'),
+            color_rendering_index=parameters.get('cri'),
+            luminous_efficacy=parameters.get('luminous_efficacy'),
+            mounting_height=parameters.get('mounting_height')
+        )
         
-        return rooms
+        room.data_completeness = self._calculate_data_completeness(room)
+        room.confidence_score = self._calculate_confidence_score(parameters)
+        
+        return room
+    
+    def _map_table_columns(self, headers) -> Dict[int, str]:
+        """Map column positions to parameters from their header text, first column per parameter"""
+        column_parameters = {}
+        for position, header in enumerate(headers):
+            parameter = self._header_parameter(str(header))
+            if parameter and parameter not in column_parameters.values():
+                column_parameters[position] = parameter
+        return column_parameters
+    
+    def _header_parameter(self, header: str) -> Optional[str]:
+        """
+        Resolve a column header such as "Em [lx]" or "UGR" to a parameter
+        
+        Rules with a label or qualifier are tried before unit-only rules, in
+        PARAMETER_RULES order, so "E min [lx]" and "Min. illuminance (lx)" map
+        to the minimum rather than the average illuminance. A header without
+        any unit, such as "Emin", is resolved from its labels alone. Cells
+        carrying a number are values, not headers.
+        """
+        words = []
+        units = set()
+        for token in PARAMETER_TOKEN_PATTERN.finditer(header):
+            if token.lastgroup == 'num':
+                return None  # a value, not a header
+            value = token.group().lower()
+            unit = UNIT_ALIASES.get(value)
+            if unit:
+                units.add(unit)
+            if token.lastgroup == 'word':
+                words.append(value)
+        if not words and not units:
+            return None
+        
+        labelled = [rule for rule in PARAMETER_RULES if rule.labels or rule.suffixes]
+        unit_only = [rule for rule in PARAMETER_RULES if not rule.labels and not rule.suffixes]
+        reversed_words = tuple(reversed(words))
+        
+        for rule in labelled + unit_only:
+            if rule.unit and rule.unit not in units and (units or not rule.labels):
+                continue
+            if rule.labels:
+                if any(self._contains_phrase(reversed_words, label) for label in rule.labels):
+                    return rule.parameter
+            elif rule.suffixes:
+                if rule.suffixes.intersection(words):
+                    return rule.parameter
+            else:
+                return rule.parameter
+        return None
+    
+    def _contains_phrase(self, words: Tuple[str, ...], phrase: Tuple[str, ...]) -> bool:
+        """Check if a word sequence contains a phrase as consecutive words"""
+        size = len(phrase)
+        return any(words[i:i + size] == phrase for i in range(len(words) - size + 1))
+    
+    def _numeric_column(self, column: pd.Series) -> pd.Series:
+        """Convert a table column to floats, reading the first number of each cell"""
+        numbers = column.astype(str).str.extract(TABLE_NUMBER_PATTERN, expand=False)
+        return pd.to_numeric(numbers.str.replace(',', '.', regex=False), errors='coerce').reset_index(drop=True)
     
     def _looks_like_room_name(self, text: str) -> bool:
         """Check if text looks like a room name"""
@@ -551,17 +841,8 @@ class DialuxAnalyzer:
         # Convert dataframe to text for pattern matching
         table_text = df.to_string()
         
-        # Extract parameters using patterns
-        for param_name, patterns in self.patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, table_text, re.IGNORECASE)
-                for match in matches:
-                    try:
-                        value = float(match.group(1))
-                        parameters[param_name] = value
-                        break
-                    except (ValueError, IndexError):
-                        continue
+        # Extract parameters with the single-scan tokenizer
+        parameters.update(self._extract_parameters_from_text(table_text))
         
         return parameters
     
@@ -659,47 +940,144 @@ class DialuxAnalyzer:
         
         return applicable if applicable else [StandardType.EN_12464_1]  # Default
     
-    def _select_best_standard(self, rooms: List[DialuxRoom], standards: List[StandardType]) -> StandardType:
-        """Select the best matching standard"""
+    def _standards_to_evaluate(self, applicable: List[StandardType],
+                               requested: Optional[List[StandardType]] = None) -> List[StandardType]:
+        """Get the applicable standards plus any requested ones, without duplicates"""
+        evaluated = list(applicable)
+        for standard in requested or []:
+            if standard not in evaluated:
+                evaluated.append(standard)
+        return evaluated
+    
+    def _select_best_standard(self, standards: List[StandardType], scores: Dict[str, float]) -> StandardType:
+        """Select the best matching applicable standard by score (ties keep applicability order)"""
         if not standards:
             return StandardType.EN_12464_1
         
-        # For now, return the first standard (could be enhanced with scoring)
-        return standards[0]
+        return max(standards, key=lambda standard: scores.get(standard.value, 0.0))
+    
+    def _score_standards(self, rooms: List[DialuxRoom], standards: List[StandardType],
+                         compliance_checks: ComplianceTable) -> Dict[str, float]:
+        """
+        Score how well each standard matches the report
+        
+        The score is the fraction of extracted room parameters that the standard
+        has a requirement for, so a standard covering the report's room types
+        and parameters ranks above one that can only check a few values.
+        """
+        scores = {}
+        
+        for standard in standards:
+            checked = 0
+            available = 0
+            for room_index, room in enumerate(rooms):
+                actual_values = self._room_actual_values(room)
+                available += len(actual_values)
+                checked += len(set(compliance_checks.parameters(room_index, standard)))
+            scores[standard.value] = checked / available if available else 0.0
+        
+        return scores
+    
+    def _room_actual_values(self, room: DialuxRoom) -> Dict[str, float]:
+        """Get the room values that are checked for compliance"""
+        actual_values = {}
+        if room.illuminance_avg is not None:
+            actual_values['illuminance'] = room.illuminance_avg
+        if room.uniformity is not None:
+            actual_values['uniformity'] = room.uniformity
+        if room.ugr is not None:
+            actual_values['ugr'] = room.ugr
+        if room.power_density is not None:
+            actual_values['power_density'] = room.power_density
+        return actual_values
     
     def _check_compliance(self, rooms: List[DialuxRoom], standard: StandardType) -> Dict[str, float]:
         """Check compliance for all rooms against standard"""
-        compliance_results = {}
-        
-        for room in rooms:
-            # Prepare actual values
-            actual_values = {}
-            if room.illuminance_avg is not None:
-                actual_values['illuminance'] = room.illuminance_avg
-            if room.uniformity is not None:
-                actual_values['uniformity'] = room.uniformity
-            if room.ugr is not None:
-                actual_values['ugr'] = room.ugr
-            if room.power_density is not None:
-                actual_values['power_density'] = room.power_density
-            
-            # Check compliance
-            room_compliance = self.standards_processor.check_compliance(
-                actual_values, room.room_type, standard
-            )
+        compliance_checks = ComplianceTable()
+        compliance_by_standard = self._check_compliance_all(rooms, [standard], compliance_checks)
+        for room_index, room in enumerate(rooms):
+            room.compliance_results = compliance_checks.results(room_index, standard)
+        return compliance_by_standard[standard.value]
+    
+    def _check_compliance_all(self, rooms: List[DialuxRoom], standards: List[StandardType],
+                              compliance_checks: ComplianceTable) -> Dict[str, Dict[str, float]]:
+        """
+        Check compliance for all rooms against every standard
+        
+        Args:
+            rooms: Rooms to check
+            standards: Standards to check against
+            compliance_checks: Table receiving every room's results per standard
             
-            room.compliance_results = room_compliance
+        Returns:
+            Compliance rate keyed by standard then room name
+        """
+        compliance_by_standard = {standard.value: {} for standard in standards}
+        
+        for room_index, room in enumerate(rooms):
+            # Prepare actual values once per room
+            actual_values = self._room_actual_values(room)
             
-            # Calculate compliance rate for this room
-            if room_compliance:
-                compliant_count = sum(1 for result in room_compliance if result.is_compliant)
-                room_compliance_rate = compliant_count / len(room_compliance)
-            else:
-                room_compliance_rate = 0.0
+            for standard in standards:
+                room_compliance = self.standards_processor.check_compliance(
+                    actual_values, room.room_type, standard
+                )
+                compliance_checks.add_results(room_index, standard, room_compliance)
+                
+                # Calculate compliance rate for this room
+                if room_compliance:
+                    compliant_count = sum(1 for result in room_compliance if result.is_compliant)
+                    room_compliance_rate = compliant_count / len(room_compliance)
+                else:
+                    room_compliance_rate = 0.0
+                
+                compliance_by_standard[standard.value][room.name] = room_compliance_rate
+        
+        return compliance_by_standard
+    
+    def _apply_standard(self, report: DialuxReport, standard: StandardType):
+        """Point the report's compliance views at one of the evaluated standards"""
+        report.selected_standard = standard
+        report.standards_compliance = report.compliance_by_standard.get(standard.value, {})
+        for room_index, room in enumerate(report.rooms):
+            room.compliance_results = report.compliance_checks.results(room_index, standard)
+        
+        if report.standards_compliance:
+            report.overall_compliance_rate = np.mean(list(report.standards_compliance.values()))
+        else:
+            report.overall_compliance_rate = 0.0
+    
+    def select_standard(self, analysis_result: DialuxAnalysisResult,
+                        standard: Union[StandardType, str]) -> DialuxAnalysisResult:
+        """
+        Switch an analysis result to another evaluated standard without re-extraction
+        
+        Args:
+            analysis_result: Result returned by analyze_dialux_report
+            standard: Standard to display
             
-            compliance_results[room.name] = room_compliance_rate
+        Returns:
+            Analysis result with summary, recommendations and issues for that standard
+        """
+        standard = StandardType(standard)
+        report = analysis_result.report
+        
+        if standard.value not in report.compliance_by_standard:
+            # Not evaluated yet: check the already-extracted room values only
+            report.compliance_by_standard.update(
+                self._check_compliance_all(report.rooms, [standard], report.compliance_checks))
+            report.standard_scores.update(
+                self._score_standards(report.rooms, [standard], report.compliance_checks))
+        
+        self._apply_standard(report, standard)
         
-        return compliance_results
+        return DialuxAnalysisResult(
+            report=report,
+            compliance_summary=self._generate_compliance_summary(report),
+            recommendations=self._generate_recommendations(report),
+            critical_issues=self._identify_critical_issues(report),
+            export_paths=analysis_result.export_paths
+        )
     
     def _generate_analysis_result(self, report: DialuxReport, pdf_path: Path) -> DialuxAnalysisResult:
         """Generate complete analysis result"""
@@ -812,37 +1190,12 @@ class DialuxAnalyzer:
         return critical_issues
     
     def _export_analysis_results(self, report: DialuxReport, pdf_path: Path) -> Dict[str, str]:
-        """Export analysis results to various formats"""
-        output_dir = Path(self.config.dialux_output_dir)
-        output_dir.mkdir(exist_ok=True)
-        
-        base_name = pdf_path.stem
-        export_paths = {}
-        
-        # Export JSON
-        json_path = output_dir / f"{base_name}_analysis.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(asdict(report), f, indent=2, ensure_ascii=False, default=str)
-        export_paths["json"] = str(json_path)
-        
-        # Export CSV summary
-        csv_path = output_dir / f"{base_name}_summary.csv"
-        summary_data = []
-        for room in report.rooms:
-            summary_data.append({
-                "room_name": room.name,
-                "room_type": room.room_type.value,
-                "area": room.area,
-                "illuminance_avg": room.illuminance_avg,
-                "uniformity": room.uniformity,
-                "ugr": room.ugr,
-                "power_density": room.power_density,
-                "data_completeness": room.data_completeness,
-                "confidence_score": room.confidence_score
-            })
-        
-        df = pd.DataFrame(summary_data)
-        df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-        export_paths["csv"] = str(csv_path)
-        
-        return export_paths
+        """Export analysis results in the configured formats"""
+        if not self.config.write_exports:
+            return {}
+        return self.exporter.export(report, pdf_path.stem, self.config.export_formats,
+                                    compact_json=self.config.compact_json_export)
+    
+    def wait_for_exports(self, timeout: Optional[float] = None):
+        """Wait for the XLSX and PDF exports still being written in the background"""
+        self.exporter.wait(timeout)
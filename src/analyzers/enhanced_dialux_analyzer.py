@@ -6,22 +6,28 @@ import os
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Callable
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
 try:
     from ..core.config import config
     from ..extractors.openai_extractor import OpenAIIntelligentExtractor, IntelligentExtractionResult
-    from ..standards.standards_processor import StandardsProcessor, RoomType, StandardType, ComplianceResult
+    from ..standards.standards_processor import (StandardsProcessor, RoomType, StandardType, ComplianceResult,
+                                                 DATACLASS_SLOTS)
+    from .result_cache import AnalysisResultCache
+    from ..utils.json_export import write_json
 except ImportError:
     from core.config import config
     from extractors.openai_extractor import OpenAIIntelligentExtractor, IntelligentExtractionResult
-    from standards.standards_processor import StandardsProcessor, RoomType, StandardType, ComplianceResult
+    from standards.standards_processor import (StandardsProcessor, RoomType, StandardType, ComplianceResult,
+                                               DATACLASS_SLOTS)
+    from analyzers.result_cache import AnalysisResultCache
+    from utils.json_export import write_json
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EnhancedRoomAnalysis:
     """Enhanced room analysis with OpenAI extraction + standards compliance"""
     room_name: str
@@ -91,11 +97,14 @@ class EnhancedAnalysisResult:
 class EnhancedDialuxAnalyzer:
     """Enhanced Dialux analyzer with OpenAI integration"""
     
+    # Bump when the OpenAI extraction changes so cached extractions are not reused
+    ANALYZER_VERSION = "2"
+    
     def __init__(self, openai_api_key: str = None):
         """Initialize the enhanced analyzer"""
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
         
-        if not self.openai_api_key:
+        if not self.openai_api_key and not config.llm.offline:
             raise ValueError("OpenAI API key is required for enhanced analysis")
         
         # Initialize OpenAI extractor
@@ -104,26 +113,61 @@ class EnhancedDialuxAnalyzer:
         # Initialize standards processor
         self.standards_processor = StandardsProcessor()
         
+        self.result_cache = AnalysisResultCache(config.dialux.result_cache_dir, config.dialux.result_cache_enabled)
+        
         logger.info("Enhanced Dialux Analyzer initialized with OpenAI integration")
     
-    def analyze_dialux_report(self, pdf_path: Union[str, Path]) -> EnhancedAnalysisResult:
-        """Analyze Dialux report using OpenAI extraction + standards comparison"""
+    def analyze_dialux_report(self, pdf_path: Union[str, Path],
+                              progress: Optional[Callable[[str], None]] = None) -> EnhancedAnalysisResult:
+        """
+        Analyze Dialux report using OpenAI extraction + standards comparison
+        
+        Args:
+            pdf_path: Path to the PDF report
+            progress: Called with each stage name as it starts (text_extraction,
+                rooms, compliance, export)
+        
+        Returns:
+            Enhanced analysis result
+        """
         start_time = datetime.now()
         pdf_path = Path(pdf_path)
+        progress = progress or (lambda stage: None)
         
         logger.info(f"Starting enhanced Dialux analysis: {pdf_path}")
         
         try:
-            # Step 1: Use OpenAI for intelligent extraction
+            # Reuse the complete result unless the document, analyzer or standards database changed
+            document_key = self.result_cache.document_key(pdf_path, "enhanced", self.ANALYZER_VERSION,
+                                                           config.llm.extraction_model, config.llm.chunk_chars,
+                                                           config.llm.extraction_token_budget)
+            result_key = self.result_cache.result_key(document_key, self.standards_processor.database_revision,
+                                                      config.dialux.compact_json_export)
+            cached_result = self.result_cache.load(AnalysisResultCache.RESULT, result_key)
+            if cached_result is not None:
+                export_paths = cached_result.export_paths
+                if not export_paths or not all(Path(path).exists() for path in export_paths.values()):
+                    cached_result.export_paths = self._export_enhanced_results(cached_result.report, pdf_path)
+                cached_result.processing_time = (datetime.now() - start_time).total_seconds()
+                logger.info(f"Enhanced analysis reused from cache in {cached_result.processing_time:.2f}s")
+                return cached_result
+            
+            # Step 1: Use OpenAI for intelligent extraction, reused when only the standards database changed
             logger.info("Step 1: Using OpenAI for intelligent data extraction...")
-            extraction_result = self.openai_extractor.extract_intelligent_data(pdf_path)
+            progress("text_extraction")
+            extraction_result = self.result_cache.load(AnalysisResultCache.EXTRACTION, document_key)
+            if extraction_result is None:
+                extraction_result = self.openai_extractor.extract_intelligent_data(pdf_path)
+                self.result_cache.store(AnalysisResultCache.EXTRACTION, document_key, extraction_result)
             
             # Step 2: Create enhanced report from OpenAI extraction
             logger.info("Step 2: Creating enhanced report...")
+            progress("rooms")
             report = self._create_enhanced_report(extraction_result)
             
             # Step 3: Perform standards compliance checking
             logger.info("Step 3: Performing standards compliance checking...")
+            progress("compliance")
             self._perform_compliance_checking(report)
             
             # Step 4: Generate recommendations and critical issues
@@ -133,6 +177,7 @@ class EnhancedDialuxAnalyzer:
             
             # Step 5: Export results
             logger.info("Step 5: Exporting results...")
+            progress("export")
             export_paths = self._export_enhanced_results(report, pdf_path)
             
             # Calculate total processing time
@@ -140,7 +185,7 @@ class EnhancedDialuxAnalyzer:
             
             logger.info(f"Enhanced analysis completed in {processing_time:.2f}s")
             
-            return EnhancedAnalysisResult(
+            analysis_result = EnhancedAnalysisResult(
                 report=report,
                 recommendations=recommendations,
                 critical_issues=critical_issues,
@@ -148,7 +193,9 @@ class EnhancedDialuxAnalyzer:
                 extraction_confidence=extraction_result.extraction_confidence,
                 processing_time=processing_time
             )
-            
+            self.result_cache.store(AnalysisResultCache.RESULT, result_key, analysis_result)
+            return analysis_result
+        
         except Exception as e:
             logger.error(f"Enhanced analysis failed: {e}")
             raise
@@ -410,6 +457,8 @@ class EnhancedDialuxAnalyzer:
     
     def _export_enhanced_results(self, report: EnhancedDialuxReport, pdf_path: Path) -> Dict[str, str]:
         """Export enhanced analysis results"""
+        if not config.dialux.write_exports:
+            return {}
         output_dir = Path(config.dialux_output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
@@ -420,8 +469,7 @@ class EnhancedDialuxAnalyzer:
         
         # Export as JSON
         json_path = output_dir / f"{base_name}_enhanced_{timestamp}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(asdict(report), f, indent=2, ensure_ascii=False, default=str)
+        write_json(report, json_path, compact=config.dialux.compact_json_export)
         export_paths['json'] = str(json_path)
         
         # Export detailed report
@@ -6,22 +6,28 @@ import os
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Callable
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
 try:
     from ..core.config import config
     from ..extractors.focused_extractor import FocusedExtractor, FocusedExtractionResult
-    from ..standards.standards_processor import StandardsProcessor, RoomType, StandardType, ComplianceResult
+    from ..standards.standards_processor import (StandardsProcessor, RoomType, StandardType, ComplianceResult,
+                                                 DATACLASS_SLOTS)
+    from .result_cache import AnalysisResultCache
+    from ..utils.json_export import write_json
 except ImportError:
     from core.config import config
     from extractors.focused_extractor import FocusedExtractor, FocusedExtractionResult
-    from standards.standards_processor import StandardsProcessor, RoomType, StandardType, ComplianceResult
+    from standards.standards_processor import (StandardsProcessor, RoomType, StandardType, ComplianceResult,
+                                               DATACLASS_SLOTS)
+    from analyzers.result_cache import AnalysisResultCache
+    from utils.json_export import write_json
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FastRoomAnalysis:
     """Fast room analysis with compliance"""
     room_name: str
@@ -82,6 +88,9 @@ class FastAnalysisResult:
 class FastDialuxAnalyzer:
     """Fast Dialux analyzer with focused extraction"""
     
+    # Bump when focused extraction changes so cached extractions are not reused
+    ANALYZER_VERSION = "2"
+    
     def __init__(self, openai_api_key: str = None):
         """Initialize the fast analyzer"""
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
@@ -92,26 +101,88 @@ class FastDialuxAnalyzer:
         # Initialize standards processor
         self.standards_processor = StandardsProcessor()
         
+        self.result_cache = AnalysisResultCache(config.dialux.result_cache_dir, config.dialux.result_cache_enabled)
+        
         logger.info("Fast Dialux Analyzer initialized")
     
-    def analyze_dialux_report(self, pdf_path: Union[str, Path]) -> FastAnalysisResult:
-        """Analyze Dialux report quickly"""
+    def _document_key(self, pdf_path: Path) -> str:
+        """Cache key of a document's focused extraction"""
+        return self.result_cache.document_key(pdf_path, "fast", self.ANALYZER_VERSION,
+                                              self.focused_extractor.openai_available,
+                                              config.llm.company_token_budget,
+                                              self.focused_extractor.company_index.revision,
+                                              config.llm.company_local_confidence)
+    
+    def extract_for_batch(self, pdf_path: Union[str, Path]) -> Optional[FocusedExtractionResult]:
+        """
+        Focused extraction for a batch run, with company names left to a cross-document request
+        
+        Returns:
+            Extraction result with pending_company_text set, or None if the
+            extraction is already cached
+        """
+        pdf_path = Path(pdf_path)
+        if self.result_cache.load(AnalysisResultCache.EXTRACTION, self._document_key(pdf_path)) is not None:
+            return None
+        return self.focused_extractor.extract_focused_data(pdf_path, resolve_companies=False)
+    
+    def analyze_dialux_report(self, pdf_path: Union[str, Path],
+                              extraction_result: Optional[FocusedExtractionResult] = None,
+                              progress: Optional[Callable[[str], None]] = None) -> FastAnalysisResult:
+        """
+        Analyze Dialux report quickly
+        
+        Args:
+            pdf_path: Path to the PDF report
+            extraction_result: Focused extraction done beforehand, e.g. by a
+                batch run that resolved company names across documents
+            progress: Called with each stage name as it starts (text_extraction,
+                rooms, compliance, export)
+        
+        Returns:
+            Fast analysis result
+        """
         start_time = datetime.now()
         pdf_path = Path(pdf_path)
+        progress = progress or (lambda stage: None)
         
         logger.info(f"Starting fast Dialux analysis: {pdf_path}")
         
         try:
-            # Step 1: Fast focused extraction
+            # Reuse the complete result unless the document, analyzer or standards database changed
+            document_key = self._document_key(pdf_path)
+            result_key = self.result_cache.result_key(document_key, self.standards_processor.database_revision,
+                                                      config.dialux.compact_json_export)
+            cached_result = self.result_cache.load(AnalysisResultCache.RESULT, result_key)
+            if cached_result is not None:
+                export_paths = cached_result.export_paths
+                if not export_paths or not all(Path(path).exists() for path in export_paths.values()):
+                    cached_result.export_paths = self._export_fast_results(cached_result.report, pdf_path)
+                cached_result.processing_time = (datetime.now() - start_time).total_seconds()
+                logger.info(f"Fast analysis reused from cache in {cached_result.processing_time:.2f}s")
+                return cached_result
+            
+            # Step 1: Fast focused extraction, reused when only the standards database changed
             logger.info("Step 1: Fast focused extraction...")
-            extraction_result = self.focused_extractor.extract_focused_data(pdf_path)
+            progress("text_extraction")
+            if extraction_result is None:
+                extraction_result = self.result_cache.load(AnalysisResultCache.EXTRACTION, document_key)
+                if extraction_result is None:
+                    extraction_result = self.focused_extractor.extract_focused_data(pdf_path)
+                    self.result_cache.store(AnalysisResultCache.EXTRACTION, document_key, extraction_result)
+            else:
+                if extraction_result.pending_company_text is not None:
+                    self.focused_extractor.resolve_companies_batch([extraction_result])
+                self.result_cache.store(AnalysisResultCache.EXTRACTION, document_key, extraction_result)
             
             # Step 2: Create fast report
             logger.info("Step 2: Creating fast report...")
+            progress("rooms")
             report = self._create_fast_report(extraction_result)
             
             # Step 3: Quick compliance checking
             logger.info("Step 3: Quick compliance checking...")
+            progress("compliance")
             self._perform_fast_compliance_checking(report)
             
             # Step 4: Generate recommendations
@@ -121,6 +192,7 @@ class FastDialuxAnalyzer:
             
             # Step 5: Export results
             logger.info("Step 5: Exporting results...")
+            progress("export")
             export_paths = self._export_fast_results(report, pdf_path)
             
             # Calculate total processing time
@@ -128,7 +200,7 @@ class FastDialuxAnalyzer:
             
             logger.info(f"Fast analysis completed in {processing_time:.2f}s")
             
-            return FastAnalysisResult(
+            analysis_result = FastAnalysisResult(
                 report=report,
                 recommendations=recommendations,
                 critical_issues=critical_issues,
@@ -136,7 +208,9 @@ class FastDialuxAnalyzer:
                 extraction_confidence=extraction_result.extraction_confidence,
                 processing_time=processing_time
             )
-            
+            self.result_cache.store(AnalysisResultCache.RESULT, result_key, analysis_result)
+            return analysis_result
+        
         except Exception as e:
             logger.error(f"Fast analysis failed: {e}")
             raise
@@ -552,6 +626,8 @@ class FastDialuxAnalyzer:
     
     def _export_fast_results(self, report: FastDialuxReport, pdf_path: Path) -> Dict[str, str]:
         """Export fast results"""
+        if not config.dialux.write_exports:
+            return {}
         output_dir = Path(config.dialux_output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
@@ -562,8 +638,7 @@ class FastDialuxAnalyzer:
         
         # Export as JSON
         json_path = output_dir / f"{base_name}_fast_{timestamp}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(asdict(report), f, indent=2, ensure_ascii=False, default=str)
+        write_json(report, json_path, compact=config.dialux.compact_json_export)
         export_paths['json'] = str(json_path)
         
         # Export detailed report
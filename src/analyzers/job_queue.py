@@ -0,0 +1,407 @@
+"""
+Background Analysis Jobs
+SQLite-backed job table and per-type worker pools reporting the stage each analysis is in
+"""
+import os
+import json
+import time
+import uuid
+import pickle
+import hashlib
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, Future
+
+try:
+    from .batch_analyzer import ANALYZER_TYPES, create_analyzer
+    from ..core.config import config
+except ImportError:
+    from analyzers.batch_analyzer import ANALYZER_TYPES, create_analyzer
+    from core.config import config
+
+logger = logging.getLogger(__name__)
+
+# Stages reported by the analyzers, in order; a job's progress is the share of stages reached
+JOB_STAGES = ("text_extraction", "tables", "rooms", "compliance", "export")
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    job_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    stage TEXT,
+    progress REAL NOT NULL DEFAULT 0,
+    file_name TEXT,
+    pdf_path TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    options TEXT NOT NULL,
+    owner_pid INTEGER,
+    result_path TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_by_document ON jobs (sha256, job_type, status);
+"""
+
+@dataclass
+class Job:
+    """One analysis job and its progress"""
+    job_id: str
+    job_type: str
+    status: str
+    pdf_path: str
+    sha256: str
+    file_name: Optional[str] = None
+    options: Dict[str, Any] = field(default_factory=dict)
+    stage: Optional[str] = None
+    progress: float = 0.0
+    owner_pid: Optional[int] = None  # process whose pool runs the job
+    result_path: Optional[str] = None
+    error: Optional[str] = None
+    created_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    
+    @property
+    def done(self) -> bool:
+        """Whether the job completed or failed"""
+        return self.status not in ACTIVE_STATUSES
+
+def _options_key(options: Dict[str, Any]) -> str:
+    return json.dumps(options, sort_keys=True)
+
+def _process_alive(pid: Optional[int]) -> bool:
+    """Check if a process exists"""
+    if pid is None:
+        return False
+    if pid == os.getpid():
+        return True
+    if os.name == 'nt':
+        # os.kill terminates processes on Windows, so other owners are treated as gone
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+class JobStore:
+    """Job table shared by the web processes and the worker processes"""
+    
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connect()
+        try:
+            # Write-ahead logging lets pages poll while workers record their progress
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+        finally:
+            connection.close()
+    
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        return connection
+    
+    def _execute(self, sql: str, params: Tuple = ()) -> List[sqlite3.Row]:
+        """Run one statement on its own connection, so the store is safe across threads and processes"""
+        connection = self._connect()
+        try:
+            return connection.execute(sql, params).fetchall()
+        finally:
+            connection.close()
+    
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> Job:
+        values = dict(row)
+        values['options'] = json.loads(values['options'])
+        return Job(**values)
+    
+    def add(self, job: Job):
+        """Insert a new job"""
+        self._execute(
+            "INSERT INTO jobs (job_id, job_type, status, stage, progress, file_name, pdf_path, sha256, "
+            "options, owner_pid, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (job.job_id, job.job_type, job.status, job.stage, job.progress, job.file_name, job.pdf_path,
+             job.sha256, _options_key(job.options), job.owner_pid, job.created_at)
+        )
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job"""
+        rows = self._execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
+        return self._to_job(rows[0]) if rows else None
+    
+    def find_active(self, job_type: str, sha256: str, options: Dict[str, Any]) -> Optional[Job]:
+        """Queued or running job of the same document, analyzer and options"""
+        rows = self._execute(
+            "SELECT * FROM jobs WHERE sha256 = ? AND job_type = ? AND status IN (?, ?) AND options = ? "
+            "ORDER BY created_at LIMIT 1",
+            (sha256, job_type, QUEUED, RUNNING, _options_key(options))
+        )
+        return self._to_job(rows[0]) if rows else None
+    
+    def has_active(self, sha256: str) -> bool:
+        """Check if any queued or running job uses a document"""
+        rows = self._execute("SELECT 1 FROM jobs WHERE sha256 = ? AND status IN (?, ?) LIMIT 1",
+                             (sha256, QUEUED, RUNNING))
+        return bool(rows)
+    
+    def list_jobs(self, limit: int = 50) -> List[Job]:
+        """Most recent jobs first"""
+        rows = self._execute("SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,))
+        return [self._to_job(row) for row in rows]
+    
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status"""
+        rows = self._execute("SELECT status, COUNT(*) AS count FROM jobs GROUP BY status")
+        return {row['status']: row['count'] for row in rows}
+    
+    def start(self, job_id: str):
+        """Mark a job as picked up by a worker"""
+        self._execute("UPDATE jobs SET status = ?, started_at = ? WHERE job_id = ?",
+                      (RUNNING, time.time(), job_id))
+    
+    def set_stage(self, job_id: str, stage: str):
+        """Record the stage a running job entered"""
+        progress = JOB_STAGES.index(stage) / len(JOB_STAGES) if stage in JOB_STAGES else None
+        self._execute("UPDATE jobs SET stage = ?, progress = COALESCE(?, progress) WHERE job_id = ?",
+                      (stage, progress, job_id))
+    
+    def complete(self, job_id: str, result_path: str):
+        """Mark a job as completed with its pickled result"""
+        self._execute(
+            "UPDATE jobs SET status = ?, progress = 1, result_path = ?, finished_at = ? WHERE job_id = ?",
+            (COMPLETED, result_path, time.time(), job_id)
+        )
+    
+    def fail(self, job_id: str, error: str):
+        """Mark an unfinished job as failed"""
+        self._execute(
+            "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE job_id = ? AND status IN (?, ?)",
+            (FAILED, error, time.time(), job_id, QUEUED, RUNNING)
+        )
+    
+    def fail_orphaned(self) -> int:
+        """
+        Fail unfinished jobs whose owning process is gone
+        
+        Returns:
+            Number of jobs marked as failed
+        """
+        rows = self._execute("SELECT job_id, owner_pid FROM jobs WHERE status IN (?, ?)", (QUEUED, RUNNING))
+        orphaned = [row['job_id'] for row in rows if not _process_alive(row['owner_pid'])]
+        for job_id in orphaned:
+            self.fail(job_id, "Interrupted: the server running the job stopped")
+        if orphaned:
+            logger.warning(f"Marked {len(orphaned)} interrupted jobs as failed")
+        return len(orphaned)
+    
+    def prune(self, max_age_seconds: float) -> List[Job]:
+        """
+        Delete finished jobs older than max_age_seconds
+        
+        Returns:
+            Deleted jobs, so their result files can be removed
+        """
+        cutoff = time.time() - max_age_seconds
+        rows = self._execute("SELECT * FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                             (COMPLETED, FAILED, cutoff))
+        jobs = [self._to_job(row) for row in rows]
+        for job in jobs:
+            self._execute("DELETE FROM jobs WHERE job_id = ?", (job.job_id,))
+        return jobs
+
+# Analyzers of the current worker process, by type and API key
+_worker_analyzers: Dict[Tuple[str, Optional[str]], Any] = {}
+
+def _init_job_worker(log_level: int):
+    logging.getLogger().setLevel(log_level)
+
+def _run_job(job_id: str, job_type: str, pdf_path: str, options: Dict[str, Any],
+             api_key: Optional[str], db_path: str, results_dir: str) -> str:
+    """Run one job in a worker process and pickle its result; returns the result path"""
+    store = JobStore(db_path)
+    store.start(job_id)
+    
+    analyzer = _worker_analyzers.get((job_type, api_key))
+    if analyzer is None:
+        analyzer = _worker_analyzers[(job_type, api_key)] = create_analyzer(job_type, api_key)
+    
+    def progress(stage: str):
+        store.set_stage(job_id, stage)
+    
+    if job_type == "standard":
+        try:
+            from ..standards.standards_processor import StandardType
+        except ImportError:
+            from standards.standards_processor import StandardType
+        standards = [StandardType(name) for name in options.get('standards', [])]
+        result = analyzer.analyze_dialux_report(pdf_path, standards=standards, progress=progress)
+    else:
+        result = analyzer.analyze_dialux_report(pdf_path, progress=progress)
+    if hasattr(analyzer, 'wait_for_exports'):
+        analyzer.wait_for_exports()
+    
+    result_path = Path(results_dir) / f"{job_id}.pkl"
+    result_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = result_path.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, result_path)
+    
+    store.complete(job_id, str(result_path))
+    return str(result_path)
+
+class JobQueue:
+    """
+    Runs analyses in the background, one worker pool per analyzer type
+    
+    Jobs and their progress live in a SQLite table, so any page or session
+    can poll them. Uploads are stored by content hash, and submitting a
+    document that is already queued or running with the same analyzer and
+    options returns the existing job.
+    """
+    
+    def __init__(self, db_path: Optional[Union[str, Path]] = None,
+                 results_dir: Optional[Union[str, Path]] = None,
+                 uploads_dir: Optional[Union[str, Path]] = None,
+                 concurrency: Optional[Dict[str, int]] = None):
+        self.store = JobStore(db_path or config.web.job_db_path)
+        self.results_dir = Path(results_dir or config.web.job_results_dir)
+        self.uploads_dir = Path(uploads_dir or config.web.job_uploads_dir)
+        self.concurrency = dict(concurrency or config.web.job_concurrency)
+        self._executors: Dict[str, ProcessPoolExecutor] = {}
+        self._lock = threading.Lock()
+        
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        self.uploads_dir.mkdir(parents=True, exist_ok=True)
+        self.store.fail_orphaned()
+        self.prune()
+    
+    def _executor(self, job_type: str) -> ProcessPoolExecutor:
+        """Worker pool of an analyzer type, started on first use"""
+        executor = self._executors.get(job_type)
+        if executor is None:
+            workers = max(1, int(self.concurrency.get(job_type, 1)))
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_job_worker,
+                                           initargs=(logging.getLogger().level,))
+            self._executors[job_type] = executor
+            logger.info(f"Started {workers} {job_type} job workers")
+        return executor
+    
+    def _store_upload(self, pdf: Union[str, Path, bytes]) -> Tuple[Path, str]:
+        """Copy an upload into the content-addressed upload directory"""
+        data = pdf if isinstance(pdf, bytes) else Path(pdf).read_bytes()
+        sha256 = hashlib.sha256(data).hexdigest()
+        upload_path = self.uploads_dir / f"{sha256}.pdf"
+        if not upload_path.exists():
+            tmp_path = upload_path.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, upload_path)
+        return upload_path, sha256
+    
+    def submit(self, job_type: str, pdf: Union[str, Path, bytes], file_name: Optional[str] = None,
+               options: Optional[Dict[str, Any]] = None, api_key: Optional[str] = None) -> Job:
+        """
+        Queue an analysis
+        
+        Args:
+            job_type: Analyzer type, one of "standard", "fast" or "enhanced"
+            pdf: Path or content of the PDF report; the queue keeps its own copy
+            file_name: Name shown for the upload
+            options: Analyzer options; "standards" lists additional standards of the standard analyzer
+            api_key: OpenAI API key of the fast and enhanced analyzers, passed to the worker and never stored
+        
+        Returns:
+            The new job, or the queued or running job of the same document
+        """
+        if job_type not in ANALYZER_TYPES:
+            raise ValueError(f"Unknown analyzer type: {job_type}")
+        options = options or {}
+        
+        with self._lock:
+            upload_path, sha256 = self._store_upload(pdf)
+            active = self.store.find_active(job_type, sha256, options)
+            if active is not None:
+                logger.info(f"Reusing {active.status} job {active.job_id} for {file_name or sha256[:12]}")
+                return active
+            
+            job = Job(
+                job_id=uuid.uuid4().hex,
+                job_type=job_type,
+                status=QUEUED,
+                pdf_path=str(upload_path),
+                sha256=sha256,
+                file_name=file_name or (None if isinstance(pdf, bytes) else Path(pdf).name),
+                options=options,
+                owner_pid=os.getpid(),
+                created_at=time.time()
+            )
+            self.store.add(job)
+            future = self._executor(job_type).submit(
+                _run_job, job.job_id, job_type, job.pdf_path, options, api_key or None,
+                str(self.store.db_path), str(self.results_dir)
+            )
+        
+        logger.info(f"Queued {job_type} job {job.job_id} for {job.file_name}")
+        future.add_done_callback(lambda done: self._job_finished(job.job_id, sha256, done))
+        return job
+    
+    def _job_finished(self, job_id: str, sha256: str, future: Future):
+        """Record failures, including crashed workers, and drop uploads no longer needed"""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Job {job_id} failed: {error}")
+            self.store.fail(job_id, str(error) or type(error).__name__)
+        
+        with self._lock:
+            if not self.store.has_active(sha256):
+                (self.uploads_dir / f"{sha256}.pdf").unlink(missing_ok=True)
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        """Current state of a job"""
+        return self.store.get(job_id)
+    
+    def result(self, job_id: str) -> Any:
+        """
+        Result of a completed job
+        
+        Raises:
+            KeyError: If the job does not exist or has no result
+        """
+        job = self.store.get(job_id)
+        if job is None or job.status != COMPLETED or not job.result_path:
+            raise KeyError(f"No result for job {job_id}")
+        with open(job.result_path, 'rb') as f:
+            return pickle.load(f)
+    
+    def prune(self) -> int:
+        """Remove finished jobs past the retention period and their results"""
+        jobs = self.store.prune(config.web.job_retention_days * 86400)
+        for job in jobs:
+            if job.result_path:
+                Path(job.result_path).unlink(missing_ok=True)
+        if jobs:
+            logger.info(f"Removed {len(jobs)} finished jobs")
+        return len(jobs)
+    
+    def shutdown(self, wait: bool = True):
+        """Stop the worker pools"""
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait)
+        self._executors.clear()
@@ -0,0 +1,396 @@
+"""
+Portfolio Store for Dialux Analysis Results
+Columnar store of rooms and compliance checks across many reports, with vectorized group-by statistics
+"""
+import os
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Union, Iterable, Sequence
+from dataclasses import asdict, is_dataclass
+from enum import Enum
+
+import numpy as np
+import pandas as pd
+
+try:
+    from ..standards.standards_processor import compliance_dict_factory
+except ImportError:
+    from standards.standards_processor import compliance_dict_factory
+
+logger = logging.getLogger(__name__)
+
+# Columns per table: categorical columns are stored as int32 codes into a shared vocabulary
+TABLE_COLUMNS = {
+    'rooms': {
+        'categories': ('project', 'report', 'room_type', 'manufacturer', 'standard'),
+        'values': ('area', 'illuminance_avg', 'illuminance_min', 'illuminance_max', 'uniformity', 'ugr',
+                   'power_density', 'color_temperature', 'color_rendering_index', 'luminous_efficacy',
+                   'compliance_rate')
+    },
+    'compliance': {
+        'categories': ('project', 'report', 'room_type', 'manufacturer', 'standard', 'parameter'),
+        'values': ('required_value', 'actual_value', 'compliance_percentage', 'is_compliant')
+    }
+}
+
+DEFAULT_STATISTICS = ('count', 'mean', 'median', 'min', 'max')
+MISSING_LABEL = "unknown"
+
+def grouped_statistics(codes: np.ndarray, values: np.ndarray, n_groups: int,
+                       statistics: Sequence[str] = DEFAULT_STATISTICS) -> Dict[str, np.ndarray]:
+    """
+    Compute statistics of values per group code, ignoring NaN values
+    
+    Sums use bincount; order statistics sort by value, then stably by group,
+    and read each group's quantiles from its slice of the sorted values.
+    
+    Args:
+        codes: Group code per row, 0 <= code < n_groups
+        values: Value per row
+        n_groups: Number of groups
+        statistics: Any of count, sum, mean, std, min, max, median and pNN percentiles
+    
+    Returns:
+        Dictionary of statistic name to one value per group
+    """
+    present = ~np.isnan(values)
+    codes = codes[present]
+    values = values[present]
+    
+    counts = np.bincount(codes, minlength=n_groups)
+    sums = np.bincount(codes, weights=values, minlength=n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+    
+    result = {}
+    sorted_values = None
+    for statistic in statistics:
+        if statistic == 'count':
+            result[statistic] = counts
+        elif statistic == 'sum':
+            result[statistic] = sums
+        elif statistic == 'mean':
+            result[statistic] = means
+        elif statistic == 'std':
+            squares = np.bincount(codes, weights=values * values, minlength=n_groups)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result[statistic] = np.sqrt(np.maximum(squares / counts - means * means, 0.0))
+        else:
+            quantile = _statistic_quantile(statistic)
+            if sorted_values is None:
+                by_value = np.argsort(values)
+                sorted_values = values[by_value[np.argsort(codes[by_value], kind='stable')]]
+                starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            result[statistic] = _grouped_quantile(sorted_values, starts, counts, quantile)
+    
+    return result
+
+def _statistic_quantile(statistic: str) -> float:
+    """Quantile of an order statistic name such as median, min or p90"""
+    if statistic == 'median':
+        return 0.5
+    if statistic == 'min':
+        return 0.0
+    if statistic == 'max':
+        return 1.0
+    if statistic.startswith('p') and statistic[1:].isdigit() and 0 <= int(statistic[1:]) <= 100:
+        return int(statistic[1:]) / 100.0
+    raise ValueError(f"Unknown statistic: {statistic}")
+
+def _grouped_quantile(sorted_values: np.ndarray, starts: np.ndarray, counts: np.ndarray,
+                      quantile: float) -> np.ndarray:
+    """Linearly interpolated quantile of each group's slice of sorted values"""
+    result = np.full(len(counts), np.nan)
+    has_values = counts > 0
+    position = starts[has_values] + quantile * (counts[has_values] - 1)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.ceil(position).astype(np.int64)
+    fraction = position - lower
+    result[has_values] = sorted_values[lower] * (1 - fraction) + sorted_values[upper] * fraction
+    return result
+
+def _label(value: Any) -> str:
+    """Category label of an enum, string or missing value"""
+    if isinstance(value, Enum):
+        value = value.value
+    if value is None or value == "":
+        return MISSING_LABEL
+    return str(value)
+
+def _number(value: Any) -> float:
+    """Float value, NaN when missing"""
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+def _field(data: Any, *names: str) -> Any:
+    """First present field of a dict or object"""
+    for name in names:
+        value = data.get(name) if isinstance(data, dict) else getattr(data, name, None)
+        if value is not None:
+            return value
+    return None
+
+class PortfolioStore:
+    """Append-only columnar store of rooms and compliance checks across reports"""
+    
+    def __init__(self, store_dir: Union[str, Path]):
+        self.store_dir = Path(store_dir)
+        self.vocabulary_path = self.store_dir / "vocabulary.json"
+        self.vocabularies: Dict[str, List[str]] = {}
+        self._lookups: Dict[str, Dict[str, int]] = {}
+        self._buffers = {table: self._empty_buffer(table) for table in TABLE_COLUMNS}
+        self._tables: Optional[Dict[str, Dict[str, np.ndarray]]] = None
+        self._load_vocabularies()
+    
+    def _empty_buffer(self, table: str) -> Dict[str, list]:
+        """Empty row buffer of a table"""
+        columns = TABLE_COLUMNS[table]
+        return {column: [] for column in columns['categories'] + columns['values']}
+    
+    def _load_vocabularies(self):
+        """Load the category vocabularies of the store"""
+        if self.vocabulary_path.exists():
+            with open(self.vocabulary_path, 'r', encoding='utf-8') as f:
+                self.vocabularies = json.load(f)
+        self._lookups = {column: {label: code for code, label in enumerate(labels)}
+                         for column, labels in self.vocabularies.items()}
+    
+    def _code(self, column: str, value: Any) -> int:
+        """Code of a category label, adding it to the vocabulary if new"""
+        label = _label(value)
+        lookup = self._lookups.setdefault(column, {})
+        code = lookup.get(label)
+        if code is None:
+            code = len(lookup)
+            lookup[label] = code
+            self.vocabularies.setdefault(column, []).append(label)
+        return code
+    
+    def has_report(self, report_id: str) -> bool:
+        """Check if a report was already added"""
+        return report_id in self._lookups.get('report', {})
+    
+    def add_report(self, report: Any, report_id: Optional[str] = None,
+                   project: Optional[str] = None) -> bool:
+        """
+        Buffer the rooms and compliance checks of an analyzed report
+        
+        Accepts DialuxReport, FastDialuxReport and EnhancedDialuxReport objects
+        as well as their dictionary form from batch result files.
+        
+        Args:
+            report: Analyzed report
+            report_id: Unique report identifier such as the PDF content hash
+            project: Project name (default: the report's project name)
+        
+        Returns:
+            False if a report with this identifier was already added
+        """
+        if is_dataclass(report):
+            report = asdict(report, dict_factory=compliance_dict_factory)
+        
+        project = project or _field(report, 'project_name')
+        report_id = report_id or _label(project)
+        if self.has_report(report_id):
+            logger.info(f"Report {report_id} already in portfolio, skipping")
+            return False
+        
+        codes = {
+            'project': self._code('project', project),
+            'report': self._code('report', report_id),
+            'manufacturer': self._code('manufacturer', _field(report, 'luminaire_manufacturer')),
+        }
+        report_standard = _field(report, 'selected_standard', 'best_matching_standard')
+        
+        # Report-level compliance columns (DialuxReport) cover every evaluated standard;
+        # other reports only carry each room's results for one standard
+        compliance_checks = _field(report, 'compliance_checks')
+        
+        rooms = self._buffers['rooms']
+        room_types = []
+        for room in _field(report, 'rooms') or []:
+            room_type = self._code('room_type', _field(room, 'room_type'))
+            room_types.append(room_type)
+            results = _field(room, 'compliance_results') or []
+            
+            rooms['project'].append(codes['project'])
+            rooms['report'].append(codes['report'])
+            rooms['manufacturer'].append(codes['manufacturer'])
+            rooms['room_type'].append(room_type)
+            rooms['standard'].append(self._code('standard', report_standard))
+            rooms['area'].append(_number(_field(room, 'area')))
+            for column in TABLE_COLUMNS['rooms']['values'][1:-1]:
+                rooms[column].append(_number(_field(room, column)))
+            rooms['compliance_rate'].append(
+                sum(1 for r in results if _field(r, 'is_compliant')) / len(results) if results else np.nan
+            )
+            
+            if not compliance_checks:
+                for result in results:
+                    self._add_check(codes, room_type, result)
+        
+        if compliance_checks:
+            for row in range(len(compliance_checks['room'])):
+                self._add_check(codes, room_types[compliance_checks['room'][row]],
+                                {column: values[row] for column, values in compliance_checks.items()})
+        
+        return True
+    
+    def _add_check(self, codes: Dict[str, int], room_type: int, result: Any):
+        """Buffer one compliance check"""
+        checks = self._buffers['compliance']
+        checks['project'].append(codes['project'])
+        checks['report'].append(codes['report'])
+        checks['manufacturer'].append(codes['manufacturer'])
+        checks['room_type'].append(room_type)
+        checks['standard'].append(self._code('standard', _field(result, 'standard')))
+        checks['parameter'].append(self._code('parameter', _field(result, 'parameter')))
+        checks['required_value'].append(_number(_field(result, 'required_value')))
+        checks['actual_value'].append(_number(_field(result, 'actual_value')))
+        checks['compliance_percentage'].append(_number(_field(result, 'compliance_percentage')))
+        checks['is_compliant'].append(1.0 if _field(result, 'is_compliant') else 0.0)
+    
+    def add_results_file(self, results_path: Union[str, Path]) -> int:
+        """
+        Add every report of a batch results JSONL file and flush
+        
+        Args:
+            results_path: JSONL file written by the batch command
+        
+        Returns:
+            Number of reports added
+        """
+        added = 0
+        with open(results_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if self.add_report(record['report'], report_id=record.get('sha256') or record.get('file')):
+                    added += 1
+        self.flush()
+        return added
+    
+    def flush(self):
+        """Write buffered rows as a new part of each table"""
+        for table, buffer in self._buffers.items():
+            if not buffer['project']:
+                continue
+            table_dir = self.store_dir / table
+            table_dir.mkdir(parents=True, exist_ok=True)
+            part_number = len(list(table_dir.glob("part-*.npz"))) + 1
+            columns = TABLE_COLUMNS[table]
+            arrays = {column: np.asarray(buffer[column], dtype=np.int32) for column in columns['categories']}
+            arrays.update({column: np.asarray(buffer[column], dtype=np.float64) for column in columns['values']})
+            np.savez(table_dir / f"part-{part_number:06d}.npz", **arrays)
+        
+        # Vocabulary last, so parts never reference codes missing from it
+        tmp_path = self.vocabulary_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.vocabularies, f, ensure_ascii=False)
+        os.replace(tmp_path, self.vocabulary_path)
+        
+        self._buffers = {table: self._empty_buffer(table) for table in TABLE_COLUMNS}
+        self._tables = None
+    
+    def table(self, name: str) -> Dict[str, np.ndarray]:
+        """Columns of a table, concatenated over all stored parts"""
+        if self._tables is None:
+            self._tables = {}
+        if name not in self._tables:
+            columns = TABLE_COLUMNS[name]
+            parts = [np.load(path) for path in sorted((self.store_dir / name).glob("part-*.npz"))]
+            self._tables[name] = {
+                column: (np.concatenate([part[column] for part in parts]) if parts
+                         else np.empty(0, dtype=np.int32 if column in columns['categories'] else np.float64))
+                for column in columns['categories'] + columns['values']
+            }
+        return self._tables[name]
+    
+    def room_statistics(self, value: str, by: Union[str, Sequence[str]] = 'room_type',
+                        statistics: Sequence[str] = DEFAULT_STATISTICS,
+                        where: Optional[Dict[str, Union[str, Iterable[str]]]] = None) -> pd.DataFrame:
+        """
+        Statistics of a room value grouped by categories
+        
+        Args:
+            value: Room value column, e.g. illuminance_avg
+            by: Category column(s): project, report, room_type, manufacturer, standard
+            statistics: Statistics to compute (count, sum, mean, std, min, max, median, pNN)
+            where: Category filters, e.g. {'standard': 'EN_12464_1'}
+        
+        Returns:
+            DataFrame with one row per group
+        """
+        return self._statistics('rooms', value, by, statistics, where)
+    
+    def compliance_statistics(self, by: Union[str, Sequence[str]] = 'standard',
+                              where: Optional[Dict[str, Union[str, Iterable[str]]]] = None) -> pd.DataFrame:
+        """
+        Compliance rate of all checks grouped by categories
+        
+        Args:
+            by: Category column(s): project, report, room_type, manufacturer, standard, parameter
+            where: Category filters, e.g. {'parameter': 'illuminance'}
+        
+        Returns:
+            DataFrame with checks, compliance rate and mean compliance percentage per group
+        """
+        rates = self._statistics('compliance', 'is_compliant', by, ('count', 'mean'), where)
+        rates = rates.rename(columns={'count': 'checks', 'mean': 'compliance_rate'})
+        percentages = self._statistics('compliance', 'compliance_percentage', by, ('mean',), where)
+        rates['compliance_percentage_mean'] = percentages['mean'].to_numpy()
+        return rates
+    
+    def _statistics(self, table_name: str, value: str, by: Union[str, Sequence[str]],
+                    statistics: Sequence[str], where: Optional[Dict[str, Any]]) -> pd.DataFrame:
+        """Group a table's value column by one or more category columns"""
+        table = self.table(table_name)
+        columns = TABLE_COLUMNS[table_name]
+        by = [by] if isinstance(by, str) else list(by)
+        for column in by + list(where or {}):
+            if column not in columns['categories']:
+                raise ValueError(f"Unknown {table_name} category: {column}")
+        if value not in columns['values']:
+            raise ValueError(f"Unknown {table_name} value: {value}")
+        
+        mask = np.ones(len(table[value]), dtype=bool)
+        for column, labels in (where or {}).items():
+            labels = [labels] if isinstance(labels, str) else list(labels)
+            lookup = self._lookups.get(column, {})
+            mask &= np.isin(table[column], [lookup[label] for label in labels if label in lookup])
+        
+        # Combine the category codes into one group key and compact it
+        key = np.zeros(int(mask.sum()), dtype=np.int64)
+        key_space = 1
+        for column in by:
+            size = max(len(self.vocabularies.get(column, [])), 1)
+            key = key * size + table[column][mask]
+            key_space *= size
+        if key_space <= max(len(key), 1 << 16):
+            group_keys = np.flatnonzero(np.bincount(key, minlength=key_space))
+            compact = np.zeros(key_space, dtype=np.int64)
+            compact[group_keys] = np.arange(len(group_keys))
+            group_codes = compact[key]
+        else:
+            group_keys, group_codes = np.unique(key, return_inverse=True)
+        
+        stats = grouped_statistics(group_codes.ravel(), table[value][mask], len(group_keys), statistics)
+        
+        # Decode group keys back to labels, last category first
+        labels = {}
+        remaining = group_keys
+        for column in reversed(by):
+            size = max(len(self.vocabularies.get(column, [])), 1)
+            labels[column] = np.asarray(self.vocabularies.get(column, [MISSING_LABEL]), dtype=object)[remaining % size]
+            remaining = remaining // size
+        
+        result = pd.DataFrame({column: labels[column] for column in by})
+        for statistic in statistics:
+            result[statistic] = stats[statistic]
+        return result
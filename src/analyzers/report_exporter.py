@@ -0,0 +1,332 @@
+"""
+Dialux Report Export
+Writes the configured export formats concurrently and skips outputs whose content is unchanged
+"""
+import os
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Union, Callable
+from dataclasses import fields
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pandas as pd
+
+try:
+    from ..utils.json_export import iter_json, write_json
+except ImportError:
+    from utils.json_export import iter_json, write_json
+
+logger = logging.getLogger(__name__)
+
+# Bump when an export layout changes so unchanged reports are written again
+EXPORT_VERSION = "1"
+
+# Report fields left out of the content digest
+VOLATILE_FIELDS = ('processing_date',)
+
+# Formats written after the analysis returns
+BACKGROUND_FORMATS = ('xlsx', 'pdf')
+
+EXPORT_SUFFIXES = {
+    'json': '_analysis.json',
+    'csv': '_summary.csv',
+    'xlsx': '_analysis.xlsx',
+    'pdf': '_summary.pdf'
+}
+
+def report_digest(report: Any) -> str:
+    """
+    Content digest of a Dialux report
+    
+    Every field except the processing date is hashed in its compact JSON
+    export form, so re-analyzing an unchanged document gives the same digest.
+    """
+    content = {field.name: getattr(report, field.name) for field in fields(report)
+               if field.name not in VOLATILE_FIELDS}
+    digest = hashlib.sha256(EXPORT_VERSION.encode('utf-8'))
+    for chunk in iter_json(content, compact=True):
+        digest.update(chunk.encode('utf-8'))
+    return digest.hexdigest()
+
+class ReportExporter:
+    """Concurrent, skip-if-unchanged writer of Dialux report exports"""
+    
+    DIGEST_FILE = ".export_digests.json"
+    
+    def __init__(self, output_dir: Union[str, Path], workers: int = 4):
+        self.output_dir = Path(output_dir)
+        self.workers = workers
+        self.pending: List[Future] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_pid: Optional[int] = None
+        self._digest_lock = threading.Lock()
+        self._preparers: Dict[str, Callable[[Any, bool], Any]] = {
+            'json': self._prepare_json,
+            'csv': self._prepare_csv,
+            'xlsx': self._prepare_xlsx,
+            'pdf': self._prepare_pdf
+        }
+        self._writers: Dict[str, Callable[[Any, Path], None]] = {
+            'json': self._write_json,
+            'csv': self._write_csv,
+            'xlsx': self._write_xlsx,
+            'pdf': self._write_pdf
+        }
+    
+    def export(self, report: Any, base_name: str, formats: List[str],
+               compact_json: bool = False) -> Dict[str, str]:
+        """
+        Export a report in the given formats
+        
+        JSON and CSV are written before returning; XLSX and PDF are written
+        in the background from data captured now, so later changes to the
+        report do not leak into them. Call wait() before relying on the
+        background outputs. Outputs whose digest matches the last written
+        one are left untouched.
+        
+        Args:
+            report: Dialux report to export
+            base_name: File name stem of the outputs
+            formats: Export formats (json, csv, xlsx, pdf)
+            compact_json: Write the JSON export without indentation
+        
+        Returns:
+            Export paths keyed by format
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        content_digest = report_digest(report)
+        written_digests = self._load_digests()
+        executor = self._pool()
+        
+        export_paths = {}
+        foreground = []
+        background = []
+        for export_format in formats:
+            if export_format not in self._writers:
+                logger.warning(f"Unsupported export format: {export_format}")
+                continue
+            
+            path = self.output_dir / f"{base_name}{EXPORT_SUFFIXES[export_format]}"
+            export_paths[export_format] = str(path)
+            digest = f"{content_digest}:{export_format}"
+            if export_format == 'json':
+                digest += f":compact={compact_json}"
+            if path.exists() and written_digests.get(path.name) == digest:
+                logger.debug(f"Export unchanged, skipping: {path}")
+                continue
+            
+            payload = self._preparers[export_format](report, compact_json)
+            if export_format in BACKGROUND_FORMATS:
+                background.append((export_format, payload, path, digest))
+            else:
+                foreground.append(executor.submit(self._write, export_format, payload, path, digest))
+        
+        for future in foreground:
+            future.result()
+        
+        # Background writers are mostly pure Python, so they only start once the
+        # foreground ones are done instead of competing with them for the GIL
+        self.pending = [future for future in self.pending if not future.done()]
+        for task in background:
+            future = executor.submit(self._write, *task)
+            future.add_done_callback(self._log_background_failure)
+            self.pending.append(future)
+        
+        return export_paths
+    
+    def wait(self, timeout: Optional[float] = None):
+        """
+        Wait for background exports to finish
+        
+        Raises:
+            Exception: First failure of a background export, after all have finished
+        """
+        pending, self.pending = self.pending, []
+        failures = []
+        for future in pending:
+            try:
+                future.result(timeout=timeout)
+            except Exception as e:
+                failures.append(e)
+        if failures:
+            raise failures[0]
+    
+    def _pool(self) -> ThreadPoolExecutor:
+        """Thread pool of this exporter, created again in forked worker processes"""
+        if self._executor is None or self._executor_pid != os.getpid():
+            # A forked child inherits the pool object but not its threads
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="dialux-export")
+            self._executor_pid = os.getpid()
+            self._digest_lock = threading.Lock()
+            self.pending = []
+        return self._executor
+    
+    def _write(self, export_format: str, payload: Any, path: Path, digest: str):
+        """Write one export and record its digest"""
+        self._writers[export_format](payload, path)
+        self._record_digest(path.name, digest)
+        logger.info(f"Exported {export_format}: {path}")
+    
+    def _log_background_failure(self, future: Future):
+        if future.exception() is not None:
+            logger.error(f"Background export failed: {future.exception()}")
+    
+    def _load_digests(self) -> Dict[str, str]:
+        """Digests of the outputs last written to the output directory"""
+        digest_path = self.output_dir / self.DIGEST_FILE
+        with self._digest_lock:
+            if not digest_path.exists():
+                return {}
+            try:
+                with open(digest_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"Failed to load export digests {digest_path}: {e}")
+                return {}
+    
+    def _record_digest(self, file_name: str, digest: str):
+        """Persist the digest of a written output atomically"""
+        digest_path = self.output_dir / self.DIGEST_FILE
+        with self._digest_lock:
+            digests = {}
+            if digest_path.exists():
+                try:
+                    with open(digest_path, 'r', encoding='utf-8') as f:
+                        digests = json.load(f)
+                except Exception:
+                    digests = {}
+            digests[file_name] = digest
+            tmp_path = digest_path.with_name(f"{digest_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(digests, f, indent=2)
+            os.replace(tmp_path, digest_path)
+    
+    # JSON and CSV are written before export() returns, so they read the report directly
+    
+    def _prepare_json(self, report: Any, compact_json: bool) -> Any:
+        return report, compact_json
+    
+    def _write_json(self, payload: Any, path: Path):
+        report, compact_json = payload
+        write_json(report, path, compact=compact_json)
+    
+    def _prepare_csv(self, report: Any, compact_json: bool) -> Any:
+        return report
+    
+    def _write_csv(self, report: Any, path: Path):
+        self._room_frame(report).to_csv(path, index=False, encoding='utf-8-sig')
+    
+    # XLSX and PDF are written in the background, so their data is captured up front
+    
+    def _prepare_xlsx(self, report: Any, compact_json: bool) -> Dict[str, pd.DataFrame]:
+        standard = report.selected_standard.value if report.selected_standard else None
+        summary = pd.DataFrame([
+            ("Project", report.project_name),
+            ("Report type", report.report_type.value),
+            ("Total rooms", report.total_rooms),
+            ("Total area (m²)", report.total_area),
+            ("Selected standard", standard),
+            ("Overall compliance rate", report.overall_compliance_rate),
+            ("Average illuminance (lux)", report.overall_illuminance_avg),
+            ("Average uniformity", report.overall_uniformity_avg),
+            ("Average UGR", report.overall_ugr_avg),
+            ("Average power density (W/m²)", report.overall_power_density_avg),
+            ("Data quality", report.data_quality_score),
+            ("Extraction confidence", report.extraction_confidence)
+        ], columns=["Metric", "Value"])
+        
+        compliance = pd.DataFrame(report.compliance_checks.to_dict())
+        if not compliance.empty:
+            room_names = [room.name for room in report.rooms]
+            compliance.insert(0, 'room_name', [room_names[index] for index in compliance.pop('room')])
+        
+        scores = pd.DataFrame(
+            [(name, score) for name, score in report.standard_scores.items()],
+            columns=["Standard", "Score"]
+        )
+        
+        return {
+            "Summary": summary,
+            "Rooms": self._room_frame(report),
+            "Compliance": compliance,
+            "Standard Scores": scores
+        }
+    
+    def _write_xlsx(self, sheets: Dict[str, pd.DataFrame], path: Path):
+        tmp_path = path.with_name(f".{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp{path.suffix}")
+        try:
+            with pd.ExcelWriter(tmp_path, engine='openpyxl') as writer:
+                for sheet_name, frame in sheets.items():
+                    frame.to_excel(writer, sheet_name=sheet_name, index=False)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+    
+    def _prepare_pdf(self, report: Any, compact_json: bool) -> List[str]:
+        standard = report.selected_standard.value if report.selected_standard else "Not selected"
+        lines = [
+            "DIALUX ANALYSIS SUMMARY",
+            "",
+            f"Project: {report.project_name}",
+            f"Report type: {report.report_type.value}",
+            f"Total rooms: {report.total_rooms}",
+            f"Total area: {report.total_area:.1f} m²",
+            f"Standard: {standard}",
+            f"Overall compliance: {report.overall_compliance_rate:.1%}",
+            f"Average illuminance: {report.overall_illuminance_avg:.0f} lux",
+            f"Average uniformity: {report.overall_uniformity_avg:.2f}",
+            f"Average UGR: {report.overall_ugr_avg:.1f}",
+            f"Data quality: {report.data_quality_score:.1%}",
+            "",
+            "ROOMS:"
+        ]
+        for room in report.rooms:
+            checks = room.compliance_results or []
+            compliant = sum(1 for result in checks if result.is_compliant)
+            values = []
+            if room.illuminance_avg is not None:
+                values.append(f"{room.illuminance_avg:.0f} lux")
+            if room.uniformity is not None:
+                values.append(f"U0 {room.uniformity:.2f}")
+            if room.ugr is not None:
+                values.append(f"UGR {room.ugr:.1f}")
+            lines.append(f"- {room.name} ({room.room_type.value}): {', '.join(values) or 'no values'}; "
+                         f"{compliant}/{len(checks)} checks compliant")
+        return lines
+    
+    def _write_pdf(self, lines: List[str], path: Path):
+        import fitz  # PyMuPDF
+        
+        lines_per_page = 50
+        doc = fitz.open()
+        try:
+            for start in range(0, max(len(lines), 1), lines_per_page):
+                page = doc.new_page()
+                page.insert_textbox(page.rect + (50, 50, -50, -50),
+                                    "\n".join(lines[start:start + lines_per_page]), fontsize=9)
+            tmp_path = path.with_name(f".{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp{path.suffix}")
+            doc.save(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            doc.close()
+    
+    def _room_frame(self, report: Any) -> pd.DataFrame:
+        """Room-by-room summary"""
+        return pd.DataFrame([
+            {
+                "room_name": room.name,
+                "room_type": room.room_type.value,
+                "area": room.area,
+                "illuminance_avg": room.illuminance_avg,
+                "uniformity": room.uniformity,
+                "ugr": room.ugr,
+                "power_density": room.power_density,
+                "data_completeness": room.data_completeness,
+                "confidence_score": room.confidence_score
+            }
+            for room in report.rooms
+        ])
@@ -0,0 +1,100 @@
+"""
+Analysis Result Cache
+Caches extraction and complete analysis results per document, analyzer and standards revision
+"""
+import os
+import pickle
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+def file_sha256(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """Content hash of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class AnalysisResultCache:
+    """
+    Two-level on-disk cache for Dialux analyses
+    
+    The extraction stage is keyed by the PDF content hash and the analyzer
+    type and version; the complete result additionally by the standards
+    database revision. When only the standards database changed, analyzers
+    reuse the cached extraction and recompute compliance.
+    """
+    
+    EXTRACTION = "extraction"
+    RESULT = "result"
+    
+    def __init__(self, cache_dir: Union[str, Path], enabled: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+    
+    def document_key(self, pdf_path: Union[str, Path], analyzer_type: str, analyzer_version: str,
+                     *options: Any) -> str:
+        """
+        Key of a document's extraction stage
+        
+        Args:
+            pdf_path: Path to the PDF report
+            analyzer_type: Analyzer name
+            analyzer_version: Version of the analyzer's extraction logic
+            options: Further settings that change the extraction
+        
+        Returns:
+            Hex digest key
+        """
+        parts = [file_sha256(pdf_path), analyzer_type, analyzer_version]
+        parts.extend(str(option) for option in options)
+        return hashlib.sha256("\x1f".join(parts).encode('utf-8')).hexdigest()
+    
+    def result_key(self, document_key: str, standards_revision: str, *options: Any) -> str:
+        """Key of a complete result: document key, standards revision and result options"""
+        parts = [document_key, standards_revision]
+        parts.extend(str(option) for option in options)
+        return hashlib.sha256("\x1f".join(parts).encode('utf-8')).hexdigest()
+    
+    def _path(self, stage: str, key: str) -> Path:
+        """Cache file of a stage output"""
+        return self.cache_dir / stage / f"{key}.pkl"
+    
+    def load(self, stage: str, key: str) -> Optional[Any]:
+        """Load a cached stage output, None if missing or unreadable"""
+        if not self.enabled:
+            return None
+        
+        path = self._path(stage, key)
+        if not path.exists():
+            return None
+        
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+            logger.info(f"Analysis cache hit ({stage}): {key[:12]}")
+            return value
+        except Exception as e:
+            logger.warning(f"Failed to load cached {stage} {key[:12]}: {e}")
+            return None
+    
+    def store(self, stage: str, key: str, value: Any):
+        """Store a stage output atomically"""
+        if not self.enabled:
+            return
+        
+        path = self._path(stage, key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to cache {stage} {key[:12]}: {e}")
+            if tmp_path.exists():
+                tmp_path.unlink()
@@ -31,6 +31,9 @@ class ExtractionConfig:
     min_cols: int = 2
     duplicate_similarity_threshold: float = 0.8
     
+    # Local company resolution
+    company_index_path: str = "data/manufacturers.json"  # manufacturer and driver vendor index
+    
     def __post_init__(self):
         if self.camelot_flavors is None:
             self.camelot_flavors = ["lattice", "stream"]
@@ -45,6 +48,10 @@ class StandardsConfig:
     standards_dir: str = "data/standards"
     standards_db_path: str = "data/standards_db.json"
     
+    # Incremental ingestion (per-page fingerprint index)
+    incremental_ingestion: bool = True
+    page_index_dir: str = "data/standards/page_index"
+    
     # Comparison settings
     similarity_threshold: float = 0.7
     compliance_threshold: float = 0.8
@@ -72,6 +79,8 @@ class DialuxConfig:
     # Room analysis
     min_room_area: float = 1.0  # m²
     max_room_area: float = 10000.0  # m²
+    lazy_table_extraction: bool = True  # only extract tables when text yields no rooms
+    flag_table_pages: bool = True  # limit table extraction to pages that look like room tables
     
     # Compliance checking
     check_illuminance_compliance: bool = True
@@ -83,15 +92,64 @@ class DialuxConfig:
     generate_detailed_reports: bool = True
     include_visualizations: bool = True
     export_formats: List[str] = None
+    compact_json_export: bool = False  # unindented JSON exports for machine consumers
+    export_workers: int = 4  # threads writing export formats concurrently
+    write_exports: bool = True  # write export files; results are returned either way
     
     # Directory settings
     standards_dir: str = "data/standards"
     dialux_output_dir: str = "data/standards/dialux_reports"
+    portfolio_dir: str = "data/portfolio"
+    
+    # Analysis result cache
+    result_cache_enabled: bool = True
+    result_cache_dir: str = "data/cache/analysis"
     
     def __post_init__(self):
         if self.export_formats is None:
             self.export_formats = ["json", "csv", "xlsx", "pdf"]
 
+@dataclass
+class LLMConfig:
+    """Configuration for OpenAI extraction"""
+    # Endpoint and model
+    base_url: Optional[str] = None  # OpenAI-compatible endpoint, default api.openai.com
+    extraction_model: str = "gpt-4"
+    company_model: str = "gpt-3.5-turbo"  # fast analysis company extraction
+    temperature: float = 0.1
+    max_tokens: int = 4000
+    
+    # Chunked extraction
+    chunk_chars: int = 8000  # page-aligned chunk size sent per request
+    max_concurrency: int = 4  # chunk requests in flight at once
+    request_timeout: float = 120.0  # seconds
+    
+    # Prompt budgets: only the most relevant pages are sent
+    extraction_token_budget: int = 16000  # enhanced extraction, all chunks together
+    company_token_budget: int = 500  # fast analysis company extraction
+    company_batch_size: int = 20  # documents per company request in batch runs
+    company_local_confidence: float = 0.75  # skip the company request when local resolution reaches this
+    
+    # Response cache
+    response_cache_enabled: bool = True
+    response_cache_dir: str = "data/cache/llm"
+    response_cache_ttl_days: float = 30.0
+    response_cache_max_mb: float = 256.0
+    offline: bool = False  # serve responses from the cache only, never call the API
+    
+    # Shared client: connection pool, per-model rate limits and retries
+    max_connections: int = 16  # HTTP requests in flight across the process
+    requests_per_minute: float = 500.0  # per model, unless listed in model_requests_per_minute
+    model_requests_per_minute: Dict[str, float] = None
+    rate_limit_burst: int = 10
+    max_retries: int = 5  # on rate limit, timeout, connection and server errors
+    backoff_base: float = 1.0  # seconds, doubled per retry
+    backoff_max: float = 60.0  # seconds
+    
+    def __post_init__(self):
+        if self.model_requests_per_minute is None:
+            self.model_requests_per_minute = {}
+
 @dataclass
 class WebConfig:
     """Configuration for web interface"""
@@ -109,9 +167,41 @@ class WebConfig:
     max_file_size: int = 100  # MB
     allowed_extensions: List[str] = None
     
+    # Shared components and cached results across reruns and sessions
+    component_cache_entries: int = 16  # analyzer and extractor instances kept per process
+    result_cache_entries: int = 32  # extraction and analysis results kept, keyed by upload content
+    
+    # Per-session uploads and results, evicted least recently used first beyond these sizes
+    session_dir: str = "data/web/sessions"
+    session_upload_mb: int = 200
+    session_result_mb: int = 100
+    session_stale_hours: float = 24.0  # upload directories of ended sessions are removed after this
+    
+    # Background analysis jobs
+    job_db_path: str = "data/jobs/jobs.db"
+    job_results_dir: str = "data/jobs/results"
+    job_uploads_dir: str = "data/jobs/uploads"
+    job_concurrency: Dict[str, int] = None  # worker processes per analyzer type
+    job_poll_interval: float = 1.0  # seconds between progress refreshes in the UI
+    job_retention_days: float = 7.0  # finished jobs and their results are removed after this
+    
+    # HTTP batch API
+    api_host: str = "localhost"
+    api_port: int = 8000
+    api_workers: Optional[int] = None  # worker processes (default: one per CPU core)
+    api_warm_kinds: List[str] = None  # components created in every worker at startup
+    api_uploads_dir: str = "data/api/uploads"
+    api_upload_retention_days: float = 7.0  # uploads not used for this long are removed
+    api_write_exports: bool = False  # results are streamed back, so workers write no export files
+    
     def __post_init__(self):
         if self.allowed_extensions is None:
             self.allowed_extensions = ["pdf", "txt", "docx"]
+        if self.job_concurrency is None:
+            # OCR-heavy standard analyses get one worker so they cannot starve fast ones
+            self.job_concurrency = {"standard": 1, "fast": 4, "enhanced": 2}
+        if self.api_warm_kinds is None:
+            self.api_warm_kinds = ["pdf", "tables", "standard", "fast"]
 
 @dataclass
 class AppConfig:
@@ -127,6 +217,7 @@ class AppConfig:
     extraction: ExtractionConfig = None
     standards: StandardsConfig = None
     dialux: DialuxConfig = None
+    llm: LLMConfig = None
     web: WebConfig = None
     
     # Logging
@@ -147,6 +238,8 @@ class AppConfig:
             self.standards = StandardsConfig()
         if self.dialux is None:
             self.dialux = DialuxConfig()
+        if self.llm is None:
+            self.llm = LLMConfig()
         if self.web is None:
             self.web = WebConfig()
         
@@ -167,6 +260,18 @@ def load_config_from_env():
     if os.getenv("LOG_LEVEL"):
         config.log_level = os.getenv("LOG_LEVEL")
     
+    if os.getenv("OPENAI_BASE_URL"):
+        config.llm.base_url = os.getenv("OPENAI_BASE_URL")
+    
+    if os.getenv("LLM_MAX_CONCURRENCY"):
+        config.llm.max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY"))
+    
+    if os.getenv("LLM_REQUESTS_PER_MINUTE"):
+        config.llm.requests_per_minute = float(os.getenv("LLM_REQUESTS_PER_MINUTE"))
+    
+    if os.getenv("LLM_OFFLINE"):
+        config.llm.offline = os.getenv("LLM_OFFLINE").lower() in ("1", "true", "yes")
+    
     if os.getenv("WEB_HOST"):
         config.web.host = os.getenv("WEB_HOST")
     
@@ -0,0 +1,202 @@
+"""
+Shared Regex Pattern Registry
+Lighting parameter, room and company patterns compiled once at import
+"""
+import re
+from typing import Dict, List, Iterator, Optional, Sequence, Tuple
+
+_LITERAL_PATTERN = re.compile(r'[A-Za-z0-9 ]+')
+
+class PatternFamily:
+    """A named group of regex patterns, compiled individually and as one combined alternation"""
+    
+    def __init__(self, name: str, sources: Sequence[str], flags: int = re.IGNORECASE):
+        self.name = name
+        # Inline global flags are only valid at the start of a whole pattern
+        self.sources = [source[4:] if source.startswith('(?i)') else source for source in sources]
+        self.flags = flags
+        self.patterns = [re.compile(source, flags) for source in self.sources]
+        
+        # Each alternative is wrapped in a named group so a match can be traced back
+        # to the pattern it came from; its own groups follow the wrapper group
+        self._group_spans = []
+        group_index = 1
+        for pattern in self.patterns:
+            self._group_spans.append((group_index + 1, group_index + 1 + pattern.groups))
+            group_index += 1 + pattern.groups
+        self.combined = re.compile(
+            '|'.join(f'(?P<_{i}>{source})' for i, source in enumerate(self.sources)),
+            flags
+        )
+        
+        # Plain keyword patterns can be tested with substring checks instead of regex scans
+        case_insensitive = bool(flags & re.IGNORECASE)
+        self.literals = [
+            source.lower() if case_insensitive else source
+            for source in self.sources if _LITERAL_PATTERN.fullmatch(source)
+        ]
+        self._regex_patterns = [
+            pattern for source, pattern in zip(self.sources, self.patterns)
+            if not _LITERAL_PATTERN.fullmatch(source)
+        ]
+    
+    def __iter__(self) -> Iterator[re.Pattern]:
+        return iter(self.patterns)
+    
+    def __len__(self) -> int:
+        return len(self.patterns)
+    
+    def finditer(self, text: str) -> Iterator[Tuple[int, Tuple[Optional[str], ...], re.Match]]:
+        """
+        Scan text once with the combined alternation
+        
+        At any position the earliest listed pattern wins, and matches do not overlap.
+        
+        Args:
+            text: Text to scan
+        
+        Returns:
+            Iterator of (pattern index, pattern groups, match)
+        """
+        for match in self.combined.finditer(text):
+            index = int(match.lastgroup[1:])
+            start, end = self._group_spans[index]
+            yield index, match.groups()[start - 1:end - 1], match
+    
+    def search(self, text: str) -> Optional[re.Match]:
+        """Find the first position where any pattern of the family matches"""
+        return self.combined.search(text)
+    
+    def contains(self, text: str) -> bool:
+        """Check whether any pattern of the family occurs in text"""
+        if self.literals:
+            haystack = text.lower() if self.flags & re.IGNORECASE else text
+            if any(literal in haystack for literal in self.literals):
+                return True
+        return any(pattern.search(text) for pattern in self._regex_patterns)
+    
+    def first_value(self, text: str) -> Optional[str]:
+        """Get the first non-empty group of the first combined match"""
+        for _, groups, match in self.finditer(text):
+            value = next((group for group in groups if group), None)
+            if value is not None:
+                return value
+        return None
+
+class PatternRegistry:
+    """Registry of pattern families keyed by dotted name (e.g. 'dialux.ugr')"""
+    
+    def __init__(self):
+        self._families: Dict[str, PatternFamily] = {}
+    
+    def register(self, name: str, sources: Sequence[str], flags: int = re.IGNORECASE) -> PatternFamily:
+        """Compile and register a pattern family"""
+        family = PatternFamily(name, sources, flags)
+        self._families[name] = family
+        return family
+    
+    def family(self, name: str) -> PatternFamily:
+        """Get a registered pattern family"""
+        return self._families[name]
+    
+    def group(self, prefix: str) -> Dict[str, PatternFamily]:
+        """Get all families under a prefix, keyed by the remaining name (in registration order)"""
+        prefix = prefix.rstrip('.') + '.'
+        return {
+            name[len(prefix):]: family
+            for name, family in self._families.items()
+            if name.startswith(prefix)
+        }
+    
+    def names(self) -> List[str]:
+        """Get all registered family names"""
+        return list(self._families.keys())
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._families
+
+registry = PatternRegistry()
+
+# Dialux report project names (parameters are resolved by the tokenizer in dialux_analyzer)
+registry.register('dialux.project', [
+    r'project[:\s]+([^\n\r]+)',
+    r'building[:\s]+([^\n\r]+)',
+    r'facility[:\s]+([^\n\r]+)',
+    r'title[:\s]+([^\n\r]+)'
+])
+registry.register('dialux.area', [  # fallback when no area parameter was found
+    r'(\d+(?:\.\d+)?)\s*(?:m²|m2|square meter)',
+    r'area[:\s]*(\d+(?:\.\d+)?)',
+    r'surface[:\s]*(\d+(?:\.\d+)?)'
+])
+
+# Dialux room types
+registry.register('dialux.room.office', [r'office', r'workplace', r'work\s+place', r'desk', r'workstation'])
+registry.register('dialux.room.meeting_room', [r'meeting', r'conference', r'boardroom', r'seminar'])
+registry.register('dialux.room.corridor', [r'corridor', r'passage', r'circulation', r'hallway', r'aisle'])
+registry.register('dialux.room.storage', [r'storage', r'warehouse', r'archive', r'stock', r'depot'])
+registry.register('dialux.room.industrial', [r'industrial', r'factory', r'manufacturing', r'production', r'workshop'])
+registry.register('dialux.room.retail', [r'retail', r'shop', r'store', r'commercial', r'showroom'])
+registry.register('dialux.room.educational', [r'classroom', r'school', r'education', r'teaching', r'lecture'])
+registry.register('dialux.room.healthcare', [r'hospital', r'medical', r'healthcare', r'clinic', r'treatment'])
+registry.register('dialux.room.residential', [r'residential', r'home', r'apartment', r'dwelling', r'living'])
+registry.register('dialux.room.outdoor', [r'outdoor', r'exterior', r'external', r'street', r'parking'])
+
+# Standards document requirements
+registry.register('standards.param.illuminance', [
+    r'(\d+(?:\.\d+)?)\s*(?:lux|lx)',
+    r'illuminance[:\s]*(\d+(?:\.\d+)?)',
+    r'lighting level[:\s]*(\d+(?:\.\d+)?)',
+    r'(\d+(?:\.\d+)?)\s*(?:lux|lx)\s*(?:minimum|min|maximum|max|average|avg)',
+])
+registry.register('standards.param.uniformity', [
+    r'uniformity[:\s]*(\d+(?:\.\d+)?)',
+    r'u0[:\s]*(\d+(?:\.\d+)?)',
+    r'(\d+(?:\.\d+)?)\s*(?:uniformity|uniform)',
+])
+registry.register('standards.param.ugr', [
+    r'ugr[:\s]*(\d+(?:\.\d+)?)',
+    r'unified glare rating[:\s]*(\d+(?:\.\d+)?)',
+    r'glare[:\s]*(\d+(?:\.\d+)?)',
+])
+registry.register('standards.param.power_density', [
+    r'(\d+(?:\.\d+)?)\s*(?:w/m²|watt/m²|w/m2)',
+    r'power density[:\s]*(\d+(?:\.\d+)?)',
+    r'lighting power density[:\s]*(\d+(?:\.\d+)?)',
+])
+registry.register('standards.param.color_temperature', [
+    r'(\d+(?:\.\d+)?)\s*(?:k|kelvin)',
+    r'color temperature[:\s]*(\d+(?:\.\d+)?)',
+    r'correlated color temperature[:\s]*(\d+(?:\.\d+)?)',
+])
+registry.register('standards.param.cri', [
+    r'cri[:\s]*(\d+(?:\.\d+)?)',
+    r'color rendering index[:\s]*(\d+(?:\.\d+)?)',
+    r'ra[:\s]*(\d+(?:\.\d+)?)',
+])
+
+# Standards document room types
+registry.register('standards.room.office', [r'office', r'workplace', r'work\s+place', r'desk'])
+registry.register('standards.room.meeting_room', [r'meeting', r'conference', r'boardroom'])
+registry.register('standards.room.corridor', [r'corridor', r'passage', r'circulation', r'hallway'])
+registry.register('standards.room.storage', [r'storage', r'warehouse', r'archive'])
+registry.register('standards.room.industrial', [r'industrial', r'factory', r'manufacturing', r'production'])
+registry.register('standards.room.retail', [r'retail', r'shop', r'store', r'commercial'])
+registry.register('standards.room.educational', [r'classroom', r'school', r'education', r'teaching'])
+registry.register('standards.room.healthcare', [r'hospital', r'medical', r'healthcare', r'clinic'])
+registry.register('standards.room.residential', [r'residential', r'home', r'apartment', r'dwelling'])
+registry.register('standards.room.outdoor', [r'outdoor', r'exterior', r'external', r'street'])
+
+# Focused extraction (fast mode): labelled cover page lines, in order of preference
+registry.register('focused.label.project_name', [
+    r'^[ \t]*project[ \t]+name[ \t]*[:\-][ \t]*(\S[^\n]{1,79})$',
+    r'^[ \t]*project[ \t]*[:\-][ \t]*(\S[^\n]{1,79})$'
+], flags=re.IGNORECASE | re.MULTILINE)
+registry.register('focused.label.project_company', [
+    r'^[ \t]*(?:customer|client)[ \t]*[:\-][ \t]*(\S[^\n]{1,79})$',
+    r'^[ \t]*company(?:[ \t]+name)?[ \t]*[:\-][ \t]*(\S[^\n]{1,79})$',
+    r'^[ \t]*(?:contractor|operator|designer|installer)[ \t]*[:\-][ \t]*(\S[^\n]{1,79})$'
+], flags=re.IGNORECASE | re.MULTILINE)
+registry.register('focused.label.luminaire_manufacturer', [
+    r'^[ \t]*manufacturer[ \t]*[:\-][ \t]*(\S[^\n]{1,79})$'
+], flags=re.IGNORECASE | re.MULTILINE)
@@ -0,0 +1,239 @@
+"""
+Local Company Resolver
+Manufacturer and driver vendor index compiled into an Aho-Corasick automaton
+"""
+import re
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+
+try:
+    from ..core.config import config
+    from ..core.patterns import registry as pattern_registry
+except ImportError:
+    from core.config import config
+    from core.patterns import registry as pattern_registry
+
+logger = logging.getLogger(__name__)
+
+LUMINAIRE = "luminaire"
+DRIVER = "driver"
+
+# A mention of a company making both is a driver mention on lines like these
+DRIVER_CONTEXT_PATTERN = re.compile(r'\b(?:drivers?|ballasts?|control gear|ecg|power supply|psu)\b')
+
+# Fields whose share found locally is the resolution confidence
+CONFIDENCE_FIELDS = ('project_name', 'project_company', 'luminaire_manufacturer')
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton finding every keyword occurrence in one pass over a text"""
+    
+    def __init__(self, keywords: Dict[str, Any]):
+        """
+        Build the automaton
+        
+        Args:
+            keywords: Keyword to the value reported for its matches
+        """
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[Tuple[int, Any]]] = [[]]  # (keyword length, value) ending at a state
+        
+        for keyword, value in keywords.items():
+            state = 0
+            for char in keyword:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[state][char] = next_state
+                state = next_state
+            self.output[state].append((len(keyword), value))
+        
+        # Failure links in breadth-first order, so shorter suffixes are linked first
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+    
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """
+        Find all keyword occurrences, overlapping ones included
+        
+        Returns:
+            Iterator of (start, end, value) in order of end position
+        """
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, value in output[state]:
+                yield index + 1 - length, index + 1, value
+
+@dataclass
+class CompanyEntry:
+    """One company of the index"""
+    name: str
+    roles: Tuple[str, ...]
+    aliases: Tuple[str, ...] = ()
+
+@dataclass
+class CompanyResolution:
+    """Company fields resolved from report text without an LLM"""
+    project_name: Optional[str] = None
+    project_company: Optional[str] = None
+    luminaire_manufacturer: Optional[str] = None
+    driver_circuit_company: Optional[str] = None
+    mentions: Dict[str, int] = field(default_factory=dict)  # index mentions per company
+    
+    @property
+    def confidence(self) -> float:
+        """Share of the project and manufacturer fields that were found"""
+        return sum(1 for name in CONFIDENCE_FIELDS if getattr(self, name)) / len(CONFIDENCE_FIELDS)
+    
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        return {
+            'project_name': self.project_name,
+            'project_company': self.project_company,
+            'luminaire_manufacturer': self.luminaire_manufacturer,
+            'driver_circuit_company': self.driver_circuit_company
+        }
+    
+    def merge(self, company_data: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
+        """Fill the fields an LLM answer left empty with the local ones"""
+        return {name: company_data.get(name) or value for name, value in self.to_dict().items()}
+
+class CompanyIndex:
+    """Manufacturer and driver vendor names, matched case-insensitively on word boundaries"""
+    
+    def __init__(self, entries: List[CompanyEntry], revision: str = "none"):
+        self.entries = entries
+        self.revision = revision  # changes with the index file, for cache keys
+        self.automaton = KeywordAutomaton({
+            alias.lower(): entry
+            for entry in entries
+            for alias in (entry.name,) + entry.aliases
+        })
+        self.labels = {
+            name: pattern_registry.family(f'focused.label.{name}')
+            for name in ('project_name', 'project_company', 'luminaire_manufacturer')
+        }
+    
+    @classmethod
+    def load(cls, index_path: Union[str, Path]) -> 'CompanyIndex':
+        """Load the index from a JSON file; a missing or broken file gives an empty index"""
+        index_path = Path(index_path)
+        if not index_path.is_absolute() and not index_path.exists():
+            index_path = config.project_root / index_path
+        
+        try:
+            content = index_path.read_bytes()
+            entries = [
+                CompanyEntry(item['name'], tuple(item.get('roles', [LUMINAIRE])), tuple(item.get('aliases', [])))
+                for item in json.loads(content.decode('utf-8')).get('companies', [])
+            ]
+        except Exception as e:
+            logger.warning(f"Failed to load company index {index_path}: {e}")
+            return cls([])
+        
+        logger.info(f"Loaded {len(entries)} companies from {index_path}")
+        return cls(entries, hashlib.sha256(content).hexdigest()[:16])
+    
+    def find(self, text: str) -> List[Tuple[int, int, CompanyEntry]]:
+        """
+        Find company mentions in text
+        
+        Overlapping matches are resolved in favor of the earliest, then the
+        longest, so "Philips Xitanium" is one mention rather than two.
+        
+        Returns:
+            Non-overlapping (start, end, entry) positions in the lowercased text
+        """
+        lowered = text.lower()
+        candidates = [
+            (start, end, entry) for start, end, entry in self.automaton.finditer(lowered)
+            if (start == 0 or not lowered[start - 1].isalnum()) and (end == len(lowered) or not lowered[end].isalnum())
+        ]
+        candidates.sort(key=lambda match: (match[0], match[0] - match[1]))
+        
+        mentions = []
+        covered = 0
+        for start, end, entry in candidates:
+            if start >= covered:
+                mentions.append((start, end, entry))
+                covered = end
+        return mentions
+    
+    def resolve(self, text: str) -> CompanyResolution:
+        """
+        Resolve the company fields of a report locally
+        
+        Manufacturers and driver vendors come from the index, the most
+        mentioned one of each role winning; companies making both count as
+        driver vendors on lines about drivers or control gear. Project name and
+        company come from labelled lines such as "Project:" and "Customer:".
+        
+        Args:
+            text: Report text
+        
+        Returns:
+            Resolved fields with their confidence
+        """
+        lowered = text.lower()
+        counts: Dict[str, Dict[str, int]] = {LUMINAIRE: {}, DRIVER: {}}
+        mentions: Dict[str, int] = {}
+        for start, end, entry in self.find(text):
+            role = entry.roles[0]
+            if len(entry.roles) > 1:
+                line_start = lowered.rfind('\n', 0, start) + 1
+                line_end = lowered.find('\n', end)
+                line = lowered[line_start:line_end if line_end >= 0 else len(lowered)]
+                role = DRIVER if DRIVER in entry.roles and DRIVER_CONTEXT_PATTERN.search(line) else LUMINAIRE
+            # Dicts keep first-mention order, so ties go to the earlier company
+            counts[role][entry.name] = counts[role].get(entry.name, 0) + 1
+            mentions[entry.name] = mentions.get(entry.name, 0) + 1
+        
+        def most_mentioned(role: str) -> Optional[str]:
+            return max(counts[role], key=counts[role].get) if counts[role] else None
+        
+        return CompanyResolution(
+            project_name=self._label_value('project_name', text),
+            project_company=self._label_value('project_company', text),
+            luminaire_manufacturer=most_mentioned(LUMINAIRE) or self._label_value('luminaire_manufacturer', text),
+            driver_circuit_company=most_mentioned(DRIVER),
+            mentions=mentions
+        )
+    
+    def _label_value(self, name: str, text: str) -> Optional[str]:
+        """Value of the most preferred label of a field present in the text"""
+        for pattern in self.labels[name]:
+            match = pattern.search(text)
+            if match:
+                return match.group(1).strip().rstrip('.,;:') or None
+        return None
+
+_company_index: Optional[CompanyIndex] = None
+_company_index_lock = threading.Lock()
+
+def get_company_index() -> CompanyIndex:
+    """Company index shared by all extractors of the process, loaded from config.extraction"""
+    global _company_index
+    with _company_index_lock:
+        if _company_index is None:
+            _company_index = CompanyIndex.load(config.extraction.company_index_path)
+        return _company_index
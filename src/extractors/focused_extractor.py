@@ -7,22 +7,85 @@ import re
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
-import openai
 import pandas as pd
 
 try:
     from ..core.config import config
     from ..extractors.pdf_extractor import PDFExtractor
+    from ..extractors.company_index import get_company_index
+    from ..extractors.llm_cache import LLMCacheMiss, get_response_cache
+    from ..extractors.llm_client import get_llm_client
+    from ..extractors.numeric_tokens import (LUX_UNITS, AREA_UNITS, UNIFORMITY_LABELS, UGR_LABELS,
+                                             tokenize_numbers)
+    from ..extractors.page_relevance import COMPANY_PROFILE, select_relevant_pages
 except ImportError:
     from core.config import config
     from extractors.pdf_extractor import PDFExtractor
+    from extractors.company_index import get_company_index
+    from extractors.llm_cache import LLMCacheMiss, get_response_cache
+    from extractors.llm_client import get_llm_client
+    from extractors.numeric_tokens import LUX_UNITS, AREA_UNITS, UNIFORMITY_LABELS, UGR_LABELS, tokenize_numbers
+    from extractors.page_relevance import COMPANY_PROFILE, select_relevant_pages
 
 logger = logging.getLogger(__name__)
 
+TABLE_ROW_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s+(\d+(?:\.\d+)?)\s+(\d+(?:\.\d+)?)')
+
+# Bump when the prompt changes so cached responses to the old prompt are not reused
+COMPANY_PROMPT_VERSION = "1"
+
+COMPANY_PROMPT = """
+Extract ONLY company names from this lighting report text. Return a simple JSON object.
+
+Text: {text}
+
+Return JSON with these fields (use null if not found):
+{{
+    "project_name": "string or null",
+    "project_company": "string or null", 
+    "luminaire_manufacturer": "string or null",
+    "driver_circuit_company": "string or null"
+}}
+
+Look for:
+- Project/company names
+- Luminaire manufacturers (like Philips, Osram, etc.)
+- Driver circuit companies
+- Brand names
+
+Return ONLY the JSON, no other text.
+"""
+
+COMPANY_FIELDS = ('project_name', 'project_company', 'luminaire_manufacturer', 'driver_circuit_company')
+
+COMPANY_BATCH_PROMPT = """
+Extract ONLY company names from each lighting report excerpt below. Each excerpt starts with a "### Document <number>" line.
+
+{documents}
+
+Return one JSON object with an entry for every document number, using null for names not found:
+{{
+    "1": {{
+        "project_name": "string or null",
+        "project_company": "string or null",
+        "luminaire_manufacturer": "string or null",
+        "driver_circuit_company": "string or null"
+    }}
+}}
+
+Look for:
+- Project/company names
+- Luminaire manufacturers (like Philips, Osram, etc.)
+- Driver circuit companies
+- Brand names
+
+Return ONLY the JSON, no other text.
+"""
+
 @dataclass
 class FocusedExtractionResult:
     """Focused extraction result with only essential data"""
@@ -34,6 +97,7 @@ class FocusedExtractionResult:
     luminaire_details: List[Dict[str, Any]] = None
     extraction_confidence: float = 0.0
     processing_time: float = 0.0
+    pending_company_text: Optional[str] = None  # excerpt awaiting cross-document company extraction
     
     def __post_init__(self):
         if self.rooms is None:
@@ -49,9 +113,13 @@ class FocusedExtractor:
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         
         # Set up OpenAI client only if API key is available
+        self.response_cache = get_response_cache()
         if self.api_key:
-            openai.api_key = self.api_key
-            self.client = openai.OpenAI(api_key=self.api_key)
+            self.client = get_llm_client(self.api_key)
+            self.openai_available = True
+        elif self.response_cache.offline:
+            # Offline mode answers from cached responses only
+            self.client = None
             self.openai_available = True
         else:
             self.client = None
@@ -61,80 +129,24 @@ class FocusedExtractor:
         # Initialize PDF extractor
         self.pdf_extractor = PDFExtractor()
         
-        # Pre-compiled regex patterns for fast extraction - Enhanced for Dialux reports
-        self.area_patterns = [
-            # Standard area patterns
-            r'area[:\s]*(\d+(?:\.\d+)?)\s*m[²2]',
-            r'(\d+(?:\.\d+)?)\s*m[²2]',
-            r'(\d+(?:\.\d+)?)\s*sqm',
-            r'(\d+(?:\.\d+)?)\s*square\s*meters?',
-            r'room[:\s]*(\d+(?:\.\d+)?)\s*m[²2]',
-            r'(\d+(?:\.\d+)?)\s*m\^2',
-            # Dialux specific patterns
-            r'(\d+(?:\.\d+)?)\s*m\s*[²2]',
-            r'(\d+(?:\.\d+)?)\s*m2',
-            r'(\d+(?:\.\d+)?)\s*m\s*2',
-            r'(\d+(?:\.\d+)?)\s*sq\.?\s*m',
-            r'(\d+(?:\.\d+)?)\s*square\s*m',
-            r'(\d+(?:\.\d+)?)\s*m\s*square',
-            # Table patterns (common in Dialux reports)
-            r'(\d+(?:\.\d+)?)\s*m[²2]\s*[^\d]',
-            r'(\d+(?:\.\d+)?)\s*m[²2]\s*$',
-            # Decimal patterns
-            r'(\d+\.\d+)\s*m[²2]',
-            r'(\d+\.\d+)\s*sqm',
-            # Large number patterns (for big areas)
-            r'(\d{2,}(?:\.\d+)?)\s*m[²2]',
-            r'(\d{2,}(?:\.\d+)?)\s*sqm',
-            # Additional patterns for Dialux reports
-            r'(\d+(?:\.\d+)?)\s*m\s*[²2]',
-            r'(\d+(?:\.\d+)?)\s*m\s*2',
-            r'(\d+(?:\.\d+)?)\s*m2',
-            r'(\d+(?:\.\d+)?)\s*m\^2',
-            r'(\d+(?:\.\d+)?)\s*sq\.?\s*m',
-            r'(\d+(?:\.\d+)?)\s*square\s*m',
-            r'(\d+(?:\.\d+)?)\s*m\s*square',
-            # Patterns without units (just numbers that could be areas)
-            r'(\d{2,}(?:\.\d+)?)\s+(?=\d)',  # Large numbers followed by other numbers
-            r'(\d+(?:\.\d+)?)\s+(?=lux|lx)',  # Numbers followed by lux
-            r'(\d+(?:\.\d+)?)\s+(?=uniformity|uniform)',  # Numbers followed by uniformity
-        ]
-        
-        self.illuminance_patterns = [
-            r'illuminance[:\s]*(\d+(?:\.\d+)?)\s*lux',
-            r'(\d+(?:\.\d+)?)\s*lux',
-            r'lighting[:\s]*(\d+(?:\.\d+)?)\s*lux',
-            r'(\d+(?:\.\d+)?)\s*lx',
-            r'(\d+(?:\.\d+)?)\s*Lux',
-            r'(\d+(?:\.\d+)?)\s*LUX',
-            r'(\d+(?:\.\d+)?)\s*Lx'
-        ]
-        
-        self.uniformity_patterns = [
-            r'uniformity[:\s]*(\d+(?:\.\d+)?)',
-            r'u[:\s]*(\d+(?:\.\d+)?)',
-            r'uniform[:\s]*(\d+(?:\.\d+)?)'
-        ]
-        
-        self.ugr_patterns = [
-            r'ugr[:\s]*(\d+(?:\.\d+)?)',
-            r'glare[:\s]*(\d+(?:\.\d+)?)',
-            r'UGR[:\s]*(\d+(?:\.\d+)?)'
-        ]
-        
-        # Company name patterns
-        self.company_patterns = [
-            r'(?i)(philips|osram|ge|ge lighting|signify|tridonic|mean well|helvar|lutron|acuity brands)',
-            r'(?i)(manufacturer[:\s]*([a-zA-Z\s&]+))',
-            r'(?i)(company[:\s]*([a-zA-Z\s&]+))',
-            r'(?i)(project[:\s]*([a-zA-Z\s&]+))',
-            r'(?i)(client[:\s]*([a-zA-Z\s&]+))'
-        ]
+        # Manufacturer and driver vendor index for local company resolution
+        self.company_index = get_company_index()
         
         logger.info("Focused Extractor initialized")
     
-    def extract_focused_data(self, pdf_path: Union[str, Path]) -> FocusedExtractionResult:
-        """Extract focused data quickly"""
+    def extract_focused_data(self, pdf_path: Union[str, Path], resolve_companies: bool = True) -> FocusedExtractionResult:
+        """
+        Extract focused data quickly
+        
+        Args:
+            pdf_path: Path to the PDF report
+            resolve_companies: Extract company names now; if False and OpenAI is
+                available, the excerpt is kept in pending_company_text for
+                resolve_companies_batch
+        
+        Returns:
+            Focused extraction result
+        """
         start_time = datetime.now()
         pdf_path = Path(pdf_path)
         
@@ -157,13 +169,21 @@ class FocusedExtractor:
             logger.info("Performing fast regex extraction...")
             regex_data = self._extract_with_regex(raw_text)
             
-            # Step 4: Extract company names (with or without OpenAI)
-            if self.openai_available:
-                logger.info("Extracting company information with OpenAI...")
-                company_data = self._extract_companies_fast(raw_text[:2000])  # Only first 2000 chars
+            # Step 4: Extract company names locally, asking OpenAI only when that is not conclusive
+            local_companies = self.company_index.resolve(raw_text)
+            company_text = None
+            if self.openai_available and local_companies.confidence < config.llm.company_local_confidence:
+                company_text = select_relevant_pages(raw_text, COMPANY_PROFILE, config.llm.company_token_budget)
+            if company_text is not None and not resolve_companies:
+                logger.info("Leaving company information to a cross-document batch...")
+                company_data = local_companies.to_dict()
+            elif company_text is not None:
+                logger.info(f"Extracting company information with OpenAI "
+                            f"(local confidence {local_companies.confidence:.0%})...")
+                company_data = local_companies.merge(self._extract_companies_fast(company_text))
             else:
-                logger.info("Extracting company information with regex patterns...")
-                company_data = self._extract_companies_regex(raw_text)
+                logger.info(f"Resolved company information locally (confidence {local_companies.confidence:.0%})")
+                company_data = local_companies.to_dict()
             
             # Step 5: Combine results
             result = FocusedExtractionResult(
@@ -174,7 +194,8 @@ class FocusedExtractor:
                 rooms=regex_data.get('rooms', []),
                 luminaire_details=regex_data.get('luminaire_details', []),
                 extraction_confidence=0.8,  # High confidence for focused extraction
-                processing_time=(datetime.now() - start_time).total_seconds()
+                processing_time=(datetime.now() - start_time).total_seconds(),
+                pending_company_text=company_text if not resolve_companies else None
             )
             
             logger.info(f"Focused extraction completed in {result.processing_time:.2f}s")
@@ -185,64 +206,39 @@ class FocusedExtractor:
             raise
     
     def _extract_with_regex(self, text: str) -> Dict[str, Any]:
-        """Extract numerical data using enhanced regex patterns"""
+        """Extract numerical data from one pass of numeric tokens over the text"""
         rooms = []
         luminaire_details = []
         
         logger.info(f"Extracting from text length: {len(text)} characters")
         
-        # First, let's find ALL area values in the entire text
-        all_area_values = []
-        for pattern in self.area_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    area_val = float(match)
-                    # More flexible area range - include smaller areas and larger areas
-                    if 0.01 <= area_val <= 1000000:  # Very flexible area range
-                        all_area_values.append(area_val)
-                except (ValueError, TypeError):
-                    continue
+        tokens = tokenize_numbers(text)
         
-        logger.info(f"Found {len(all_area_values)} area values: {all_area_values[:10]}")  # Log first 10
-        
-        # Find ALL illuminance values
+        # Derive all four value families from the token stream
+        all_area_values = []
         all_illuminance_values = []
-        for pattern in self.illuminance_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    illum_val = float(match)
-                    if 1 <= illum_val <= 10000:  # Reasonable illuminance range
-                        all_illuminance_values.append(illum_val)
-                except (ValueError, TypeError):
-                    continue
-        
-        logger.info(f"Found {len(all_illuminance_values)} illuminance values: {all_illuminance_values[:10]}")
-        
-        # Find ALL uniformity values
         all_uniformity_values = []
-        for pattern in self.uniformity_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    uniform_val = float(match)
-                    if 0.01 <= uniform_val <= 1.0:  # Reasonable uniformity range
-                        all_uniformity_values.append(uniform_val)
-                except (ValueError, TypeError):
-                    continue
-        
-        # Find ALL UGR values
         all_ugr_values = []
-        for pattern in self.ugr_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    ugr_val = float(match)
-                    if 1 <= ugr_val <= 50:  # Reasonable UGR range
-                        all_ugr_values.append(ugr_val)
-                except (ValueError, TypeError):
-                    continue
+        for token in tokens:
+            if token.unit in LUX_UNITS and 1 <= token.value <= 10000:  # Reasonable illuminance range
+                all_illuminance_values.append(token.value)
+            if token.label.endswith(UNIFORMITY_LABELS) and 0.01 <= token.value <= 1.0:  # Reasonable uniformity range
+                all_uniformity_values.append(token.value)
+            if token.label.endswith(UGR_LABELS) and 1 <= token.value <= 50:  # Reasonable UGR range
+                all_ugr_values.append(token.value)
+            
+            # Areas by unit, plus unitless numbers in table rows or directly before lux and uniformity values
+            is_area = token.unit in AREA_UNITS
+            if not is_area and token.spaced:
+                if token.unit in LUX_UNITS:
+                    is_area = True
+                elif not token.unit:
+                    is_area = (token.next_char.isdigit() and token.integer_digits >= 2) or token.before_uniformity
+            if is_area and 0.01 <= token.value <= 1000000:  # Very flexible area range
+                all_area_values.append(token.value)
+        
+        logger.info(f"Found {len(all_area_values)} area values: {all_area_values[:10]}")  # Log first 10
+        logger.info(f"Found {len(all_illuminance_values)} illuminance values: {all_illuminance_values[:10]}")
         
         # Now create rooms based on found data
         # Strategy 1: If we have area values, create rooms for each
@@ -285,8 +281,7 @@ class FocusedExtractor:
         if not rooms:
             logger.info("Trying table-based extraction")
             # Look for table patterns (numbers in rows/columns)
-            table_pattern = r'(\d+(?:\.\d+)?)\s+(\d+(?:\.\d+)?)\s+(\d+(?:\.\d+)?)'
-            table_matches = re.findall(table_pattern, text)
+            table_matches = TABLE_ROW_PATTERN.findall(text)
             
             for i, match in enumerate(table_matches[:5]):  # Max 5 rooms from tables
                 try:
@@ -312,18 +307,10 @@ class FocusedExtractor:
         if not rooms:
             logger.info("Trying to find any reasonable numbers as potential areas")
             # Look for any numbers that could be areas (2+ digits, possibly with decimals)
-            number_pattern = r'(\d{2,}(?:\.\d+)?)'
-            all_numbers = re.findall(number_pattern, text)
-            
-            potential_areas = []
-            for num_str in all_numbers:
-                try:
-                    num_val = float(num_str)
-                    # Look for numbers that could reasonably be areas
-                    if 1.0 <= num_val <= 10000:  # Reasonable area range
-                        potential_areas.append(num_val)
-                except (ValueError, TypeError):
-                    continue
+            potential_areas = [
+                token.value for token in tokens
+                if token.integer_digits >= 2 and 1.0 <= token.value <= 10000  # Reasonable area range
+            ]
             
             # Remove duplicates and sort
             unique_areas = sorted(list(set(potential_areas)), reverse=True)
@@ -364,52 +351,122 @@ class FocusedExtractor:
             'luminaire_details': luminaire_details
         }
     
+    def resolve_companies_batch(self, results: List[FocusedExtractionResult]):
+        """
+        Fill in the company names of results extracted with resolve_companies=False
+        
+        Excerpts are sent llm.company_batch_size documents per request, so a
+        batch run pays one round trip per group instead of one per document.
+        
+        Args:
+            results: Focused extraction results, updated in place
+        """
+        pending = [result for result in results if result.pending_company_text is not None]
+        batch_size = max(1, config.llm.company_batch_size)
+        for start in range(0, len(pending), batch_size):
+            group = pending[start:start + batch_size]
+            company_data = self._extract_companies_batch([result.pending_company_text for result in group])
+            for result, data in zip(group, company_data):
+                # Fields the answer leaves empty keep their local resolution
+                result.project_name = data.get('project_name') or result.project_name
+                result.project_company = data.get('project_company') or result.project_company
+                result.luminaire_manufacturer = data.get('luminaire_manufacturer') or result.luminaire_manufacturer
+                result.driver_circuit_company = data.get('driver_circuit_company') or result.driver_circuit_company
+                result.pending_company_text = None
+    
+    def _company_request(self, text: str) -> Tuple[str, List[Dict[str, str]], Dict[str, Any], str]:
+        """Model, messages, settings and cache key of a single-document company request"""
+        model = config.llm.company_model  # Faster model
+        messages = [
+            {"role": "system", "content": "Extract company names from text. Return JSON only."},
+            {"role": "user", "content": COMPANY_PROMPT.format(text=text)}
+        ]
+        params = {'temperature': 0.1, 'max_tokens': 200}  # Small response
+        return model, messages, params, self.response_cache.key(model, COMPANY_PROMPT_VERSION, messages, **params)
+    
+    def _parse_json_response(self, response_text: str) -> Any:
+        """Parse a JSON response, removing any markdown formatting"""
+        response_text = response_text.strip()
+        if response_text.startswith("```json"):
+            response_text = response_text[7:]
+        elif response_text.startswith("```"):
+            response_text = response_text[3:]
+        if response_text.endswith("```"):
+            response_text = response_text[:-3]
+        return json.loads(response_text)
+    
+    def _extract_companies_batch(self, texts: List[str]) -> List[Dict[str, str]]:
+        """
+        Extract company information of several documents with one OpenAI call
+        
+        Documents with a cached response are answered from the cache. Each
+        document's answer is cached as if it had been asked on its own;
+        documents missing from an unparsable or incomplete answer fall back to
+        single-document calls.
+        """
+        requests = [self._company_request(text) for text in texts]
+        company_data: List[Optional[Dict[str, str]]] = [None] * len(texts)
+        
+        if not self.response_cache.offline:
+            for index, (_, _, _, cache_key) in enumerate(requests):
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    try:
+                        company_data[index] = self._parse_json_response(cached)
+                    except ValueError:
+                        pass
+            
+            uncached = [index for index, data in enumerate(company_data) if data is None]
+            if len(uncached) > 1:
+                documents = "\n\n".join(f"### Document {number}\n{texts[index]}"
+                                         for number, index in enumerate(uncached, start=1))
+                model = config.llm.company_model
+                messages = [
+                    {"role": "system", "content": "Extract company names from text. Return JSON only."},
+                    {"role": "user", "content": COMPANY_BATCH_PROMPT.format(documents=documents)}
+                ]
+                try:
+                    answers = self._parse_json_response(self.client.complete(
+                        model, messages, temperature=0.1, max_tokens=200 * len(uncached)))
+                except Exception as e:
+                    logger.warning(f"Batched company extraction failed, asking per document: {e}")
+                    answers = {}
+                
+                for number, index in enumerate(uncached, start=1):
+                    answer = answers.get(str(number)) if isinstance(answers, dict) else None
+                    if isinstance(answer, dict) and set(COMPANY_FIELDS) <= set(answer):
+                        company_data[index] = {field: answer[field] for field in COMPANY_FIELDS}
+                        model, _, _, cache_key = requests[index]
+                        self.response_cache.put(cache_key, json.dumps(company_data[index]), model,
+                                                COMPANY_PROMPT_VERSION)
+                logger.info(f"Extracted companies of {sum(1 for index in uncached if company_data[index])}"
+                            f"/{len(uncached)} documents in one request")
+        
+        # Single-document calls for whatever the batch did not answer
+        return [data if data is not None else self._extract_companies_fast(text)
+                for data, text in zip(company_data, texts)]
+    
     def _extract_companies_fast(self, text: str) -> Dict[str, str]:
-        """Extract company information with minimal OpenAI call"""
+        """Extract company information with minimal OpenAI call, reusing cached responses"""
+        model, messages, params, cache_key = self._company_request(text)
         
-        prompt = f"""
-Extract ONLY company names from this lighting report text. Return a simple JSON object.
-
-Text: {text}
-
-Return JSON with these fields (use null if not found):
-{{
-    "project_name": "string or null",
-    "project_company": "string or null", 
-    "luminaire_manufacturer": "string or null",
-    "driver_circuit_company": "string or null"
-}}
-
-Look for:
-- Project/company names
-- Luminaire manufacturers (like Philips, Osram, etc.)
-- Driver circuit companies
-- Brand names
-
-Return ONLY the JSON, no other text.
-"""
+        try:
+            cached = self.response_cache.get(cache_key)
+        except LLMCacheMiss as e:
+            logger.info(f"{e} - using the local company index")
+            return self.company_index.resolve(text).to_dict()
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",  # Faster model
-                messages=[
-                    {"role": "system", "content": "Extract company names from text. Return JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=200  # Small response
-            )
-            
-            response_text = response.choices[0].message.content.strip()
-            
-            # Clean up response
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            
-            return json.loads(response_text)
+            if cached is not None:
+                content = cached
+            else:
+                content = self.client.complete(model, messages, **params)
             
+            company_data = self._parse_json_response(content)
+            if cached is None:
+                self.response_cache.put(cache_key, content, model, COMPANY_PROMPT_VERSION)
+            return company_data
+        
         except Exception as e:
             logger.warning(f"OpenAI company extraction failed: {e}")
             return {
@@ -419,44 +476,6 @@ Return ONLY the JSON, no other text.
                 'driver_circuit_company': None
             }
     
-    def _extract_companies_regex(self, text: str) -> Dict[str, str]:
-        """Extract company information using regex patterns"""
-        companies = []
-        
-        for pattern in self.company_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    # Take the first non-empty group
-                    company = next((m for m in match if m and m.strip()), None)
-                else:
-                    company = match
-                
-                if company and company.strip() and len(company.strip()) > 2:
-                    companies.append(company.strip())
-        
-        # Remove duplicates and common words
-        companies = list(set(companies))
-        companies = [c for c in companies if c.lower() not in ['the', 'and', 'or', 'of', 'in', 'for', 'with', 'by']]
-        
-        # Try to identify specific company types
-        luminaire_manufacturer = None
-        project_company = None
-        
-        for company in companies:
-            company_lower = company.lower()
-            if any(brand in company_lower for brand in ['philips', 'osram', 'ge', 'signify', 'tridonic', 'mean well', 'helvar', 'lutron']):
-                luminaire_manufacturer = company
-            elif any(word in company_lower for word in ['project', 'client', 'company']):
-                project_company = company
-        
-        return {
-            'project_name': companies[0] if companies else None,
-            'project_company': project_company or (companies[0] if companies else None),
-            'luminaire_manufacturer': luminaire_manufacturer,
-            'driver_circuit_company': None  # Hard to identify with regex alone
-        }
-    
     def export_results(self, result: FocusedExtractionResult, output_path: Path) -> Dict[str, str]:
         """Export focused results"""
         output_path = Path(output_path)
@@ -0,0 +1,217 @@
+"""
+LLM Response Cache
+Disk-backed cache of chat completion responses keyed by model, prompt template version and prompt hash
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from dataclasses import dataclass, asdict
+
+try:
+    from ..core.config import config
+except ImportError:
+    from core.config import config
+
+logger = logging.getLogger(__name__)
+
+class LLMCacheMiss(Exception):
+    """Raised in offline mode when a prompt has no cached response"""
+
+@dataclass
+class LLMCacheStats:
+    """Cache lookups of the current process"""
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    stores: int = 0
+    evictions: int = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        stats = asdict(self)
+        stats['hit_rate'] = self.hit_rate
+        return stats
+
+def prompt_sha256(messages: List[Dict[str, str]]) -> str:
+    """Hash of the chat messages sent to the model"""
+    return hashlib.sha256(json.dumps(messages, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+
+class LLMResponseCache:
+    """
+    On-disk cache of LLM responses
+    
+    Entries are keyed by model, prompt template version, the SHA-256 of the
+    prompt and the sampling settings, so changing any of them never serves a
+    stale answer. Entries older than the TTL are dropped on read; when the
+    cache outgrows its size limit the least recently used entries are evicted.
+    In offline mode expired entries are still served and a miss raises
+    LLMCacheMiss instead of calling the API.
+    """
+    
+    def __init__(self, cache_dir: Union[str, Path], ttl_seconds: float, max_bytes: int,
+                 enabled: bool = True, offline: bool = False):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.offline = offline
+        self.stats = LLMCacheStats()
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+    
+    def key(self, model: str, template_version: str, messages: List[Dict[str, str]], **params: Any) -> str:
+        """
+        Cache key of a chat completion request
+        
+        Args:
+            model: Model name
+            template_version: Version of the prompt template
+            messages: Chat messages sent to the model
+            params: Sampling settings such as temperature and max_tokens
+        
+        Returns:
+            Hex digest key
+        """
+        parts = [model, template_version, prompt_sha256(messages), json.dumps(params, sort_keys=True)]
+        return hashlib.sha256("\x1f".join(parts).encode('utf-8')).hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Cached response text
+        
+        Returns:
+            The response, or None on a miss when online
+        
+        Raises:
+            LLMCacheMiss: On a miss in offline mode
+        """
+        content = self._read(key) if self.enabled or self.offline else None
+        with self._lock:
+            if content is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        
+        if content is None and self.offline:
+            raise LLMCacheMiss(f"No cached LLM response for {key[:12]} (offline mode)")
+        return content
+    
+    def _read(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read cached LLM response {key[:12]}: {e}")
+            return None
+        
+        if not self.offline and time.time() - entry.get('created', 0) > self.ttl_seconds:
+            with self._lock:
+                self.stats.expired += 1
+            self._remove(path)
+            return None
+        
+        # The modification time tracks the last use for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get('content')
+    
+    def put(self, key: str, content: str, model: str, template_version: str):
+        """Store a response atomically and evict old entries beyond the size limit"""
+        if not self.enabled:
+            return
+        
+        path = self._path(key)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        entry = {'model': model, 'template_version': template_version, 'created': time.time(), 'content': content}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            size = tmp_path.stat().st_size
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to cache LLM response {key[:12]}: {e}")
+            self._remove(tmp_path)
+            return
+        
+        with self._lock:
+            self.stats.stores += 1
+            if self._total_bytes is not None:
+                self._total_bytes += size
+            if self._total_bytes is None or self._total_bytes > self.max_bytes:
+                self._evict()
+    
+    def _evict(self):
+        """Drop expired entries, then the least recently used ones until the cache fits"""
+        entries = []
+        for path in self.cache_dir.glob('*/*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        
+        total = sum(size for _, size, _ in entries)
+        now = time.time()
+        for last_used, size, path in sorted(entries):
+            if total <= self.max_bytes and now - last_used <= self.ttl_seconds:
+                break
+            self._remove(path)
+            total -= size
+            self.stats.evictions += 1
+        self._total_bytes = total
+    
+    def _remove(self, path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+    
+    def usage(self) -> Dict[str, Any]:
+        """Entries and bytes currently on disk"""
+        sizes = [path.stat().st_size for path in self.cache_dir.glob('*/*.json')]
+        return {'entries': len(sizes), 'bytes': sum(sizes), 'max_bytes': self.max_bytes}
+    
+    def clear(self) -> int:
+        """Remove every cached response and return how many were removed"""
+        removed = 0
+        with self._lock:
+            for path in self.cache_dir.glob('*/*.json'):
+                self._remove(path)
+                removed += 1
+            self._total_bytes = 0
+        return removed
+
+_response_cache: Optional[LLMResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+def get_response_cache() -> LLMResponseCache:
+    """Response cache shared by all extractors of the process, created again when its directory changes"""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None or _response_cache.cache_dir != Path(config.llm.response_cache_dir):
+            _response_cache = LLMResponseCache(
+                config.llm.response_cache_dir,
+                ttl_seconds=config.llm.response_cache_ttl_days * 86400,
+                max_bytes=int(config.llm.response_cache_max_mb * 2**20),
+                enabled=config.llm.response_cache_enabled,
+                offline=config.llm.offline
+            )
+        return _response_cache
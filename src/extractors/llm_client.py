@@ -0,0 +1,209 @@
+"""
+Shared LLM Client
+One pooled, rate-limited OpenAI client per process with retry/backoff and request coalescing
+"""
+import os
+import json
+import time
+import random
+import asyncio
+import hashlib
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, asdict
+
+import openai
+
+try:
+    from ..core.config import config
+except ImportError:
+    from core.config import config
+
+logger = logging.getLogger(__name__)
+
+# Errors worth retrying: rate limits, timeouts, dropped connections and server errors
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError,
+                    openai.InternalServerError)
+
+class TokenBucket:
+    """Request budget of one model, refilled continuously"""
+    
+    def __init__(self, requests_per_minute: float, burst: int):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+    
+    def reserve(self) -> float:
+        """Take one request slot and return the seconds to wait before using it"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+@dataclass
+class LLMClientStats:
+    """Requests of the shared client in the current process"""
+    requests: int = 0  # completions asked for by callers
+    api_calls: int = 0  # HTTP requests sent, including retries
+    coalesced: int = 0  # requests answered by an identical one already in flight
+    retries: int = 0
+    rate_limited: int = 0  # 429 responses
+    throttle_seconds: float = 0.0  # time spent waiting for the rate limiter
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Server-requested delay of a rate limit response, if any"""
+    response = getattr(error, 'response', None)
+    if response is None:
+        return None
+    headers = response.headers
+    try:
+        if headers.get('retry-after-ms'):
+            return float(headers['retry-after-ms']) / 1000
+        if headers.get('retry-after'):
+            return float(headers['retry-after'])
+    except ValueError:
+        pass
+    return None
+
+class LLMClient:
+    """
+    Process-wide chat completion client
+    
+    Requests from every thread and event loop run on one background event
+    loop that owns a single AsyncOpenAI client, so HTTP connections are
+    pooled and reused across analyses. Each model has a token-bucket rate
+    limit; rate limit, timeout and server errors are retried with exponential
+    backoff and jitter, honoring Retry-After. Identical requests already in
+    flight are coalesced into one API call.
+    """
+    
+    def __init__(self, api_key: str, base_url: Optional[str] = None):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.llm_config = config.llm
+        self.stats = LLMClientStats()
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[openai.AsyncOpenAI] = None
+        self._connections: Optional[asyncio.Semaphore] = None
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._in_flight: Dict[str, Future] = {}
+    
+    def complete(self, model: str, messages: List[Dict[str, str]], **params: Any) -> str:
+        """
+        Run a chat completion and return the response text
+        
+        Args:
+            model: Model name
+            messages: Chat messages
+            params: Completion settings such as temperature and max_tokens
+        
+        Returns:
+            Content of the first choice
+        """
+        return self._submit(model, messages, params).result()
+    
+    async def complete_async(self, model: str, messages: List[Dict[str, str]], **params: Any) -> str:
+        """Run a chat completion from any event loop and return the response text"""
+        return await asyncio.wrap_future(self._submit(model, messages, params))
+    
+    def close(self):
+        """Close the connection pool and stop the background loop"""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.close(), loop).result()
+            self._client = None
+        loop.call_soon_threadsafe(loop.stop)
+    
+    def _submit(self, model: str, messages: List[Dict[str, str]], params: Dict[str, Any]) -> Future:
+        """Start a request, or join the identical one already in flight"""
+        key = hashlib.sha256(json.dumps([model, messages, params], sort_keys=True).encode('utf-8')).hexdigest()
+        with self._lock:
+            self.stats.requests += 1
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.stats.coalesced += 1
+                return future
+            
+            future = asyncio.run_coroutine_threadsafe(self._request(model, messages, params), self._event_loop())
+            self._in_flight[key] = future
+        future.add_done_callback(lambda _: self._forget(key))
+        return future
+    
+    def _forget(self, key: str):
+        with self._lock:
+            self._in_flight.pop(key, None)
+    
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """Background loop the requests run on, started on first use"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, name="llm-client", daemon=True).start()
+        return self._loop
+    
+    def _bucket(self, model: str) -> TokenBucket:
+        bucket = self._buckets.get(model)
+        if bucket is None:
+            limit = self.llm_config.model_requests_per_minute.get(model, self.llm_config.requests_per_minute)
+            bucket = self._buckets[model] = TokenBucket(limit, self.llm_config.rate_limit_burst)
+        return bucket
+    
+    async def _request(self, model: str, messages: List[Dict[str, str]], params: Dict[str, Any]) -> str:
+        """Send one completion on the background loop, with rate limiting and retries"""
+        if self._client is None:
+            # Retries are handled here, so they also pass the rate limiter
+            self._client = openai.AsyncOpenAI(api_key=self.api_key, base_url=self.base_url,
+                                              timeout=self.llm_config.request_timeout, max_retries=0)
+            self._connections = asyncio.Semaphore(max(1, self.llm_config.max_connections))
+        
+        attempt = 0
+        while True:
+            wait = self._bucket(model).reserve()
+            if wait > 0:
+                self.stats.throttle_seconds += wait
+                await asyncio.sleep(wait)
+            
+            try:
+                async with self._connections:
+                    self.stats.api_calls += 1
+                    response = await self._client.chat.completions.create(model=model, messages=messages, **params)
+                return response.choices[0].message.content
+            except RETRYABLE_ERRORS as e:
+                if isinstance(e, openai.RateLimitError):
+                    self.stats.rate_limited += 1
+                if attempt >= self.llm_config.max_retries:
+                    raise
+                
+                delay = _retry_after(e)
+                if delay is None:
+                    backoff = min(self.llm_config.backoff_max, self.llm_config.backoff_base * 2 ** attempt)
+                    delay = backoff * (0.5 + random.random() / 2)
+                attempt += 1
+                self.stats.retries += 1
+                logger.warning(f"LLM request to {model} failed ({type(e).__name__}), "
+                               f"retry {attempt}/{self.llm_config.max_retries} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+_clients: Dict[Tuple[str, Optional[str]], LLMClient] = {}
+_clients_lock = threading.Lock()
+
+def get_llm_client(api_key: str) -> LLMClient:
+    """Shared client of the process for an API key and the configured endpoint"""
+    key = (api_key, config.llm.base_url)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None or client.pid != os.getpid():
+            # A forked worker cannot use its parent's event loop thread
+            client = _clients[key] = LLMClient(api_key, config.llm.base_url)
+        return client
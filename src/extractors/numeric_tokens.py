@@ -0,0 +1,60 @@
+"""
+Numeric Token Stream
+Scans report text once for numbers with their units and labels
+"""
+import re
+from typing import List, NamedTuple
+
+# One scan over the document yields every number with the word before it and the unit after it
+NUMERIC_TOKEN_PATTERN = re.compile(
+    r'(?:\b(?P<label>[a-z]+)[:\s]*)?'
+    r'(?P<value>\d+(?:\.\d+)?)'
+    r'(?P<gap>\s*)'
+    r'(?P<unit>m\s*[²2](?!\d)|m\^2|sqm|sq\.?\s*m|square\s*m|m\s*square|lux|lx)?',
+    re.IGNORECASE
+)
+
+LUX_UNITS = ('lux', 'lx')
+AREA_UNITS = ('m2', 'm^2', 'sqm', 'squarem', 'msquare')
+UNIFORMITY_LABELS = ('u', 'uniformity', 'uniform')
+UGR_LABELS = ('ugr', 'glare')
+
+class NumericToken(NamedTuple):
+    """A number in the document with its unit and surroundings"""
+    value: float
+    unit: str  # normalized: lowercase, no spaces or dots, ² as 2
+    offset: int
+    label: str = ""  # lowercase word directly before the number
+    integer_digits: int = 0
+    spaced: bool = False  # whitespace between the number and what follows
+    next_char: str = ""  # first character after the number and its unit
+    before_uniformity: bool = False  # directly followed by a uniformity label
+
+def tokenize_numbers(text: str) -> List[NumericToken]:
+    """
+    Scan text once for numbers with their units
+    
+    Args:
+        text: Document text
+    
+    Returns:
+        Numeric tokens in document order
+    """
+    tokens = []
+    for match in NUMERIC_TOKEN_PATTERN.finditer(text):
+        raw_value = match.group('value')
+        unit = match.group('unit') or ''
+        if unit:
+            unit = ''.join(unit.lower().replace('²', '2').replace('.', '').split())
+        end = match.end()
+        tokens.append(NumericToken(
+            value=float(raw_value),
+            unit=unit,
+            offset=match.start('value'),
+            label=(match.group('label') or '').lower(),
+            integer_digits=len(raw_value.split('.', 1)[0]),
+            spaced=bool(match.group('gap')),
+            next_char=text[end:end + 1],
+            before_uniformity=not unit and text[end:end + 7].lower() == 'uniform'
+        ))
+    return tokens
@@ -4,24 +4,245 @@ Uses OpenAI GPT for smart extraction of detailed information from Dialux reports
 """
 import os
 import json
+import asyncio
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Tuple, Awaitable
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
-import openai
 import pandas as pd
 
 try:
     from ..core.config import config
-    from ..extractors.pdf_extractor import PDFExtractor
+    from ..extractors.pdf_extractor import PDFExtractor, split_pages
+    from ..extractors.llm_cache import get_response_cache
+    from ..extractors.llm_client import get_llm_client
+    from ..extractors.page_relevance import ROOM_PROFILE, select_relevant_pages
 except ImportError:
     from core.config import config
-    from extractors.pdf_extractor import PDFExtractor
+    from extractors.pdf_extractor import PDFExtractor, split_pages
+    from extractors.llm_cache import get_response_cache
+    from extractors.llm_client import get_llm_client
+    from extractors.page_relevance import ROOM_PROFILE, select_relevant_pages
 
 logger = logging.getLogger(__name__)
 
+EXTRACTION_SYSTEM_PROMPT = ("You are an expert lighting engineer. "
+                            "Extract structured data from lighting reports and return valid JSON only.")
+
+# Bump when the prompt changes so cached responses to the old prompt are not reused
+EXTRACTION_PROMPT_VERSION = "1"
+
+EXTRACTION_PROMPT = """
+You are an expert lighting engineer analyzing a Dialux lighting report. Extract the following information from the text below and return it as a JSON object.
+
+IMPORTANT: 
+- Extract ALL numerical values (areas, illuminance, etc.) as numbers, not text
+- If area is mentioned in square meters (m²), convert to float
+- If illuminance is in lux, extract as float
+- If uniformity is a ratio (like 0.6), extract as float
+- If UGR is mentioned, extract as float
+- If power density is in W/m², extract as float
+
+Text to analyze:
+{text}
+
+Extract and return a JSON object with this structure:
+{{
+    "project_metadata": {{
+        "project_name": "string or null",
+        "project_location": "string or null", 
+        "project_date": "string or null",
+        "project_type": "string or null",
+        "building_type": "string or null",
+        "total_area": number or null,
+        "total_rooms": number or null
+    }},
+    "company_info": {{
+        "project_company": "string or null",
+        "luminaire_manufacturer": "string or null", 
+        "driver_circuit_company": "string or null",
+        "consultant_company": "string or null",
+        "installer_company": "string or null"
+    }},
+    "luminaire_details": [
+        {{
+            "luminaire_model": "string or null",
+            "luminaire_type": "string or null",
+            "driver_type": "string or null", 
+            "driver_model": "string or null",
+            "power_consumption": number or null,
+            "luminous_flux": number or null,
+            "color_temperature": number or null,
+            "cri": number or null,
+            "beam_angle": number or null
+        }}
+    ],
+    "room_details": [
+        {{
+            "room_name": "string",
+            "room_type": "string",
+            "area": number,
+            "illuminance_avg": number or null,
+            "illuminance_min": number or null, 
+            "illuminance_max": number or null,
+            "uniformity": number or null,
+            "ugr": number or null,
+            "power_density": number or null,
+            "luminaire_count": number or null,
+            "luminaire_spacing": number or null
+        }}
+    ],
+    "confidence": number between 0 and 1
+}}
+
+Focus on finding:
+1. All room areas (in m²) - this is critical!
+2. Illuminance values (in lux)
+3. Uniformity ratios
+4. UGR values
+5. Power density (W/m²)
+6. Company names and manufacturers
+7. Driver circuit information
+8. Luminaire specifications
+
+Return ONLY the JSON object, no other text.
+"""
+
+def _split_long_page(page: str, max_chars: int) -> List[str]:
+    """Split a page longer than max_chars at line breaks"""
+    pieces = []
+    current = ""
+    for line in page.splitlines(keepends=True):
+        while len(line) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(line[:max_chars])
+            line = line[max_chars:]
+        if current and len(current) + len(line) > max_chars:
+            pieces.append(current)
+            current = ""
+        current += line
+    if current:
+        pieces.append(current)
+    return pieces
+
+def chunk_pages(text: str, max_chars: int) -> List[str]:
+    """
+    Group the pages of a report into chunks of at most max_chars
+    
+    Chunks end at page boundaries; only a page longer than max_chars is split,
+    at line breaks.
+    
+    Args:
+        text: Text produced by PDFExtractor
+        max_chars: Maximum chunk size in characters
+    
+    Returns:
+        Text chunks in document order
+    """
+    chunks = []
+    current = ""
+    for _, page in split_pages(text):
+        for piece in ([page] if len(page) <= max_chars else _split_long_page(page, max_chars)):
+            if current and len(current) + len(piece) > max_chars:
+                chunks.append(current)
+                current = ""
+            current += piece
+    if current.strip():
+        chunks.append(current)
+    return chunks
+
+def _normalized(value: Any) -> str:
+    """Lowercase text with collapsed whitespace, for matching names across chunks"""
+    return " ".join(str(value).lower().split()) if value is not None else ""
+
+def _number(value: Any) -> Optional[float]:
+    """Numeric value of an extracted field, None if it is not a number"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def _fill_missing(target: Dict[str, Any], source: Dict[str, Any]):
+    """Copy the values target does not have yet"""
+    for key, value in source.items():
+        if target.get(key) in (None, "") and value not in (None, ""):
+            target[key] = value
+
+def _same_room(room: Dict[str, Any], other: Dict[str, Any]) -> bool:
+    """Rooms match by name, unless both have clearly different areas"""
+    if _normalized(room.get('room_name')) != _normalized(other.get('room_name')):
+        return False
+    area, other_area = _number(room.get('area')), _number(other.get('area'))
+    if not area or not other_area:
+        return True
+    return abs(area - other_area) <= 0.01 * max(area, other_area)
+
+def _luminaire_key(luminaire: Dict[str, Any]) -> Tuple[str, ...]:
+    key = tuple(_normalized(luminaire.get(field)) for field in ('luminaire_model', 'luminaire_type', 'driver_model'))
+    if any(key):
+        return key
+    return tuple(_normalized(value) for _, value in sorted(luminaire.items()))
+
+def merge_chunk_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge the JSON objects extracted from each chunk
+    
+    Project and company fields take the first value found. Rooms seen in
+    several chunks (same name, matching area) and repeated luminaires are
+    merged into one entry that keeps every value found.
+    
+    Args:
+        results: Parsed chunk responses in chunk order
+    
+    Returns:
+        One JSON object in the single-request layout
+    """
+    merged = {'project_metadata': {}, 'company_info': {}, 'luminaire_details': [], 'room_details': []}
+    luminaires = {}
+    
+    for result in results:
+        for section in ('project_metadata', 'company_info'):
+            if isinstance(result.get(section), dict):
+                _fill_missing(merged[section], result[section])
+        
+        for luminaire in result.get('luminaire_details') or []:
+            if not isinstance(luminaire, dict):
+                continue
+            key = _luminaire_key(luminaire)
+            if key in luminaires:
+                _fill_missing(luminaires[key], luminaire)
+            else:
+                luminaires[key] = dict(luminaire)
+                merged['luminaire_details'].append(luminaires[key])
+        
+        for room in result.get('room_details') or []:
+            if not isinstance(room, dict):
+                continue
+            existing = next((other for other in merged['room_details'] if _same_room(room, other)), None)
+            if existing is not None:
+                _fill_missing(existing, room)
+            else:
+                merged['room_details'].append(dict(room))
+    
+    confidences = [value for value in (_number(result.get('confidence')) for result in results) if value is not None]
+    merged['confidence'] = sum(confidences) / len(confidences) if confidences else 0.8
+    return merged
+
+def _run_coroutine(coroutine: Awaitable[Any]) -> Any:
+    """Run a coroutine to completion, also when called from inside a running event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
 @dataclass
 class CompanyInfo:
     """Company information extracted from report"""
@@ -88,12 +309,14 @@ class OpenAIIntelligentExtractor:
     def __init__(self, api_key: str = None):
         """Initialize the OpenAI extractor"""
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
+        if not self.api_key and not config.llm.offline:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable or pass api_key parameter.")
         
-        # Set up OpenAI client
-        openai.api_key = self.api_key
-        self.client = openai.OpenAI(api_key=self.api_key)
+        # Requests go to the configured OpenAI-compatible endpoint
+        self.llm_config = config.llm
+        self.model = self.llm_config.extraction_model
+        self.response_cache = get_response_cache()
+        self.llm_client = get_llm_client(self.api_key) if self.api_key else None
         
         # Initialize PDF extractor for getting raw text
         self.pdf_extractor = PDFExtractor()
@@ -134,7 +357,7 @@ class OpenAIIntelligentExtractor:
                 raw_text=raw_text,
                 extraction_confidence=extracted_data.get('confidence', 0.8),
                 processing_time=processing_time,
-                openai_model_used="gpt-4"
+                openai_model_used=self.model
             )
             
         except Exception as e:
@@ -142,179 +365,147 @@ class OpenAIIntelligentExtractor:
             raise
     
     def _extract_with_openai(self, text: str) -> Dict[str, Any]:
-        """Use OpenAI to extract structured data from text"""
+        """Use OpenAI to extract structured data from the most relevant pages, one request per page-aligned chunk"""
+        text = select_relevant_pages(text, ROOM_PROFILE, self.llm_config.extraction_token_budget)
+        chunk_results = _run_coroutine(self._extract_chunks_async(chunk_pages(text, self.llm_config.chunk_chars)))
+        stats = self.response_cache.stats
+        logger.info(f"LLM response cache: {stats.hits} hits, {stats.misses} misses ({stats.hit_rate:.0%} hit rate)")
+        return self._to_dataclasses(merge_chunk_results(chunk_results))
+    
+    async def _extract_chunks_async(self, chunks: List[str]) -> List[Dict[str, Any]]:
+        """
+        Send the chunk requests concurrently, at most max_concurrency at a time
         
-        prompt = f"""
-You are an expert lighting engineer analyzing a Dialux lighting report. Extract the following information from the text below and return it as a JSON object.
-
-IMPORTANT: 
-- Extract ALL numerical values (areas, illuminance, etc.) as numbers, not text
-- If area is mentioned in square meters (m²), convert to float
-- If illuminance is in lux, extract as float
-- If uniformity is a ratio (like 0.6), extract as float
-- If UGR is mentioned, extract as float
-- If power density is in W/m², extract as float
-
-Text to analyze:
-{text[:8000]}  # Limit text to avoid token limits
-
-Extract and return a JSON object with this structure:
-{{
-    "project_metadata": {{
-        "project_name": "string or null",
-        "project_location": "string or null", 
-        "project_date": "string or null",
-        "project_type": "string or null",
-        "building_type": "string or null",
-        "total_area": number or null,
-        "total_rooms": number or null
-    }},
-    "company_info": {{
-        "project_company": "string or null",
-        "luminaire_manufacturer": "string or null", 
-        "driver_circuit_company": "string or null",
-        "consultant_company": "string or null",
-        "installer_company": "string or null"
-    }},
-    "luminaire_details": [
-        {{
-            "luminaire_model": "string or null",
-            "luminaire_type": "string or null",
-            "driver_type": "string or null", 
-            "driver_model": "string or null",
-            "power_consumption": number or null,
-            "luminous_flux": number or null,
-            "color_temperature": number or null,
-            "cri": number or null,
-            "beam_angle": number or null
-        }}
-    ],
-    "room_details": [
-        {{
-            "room_name": "string",
-            "room_type": "string",
-            "area": number,
-            "illuminance_avg": number or null,
-            "illuminance_min": number or null, 
-            "illuminance_max": number or null,
-            "uniformity": number or null,
-            "ugr": number or null,
-            "power_density": number or null,
-            "luminaire_count": number or null,
-            "luminaire_spacing": number or null
-        }}
-    ],
-    "confidence": number between 0 and 1
-}}
-
-Focus on finding:
-1. All room areas (in m²) - this is critical!
-2. Illuminance values (in lux)
-3. Uniformity ratios
-4. UGR values
-5. Power density (W/m²)
-6. Company names and manufacturers
-7. Driver circuit information
-8. Luminaire specifications
-
-Return ONLY the JSON object, no other text.
-"""
+        Failed chunks are logged and left out; extraction only fails if every chunk fails.
         
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert lighting engineer. Extract structured data from lighting reports and return valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=4000
-            )
-            
-            # Parse the response
-            response_text = response.choices[0].message.content.strip()
-            
-            # Clean up the response (remove any markdown formatting)
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            
-            # Parse JSON
-            extracted_data = json.loads(response_text)
-            
-            # Convert to proper data classes
-            result = {}
-            
-            # Project metadata
-            if 'project_metadata' in extracted_data:
-                pm_data = extracted_data['project_metadata']
-                result['project_metadata'] = ProjectMetadata(
-                    project_name=pm_data.get('project_name'),
-                    project_location=pm_data.get('project_location'),
-                    project_date=pm_data.get('project_date'),
-                    project_type=pm_data.get('project_type'),
-                    building_type=pm_data.get('building_type'),
-                    total_area=pm_data.get('total_area'),
-                    total_rooms=pm_data.get('total_rooms')
-                )
-            
-            # Company info
-            if 'company_info' in extracted_data:
-                ci_data = extracted_data['company_info']
-                result['company_info'] = CompanyInfo(
-                    project_company=ci_data.get('project_company'),
-                    luminaire_manufacturer=ci_data.get('luminaire_manufacturer'),
-                    driver_circuit_company=ci_data.get('driver_circuit_company'),
-                    consultant_company=ci_data.get('consultant_company'),
-                    installer_company=ci_data.get('installer_company')
-                )
-            
-            # Luminaire details
-            result['luminaire_details'] = []
-            if 'luminaire_details' in extracted_data:
-                for ld_data in extracted_data['luminaire_details']:
-                    result['luminaire_details'].append(LuminaireDetails(
-                        luminaire_model=ld_data.get('luminaire_model'),
-                        luminaire_type=ld_data.get('luminaire_type'),
-                        driver_type=ld_data.get('driver_type'),
-                        driver_model=ld_data.get('driver_model'),
-                        power_consumption=ld_data.get('power_consumption'),
-                        luminous_flux=ld_data.get('luminous_flux'),
-                        color_temperature=ld_data.get('color_temperature'),
-                        cri=ld_data.get('cri'),
-                        beam_angle=ld_data.get('beam_angle')
-                    ))
-            
-            # Room details
-            result['room_details'] = []
-            if 'room_details' in extracted_data:
-                for rd_data in extracted_data['room_details']:
-                    result['room_details'].append(RoomDetails(
-                        room_name=rd_data.get('room_name', 'Unknown'),
-                        room_type=rd_data.get('room_type', 'unknown'),
-                        area=rd_data.get('area', 0.0),
-                        illuminance_avg=rd_data.get('illuminance_avg'),
-                        illuminance_min=rd_data.get('illuminance_min'),
-                        illuminance_max=rd_data.get('illuminance_max'),
-                        uniformity=rd_data.get('uniformity'),
-                        ugr=rd_data.get('ugr'),
-                        power_density=rd_data.get('power_density'),
-                        luminaire_count=rd_data.get('luminaire_count'),
-                        luminaire_spacing=rd_data.get('luminaire_spacing')
-                    ))
-            
-            result['confidence'] = extracted_data.get('confidence', 0.8)
-            
-            return result
+        Args:
+            chunks: Page-aligned text chunks
+        
+        Returns:
+            Parsed JSON object of each successful chunk, in chunk order
+        """
+        if not chunks:
+            chunks = ["No readable text found in PDF"]
+        
+        semaphore = asyncio.Semaphore(max(1, self.llm_config.max_concurrency))
+        params = {'temperature': self.llm_config.temperature, 'max_tokens': self.llm_config.max_tokens}
+        
+        async def extract_chunk(index: int, chunk: str) -> Dict[str, Any]:
+            messages = [
+                {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+                {"role": "user", "content": EXTRACTION_PROMPT.format(text=chunk)}
+            ]
+            cache_key = self.response_cache.key(self.model, EXTRACTION_PROMPT_VERSION, messages, **params)
+            content = self.response_cache.get(cache_key)
+            if content is not None:
+                return self._parse_response(content)
             
+            async with semaphore:
+                logger.info(f"Extracting chunk {index + 1}/{len(chunks)} ({len(chunk)} characters)")
+                content = await self.llm_client.complete_async(self.model, messages, **params)
+            parsed = self._parse_response(content)
+            self.response_cache.put(cache_key, content, self.model, EXTRACTION_PROMPT_VERSION)
+            return parsed
+        
+        results = await asyncio.gather(*(extract_chunk(index, chunk) for index, chunk in enumerate(chunks)),
+                                       return_exceptions=True)
+        
+        parsed = []
+        errors = []
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                logger.error(f"OpenAI extraction failed for chunk {index + 1}/{len(chunks)}: {result}")
+                errors.append(result)
+            else:
+                parsed.append(result)
+        
+        if not parsed:
+            raise errors[0]
+        return parsed
+    
+    def _parse_response(self, response_text: str) -> Dict[str, Any]:
+        """Parse a JSON response, removing any markdown formatting"""
+        response_text = (response_text or "").strip()
+        if response_text.startswith("```json"):
+            response_text = response_text[7:]
+        elif response_text.startswith("```"):
+            response_text = response_text[3:]
+        if response_text.endswith("```"):
+            response_text = response_text[:-3]
+        
+        try:
+            return json.loads(response_text)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse OpenAI response as JSON: {e}")
             logger.error(f"Response was: {response_text}")
             raise
-        except Exception as e:
-            logger.error(f"OpenAI extraction failed: {e}")
-            raise
+    
+    def _to_dataclasses(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert merged JSON data to extraction dataclasses"""
+        # Convert to proper data classes
+        result = {}
+        
+        # Project metadata
+        if 'project_metadata' in extracted_data:
+            pm_data = extracted_data['project_metadata']
+            result['project_metadata'] = ProjectMetadata(
+                project_name=pm_data.get('project_name'),
+                project_location=pm_data.get('project_location'),
+                project_date=pm_data.get('project_date'),
+                project_type=pm_data.get('project_type'),
+                building_type=pm_data.get('building_type'),
+                total_area=pm_data.get('total_area'),
+                total_rooms=pm_data.get('total_rooms')
+            )
+        
+        # Company info
+        if 'company_info' in extracted_data:
+            ci_data = extracted_data['company_info']
+            result['company_info'] = CompanyInfo(
+                project_company=ci_data.get('project_company'),
+                luminaire_manufacturer=ci_data.get('luminaire_manufacturer'),
+                driver_circuit_company=ci_data.get('driver_circuit_company'),
+                consultant_company=ci_data.get('consultant_company'),
+                installer_company=ci_data.get('installer_company')
+            )
+        
+        # Luminaire details
+        result['luminaire_details'] = []
+        if 'luminaire_details' in extracted_data:
+            for ld_data in extracted_data['luminaire_details']:
+                result['luminaire_details'].append(LuminaireDetails(
+                    luminaire_model=ld_data.get('luminaire_model'),
+                    luminaire_type=ld_data.get('luminaire_type'),
+                    driver_type=ld_data.get('driver_type'),
+                    driver_model=ld_data.get('driver_model'),
+                    power_consumption=ld_data.get('power_consumption'),
+                    luminous_flux=ld_data.get('luminous_flux'),
+                    color_temperature=ld_data.get('color_temperature'),
+                    cri=ld_data.get('cri'),
+                    beam_angle=ld_data.get('beam_angle')
+                ))
+        
+        # Room details
+        result['room_details'] = []
+        if 'room_details' in extracted_data:
+            for rd_data in extracted_data['room_details']:
+                result['room_details'].append(RoomDetails(
+                    room_name=rd_data.get('room_name', 'Unknown'),
+                    room_type=rd_data.get('room_type', 'unknown'),
+                    area=rd_data.get('area', 0.0),
+                    illuminance_avg=rd_data.get('illuminance_avg'),
+                    illuminance_min=rd_data.get('illuminance_min'),
+                    illuminance_max=rd_data.get('illuminance_max'),
+                    uniformity=rd_data.get('uniformity'),
+                    ugr=rd_data.get('ugr'),
+                    power_density=rd_data.get('power_density'),
+                    luminaire_count=rd_data.get('luminaire_count'),
+                    luminaire_spacing=rd_data.get('luminaire_spacing')
+                ))
+        
+        result['confidence'] = extracted_data.get('confidence', 0.8)
+        
+        return result
     
     def export_results(self, result: IntelligentExtractionResult, output_path: Path) -> Dict[str, str]:
         """Export extraction results to various formats"""
@@ -0,0 +1,147 @@
+"""
+Page Relevance Ranking
+Ranks report pages by keyword and numeric-unit density so LLM prompts carry the pages that matter
+"""
+import re
+import logging
+from typing import List, Pattern
+from dataclasses import dataclass
+
+try:
+    from ..extractors.pdf_extractor import split_pages
+    from ..extractors.numeric_tokens import UNIFORMITY_LABELS, UGR_LABELS, tokenize_numbers
+except ImportError:
+    from extractors.pdf_extractor import split_pages
+    from extractors.numeric_tokens import UNIFORMITY_LABELS, UGR_LABELS, tokenize_numbers
+
+logger = logging.getLogger(__name__)
+
+WORD_PATTERN = re.compile(r'\w+')
+
+# Density is taken over at least this many words, so near-empty pages do not rank high on one hit
+MIN_DENSITY_WORDS = 50
+
+# Luminaire values the numeric token stream does not carry a unit for
+LUMINAIRE_UNIT_PATTERN = re.compile(r'\d\s*(?:lm/w|lm|w|k|cd)\b', re.IGNORECASE)
+
+# Pages scoring below this share of the best page are left out even if the budget allows
+MIN_RELATIVE_SCORE = 0.1
+
+# Rough characters per prompt token for English report text
+CHARS_PER_TOKEN = 4
+
+@dataclass
+class RelevanceProfile:
+    """What makes a page relevant to one prompt"""
+    keyword_pattern: Pattern
+    keyword_weight: float = 1.0
+    unit_weight: float = 0.0  # weight of numbers with a lighting unit or label
+    keep_first_page: bool = False  # the cover page carries project metadata
+
+@dataclass
+class PageRelevance:
+    """Relevance score of one report page"""
+    page_number: int
+    text: str
+    score: float
+
+# Room summaries and luminaire lists: lighting keywords and many values with units
+ROOM_PROFILE = RelevanceProfile(
+    keyword_pattern=re.compile(
+        r'\b(?:rooms?|spaces?|zones?|office|corridor|illuminance|uniformity|ugr|glare|luminaires?|'
+        r'workplane|calculation|utili[sz]ation|maintenance|lumens?|flux|w/m)\b',
+        re.IGNORECASE
+    ),
+    keyword_weight=1.0,
+    unit_weight=2.0,
+    keep_first_page=True
+)
+
+# Cover, contact and luminaire pages naming companies and manufacturers
+COMPANY_PROFILE = RelevanceProfile(
+    keyword_pattern=re.compile(
+        r'\b(?:company|manufacturer|project|customer|client|designer|consultant|installer|contractor|'
+        r'partner|driver|ltd|gmbh|inc|llc|plc|philips|signify|osram|ledvance|zumtobel|thorn|trilux|'
+        r'fagerhult|erco|iguzzini)\b',
+        re.IGNORECASE
+    ),
+    keyword_weight=1.0
+)
+
+def estimate_tokens(text: str) -> int:
+    """Approximate prompt tokens of a text"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+def score_pages(text: str, profile: RelevanceProfile) -> List[PageRelevance]:
+    """
+    Score every page of a report for one prompt
+    
+    The score is the density of profile keywords plus, weighted, the density
+    of numbers carrying a lighting unit or a uniformity/UGR label.
+    
+    Args:
+        text: Text produced by PDFExtractor
+        profile: Relevance profile of the prompt
+    
+    Returns:
+        Page scores in document order
+    """
+    scores = []
+    for page_number, page_text in split_pages(text):
+        words = max(len(WORD_PATTERN.findall(page_text)), MIN_DENSITY_WORDS)
+        score = profile.keyword_weight * len(profile.keyword_pattern.findall(page_text)) / words
+        if profile.unit_weight:
+            unit_values = sum(1 for token in tokenize_numbers(page_text)
+                              if token.unit or token.label.endswith(UNIFORMITY_LABELS + UGR_LABELS))
+            unit_values += len(LUMINAIRE_UNIT_PATTERN.findall(page_text))
+            score += profile.unit_weight * unit_values / words
+        scores.append(PageRelevance(page_number, page_text, score))
+    return scores
+
+def select_relevant_pages(text: str, profile: RelevanceProfile, token_budget: int) -> str:
+    """
+    Keep the most relevant pages of a report within a token budget
+    
+    Pages are taken in order of relevance until the budget is spent and
+    returned in document order with their page markers. Text that fits the
+    budget is returned unchanged; pages scoring far below the best page are
+    left out even when the budget would allow them.
+    
+    Args:
+        text: Text produced by PDFExtractor
+        profile: Relevance profile of the prompt
+        token_budget: Maximum estimated prompt tokens of the selected text
+    
+    Returns:
+        Selected page text
+    """
+    if estimate_tokens(text) <= token_budget:
+        return text
+    
+    pages = score_pages(text, profile)
+    ranked = sorted(range(len(pages)), key=lambda index: (-pages[index].score, index))
+    if profile.keep_first_page and pages:
+        ranked.remove(0)
+        ranked.insert(0, 0)
+    
+    min_score = max((page.score for page in pages), default=0.0) * MIN_RELATIVE_SCORE
+    
+    selected = {}
+    remaining = token_budget
+    for index in ranked:
+        page = pages[index]
+        if remaining <= 0 or (selected and (page.score <= 0 or page.score < min_score)):
+            break
+        tokens = estimate_tokens(page.text)
+        if tokens > remaining:
+            if selected:
+                continue  # a smaller page further down may still fit
+            selected[index] = page.text[:remaining * CHARS_PER_TOKEN]
+            break
+        selected[index] = page.text
+        remaining -= tokens
+    
+    selected_text = "".join(selected[index] for index in sorted(selected))
+    logger.info(f"Selected {len(selected)} of {len(pages)} pages for the prompt "
+                f"({estimate_tokens(selected_text)} of {estimate_tokens(text)} estimated tokens)")
+    return selected_text
@@ -50,6 +50,32 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Page markers written in front of each page's text
+PAGE_MARKER_PATTERN = re.compile(r'^--- Page (\d+)(?: \(OCR\))? ---$', re.MULTILINE)
+
+def split_pages(text: str) -> List[Tuple[int, str]]:
+    """
+    Split extracted text at its page markers
+    
+    Args:
+        text: Text produced by PDFExtractor
+    
+    Returns:
+        (page number, page text including its marker) in document order; text
+        without markers is returned as page 1
+    """
+    markers = list(PAGE_MARKER_PATTERN.finditer(text))
+    if not markers:
+        return [(1, text)] if text.strip() else []
+    
+    pages = []
+    if text[:markers[0].start()].strip():
+        pages.append((1, text[:markers[0].start()]))
+    for marker, next_marker in zip(markers, markers[1:] + [None]):
+        end = next_marker.start() if next_marker else len(text)
+        pages.append((int(marker.group(1)), text[marker.start():end]))
+    return pages
+
 @dataclass
 class ExtractionResult:
     """Result of PDF extraction"""
@@ -92,35 +92,41 @@ class AdvancedTableExtractor:
         if OCR_AVAILABLE and self.config.tesseract_cmd:
             pytesseract.pytesseract.tesseract_cmd = self.config.tesseract_cmd
     
-    def extract_tables_from_pdf(self, pdf_path: Union[str, Path]) -> List[ExtractedTable]:
+    def extract_tables_from_pdf(self, pdf_path: Union[str, Path],
+                                pages: Optional[List[int]] = None) -> List[ExtractedTable]:
         """
         Extract all tables from PDF with quality analysis
         
         Args:
             pdf_path: Path to PDF file
+            pages: One-based page numbers to extract from (all pages if None)
             
         Returns:
             List of ExtractedTable objects with quality metrics
         """
         pdf_path = Path(pdf_path)
-        logger.info(f"Starting advanced table extraction from: {pdf_path}")
+        if pages is not None:
+            pages = sorted(set(pages))
+            logger.info(f"Starting advanced table extraction from: {pdf_path} (pages {pages})")
+        else:
+            logger.info(f"Starting advanced table extraction from: {pdf_path}")
         
         all_tables = []
         
         # Method 1: Camelot (lattice and stream)
         if CAMELOT_AVAILABLE and self.config.use_camelot:
-            camelot_tables = self._extract_with_camelot(pdf_path)
+            camelot_tables = self._extract_with_camelot(pdf_path, pages)
             all_tables.extend(camelot_tables)
             logger.info(f"Camelot extracted {len(camelot_tables)} tables")
         
         # Method 2: pdfplumber
-        pdfplumber_tables = self._extract_with_pdfplumber(pdf_path)
+        pdfplumber_tables = self._extract_with_pdfplumber(pdf_path, pages)
         all_tables.extend(pdfplumber_tables)
         logger.info(f"pdfplumber extracted {len(pdfplumber_tables)} tables")
         
         # Method 3: OCR-based grid detection
         if OCR_AVAILABLE and self.config.use_ocr:
-            ocr_tables = self._extract_with_ocr_grid(pdf_path)
+            ocr_tables = self._extract_with_ocr_grid(pdf_path, pages)
             all_tables.extend(ocr_tables)
             logger.info(f"OCR grid extraction found {len(ocr_tables)} tables")
         
@@ -134,13 +140,16 @@ class AdvancedTableExtractor:
         logger.info(f"Final result: {len(unique_tables)} high-quality unique tables")
         return unique_tables
     
-    def _extract_with_camelot(self, pdf_path: Path) -> List[ExtractedTable]:
+    def _extract_with_camelot(self, pdf_path: Path, pages: Optional[List[int]] = None) -> List[ExtractedTable]:
         """Extract tables using Camelot with both lattice and stream methods"""
         tables = []
+        page_spec = ','.join(str(page) for page in pages) if pages is not None else 'all'
+        if not page_spec:
+            return tables
         
         for flavor in self.config.camelot_flavors:
             try:
-                camelot_tables = camelot.read_pdf(str(pdf_path), pages='all', flavor=flavor)
+                camelot_tables = camelot.read_pdf(str(pdf_path), pages=page_spec, flavor=flavor)
                 
                 for i, table in enumerate(camelot_tables):
                     if table.df is not None and not table.df.empty:
@@ -162,12 +171,14 @@ class AdvancedTableExtractor:
         
         return tables
     
-    def _extract_with_pdfplumber(self, pdf_path: Path) -> List[ExtractedTable]:
+    def _extract_with_pdfplumber(self, pdf_path: Path, pages: Optional[List[int]] = None) -> List[ExtractedTable]:
         """Extract tables using pdfplumber"""
         tables = []
         
         with pdfplumber.open(pdf_path) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
+                if pages is not None and page_num not in pages:
+                    continue
                 try:
                     page_tables = page.extract_tables()
                     
@@ -193,7 +204,7 @@ class AdvancedTableExtractor:
         
         return tables
     
-    def _extract_with_ocr_grid(self, pdf_path: Path) -> List[ExtractedTable]:
+    def _extract_with_ocr_grid(self, pdf_path: Path, pages: Optional[List[int]] = None) -> List[ExtractedTable]:
         """Extract tables using OCR-based grid detection"""
         if not OCR_AVAILABLE:
             return []
@@ -201,10 +212,15 @@ class AdvancedTableExtractor:
         tables = []
         
         try:
-            # Convert PDF to images
-            pages = convert_from_path(pdf_path, dpi=self.config.ocr_dpi)
+            # Convert PDF to images, rendering only the requested pages
+            if pages is None:
+                images = list(enumerate(convert_from_path(pdf_path, dpi=self.config.ocr_dpi), 1))
+            else:
+                images = [(page, image) for page in pages
+                          for image in convert_from_path(pdf_path, dpi=self.config.ocr_dpi,
+                                                         first_page=page, last_page=page)]
             
-            for page_num, pil_img in enumerate(pages, 1):
+            for page_num, pil_img in images:
                 img = np.array(pil_img.convert("RGB"))[:, :, ::-1]
                 gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
                 
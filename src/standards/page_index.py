@@ -0,0 +1,141 @@
+"""
+Page Fingerprint Index for Standards Documents
+Tracks per-page content hashes so unchanged pages are not re-extracted
+"""
+import json
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Union
+from dataclasses import dataclass, asdict
+
+import fitz  # PyMuPDF
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class IndexedPage:
+    """Extraction results cached for one page fingerprint"""
+    fingerprint: str
+    text: str
+    tables: List[Dict[str, Any]]
+
+@dataclass
+class DocumentManifest:
+    """Page fingerprints of the last ingested edition of a standards document"""
+    name: str
+    fingerprints: List[str]
+    metadata: Dict[str, Any]
+
+class StandardsPageIndex:
+    """Content-addressed store of extracted standards pages"""
+    
+    def __init__(self, index_dir: Union[str, Path]):
+        self.index_dir = Path(index_dir)
+        self.pages_dir = self.index_dir / "pages"
+        self.documents_dir = self.index_dir / "documents"
+    
+    def fingerprint_pages(self, pdf_path: Union[str, Path]) -> List[str]:
+        """
+        Compute a content fingerprint for every page of a PDF
+        
+        The fingerprint covers the page text, the raw content stream and the
+        embedded image streams, so scanned pages are distinguished as well.
+        
+        Args:
+            pdf_path: Path to PDF file
+        
+        Returns:
+            List of hex digests, one per page
+        """
+        fingerprints = []
+        
+        doc = fitz.open(pdf_path)
+        try:
+            for page in doc:
+                digest = hashlib.sha256()
+                digest.update(page.get_text("text").encode('utf-8'))
+                digest.update(page.read_contents())
+                for image in page.get_images(full=True):
+                    digest.update(hashlib.sha256(doc.xref_stream_raw(image[0]) or b"").digest())
+                fingerprints.append(digest.hexdigest())
+        finally:
+            doc.close()
+        
+        return fingerprints
+    
+    def write_subset_pdf(self, pdf_path: Union[str, Path], page_indices: List[int],
+                         output_path: Union[str, Path]):
+        """Write the given zero-based pages of a PDF to a new PDF"""
+        source = fitz.open(pdf_path)
+        subset = fitz.open()
+        try:
+            for page_index in page_indices:
+                subset.insert_pdf(source, from_page=page_index, to_page=page_index)
+            subset.save(str(output_path))
+        finally:
+            subset.close()
+            source.close()
+    
+    def load_page(self, fingerprint: str) -> Optional[IndexedPage]:
+        """Load cached results for a page fingerprint"""
+        page_path = self.pages_dir / f"{fingerprint}.json"
+        if not page_path.exists():
+            return None
+        
+        try:
+            with open(page_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            data.pop('requirements', None)  # per-page requirements stored by earlier versions
+            return IndexedPage(**data)
+        except Exception as e:
+            logger.warning(f"Failed to load indexed page {fingerprint[:12]}: {e}")
+            return None
+    
+    def store_page(self, page: IndexedPage):
+        """Store extraction results for a page fingerprint"""
+        self.pages_dir.mkdir(parents=True, exist_ok=True)
+        page_path = self.pages_dir / f"{page.fingerprint}.json"
+        
+        try:
+            with open(page_path, 'w', encoding='utf-8') as f:
+                json.dump(asdict(page), f, ensure_ascii=False, default=str)
+        except Exception as e:
+            logger.error(f"Failed to store indexed page {page.fingerprint[:12]}: {e}")
+    
+    def load_manifest(self, name: str) -> Optional[DocumentManifest]:
+        """Load the manifest of a previously ingested document"""
+        manifest_path = self.documents_dir / f"{name}.json"
+        if not manifest_path.exists():
+            return None
+        
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return DocumentManifest(**json.load(f))
+        except Exception as e:
+            logger.warning(f"Failed to load page manifest for {name}: {e}")
+            return None
+    
+    def save_manifest(self, manifest: DocumentManifest):
+        """Save the manifest of an ingested document"""
+        self.documents_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = self.documents_dir / f"{manifest.name}.json"
+        
+        try:
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(asdict(manifest), f, indent=2, ensure_ascii=False, default=str)
+        except Exception as e:
+            logger.error(f"Failed to save page manifest for {manifest.name}: {e}")
+
+def table_to_record(df: pd.DataFrame) -> Dict[str, Any]:
+    """Serialize a table for the page index"""
+    split = df.astype(object).where(pd.notna(df), None).to_dict(orient='split')
+    return {
+        'columns': [str(c) if c is not None else None for c in split['columns']],
+        'data': split['data']
+    }
+
+def table_from_record(record: Dict[str, Any]) -> pd.DataFrame:
+    """Rebuild a table stored in the page index"""
+    return pd.DataFrame(record['data'], columns=record['columns'])
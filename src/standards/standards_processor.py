@@ -2,9 +2,13 @@
 Lighting Standards Processing and Comparison
 Handles standards documents, compliance checking, and comparison analysis
 """
+import sys
 import json
 import re
+import hashlib
 import logging
+import tempfile
+from array import array
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass, asdict
@@ -16,15 +20,24 @@ import numpy as np
 
 try:
     from ..core.config import config
-    from ..extractors.pdf_extractor import PDFExtractor
+    from ..core.patterns import registry as pattern_registry
+    from ..extractors.pdf_extractor import PDFExtractor, PAGE_MARKER_PATTERN, split_pages
     from ..extractors.table_extractor import AdvancedTableExtractor
+    from .page_index import (StandardsPageIndex, IndexedPage, DocumentManifest,
+                             table_to_record, table_from_record)
 except ImportError:
     from core.config import config
-    from extractors.pdf_extractor import PDFExtractor
+    from core.patterns import registry as pattern_registry
+    from extractors.pdf_extractor import PDFExtractor, PAGE_MARKER_PATTERN, split_pages
     from extractors.table_extractor import AdvancedTableExtractor
+    from standards.page_index import (StandardsPageIndex, IndexedPage, DocumentManifest,
+                                      table_to_record, table_from_record)
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses where supported (Python 3.10+): no per-instance __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 class StandardType(Enum):
     """Types of lighting standards"""
     EN_12464_1 = "EN_12464_1"
@@ -72,8 +85,10 @@ class StandardsDocument:
     text_content: str
     metadata: Dict[str, Any]
     processing_date: datetime
+    pages_total: int = 0
+    pages_reused: int = 0
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ComplianceResult:
     """Result of compliance checking"""
     parameter: str
@@ -87,6 +102,122 @@ class ComplianceResult:
     standard: StandardType
     notes: str = ""
 
+class ComplianceTable:
+    """
+    Compliance results of a report's rooms stored as a struct of arrays
+    
+    Text and enum fields are stored as 16-bit codes into per-table
+    vocabularies and numbers in typed arrays, so a result takes a few dozen
+    bytes instead of a ComplianceResult object. Results are materialized on
+    request, per room and standard.
+    """
+    
+    CATEGORIES = ('standard', 'room_type', 'parameter', 'unit', 'notes')
+    VALUES = ('required_value', 'actual_value', 'compliance_percentage', 'deviation')
+    
+    __slots__ = ('_codes', '_values', '_compliant', '_vocabularies', '_lookups', '_starts', '_ends')
+    
+    def __init__(self):
+        self._codes = {column: array('H') for column in self.CATEGORIES}
+        self._values = {column: array('d') for column in self.VALUES}
+        self._compliant = array('b')
+        self._vocabularies = {column: [] for column in self.CATEGORIES}
+        self._lookups = {column: {} for column in self.CATEGORIES}
+        # Row range of each room per standard, indexed by room position (-1: not evaluated)
+        self._starts: Dict[StandardType, array] = {}
+        self._ends: Dict[StandardType, array] = {}
+    
+    def __len__(self) -> int:
+        return len(self._compliant)
+    
+    def _code(self, column: str, value: Any) -> int:
+        """Code of a category value, adding it to the vocabulary if new"""
+        lookup = self._lookups[column]
+        code = lookup.get(value)
+        if code is None:
+            code = len(lookup)
+            lookup[value] = code
+            self._vocabularies[column].append(value)
+        return code
+    
+    def add_results(self, room_index: int, standard: StandardType, results: List[ComplianceResult]):
+        """Store the results of one room against one standard"""
+        starts = self._starts.setdefault(standard, array('i'))
+        ends = self._ends.setdefault(standard, array('i'))
+        if room_index >= len(starts):
+            padding = [-1] * (room_index + 1 - len(starts))
+            starts.extend(padding)
+            ends.extend(padding)
+        
+        starts[room_index] = len(self)
+        for result in results:
+            for column in self.CATEGORIES:
+                self._codes[column].append(self._code(column, getattr(result, column)))
+            for column in self.VALUES:
+                self._values[column].append(getattr(result, column))
+            self._compliant.append(1 if result.is_compliant else 0)
+        ends[room_index] = len(self)
+    
+    def has_standard(self, standard: StandardType) -> bool:
+        """Check if any room was evaluated against a standard"""
+        return standard in self._starts
+    
+    def standards(self) -> List[StandardType]:
+        """Evaluated standards, in evaluation order"""
+        return list(self._starts)
+    
+    def _row_range(self, room_index: int, standard: StandardType) -> range:
+        """Rows of one room against one standard"""
+        starts = self._starts.get(standard)
+        if starts is None or room_index >= len(starts) or starts[room_index] < 0:
+            return range(0)
+        return range(starts[room_index], self._ends[standard][room_index])
+    
+    def parameters(self, room_index: int, standard: StandardType) -> List[str]:
+        """Checked parameter names of one room against one standard"""
+        vocabulary = self._vocabularies['parameter']
+        codes = self._codes['parameter']
+        return [vocabulary[codes[row]] for row in self._row_range(room_index, standard)]
+    
+    def results(self, room_index: int, standard: StandardType) -> List[ComplianceResult]:
+        """Materialize the results of one room against one standard"""
+        return [self._result(row) for row in self._row_range(room_index, standard)]
+    
+    def _result(self, row: int) -> ComplianceResult:
+        """Materialize one stored result"""
+        fields = {column: self._vocabularies[column][self._codes[column][row]] for column in self.CATEGORIES}
+        fields.update({column: self._values[column][row] for column in self.VALUES})
+        return ComplianceResult(is_compliant=bool(self._compliant[row]), **fields)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Columns with decoded labels, for JSON export"""
+        rooms = [0] * len(self)
+        for standard, starts in self._starts.items():
+            for room_index, (start, end) in enumerate(zip(starts, self._ends[standard])):
+                for row in range(max(start, 0), end):
+                    rooms[row] = room_index
+        
+        columns = {'room': rooms}
+        for column in self.CATEGORIES:
+            vocabulary = [value.value if isinstance(value, Enum) else value
+                          for value in self._vocabularies[column]]
+            columns[column] = [vocabulary[code] for code in self._codes[column]]
+        for column in self.VALUES:
+            columns[column] = self._values[column].tolist()
+        columns['is_compliant'] = [bool(value) for value in self._compliant]
+        return columns
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays"""
+        arrays = list(self._codes.values()) + list(self._values.values()) + [self._compliant]
+        arrays += list(self._starts.values()) + list(self._ends.values())
+        return sum(column.itemsize * len(column) for column in arrays)
+
+def compliance_dict_factory(items: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """dict_factory for asdict() that exports compliance tables as columns"""
+    return {key: value.to_dict() if isinstance(value, ComplianceTable) else value for key, value in items}
+
 @dataclass
 class StandardsComparison:
     """Comparison between standards"""
@@ -101,6 +232,120 @@ class StandardsComparison:
     more_strict: StandardType
     harmonization_recommendation: str
 
+def requirement_condition(param: str) -> str:
+    """Get the condition (minimum, maximum or '') encoded in a requirement key"""
+    if param.endswith('_min') or 'minimum' in param:
+        return 'minimum'
+    if param.endswith('_max') or 'maximum' in param:
+        return 'maximum'
+    return ''
+
+class StandardsComparisonMatrix:
+    """Precomputed standards x standards x room type x parameter comparison"""
+    
+    def __init__(self, standards_database: Dict[str, Any], revision: str):
+        self.revision = revision
+        self.standards = sorted(standards_database.keys())
+        
+        room_keys = set()
+        param_keys = set()
+        for standard_data in standards_database.values():
+            for room_key, room_reqs in standard_data.get("requirements", {}).items():
+                room_keys.add(room_key)
+                param_keys.update(
+                    param for param, value in room_reqs.items()
+                    if isinstance(value, (int, float)) and not isinstance(value, bool)
+                )
+        
+        self.room_types = sorted(room_keys)
+        self.parameters = sorted(param_keys)
+        self._standard_index = {key: i for i, key in enumerate(self.standards)}
+        self._room_index = {key: i for i, key in enumerate(self.room_types)}
+        
+        # Requirement values, NaN where a standard does not define a parameter
+        values = np.full((len(self.standards), len(self.room_types), len(self.parameters)), np.nan)
+        param_index = {key: i for i, key in enumerate(self.parameters)}
+        for standard_key, standard_data in standards_database.items():
+            s = self._standard_index[standard_key]
+            for room_key, room_reqs in standard_data.get("requirements", {}).items():
+                r = self._room_index[room_key]
+                for param, value in room_reqs.items():
+                    if param in param_index and isinstance(value, (int, float)) and not isinstance(value, bool):
+                        values[s, r, param_index[param]] = value
+        self.values = values
+        
+        # 1 for minimum requirements, -1 for maximum requirements, 0 otherwise
+        self.conditions = [requirement_condition(param) for param in self.parameters]
+        kind = np.array([1 if c == 'minimum' else -1 if c == 'maximum' else 0
+                         for c in self.conditions], dtype=np.int8)
+        
+        # All pairs in one pass: axes are (standard_a, standard_b, room_type, parameter)
+        value_a = values[:, None, :, :]
+        value_b = values[None, :, :, :]
+        self.valid = ~np.isnan(value_a) & ~np.isnan(value_b)
+        self.difference = value_a - value_b
+        self.difference_percentage = np.zeros_like(self.difference)
+        np.divide(self.difference, value_b, out=self.difference_percentage,
+                  where=self.valid & (value_b != 0))
+        self.difference_percentage *= 100
+        self.a_more_strict = np.where(kind == 1, value_a > value_b,
+                                      np.where(kind == -1, value_a < value_b, True))
+        self.harmonized = np.abs(np.nan_to_num(self.difference)) < 0.01
+    
+    def has_standard(self, standard: StandardType) -> bool:
+        """Check whether a standard is part of the matrix"""
+        return standard.value in self._standard_index
+    
+    def query(self, standard_a: StandardType, standard_b: StandardType,
+              room_type: RoomType) -> List[StandardsComparison]:
+        """Read the comparisons for one pair of standards and one room type"""
+        comparisons = []
+        
+        i = self._standard_index.get(standard_a.value)
+        j = self._standard_index.get(standard_b.value)
+        r = self._room_index.get(room_type.value)
+        if i is None or j is None or r is None:
+            return comparisons
+        
+        for p in np.flatnonzero(self.valid[i, j, r]):
+            value_a = float(self.values[i, r, p])
+            value_b = float(self.values[j, r, p])
+            a_more_strict = bool(self.a_more_strict[i, j, r, p])
+            more_strict = standard_a if a_more_strict else standard_b
+        
+            comparisons.append(StandardsComparison(
+                standard_a=standard_a,
+                standard_b=standard_b,
+                room_type=room_type,
+                parameter=self.parameters[p],
+                value_a=value_a,
+                value_b=value_b,
+                difference=float(self.difference[i, j, r, p]),
+                difference_percentage=float(self.difference_percentage[i, j, r, p]),
+                more_strict=more_strict,
+                harmonization_recommendation=self._recommendation(
+                    p, bool(self.harmonized[i, j, r, p]), more_strict,
+                    value_a if a_more_strict else value_b
+                )
+            ))
+        
+        return comparisons
+    
+    def _recommendation(self, p: int, harmonized: bool, more_strict: StandardType,
+                        strict_value: float) -> str:
+        """Generate harmonization recommendation from precomputed matrix cells"""
+        if harmonized:
+            return "Values are harmonized"
+        
+        name = "EN 12464-1" if more_strict == StandardType.EN_12464_1 else more_strict.value
+        condition = self.conditions[p]
+        if condition == 'minimum':
+            return f"Consider adopting {name} value ({strict_value}) for better lighting quality"
+        elif condition == 'maximum':
+            return f"Consider adopting {name} value ({strict_value}) for better energy efficiency"
+        else:
+            return "Consider harmonizing values for consistency"
+
 class StandardsProcessor:
     """Processor for lighting standards documents and compliance checking"""
     
@@ -108,57 +353,16 @@ class StandardsProcessor:
         self.config = config.standards
         self.pdf_extractor = PDFExtractor()
         self.table_extractor = AdvancedTableExtractor()
+        self.page_index = StandardsPageIndex(self.config.page_index_dir)
         self.standards_database = self._load_standards_database()
+        self._comparison_matrix = None
+        self._mark_database_changed()
         self._setup_lighting_patterns()
     
     def _setup_lighting_patterns(self):
-        """Setup regex patterns for lighting parameter extraction"""
-        self.patterns = {
-            'illuminance': [
-                r'(\d+(?:\.\d+)?)\s*(?:lux|lx)',
-                r'illuminance[:\s]*(\d+(?:\.\d+)?)',
-                r'lighting level[:\s]*(\d+(?:\.\d+)?)',
-                r'(\d+(?:\.\d+)?)\s*(?:lux|lx)\s*(?:minimum|min|maximum|max|average|avg)',
-            ],
-            'uniformity': [
-                r'uniformity[:\s]*(\d+(?:\.\d+)?)',
-                r'u0[:\s]*(\d+(?:\.\d+)?)',
-                r'(\d+(?:\.\d+)?)\s*(?:uniformity|uniform)',
-            ],
-            'ugr': [
-                r'ugr[:\s]*(\d+(?:\.\d+)?)',
-                r'unified glare rating[:\s]*(\d+(?:\.\d+)?)',
-                r'glare[:\s]*(\d+(?:\.\d+)?)',
-            ],
-            'power_density': [
-                r'(\d+(?:\.\d+)?)\s*(?:w/m²|watt/m²|w/m2)',
-                r'power density[:\s]*(\d+(?:\.\d+)?)',
-                r'lighting power density[:\s]*(\d+(?:\.\d+)?)',
-            ],
-            'color_temperature': [
-                r'(\d+(?:\.\d+)?)\s*(?:k|kelvin)',
-                r'color temperature[:\s]*(\d+(?:\.\d+)?)',
-                r'correlated color temperature[:\s]*(\d+(?:\.\d+)?)',
-            ],
-            'cri': [
-                r'cri[:\s]*(\d+(?:\.\d+)?)',
-                r'color rendering index[:\s]*(\d+(?:\.\d+)?)',
-                r'ra[:\s]*(\d+(?:\.\d+)?)',
-            ]
-        }
-        
-        self.room_patterns = {
-            'office': [r'office', r'workplace', r'work\s+place', r'desk'],
-            'meeting_room': [r'meeting', r'conference', r'boardroom'],
-            'corridor': [r'corridor', r'passage', r'circulation', r'hallway'],
-            'storage': [r'storage', r'warehouse', r'archive'],
-            'industrial': [r'industrial', r'factory', r'manufacturing', r'production'],
-            'retail': [r'retail', r'shop', r'store', r'commercial'],
-            'educational': [r'classroom', r'school', r'education', r'teaching'],
-            'healthcare': [r'hospital', r'medical', r'healthcare', r'clinic'],
-            'residential': [r'residential', r'home', r'apartment', r'dwelling'],
-            'outdoor': [r'outdoor', r'exterior', r'external', r'street']
-        }
+        """Setup regex patterns for lighting parameter extraction (compiled in the shared registry)"""
+        self.patterns = pattern_registry.group('standards.param')
+        self.room_patterns = pattern_registry.group('standards.room')
     
     def _load_standards_database(self) -> Dict[str, Any]:
         """Load or create standards database"""
@@ -265,6 +469,11 @@ class StandardsProcessor:
             }
         }
     
+    def _mark_database_changed(self):
+        """Recompute the database revision used to key derived caches"""
+        payload = json.dumps(self.standards_database, sort_keys=True, ensure_ascii=False, default=str)
+        self.database_revision = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
     def _save_standards_database(self, database: Dict[str, Any]):
         """Save standards database to file"""
         db_path = Path(self.config.standards_db_path)
@@ -289,6 +498,12 @@ class StandardsProcessor:
         pdf_path = Path(pdf_path)
         logger.info(f"Processing standards document: {pdf_path}")
         
+        if self.config.incremental_ingestion:
+            try:
+                return self._process_standards_document_incremental(pdf_path)
+            except Exception as e:
+                logger.warning(f"Incremental ingestion failed, processing full document: {e}")
+        
         # Extract content from PDF
         extraction_result = self.pdf_extractor.extract_from_pdf(pdf_path)
         
@@ -312,7 +527,8 @@ class StandardsProcessor:
             tables=table_dataframes,
             text_content=extraction_result.text,
             metadata=extraction_result.metadata,
-            processing_date=datetime.now()
+            processing_date=datetime.now(),
+            pages_total=extraction_result.metadata.get('pages', 0)
         )
         
         # Update database
@@ -321,6 +537,129 @@ class StandardsProcessor:
         logger.info(f"Processed standards document: {len(requirements)} requirements found")
         return standards_doc
     
+    def _process_standards_document_incremental(self, pdf_path: Path) -> StandardsDocument:
+        """Process a standards document, re-extracting only pages not seen before"""
+        fingerprints = self.page_index.fingerprint_pages(pdf_path)
+        
+        pages = {}
+        changed_pages = []
+        for page_index, fingerprint in enumerate(fingerprints):
+            if fingerprint in pages:
+                continue
+            indexed_page = self.page_index.load_page(fingerprint)
+            if indexed_page is None:
+                changed_pages.append(page_index)
+            pages[fingerprint] = indexed_page
+        
+        previous = self.page_index.load_manifest(pdf_path.stem)
+        metadata = dict(previous.metadata) if previous else {}
+        
+        if changed_pages:
+            page_texts, page_tables, extraction_metadata = self._extract_pages(pdf_path, changed_pages)
+            metadata.update(extraction_metadata)
+            
+            for page_index in changed_pages:
+                indexed_page = IndexedPage(
+                    fingerprint=fingerprints[page_index],
+                    text=page_texts.get(page_index, ""),
+                    tables=[table_to_record(df) for df in page_tables.get(page_index, [])]
+                )
+                self.page_index.store_page(indexed_page)
+                pages[indexed_page.fingerprint] = indexed_page
+        
+        # Reassemble the document in page order, as the full extraction would
+        text_parts = []
+        table_dataframes = []
+        for page_number, fingerprint in enumerate(fingerprints, 1):
+            indexed_page = pages[fingerprint]
+            if indexed_page.text.strip():
+                text_parts.append(f"--- Page {page_number} ---\n{indexed_page.text}")
+            table_dataframes.extend(table_from_record(record) for record in indexed_page.tables)
+        text = "\n\n".join(text_parts)
+        
+        pages_reused = len(fingerprints) - len(changed_pages)
+        metadata['pages'] = len(fingerprints)
+        metadata['pages_reused'] = pages_reused
+        
+        # Requirements come from the whole text, so ones spanning a page break are found as well
+        standard_type = self._identify_standard_type(text, pdf_path.name)
+        requirements = self._extract_requirements(text, standard_type)
+        standards_doc = StandardsDocument(
+            name=pdf_path.stem,
+            standard_type=standard_type,
+            version=self._extract_version(text),
+            language=self._detect_language(text),
+            requirements=requirements,
+            tables=table_dataframes,
+            text_content=text,
+            metadata=metadata,
+            processing_date=datetime.now(),
+            pages_total=len(fingerprints),
+            pages_reused=pages_reused
+        )
+        
+        # All requirements are merged, since reused pages may have been ingested under
+        # another document or standard, or before the database was reset or imported
+        self._update_standards_database(standards_doc)
+        
+        self.page_index.save_manifest(DocumentManifest(
+            name=pdf_path.stem,
+            fingerprints=fingerprints,
+            metadata=metadata
+        ))
+        
+        logger.info(f"Processed standards document: {len(requirements)} requirements found, "
+                    f"{pages_reused}/{len(fingerprints)} pages reused")
+        return standards_doc
+    
+    def _extract_pages(self, pdf_path: Path, page_indices: List[int]) -> Tuple[Dict[int, str], Dict[int, List[pd.DataFrame]], Dict[str, Any]]:
+        """Extract text and tables for selected zero-based pages of a PDF"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            subset_path = Path(tmp_dir) / f"{pdf_path.stem}_pages.pdf"
+            self.page_index.write_subset_pdf(pdf_path, page_indices, subset_path)
+            
+            extraction_result = self.pdf_extractor.extract_from_pdf(subset_path)
+            tables = self.table_extractor.extract_tables_from_pdf(subset_path)
+        
+        page_texts = self._split_page_text(extraction_result.text, len(page_indices))
+        if page_texts is None:
+            # Extraction method without page markers: fall back to per-page extraction
+            page_texts = {}
+            for position, page_index in enumerate(page_indices, 1):
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    page_path = Path(tmp_dir) / f"{pdf_path.stem}_page.pdf"
+                    self.page_index.write_subset_pdf(pdf_path, [page_index], page_path)
+                    page_texts[position] = self.pdf_extractor.extract_from_pdf(page_path).text
+        
+        texts = {page_index: page_texts.get(position, "")
+                 for position, page_index in enumerate(page_indices, 1)}
+        
+        page_tables = {}
+        for table in tables:
+            try:
+                position = int(table.page_number)
+            except (TypeError, ValueError):
+                continue
+            if 1 <= position <= len(page_indices):
+                page_tables.setdefault(page_indices[position - 1], []).append(table.dataframe)
+        
+        metadata = {key: value for key, value in extraction_result.metadata.items() if key != 'pages'}
+        return texts, page_tables, metadata
+    
+    def _split_page_text(self, text: str, page_count: int) -> Optional[Dict[int, str]]:
+        """Split extracted text on page markers, keyed by one-based page number"""
+        if not PAGE_MARKER_PATTERN.search(text):
+            if page_count == 1:
+                return {1: text}
+            form_feed_pages = text.split('\f')
+            if len(form_feed_pages) in (page_count, page_count + 1):
+                return {position: page_text.strip()
+                        for position, page_text in enumerate(form_feed_pages[:page_count], 1)}
+            return None
+        
+        return {page_number: PAGE_MARKER_PATTERN.sub('', page_text, count=1).strip()
+                for page_number, page_text in split_pages(text)}
+    
     def _identify_standard_type(self, text: str, filename: str) -> StandardType:
         """Identify the type of standard from text and filename"""
         text_lower = text.lower()
@@ -425,9 +764,7 @@ class StandardsProcessor:
             return requirements
         
         for pattern in self.patterns[parameter]:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            
-            for match in matches:
+            for match in pattern.finditer(text):
                 value = float(match.group(1))
                 
                 # Determine room type from context
@@ -457,9 +794,8 @@ class StandardsProcessor:
         context = text[context_start:context_end].lower()
         
         for room_type, patterns in self.room_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, context):
-                    return RoomType(room_type)
+            if patterns.contains(context):
+                return RoomType(room_type)
         
         return RoomType.OFFICE  # Default
     
@@ -499,6 +835,7 @@ class StandardsProcessor:
             self.standards_database[standard_key]["requirements"][room_key][param_key] = req.value
         
         # Save updated database
+        self._mark_database_changed()
         self._save_standards_database(self.standards_database)
     
     def check_compliance(self, actual_values: Dict[str, float], room_type: RoomType, 
@@ -530,9 +867,10 @@ class StandardsProcessor:
         room_requirements = standard_data["requirements"][room_key]
         
         for param, actual_value in actual_values.items():
-            # Check for minimum requirements
-            min_key = f"{param}_minimum"
-            if min_key in room_requirements:
+            # Check for minimum requirements (database keys use either suffix)
+            min_key = next((key for key in (f"{param}_minimum", f"{param}_min")
+                            if key in room_requirements), None)
+            if min_key:
                 required_value = room_requirements[min_key]
                 is_compliant = actual_value >= required_value
                 compliance_percentage = (actual_value / required_value) * 100 if required_value > 0 else 0
@@ -553,8 +891,9 @@ class StandardsProcessor:
                 compliance_results.append(result)
             
             # Check for maximum requirements
-            max_key = f"{param}_maximum"
-            if max_key in room_requirements:
+            max_key = next((key for key in (f"{param}_maximum", f"{param}_max")
+                            if key in room_requirements), None)
+            if max_key:
                 required_value = room_requirements[max_key]
                 is_compliant = actual_value <= required_value
                 compliance_percentage = (required_value / actual_value) * 100 if actual_value > 0 else 0
@@ -601,72 +940,20 @@ class StandardsProcessor:
         Returns:
             List of comparisons
         """
-        comparisons = []
+        matrix = self.get_comparison_matrix()
         
-        if (standard_a.value not in self.standards_database or 
-            standard_b.value not in self.standards_database):
+        if not (matrix.has_standard(standard_a) and matrix.has_standard(standard_b)):
             logger.warning("One or both standards not found in database")
-            return comparisons
+            return []
         
-        room_key = room_type.value
-        reqs_a = self.standards_database[standard_a.value].get("requirements", {}).get(room_key, {})
-        reqs_b = self.standards_database[standard_b.value].get("requirements", {}).get(room_key, {})
-        
-        # Find common parameters
-        all_params = set(reqs_a.keys()) | set(reqs_b.keys())
-        
-        for param in all_params:
-            if param in reqs_a and param in reqs_b:
-                value_a = reqs_a[param]
-                value_b = reqs_b[param]
-                
-                difference = value_a - value_b
-                difference_percentage = (difference / value_b) * 100 if value_b != 0 else 0
-                
-                # Determine which is more strict
-                if 'minimum' in param:
-                    more_strict = standard_a if value_a > value_b else standard_b
-                elif 'maximum' in param:
-                    more_strict = standard_a if value_a < value_b else standard_b
-                else:
-                    more_strict = standard_a  # Default
-                
-                comparison = StandardsComparison(
-                    standard_a=standard_a,
-                    standard_b=standard_b,
-                    room_type=room_type,
-                    parameter=param,
-                    value_a=value_a,
-                    value_b=value_b,
-                    difference=difference,
-                    difference_percentage=difference_percentage,
-                    more_strict=more_strict,
-                    harmonization_recommendation=self._generate_harmonization_recommendation(
-                        param, value_a, value_b, more_strict
-                    )
-                )
-                comparisons.append(comparison)
-        
-        return comparisons
+        return matrix.query(standard_a, standard_b, room_type)
     
-    def _generate_harmonization_recommendation(self, param: str, value_a: float, 
-                                             value_b: float, more_strict: StandardType) -> str:
-        """Generate harmonization recommendation"""
-        if abs(value_a - value_b) < 0.01:  # Values are essentially the same
-            return "Values are harmonized"
-        
-        if 'minimum' in param:
-            if more_strict == StandardType.EN_12464_1:
-                return f"Consider adopting EN 12464-1 value ({value_a}) for better lighting quality"
-            else:
-                return f"Consider adopting {more_strict.value} value ({value_b}) for better lighting quality"
-        elif 'maximum' in param:
-            if more_strict == StandardType.EN_12464_1:
-                return f"Consider adopting EN 12464-1 value ({value_a}) for better energy efficiency"
-            else:
-                return f"Consider adopting {more_strict.value} value ({value_b}) for better energy efficiency"
-        else:
-            return "Consider harmonizing values for consistency"
+    def get_comparison_matrix(self) -> StandardsComparisonMatrix:
+        """Get the all-pairs comparison matrix, rebuilt only when the database changes"""
+        if self._comparison_matrix is None or self._comparison_matrix.revision != self.database_revision:
+            self._comparison_matrix = StandardsComparisonMatrix(self.standards_database, self.database_revision)
+            logger.debug(f"Built standards comparison matrix for revision {self.database_revision[:12]}")
+        return self._comparison_matrix
     
     def get_standards_summary(self) -> Dict[str, Any]:
         """Get summary of all standards in database"""
@@ -706,6 +993,7 @@ class StandardsProcessor:
         
         with open(input_path, 'r', encoding='utf-8') as f:
             self.standards_database = json.load(f)
+        self._mark_database_changed()
         
         # Save to default location
         self._save_standards_database(self.standards_database)
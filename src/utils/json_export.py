@@ -0,0 +1,191 @@
+"""
+Streaming JSON Export
+Serializes analysis dataclasses straight from the objects, without asdict() deep copies
+"""
+import os
+import json
+from enum import Enum
+from pathlib import Path
+from datetime import date, datetime
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+from json.encoder import INFINITY, encode_basestring
+
+import numpy as np
+
+SCALAR_TYPES = (str, int, float, bool, type(None))
+
+# Containers down to this depth are written item by item in compact mode;
+# anything deeper is encoded in one C-accelerated call per item
+COMPACT_STREAM_DEPTH = 2
+
+# Field names per dataclass type, looked up once
+_field_names: Dict[type, Tuple[str, ...]] = {}
+
+def json_default(value: Any) -> Any:
+    """
+    Encoder hook converting analysis objects one level at a time
+    
+    Dataclasses become shallow field dicts, so nested rooms and compliance
+    results are converted lazily while encoding instead of being deep-copied
+    up front.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    names = _field_names.get(type(value))
+    if names is None and is_dataclass(value) and not isinstance(value, type):
+        names = _field_names[type(value)] = tuple(field.name for field in fields(value))
+    if names is not None:
+        return {name: getattr(value, name) for name in names}
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, Path):
+        return str(value)
+    if callable(getattr(value, 'to_dict', None)):
+        # Columnar tables such as ComplianceTable
+        return value.to_dict()
+    return str(value)
+
+# The C encoder is only used without indentation, so values are always
+# encoded compactly and indentation is added around them while streaming
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=json_default)
+
+def _encode_scalar(value: Any) -> Optional[str]:
+    """JSON text of a scalar or enum, None for anything else"""
+    if isinstance(value, str):
+        return encode_basestring(value)
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if isinstance(value, float):
+        return _encoder.encode(value) if value != value or value in (INFINITY, -INFINITY) else float.__repr__(value)
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, Enum):
+        return _encode_scalar(value.value)
+    return None
+
+def _encode_key(key: Any) -> str:
+    """JSON text of a dict key; enum keys are written as their value like enum values"""
+    if isinstance(key, Enum):
+        key = key.value
+    if isinstance(key, str):
+        return encode_basestring(key)
+    if isinstance(key, (bool, type(None))):
+        return f'"{_encode_scalar(key)}"'
+    return encode_basestring(_encode_scalar(key) or str(key))
+
+def _encode_nested(value: Any, indent: Optional[int], depth: int) -> Iterator[str]:
+    """Encode a container in one C-accelerated call, streaming it if it has enum keys"""
+    try:
+        text = _encoder.encode(value)
+    except TypeError:
+        # Keys the C encoder rejects (enums) are handled by the streaming encoder
+        yield from _iter_value(value, indent, depth, nested=False)
+    else:
+        yield text
+
+def _iter_value(value: Any, indent: Optional[int], depth: int, nested: bool = True) -> Iterator[str]:
+    """Yield JSON for a non-scalar value, streaming containers item by item"""
+    if not isinstance(value, (dict, list, tuple)):
+        value = json_default(value)
+        text = _encode_scalar(value)
+        if text is not None:
+            yield text
+            return
+    
+    if nested:
+        if isinstance(value, (list, tuple)) and (not value or _encode_scalar(value[0]) is not None):
+            # Columns and other flat lists stay on one line
+            yield from _encode_nested(value, indent, depth)
+            return
+        if (indent is None and depth >= COMPACT_STREAM_DEPTH) or not value:
+            yield from _encode_nested(value, indent, depth)
+            return
+    
+    if indent is None:
+        newline = closing = ''
+        key_separator = ':'
+    else:
+        newline = '\n' + ' ' * (indent * (depth + 1))
+        closing = newline[:-indent]
+        key_separator = ': '
+    
+    if isinstance(value, dict):
+        yield '{'
+        for index, (key, item) in enumerate(value.items()):
+            head = f'{"," if index else ""}{newline}{_encode_key(key)}{key_separator}'
+            text = _encode_scalar(item)
+            if text is not None:
+                yield head + text
+            else:
+                yield head
+                yield from _iter_value(item, indent, depth + 1)
+        yield closing + '}'
+    else:
+        yield '['
+        for index, item in enumerate(value):
+            head = f'{"," if index else ""}{newline}'
+            text = _encode_scalar(item)
+            if text is not None:
+                yield head + text
+            else:
+                yield head
+                yield from _iter_value(item, indent, depth + 1)
+        yield closing + ']'
+
+def iter_json(value: Any, compact: bool = False) -> Iterator[str]:
+    """
+    Encode an analysis object as JSON chunks
+    
+    Args:
+        value: Dataclass, dict, list or scalar to encode
+        compact: Write without indentation or spaces, for machine consumers
+    
+    Returns:
+        Iterator of JSON text chunks
+    """
+    text = _encode_scalar(value)
+    if text is not None:
+        return iter((text,))
+    return _iter_value(value, None if compact else 2, 0)
+
+def dumps_json(value: Any, compact: bool = False) -> str:
+    """Encode an analysis object as a JSON string"""
+    return ''.join(iter_json(value, compact))
+
+def write_json(value: Any, path: Union[str, Path], compact: bool = False) -> Path:
+    """
+    Stream an analysis object to a JSON file
+    
+    The file is written under a temporary name and moved into place, so
+    readers never see a partially written export.
+    
+    Args:
+        value: Dataclass, dict, list or scalar to export
+        path: Output file
+        compact: Write without indentation or spaces, for machine consumers
+    
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for chunk in iter_json(value, compact):
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return path
@@ -0,0 +1,122 @@
+"""
+HTTP Batch API
+FastAPI service streaming extraction and analysis results of many reports as NDJSON
+"""
+import logging
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
+
+try:
+    from ..core.config import config
+    from ..analyzers.analysis_pool import AnalysisPool, PoolDocument, UploadStore
+    from ..standards.standards_processor import StandardType
+except ImportError:
+    from core.config import config
+    from analyzers.analysis_pool import AnalysisPool, PoolDocument, UploadStore
+    from standards.standards_processor import StandardType
+
+logger = logging.getLogger(__name__)
+
+NDJSON = "application/x-ndjson"
+
+# Endpoint path to the pool kind it runs
+ENDPOINTS = {
+    "extract": "pdf",
+    "tables": "tables",
+    "analyze-fast": "fast",
+    "analyze": "standard",
+    "compliance": "compliance"
+}
+
+async def _store_files(store: UploadStore, files: Optional[List[UploadFile]]) -> List[PoolDocument]:
+    """Store uploaded files, rejecting ones over the configured size"""
+    documents = []
+    max_bytes = config.web.max_file_size * 1024 * 1024
+    for upload in files or []:
+        data = await upload.read()
+        if len(data) > max_bytes:
+            raise HTTPException(413, f"{upload.filename} exceeds {config.web.max_file_size} MB")
+        sha256 = store.put(data)
+        documents.append(PoolDocument(upload.filename or sha256, sha256, store.path(sha256)))
+    return documents
+
+def _stored_documents(store: UploadStore, hashes: Optional[List[str]]) -> List[PoolDocument]:
+    """Documents referenced by the content hash of an earlier upload"""
+    documents = []
+    for sha256 in hashes or []:
+        path = store.path(sha256)
+        if path is None:
+            raise HTTPException(404, f"No upload with content hash {sha256}")
+        documents.append(PoolDocument(sha256, path.stem, path))
+    return documents
+
+def _validate_standards(standards: Optional[List[str]]) -> List[str]:
+    try:
+        return [StandardType(name).value for name in standards or []]
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+def create_app(pool: Optional[AnalysisPool] = None, store: Optional[UploadStore] = None) -> FastAPI:
+    """
+    Create the API application
+    
+    Args:
+        pool: Worker pool, started with the application (default: from config.web)
+        store: Upload store (default: config.web.api_uploads_dir)
+    
+    Returns:
+        FastAPI application
+    """
+    pool = pool or AnalysisPool()
+    store = store or UploadStore(config.web.api_uploads_dir)
+    
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        store.prune(config.web.api_upload_retention_days * 86400)
+        pool.start()
+        yield
+        pool.shutdown()
+    
+    app = FastAPI(title="Unified Lighting Analyzer API", lifespan=lifespan)
+    
+    @app.get("/health")
+    async def health():
+        """Worker pool status"""
+        return {"status": "ok", "workers": pool.workers, "warm_kinds": pool.warm_kinds}
+    
+    @app.post("/uploads")
+    async def upload(files: List[UploadFile] = File(...)):
+        """Store PDFs for later requests by content hash"""
+        documents = await _store_files(store, files)
+        return {"files": [{"file": document.file, "sha256": document.sha256,
+                           "size": document.path.stat().st_size} for document in documents]}
+    
+    def add_endpoint(path: str, kind: str):
+        async def process(files: Optional[List[UploadFile]] = File(None),
+                          sha256: Optional[List[str]] = Form(None),
+                          standards: Optional[List[str]] = Form(None)):
+            standards = _validate_standards(standards)
+            documents = _stored_documents(store, sha256) + await _store_files(store, files)
+            if not documents:
+                raise HTTPException(400, "Send PDF files or sha256 hashes of earlier uploads")
+            logger.info(f"Streaming {kind} results of {len(documents)} documents")
+            return StreamingResponse(pool.stream(kind, documents, standards), media_type=NDJSON)
+        
+        process.__name__ = path.replace("-", "_")
+        process.__doc__ = f"Run {kind} on each document, one NDJSON line per document as it finishes"
+        app.post(f"/{path}")(process)
+    
+    for path, kind in ENDPOINTS.items():
+        add_endpoint(path, kind)
+    
+    return app
+
+def run_api(host: Optional[str] = None, port: Optional[int] = None, workers: Optional[int] = None):
+    """Serve the API with uvicorn"""
+    import uvicorn
+    
+    app = create_app(AnalysisPool(workers=workers))
+    uvicorn.run(app, host=host or config.web.api_host, port=port or config.web.api_port)
@@ -0,0 +1,230 @@
+"""
+Shared Web Resources
+Process-wide analyzers, extractors and job queue, per-session stores, and results cached by upload content, for the Streamlit front ends
+"""
+import json
+import time
+import hashlib
+import logging
+from pathlib import Path
+from dataclasses import asdict
+from typing import Any, Dict, Optional, Sequence, Union
+
+import streamlit as st
+
+try:
+    from ..core.config import config
+    from ..analyzers.batch_analyzer import create_analyzer
+    from ..analyzers.result_cache import file_sha256
+    from ..analyzers.job_queue import JobQueue, COMPLETED, FAILED, QUEUED
+    from .session_store import SessionStore
+except ImportError:
+    from core.config import config
+    from analyzers.batch_analyzer import create_analyzer
+    from analyzers.result_cache import file_sha256
+    from analyzers.job_queue import JobQueue, COMPLETED, FAILED, QUEUED
+    from web.session_store import SessionStore
+
+logger = logging.getLogger(__name__)
+
+# Components shared by all sessions: extractors, the standards processor and the analyzers
+COMPONENT_KINDS = ("pdf", "tables", "standards_processor", "standard", "fast", "enhanced")
+
+STAGE_LABELS = {
+    "text_extraction": "📄 Extracting text",
+    "tables": "📋 Extracting tables",
+    "rooms": "🏠 Reading rooms",
+    "compliance": "📏 Checking compliance",
+    "export": "💾 Exporting results"
+}
+
+def config_fingerprint() -> str:
+    """
+    Hash of everything the components are built from
+    
+    Covers the extraction, standards, Dialux and LLM settings and the
+    standards database on disk, so changing a setting or ingesting a
+    standard gives new component instances and new cached results.
+    """
+    settings = {name: asdict(getattr(config, name)) for name in ('extraction', 'standards', 'dialux', 'llm')}
+    db_path = Path(config.standards.standards_db_path)
+    settings['standards_db_mtime'] = db_path.stat().st_mtime_ns if db_path.exists() else None
+    return hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+@st.cache_resource(max_entries=config.web.component_cache_entries, show_spinner=False)
+def _component(kind: str, api_key: Optional[str], fingerprint: str) -> Any:
+    """Create a component once per process for a settings fingerprint"""
+    logger.info(f"Creating shared {kind} component")
+    if kind == "pdf":
+        try:
+            from ..extractors.pdf_extractor import PDFExtractor
+        except ImportError:
+            from extractors.pdf_extractor import PDFExtractor
+        return PDFExtractor()
+    if kind == "tables":
+        try:
+            from ..extractors.table_extractor import AdvancedTableExtractor
+        except ImportError:
+            from extractors.table_extractor import AdvancedTableExtractor
+        return AdvancedTableExtractor()
+    if kind == "standards_processor":
+        try:
+            from ..standards.standards_processor import StandardsProcessor
+        except ImportError:
+            from standards.standards_processor import StandardsProcessor
+        return StandardsProcessor()
+    if kind in ("standard", "fast", "enhanced"):
+        return create_analyzer(kind, api_key)
+    raise ValueError(f"Unknown component kind: {kind}")
+
+def get_component(kind: str, api_key: Optional[str] = None) -> Any:
+    """
+    Shared instance of a component for the current settings
+    
+    Args:
+        kind: One of COMPONENT_KINDS
+        api_key: OpenAI API key of the fast and enhanced analyzers
+    
+    Returns:
+        Extractor, standards processor or analyzer
+    """
+    return _component(kind, api_key or None, config_fingerprint())
+
+@st.cache_data(max_entries=config.web.result_cache_entries, show_spinner=False)
+def _cached_run(kind: str, sha256: str, api_key: Optional[str], fingerprint: str,
+                standards: Sequence[str], _pdf_path: str) -> Any:
+    """Run an extraction or analysis; the path is left out of the cache key"""
+    component = _component(kind, api_key, fingerprint)
+    if kind == "pdf":
+        return component.extract_from_pdf(_pdf_path)
+    if kind == "tables":
+        return component.extract_tables_from_pdf(_pdf_path)
+    if kind == "standard":
+        try:
+            from ..standards.standards_processor import StandardType
+        except ImportError:
+            from standards.standards_processor import StandardType
+        return component.analyze_dialux_report(_pdf_path, standards=[StandardType(s) for s in standards])
+    return component.analyze_dialux_report(_pdf_path)
+
+def run_cached(kind: str, pdf_path: Union[str, Path], sha256: Optional[str] = None,
+               api_key: Optional[str] = None, standards: Sequence[str] = ()) -> Any:
+    """
+    Extract or analyze an upload, reusing the result of identical content
+    
+    Results are keyed by the file's content hash, the analyzer kind and
+    options and the settings fingerprint, so reruns triggered by UI
+    interactions do not repeat the work.
+    
+    Args:
+        kind: "pdf", "tables" or an analyzer kind ("standard", "fast", "enhanced")
+        pdf_path: Uploaded file on disk
+        sha256: Content hash of the file, if already known
+        api_key: OpenAI API key of the fast and enhanced analyzers
+        standards: Additional standard names for the standard analyzer
+    
+    Returns:
+        Extraction or analysis result
+    """
+    sha256 = sha256 or file_sha256(pdf_path)
+    return _cached_run(kind, sha256, api_key or None, config_fingerprint(), tuple(standards), str(pdf_path))
+
+def clear_caches():
+    """Drop all shared components and cached results"""
+    _component.clear()
+    _cached_run.clear()
+    logger.info("Cleared shared web components and cached results")
+
+@st.cache_resource(show_spinner=False)
+def get_job_queue() -> JobQueue:
+    """Background job queue shared by all sessions of the process"""
+    return JobQueue()
+
+def submit_upload(job_type: str, uploaded_file: Any, options: Optional[Dict[str, Any]] = None,
+                  api_key: Optional[str] = None) -> str:
+    """
+    Queue the analysis of an upload once per session
+    
+    Reruns of the page return the job submitted first for the same
+    content, analyzer and options; a failed job is submitted again.
+    
+    Args:
+        job_type: Analyzer type, one of "standard", "fast" or "enhanced"
+        uploaded_file: Streamlit uploaded file
+        options: Analyzer options, see JobQueue.submit
+        api_key: OpenAI API key of the fast and enhanced analyzers
+    
+    Returns:
+        Job id
+    """
+    data = uploaded_file.getvalue()
+    key = (job_type, hashlib.sha256(data).hexdigest(), json.dumps(options or {}, sort_keys=True))
+    jobs = st.session_state.setdefault('analysis_jobs', {})
+    queue = get_job_queue()
+    
+    job = queue.get(jobs[key]) if key in jobs else None
+    if job is None or job.status == FAILED:
+        job = queue.submit(job_type, data, file_name=uploaded_file.name, options=options, api_key=api_key)
+        jobs[key] = job.job_id
+    return job.job_id
+
+@st.cache_data(max_entries=config.web.result_cache_entries, show_spinner=False)
+def load_job_result(job_id: str) -> Any:
+    """Result of a completed job, loaded once per process"""
+    return get_job_queue().result(job_id)
+
+def wait_for_job(job_id: str) -> Optional[Any]:
+    """
+    Show the progress of a background job until it finishes
+    
+    While the job is queued or running this draws a progress bar and
+    reruns the page every web.job_poll_interval seconds, so it does not
+    return; afterwards it shows the error of a failed job.
+    
+    Returns:
+        Result of a completed job, None if the job failed or is unknown
+    """
+    job = get_job_queue().get(job_id)
+    if job is None:
+        st.error("❌ Analysis job not found")
+        return None
+    if job.status == COMPLETED:
+        return load_job_result(job_id)
+    if job.status == FAILED:
+        st.error(f"❌ Analysis failed: {job.error}")
+        return None
+    
+    label = "⏳ Waiting for a worker" if job.status == QUEUED else STAGE_LABELS.get(job.stage, "🚀 Starting")
+    st.progress(job.progress, text=f"{label}... ({job.file_name})")
+    time.sleep(config.web.job_poll_interval)
+    st.rerun()
+
+def get_session_store() -> SessionStore:
+    """Bounded upload and result store of the current session, see web.session_* settings"""
+    store = st.session_state.get('session_store')
+    if store is None:
+        SessionStore.remove_stale(config.web.session_dir, config.web.session_stale_hours * 3600)
+        store = SessionStore(config.web.session_dir, config.web.session_upload_mb * 1024 * 1024,
+                             config.web.session_result_mb * 1024 * 1024)
+        st.session_state['session_store'] = store
+    return store
+
+def show_session_footprint():
+    """Show the size of the session's uploads and results against their budgets"""
+    footprint = get_session_store().footprint()
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Session Uploads", f"{footprint['upload_bytes'] / 2**20:.1f} / "
+                  f"{footprint['max_upload_bytes'] / 2**20:.0f} MB", f"{footprint['uploads']} files",
+                  delta_color="off")
+    
+    with col2:
+        st.metric("Session Results", f"{footprint['result_bytes'] / 2**20:.1f} / "
+                  f"{footprint['max_result_bytes'] / 2**20:.0f} MB", f"{footprint['results']} results",
+                  delta_color="off")
+    
+    with col3:
+        st.metric("Evicted", f"{footprint['evicted_uploads'] + footprint['evicted_results']}",
+                  f"{footprint['evicted_uploads']} uploads, {footprint['evicted_results']} results",
+                  delta_color="off")
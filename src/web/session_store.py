@@ -0,0 +1,272 @@
+"""
+Session Store
+Bounded per-session uploads and results, evicted least recently used first by size
+"""
+import sys
+import time
+import uuid
+import pickle
+import shutil
+import hashlib
+import logging
+import weakref
+from pathlib import Path
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Union
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Directories of the stores alive in this process, never removed as stale
+_live_directories = set()
+
+def _remove_directory(directory: str):
+    _live_directories.discard(directory)
+    shutil.rmtree(directory, ignore_errors=True)
+
+@dataclass
+class StoredUpload:
+    """An uploaded file kept on disk under its content hash"""
+    sha256: str
+    path: Path
+    size: int
+
+@dataclass
+class StoredResult:
+    """An extraction or analysis result kept in memory"""
+    key: str
+    value: Any
+    size: int
+    label: str
+    sha256: Optional[str] = None  # upload the result belongs to, if any
+
+def estimate_size(value: Any) -> int:
+    """Approximate footprint of a result, measured by its pickled size"""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+class SessionStore:
+    """
+    Uploads and results of one web session within byte budgets
+    
+    Uploads are written once per content hash to a directory of the
+    session, and file names map to their content. Results are keyed by
+    the content hash of their upload, so the same content under two names
+    shares them. When a budget is exceeded the least recently used entries
+    are evicted, except the one just added; evicting an upload also drops
+    its results. The session directory is removed when the store is
+    garbage collected, i.e. when Streamlit discards the session, or at
+    interpreter exit.
+    """
+    
+    def __init__(self, root_dir: Union[str, Path], max_upload_bytes: int, max_result_bytes: int):
+        self.root_dir = Path(root_dir)
+        self.directory = self.root_dir / uuid.uuid4().hex
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_upload_bytes = max_upload_bytes
+        self.max_result_bytes = max_result_bytes
+        
+        self.uploads: "OrderedDict[str, StoredUpload]" = OrderedDict()  # by content hash, least recent first
+        self.names: Dict[str, str] = {}  # file name to content hash
+        self.results: "OrderedDict[str, StoredResult]" = OrderedDict()
+        self.upload_bytes = 0
+        self.result_bytes = 0
+        self.evictions = {"uploads": 0, "results": 0}
+        
+        _live_directories.add(str(self.directory))
+        self._finalizer = weakref.finalize(self, _remove_directory, str(self.directory))
+    
+    # Uploads
+    
+    def add_upload(self, name: str, data: bytes) -> Path:
+        """
+        Store an uploaded file
+        
+        Args:
+            name: File name shown to the user
+            data: File content
+        
+        Returns:
+            Path of the stored file
+        """
+        sha256 = hashlib.sha256(data).hexdigest()
+        previous = self.names.get(name)
+        self.names[name] = sha256
+        if previous is not None and previous != sha256 and previous not in self.names.values():
+            self._drop_upload(previous)
+        
+        upload = self.uploads.get(sha256)
+        if upload is None or not upload.path.exists():
+            path = self.directory / f"{sha256}.pdf"
+            path.write_bytes(data)
+            if upload is not None:
+                self.upload_bytes -= upload.size
+            upload = self.uploads[sha256] = StoredUpload(sha256, path, len(data))
+            self.upload_bytes += upload.size
+        self.uploads.move_to_end(sha256)
+        self._evict_uploads(keep=sha256)
+        return upload.path
+    
+    def upload_path(self, name: str) -> Optional[Path]:
+        """Path of an uploaded file, None if it was evicted or removed"""
+        sha256 = self.names.get(name)
+        upload = self.uploads.get(sha256) if sha256 else None
+        if upload is None or not upload.path.exists():
+            if sha256:
+                self._drop_upload(sha256)
+            return None
+        self.uploads.move_to_end(sha256)
+        return upload.path
+    
+    def upload_sha256(self, name: str) -> Optional[str]:
+        """Content hash of an uploaded file"""
+        return self.names.get(name)
+    
+    def upload_names(self) -> List[str]:
+        """Names of the stored uploads, in upload order"""
+        return list(self.names)
+    
+    def _evict_uploads(self, keep: str):
+        while self.upload_bytes > self.max_upload_bytes and len(self.uploads) > 1:
+            sha256 = next(iter(self.uploads))
+            if sha256 == keep:
+                self.uploads.move_to_end(sha256)
+                sha256 = next(iter(self.uploads))
+            logger.info(f"Evicting upload {sha256[:12]} from session store")
+            self._drop_upload(sha256)
+            self.evictions["uploads"] += 1
+    
+    def _drop_upload(self, sha256: str):
+        """Remove an upload, the names pointing to it and its results"""
+        upload = self.uploads.pop(sha256, None)
+        if upload is not None:
+            self.upload_bytes -= upload.size
+            upload.path.unlink(missing_ok=True)
+        for name in [name for name, value in self.names.items() if value == sha256]:
+            del self.names[name]
+        for key in [key for key, result in self.results.items() if result.sha256 == sha256]:
+            self._drop_result(key)
+    
+    # Results
+    
+    def result_key(self, kind: str, name: Optional[str] = None, *options: Any) -> str:
+        """
+        Key of a result
+        
+        Args:
+            kind: Kind of result, e.g. "pdf_extraction" or "dialux"
+            name: Uploaded file the result was computed from; the key uses its content hash
+            options: Further settings the result depends on
+        
+        Returns:
+            Result key
+        """
+        parts = [kind]
+        if name is not None:
+            parts.append(self.names.get(name, name))
+        parts.extend(str(option) for option in options)
+        return "_".join(parts)
+    
+    def put_result(self, key: str, value: Any, label: Optional[str] = None, name: Optional[str] = None):
+        """
+        Store a result, evicting older ones beyond the byte budget
+        
+        Args:
+            key: Result key, see result_key
+            value: Result object
+            label: Text shown in result lists (default: the key)
+            name: Uploaded file the result belongs to; evicting the upload drops the result
+        """
+        self._drop_result(key)
+        result = StoredResult(key, value, estimate_size(value), label or key, self.names.get(name) if name else None)
+        self.results[key] = result
+        self.result_bytes += result.size
+        while self.result_bytes > self.max_result_bytes and len(self.results) > 1:
+            oldest = next(iter(self.results))
+            logger.info(f"Evicting result {oldest} from session store")
+            self._drop_result(oldest)
+            self.evictions["results"] += 1
+    
+    def get_result(self, key: str) -> Optional[Any]:
+        """Stored result, None if missing or evicted"""
+        result = self.results.get(key)
+        if result is None:
+            return None
+        self.results.move_to_end(key)
+        return result.value
+    
+    def has_result(self, key: str) -> bool:
+        return key in self.results
+    
+    def replace_value(self, old_value: Any, new_value: Any):
+        """Replace a stored result object everywhere it is stored, keeping its place"""
+        for result in self.results.values():
+            if result.value is old_value:
+                result.value = new_value
+    
+    def recent_results(self, limit: int = 5) -> List[StoredResult]:
+        """Most recently used results, oldest first"""
+        return list(self.results.values())[-limit:]
+    
+    def _drop_result(self, key: str):
+        result = self.results.pop(key, None)
+        if result is not None:
+            self.result_bytes -= result.size
+    
+    # Housekeeping
+    
+    def footprint(self) -> Dict[str, Any]:
+        """Sizes, budgets and eviction counts"""
+        return {
+            "uploads": len(self.uploads),
+            "upload_bytes": self.upload_bytes,
+            "max_upload_bytes": self.max_upload_bytes,
+            "results": len(self.results),
+            "result_bytes": self.result_bytes,
+            "max_result_bytes": self.max_result_bytes,
+            "evicted_uploads": self.evictions["uploads"],
+            "evicted_results": self.evictions["results"]
+        }
+    
+    def clear(self):
+        """Drop all uploads and results of the session"""
+        for sha256 in list(self.uploads):
+            self._drop_upload(sha256)
+        self.names.clear()
+        self.results.clear()
+        self.result_bytes = 0
+    
+    def close(self):
+        """Remove the session directory now"""
+        self.uploads.clear()
+        self.names.clear()
+        self.results.clear()
+        self.upload_bytes = self.result_bytes = 0
+        self._finalizer()
+    
+    @staticmethod
+    def remove_stale(root_dir: Union[str, Path], max_age_seconds: float) -> int:
+        """
+        Remove session directories not modified within max_age_seconds, except live ones
+        
+        These are left behind by sessions of a previous server process.
+        
+        Returns:
+            Number of directories removed
+        """
+        root_dir = Path(root_dir)
+        if not root_dir.exists():
+            return 0
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        for directory in root_dir.iterdir():
+            if str(directory) in _live_directories or not directory.is_dir():
+                continue
+            if directory.stat().st_mtime < cutoff:
+                shutil.rmtree(directory, ignore_errors=True)
+                removed += 1
+        if removed:
+            logger.info(f"Removed {removed} stale session directories from {root_dir}")
+        return removed
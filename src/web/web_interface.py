@@ -8,18 +8,15 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import json
-import tempfile
-import shutil
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import logging
 
 # Import our modules
 from ..core.config import config
-from ..extractors.pdf_extractor import PDFExtractor
-from ..extractors.table_extractor import AdvancedTableExtractor
-from ..standards.standards_processor import StandardsProcessor, StandardType, RoomType
-from ..analyzers.dialux_analyzer import DialuxAnalyzer
+from ..standards.standards_processor import StandardType, RoomType
+from .resources import (get_component, run_cached, clear_caches, get_job_queue, wait_for_job,
+                        get_session_store, show_session_footprint)
 
 logger = logging.getLogger(__name__)
 
@@ -28,16 +25,26 @@ class UnifiedWebInterface:
     
     def __init__(self):
         self.config = config.web
-        self.pdf_extractor = PDFExtractor()
-        self.table_extractor = AdvancedTableExtractor()
-        self.standards_processor = StandardsProcessor()
-        self.dialux_analyzer = DialuxAnalyzer()
-        
-        # Initialize session state
-        if 'analysis_results' not in st.session_state:
-            st.session_state.analysis_results = {}
-        if 'uploaded_files' not in st.session_state:
-            st.session_state.uploaded_files = {}
+        
+        # Uploads and results of this session, bounded in size
+        self.store = get_session_store()
+    
+    # Components are created on first use and shared by all sessions of the process
+    @property
+    def pdf_extractor(self):
+        return get_component("pdf")
+    
+    @property
+    def table_extractor(self):
+        return get_component("tables")
+    
+    @property
+    def standards_processor(self):
+        return get_component("standards_processor")
+    
+    @property
+    def dialux_analyzer(self):
+        return get_component("standard")
     
     def run(self):
         """Run the web interface"""
@@ -104,20 +111,25 @@ class UnifiedWebInterface:
         
         if uploaded_file:
             file_key = uploaded_file.name
-            if file_key not in st.session_state.uploaded_files:
-                # Save uploaded file temporarily
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                    shutil.copyfileobj(uploaded_file, tmp_file)
-                    st.session_state.uploaded_files[file_key] = tmp_file.name
-                
+            is_new = self.store.upload_sha256(file_key) is None
+            # Stored once per content; reruns only mark it as recently used
+            self.store.add_upload(file_key, uploaded_file.getvalue())
+            if is_new:
                 st.sidebar.success(f"✅ {file_key} uploaded successfully!")
         
         # Display uploaded files
-        if st.session_state.uploaded_files:
+        if self.store.upload_names():
             st.sidebar.subheader("📂 Uploaded Files")
-            for file_name in st.session_state.uploaded_files.keys():
+            for file_name in self.store.upload_names():
                 st.sidebar.text(f"• {file_name}")
     
+    def _upload_path(self, file_name: str) -> str:
+        """Path of an uploaded file, failing if it was evicted from the session store"""
+        path = self.store.upload_path(file_name)
+        if path is None:
+            raise FileNotFoundError(f"{file_name} is no longer stored, please upload it again")
+        return str(path)
+    
     def _render_home_page(self):
         """Render home page"""
         st.header("🏠 Welcome to Unified Lighting Analyzer")
@@ -157,7 +169,7 @@ class UnifiedWebInterface:
         st.markdown("Extract text and metadata from PDF documents using multiple methods")
         
         # File selection
-        uploaded_files = list(st.session_state.uploaded_files.keys())
+        uploaded_files = self.store.upload_names()
         if not uploaded_files:
             st.warning("Please upload a PDF file first using the sidebar")
             return
@@ -167,11 +179,12 @@ class UnifiedWebInterface:
         if st.button("🔍 Extract Text", type="primary"):
             with st.spinner("Extracting text from PDF..."):
                 try:
-                    file_path = st.session_state.uploaded_files[selected_file]
-                    result = self.pdf_extractor.extract_from_pdf(file_path)
+                    file_path = self._upload_path(selected_file)
+                    result = run_cached("pdf", file_path)
                     
                     # Store result
-                    st.session_state.analysis_results[f"pdf_extraction_{selected_file}"] = result
+                    self.store.put_result(self.store.result_key("pdf_extraction", selected_file), result,
+                                          f"pdf_extraction · {selected_file}", selected_file)
                     
                     st.success("✅ Text extraction completed!")
                     
@@ -188,7 +201,7 @@ class UnifiedWebInterface:
         st.markdown("Extract tables from PDFs with quality analysis and multiple extraction methods")
         
         # File selection
-        uploaded_files = list(st.session_state.uploaded_files.keys())
+        uploaded_files = self.store.upload_names()
         if not uploaded_files:
             st.warning("Please upload a PDF file first using the sidebar")
             return
@@ -210,18 +223,19 @@ class UnifiedWebInterface:
         if st.button("🔍 Extract Tables", type="primary"):
             with st.spinner("Extracting tables from PDF..."):
                 try:
-                    file_path = st.session_state.uploaded_files[selected_file]
+                    file_path = self._upload_path(selected_file)
                     
-                    # Update config
-                    self.table_extractor.config.min_table_score = min_score
-                    self.table_extractor.config.min_rows = min_rows
-                    self.table_extractor.config.min_cols = min_cols
-                    self.table_extractor.config.duplicate_similarity_threshold = duplicate_threshold
+                    # Update config; changed thresholds give a new extractor and cache key
+                    config.extraction.min_table_score = min_score
+                    config.extraction.min_rows = min_rows
+                    config.extraction.min_cols = min_cols
+                    config.extraction.duplicate_similarity_threshold = duplicate_threshold
                     
-                    tables = self.table_extractor.extract_tables_from_pdf(file_path)
+                    tables = run_cached("tables", file_path)
                     
                     # Store result
-                    st.session_state.analysis_results[f"table_extraction_{selected_file}"] = tables
+                    self.store.put_result(self.store.result_key("table_extraction", selected_file), tables,
+                                          f"table_extraction · {selected_file}", selected_file)
                     
                     st.success(f"✅ Table extraction completed! Found {len(tables)} tables")
                     
@@ -238,7 +252,7 @@ class UnifiedWebInterface:
         st.markdown("Process lighting standards documents and build compliance database")
         
         # File selection
-        uploaded_files = list(st.session_state.uploaded_files.keys())
+        uploaded_files = self.store.upload_names()
         if not uploaded_files:
             st.warning("Please upload a PDF file first using the sidebar")
             return
@@ -248,11 +262,12 @@ class UnifiedWebInterface:
         if st.button("🔍 Process Standards", type="primary"):
             with st.spinner("Processing standards document..."):
                 try:
-                    file_path = st.session_state.uploaded_files[selected_file]
+                    file_path = self._upload_path(selected_file)
                     standards_doc = self.standards_processor.process_standards_document(file_path)
                     
                     # Store result
-                    st.session_state.analysis_results[f"standards_{selected_file}"] = standards_doc
+                    self.store.put_result(self.store.result_key("standards", selected_file), standards_doc,
+                                          f"standards · {selected_file}", selected_file)
                     
                     st.success("✅ Standards processing completed!")
                     
@@ -273,7 +288,7 @@ class UnifiedWebInterface:
         st.markdown("Comprehensive analysis of Dialux reports with compliance checking")
         
         # File selection
-        uploaded_files = list(st.session_state.uploaded_files.keys())
+        uploaded_files = self.store.upload_names()
         if not uploaded_files:
             st.warning("Please upload a PDF file first using the sidebar")
             return
@@ -302,23 +317,31 @@ class UnifiedWebInterface:
             
             detailed_report = st.checkbox("Generate Detailed Report", True)
         
+        result_key = self.store.result_key("dialux", selected_file)
+        job_key = f"dialux_job_{selected_file}"
+        
         if st.button("🔍 Analyze Dialux Report", type="primary"):
-            with st.spinner("Analyzing Dialux report..."):
-                try:
-                    file_path = st.session_state.uploaded_files[selected_file]
-                    analysis_result = self.dialux_analyzer.analyze_dialux_report(file_path)
-                    
-                    # Store result
-                    st.session_state.analysis_results[f"dialux_{selected_file}"] = analysis_result
-                    
-                    st.success("✅ Dialux analysis completed!")
-                    
-                    # Display results
-                    self._display_dialux_results(analysis_result, include_visualizations)
-                    
-                except Exception as e:
-                    st.error(f"❌ Dialux analysis failed: {e}")
-                    logger.error(f"Dialux analysis failed: {e}")
+            try:
+                file_path = self._upload_path(selected_file)
+                job = get_job_queue().submit("standard", file_path, file_name=selected_file,
+                                             options={"standards": sorted(standards_to_check)})
+                st.session_state[job_key] = job.job_id
+                
+            except Exception as e:
+                st.error(f"❌ Dialux analysis failed: {e}")
+                logger.error(f"Dialux analysis failed: {e}")
+        
+        # Poll the background job until its result is in
+        if job_key in st.session_state:
+            analysis_result = wait_for_job(st.session_state[job_key])
+            del st.session_state[job_key]
+            if analysis_result is not None:
+                self.store.put_result(result_key, analysis_result, f"dialux · {selected_file}", selected_file)
+                st.success("✅ Dialux analysis completed!")
+        
+        # Display results (kept across reruns so the standard can be switched)
+        if self.store.has_result(result_key):
+            self._display_dialux_results(self.store.get_result(result_key), include_visualizations)
     
     def _render_comparison_page(self):
         """Render comparison page"""
@@ -360,8 +383,8 @@ class UnifiedWebInterface:
                     )
                     
                     # Store result
-                    comparison_key = f"comparison_{standard_a}_{standard_b}_{room_type}"
-                    st.session_state.analysis_results[comparison_key] = comparisons
+                    comparison_key = self.store.result_key("comparison", None, standard_a, standard_b, room_type)
+                    self.store.put_result(comparison_key, comparisons)
                     
                     st.success("✅ Standards comparison completed!")
                     
@@ -418,6 +441,18 @@ class UnifiedWebInterface:
             self.config.standards.compliance_threshold = compliance_threshold
             
             st.success("✅ Settings saved successfully!")
+        
+        # Shared components are rebuilt automatically when a setting changes
+        if st.button("🔄 Reload Analyzers"):
+            clear_caches()
+            st.success("✅ Analyzers and cached results cleared")
+        
+        # Session storage
+        st.subheader("💾 Session Storage")
+        show_session_footprint()
+        if st.button("🧹 Clear Session Files and Results"):
+            self.store.clear()
+            st.success("✅ Session uploads and results removed")
     
     def _render_system_status(self):
         """Render system status"""
@@ -434,16 +469,24 @@ class UnifiedWebInterface:
         
         with col4:
             st.metric("Dialux Analyzer", "✅ Ready")
+        
+        job_counts = get_job_queue().store.counts()
+        st.caption(f"Background jobs: {job_counts.get('running', 0)} running, "
+                   f"{job_counts.get('queued', 0)} queued, {job_counts.get('failed', 0)} failed")
+        
+        show_session_footprint()
     
     def _render_recent_analysis(self):
         """Render recent analysis results"""
-        if not st.session_state.analysis_results:
+        recent = self.store.recent_results(5)
+        if not recent:
             st.info("No analysis results yet. Upload a file and run an analysis to see results here.")
             return
         
         # Display recent results
-        for key, result in list(st.session_state.analysis_results.items())[-5:]:
-            with st.expander(f"📊 {key}"):
+        for stored in recent:
+            key, result = stored.key, stored.value
+            with st.expander(f"📊 {stored.label}"):
                 if "pdf_extraction" in key:
                     st.text(f"Text length: {len(result.text)} characters")
                     st.text(f"Tables found: {len(result.tables)}")
@@ -661,6 +704,23 @@ class UnifiedWebInterface:
         
         st.subheader("🔍 Dialux Analysis Results")
         
+        # Standard selection (all standards were evaluated during analysis)
+        evaluated_standards = list(getattr(report, 'compliance_by_standard', {}).keys())
+        if len(evaluated_standards) > 1:
+            current = report.selected_standard.value if report.selected_standard else evaluated_standards[0]
+            displayed_standard = st.selectbox(
+                "Displayed Standard",
+                evaluated_standards,
+                index=evaluated_standards.index(current) if current in evaluated_standards else 0,
+                format_func=lambda s: f"{s} (match score {report.standard_scores.get(s, 0.0):.2f})",
+                key=f"standard_{report.project_name}"
+            )
+            if displayed_standard != current:
+                switched_result = self.dialux_analyzer.select_standard(analysis_result, displayed_standard)
+                self.store.replace_value(analysis_result, switched_result)
+                analysis_result = switched_result
+                report = analysis_result.report
+        
         # Key metrics
         col1, col2, col3, col4 = st.columns(4)
         
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test the pre-warmed analysis pool behind the HTTP batch API and its NDJSON streaming
+"""
+import sys
+import json
+import time
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+REPORT = """Project: Pool {number}
+Customer: Company {number}
+Room {number}: Office
+Area: {area} m2
+Average illuminance: 520 lx
+Uniformity: 0.62
+UGR: 18.5
+"""
+
+def make_pdf(number: int) -> bytes:
+    import fitz
+    document = fitz.open()
+    document.new_page().insert_text((50, 72), REPORT.format(number=number, area=20 + number), fontsize=10)
+    return document.tobytes()
+
+async def collect(pool, kind, documents, standards=()):
+    return [json.loads(line) async for line in pool.stream(kind, documents, standards)]
+
+def test_analysis_pool():
+    """Documents stream back one line each, identical content is processed once, no exports are written"""
+    from core.config import config
+    from analyzers.analysis_pool import AnalysisPool, PoolDocument, UploadStore
+    
+    work_dir = Path(tempfile.mkdtemp(prefix="api-pool-"))
+    settings = (config.dialux_output_dir, config.dialux.dialux_output_dir, config.dialux.result_cache_dir)
+    config.dialux_output_dir = config.dialux.dialux_output_dir = str(work_dir / "exports")
+    config.dialux.result_cache_dir = str(work_dir / "cache")
+    
+    store = UploadStore(work_dir / "uploads")
+    hashes = [store.put(make_pdf(number)) for number in range(6)]
+    assert store.put(Path(store.path(hashes[0])).read_bytes()) == hashes[0]
+    assert store.path("../../etc/passwd") is None and store.path("0" * 64) is None
+    
+    broken = store.put(b"%PDF-1.4 not really a pdf")
+    documents = [PoolDocument(f"report-{i}.pdf", sha256, store.path(sha256)) for i, sha256 in enumerate(hashes)]
+    documents.append(PoolDocument("copy-of-report-0.pdf", hashes[0], store.path(hashes[0])))
+    
+    pool = AnalysisPool(workers=2, warm_kinds=["fast"])
+    start = time.time()
+    pool.start()
+    print(f"🔥 {pool.workers} workers warm in {time.time() - start:.2f}s")
+    try:
+        start = time.time()
+        lines = asyncio.run(collect(pool, "fast", documents))
+        print(f"✅ {len(lines)} NDJSON lines in {time.time() - start:.2f}s")
+        assert len(lines) == len(documents)
+        assert all(line['status'] == 'completed' for line in lines), lines
+        assert {line['file'] for line in lines} == {document.file for document in documents}
+        projects = {line['file']: line['result']['report']['project_name'] for line in lines}
+        assert projects["copy-of-report-0.pdf"] == projects["report-0.pdf"]
+        
+        lines = asyncio.run(collect(pool, "compliance", documents[:2], ["EN_12464_1"]))
+        print(f"📏 Compliance keys: {sorted(lines[0]['result'])[:4]}...")
+        assert all('overall_compliance_rate' in line['result'] for line in lines)
+        
+        lines = asyncio.run(collect(pool, "pdf", [PoolDocument("broken.pdf", broken, store.path(broken))]))
+        print(f"🧯 Broken upload: {lines[0]['status']}")
+        assert len(lines) == 1 and lines[0]['file'] == "broken.pdf"
+        
+        # A document whose analysis raises gets a failed line, the others still complete
+        missing = PoolDocument("missing.pdf", "0" * 64, Path(store.uploads_dir) / "missing.pdf")
+        lines = asyncio.run(collect(pool, "fast", [missing, documents[1]]))
+        statuses = {line['file']: line['status'] for line in lines}
+        print(f"🧯 Missing file: {statuses}")
+        assert statuses == {"missing.pdf": "failed", "report-1.pdf": "completed"}
+        
+        # Results are streamed back, so workers leave no export files behind
+        assert not (work_dir / "exports").exists() or not any((work_dir / "exports").iterdir())
+        assert config.dialux.write_exports, "the API setting only applies inside the workers"
+    finally:
+        pool.shutdown()
+        config.dialux_output_dir, config.dialux.dialux_output_dir, config.dialux.result_cache_dir = settings
+
+if __name__ == "__main__":
+    print("🧪 Analysis Pool Test")
+    print("=" * 30)
+
+    try:
+        test_analysis_pool()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test the parallel batch command against analyzing each report in turn, and resuming a run
+"""
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+REPORT = """Project: Batch {number}
+Room {number}: Office
+Area: {area} m2
+Average illuminance: {illuminance} lx
+Uniformity: 0.62
+UGR: 18.5
+"""
+
+def make_pdf(path: Path, number: int):
+    import fitz
+    document = fitz.open()
+    text = REPORT.format(number=number, area=20 + number, illuminance=300 + 50 * number)
+    document.new_page().insert_text((50, 72), text, fontsize=10)
+    document.save(str(path))
+    document.close()
+
+def summary(report):
+    return (report['project_name'], report['total_rooms'], round(report['overall_compliance_rate'], 9))
+
+def read_results(results_path: Path):
+    with open(results_path, 'r', encoding='utf-8') as f:
+        return {Path(record['file']).name: summary(record['report']) for record in map(json.loads, f)}
+
+def test_batch_analysis():
+    """Batch results match one-by-one analysis, and a re-run only analyzes what is left"""
+    from core.config import config
+    from analyzers.batch_analyzer import BatchAnalyzer, BatchManifest, collect_pdf_paths
+    from analyzers.dialux_analyzer import DialuxAnalyzer
+    from utils.json_export import dumps_json
+    
+    work_dir = Path(tempfile.mkdtemp(prefix="batch-"))
+    reports_dir = work_dir / "reports"
+    reports_dir.mkdir()
+    for number in range(4):
+        make_pdf(reports_dir / f"report-{number}.pdf", number)
+    (reports_dir / "copy-of-report-0.pdf").write_bytes((reports_dir / "report-0.pdf").read_bytes())
+    results_path, manifest_path = work_dir / "batch_results.jsonl", work_dir / "batch_manifest.json"
+    
+    original = (config.dialux.dialux_output_dir, config.dialux.result_cache_dir)
+    try:
+        config.dialux.dialux_output_dir = str(work_dir / "exports")
+        config.dialux.result_cache_dir = str(work_dir / "cache")
+        
+        pdf_paths = collect_pdf_paths(reports_dir)
+        batch = BatchAnalyzer("standard", workers=2)
+        outcomes = {Path(outcome.file).name: outcome.status for outcome in batch.run(pdf_paths, results_path, manifest_path)}
+        print(f"📦 First run: {outcomes}")
+        
+        # Reference: every report analyzed in turn, as the per-file loop did
+        analyzer = DialuxAnalyzer()
+        expected = {path.name: summary(json.loads(dumps_json(analyzer.analyze_dialux_report(path).report)))
+                    for path in pdf_paths if path.name != "report-0.pdf"}
+        assert outcomes == {"report-0.pdf": "duplicate", **{name: "completed" for name in expected}}
+        assert read_results(results_path) == expected
+        
+        # Re-running skips everything already completed
+        outcomes = [outcome.status for outcome in batch.run(pdf_paths, results_path, manifest_path)]
+        assert set(outcomes) == {"skipped"} and len(read_results(results_path)) == len(expected)
+        
+        # A run interrupted before the last report resumes with that report only
+        manifest = BatchManifest(manifest_path)
+        interrupted = next(sha256 for sha256, entry in manifest.entries.items()
+                           if Path(entry['file']).name == "report-3.pdf")
+        del manifest.entries[interrupted]
+        manifest.save()
+        outcomes = {Path(outcome.file).name: outcome.status for outcome in batch.run(pdf_paths, results_path, manifest_path)}
+        print(f"🔁 Resumed run: {outcomes}")
+        assert [name for name, status in outcomes.items() if status == "completed"] == ["report-3.pdf"]
+    finally:
+        config.dialux.dialux_output_dir, config.dialux.result_cache_dir = original
+
+if __name__ == "__main__":
+    print("🧪 Batch Analysis Test")
+    print("=" * 30)
+
+    try:
+        test_batch_analysis()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test cross-document company-name extraction against a local stub chat-completions server
+"""
+import re
+import sys
+import json
+import time
+import tempfile
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+DOCUMENT_PATTERN = re.compile(r'^### Document (\d+)\n(.*?)(?=^### Document |\Z)', re.MULTILINE | re.DOTALL)
+CUSTOMER_PATTERN = re.compile(r'Customer: Company (\d+)')
+
+class StubState:
+    """Requests seen by the stub server"""
+    lock = threading.Lock()
+    requests = 0
+    batched_requests = 0
+    malformed_batches = False
+
+def company_answer(text: str) -> dict:
+    number = CUSTOMER_PATTERN.search(text).group(1)
+    return {"project_name": f"Project {number}", "project_company": f"Company {number}",
+            "luminaire_manufacturer": "Philips", "driver_circuit_company": None}
+
+class StubChatHandler(BaseHTTPRequestHandler):
+    """Answers batched prompts with one entry per document and single prompts with one object"""
+    
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        prompt = body['messages'][-1]['content']
+        documents = DOCUMENT_PATTERN.findall(prompt)
+        with StubState.lock:
+            StubState.requests += 1
+            StubState.batched_requests += bool(documents)
+        
+        if documents and StubState.malformed_batches:
+            content = "Here are the companies you asked for."
+        elif documents:
+            content = json.dumps({number: company_answer(text) for number, text in documents})
+        else:
+            content = json.dumps(company_answer(prompt))
+        
+        payload = json.dumps({
+            "id": f"chatcmpl-{StubState.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body['model'],
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        }).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def log_message(self, format, *args):
+        pass
+
+def excerpt(number: int) -> str:
+    return f"--- Page 1 ---\nProject: Project {number}\nCustomer: Company {number}\nManufacturer: Philips\n"
+
+def test_company_batching():
+    """Test that pending company names are resolved a group of documents per request"""
+    from core.config import config
+    from extractors.focused_extractor import FocusedExtractor, FocusedExtractionResult
+    
+    StubState.requests = StubState.batched_requests = 0
+    StubState.malformed_batches = False
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubChatHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    settings = (config.llm.base_url, config.llm.response_cache_dir, config.llm.company_batch_size)
+    try:
+        config.llm.base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+        config.llm.response_cache_dir = tempfile.mkdtemp(prefix="llm-cache-")
+        config.llm.company_batch_size = 10
+        
+        extractor = FocusedExtractor(api_key="test-key")
+        
+        # 25 documents in groups of 10: three requests instead of 25
+        results = [FocusedExtractionResult(pending_company_text=excerpt(number)) for number in range(25)]
+        extractor.resolve_companies_batch(results)
+        print(f"✅ {len(results)} documents resolved with {StubState.requests} requests")
+        assert StubState.requests == 3 and StubState.batched_requests == 3
+        for number, result in enumerate(results):
+            assert result.project_name == f"Project {number}"
+            assert result.project_company == f"Company {number}"
+            assert result.luminaire_manufacturer == "Philips"
+            assert result.pending_company_text is None
+        
+        # An unparsable batch answer falls back to one request per document
+        StubState.malformed_batches = True
+        requests = StubState.requests
+        results = [FocusedExtractionResult(pending_company_text=excerpt(number)) for number in range(100, 105)]
+        extractor.resolve_companies_batch(results)
+        print(f"✅ Malformed batch answer: {StubState.requests - requests} requests for {len(results)} documents")
+        assert StubState.requests - requests == 1 + len(results)
+        assert [result.project_company for result in results] == [f"Company {number}" for number in range(100, 105)]
+        
+        # Batched answers are cached per document, so single-document extraction reuses them
+        requests = StubState.requests
+        company_data = extractor._extract_companies_fast(excerpt(7))
+        print(f"✅ Single-document extraction after the batch: {StubState.requests - requests} requests")
+        assert StubState.requests == requests
+        assert company_data['project_company'] == "Company 7"
+    finally:
+        StubState.malformed_batches = False
+        server.shutdown()
+        config.llm.base_url, config.llm.response_cache_dir, config.llm.company_batch_size = settings
+
+if __name__ == "__main__":
+    print("🧪 Company Batching Test")
+    print("=" * 30)
+
+    try:
+        test_company_batching()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Test local company resolution with the manufacturer index and the LLM fallback on low confidence
+"""
+import sys
+import time
+import tempfile
+import threading
+from pathlib import Path
+from http.server import ThreadingHTTPServer
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from test_company_batching import StubChatHandler, StubState
+
+REPORT = """--- Page 1 ---
+Project: Riverside Campus
+Customer: Nile Holdings Ltd
+Designer: Short Circuit Company
+Geneva office, signage and Ercolano stone by others
+
+--- Page 9 ---
+Luminaire list
+PHILIPS CoreLine Panel RC132V 3400 lm 28 W
+Philips CoreLine Downlight DN140B 2200 lm 20 W
+Zumtobel ONDARIA 3100 lm 27 W
+Driver: Philips Xitanium 36W 0.3-1A
+Control gear: Tridonic LC 25W
+"""
+
+def write_pdf(path: Path, text: str):
+    import fitz
+    document = fitz.open()
+    document.new_page().insert_text((50, 72), text, fontsize=9)
+    document.save(str(path))
+
+def test_local_resolution():
+    """Companies are resolved from the index and labelled lines in microseconds"""
+    from extractors.company_index import get_company_index
+    
+    index = get_company_index()
+    print(f"📇 {len(index.entries)} companies in the index, revision {index.revision}")
+    assert index.entries, "the bundled index should load"
+    
+    resolution = index.resolve(REPORT)
+    print(f"✅ Resolved {resolution.to_dict()} with confidence {resolution.confidence:.0%}")
+    assert resolution.project_name == "Riverside Campus"
+    assert resolution.project_company == "Nile Holdings Ltd"
+    assert resolution.luminaire_manufacturer == "Philips"
+    assert resolution.driver_circuit_company in ("Philips", "Tridonic")
+    assert resolution.confidence == 1.0
+    assert "GE Lighting" not in resolution.mentions and "ERCO" not in resolution.mentions, \
+        "names inside other words should not match"
+    
+    driver_only = index.resolve("Control gear: OSRAM OPTOTRONIC OTi DALI 35W\nDriver: Mean Well XLG-150\n")
+    assert driver_only.luminaire_manufacturer is None
+    assert driver_only.driver_circuit_company in ("Osram", "Mean Well")
+    
+    runs = 1000
+    start = time.perf_counter()
+    for _ in range(runs):
+        index.resolve(REPORT)
+    print(f"⚡ {(time.perf_counter() - start) / runs * 1e6:.0f} µs per resolution")
+
+def test_llm_fallback():
+    """The company request is only sent when local resolution is not conclusive"""
+    from core.config import config
+    from extractors.focused_extractor import FocusedExtractor
+    
+    StubState.requests = StubState.batched_requests = 0
+    StubState.malformed_batches = False
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubChatHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    settings = (config.llm.base_url, config.llm.response_cache_dir, config.llm.company_local_confidence)
+    try:
+        config.llm.base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+        config.llm.response_cache_dir = tempfile.mkdtemp(prefix="llm-cache-")
+        extractor = FocusedExtractor(api_key="test-key")
+        work_dir = Path(tempfile.mkdtemp(prefix="company-index-"))
+        
+        # Every field found locally: no request
+        write_pdf(work_dir / "complete.pdf", "Project: Project 4\nCustomer: Company 4\n"
+                                             "Luminaire: Philips CoreLine Panel RC132V 3400 lm 28 W\nArea: 25 m2\n")
+        result = extractor.extract_focused_data(work_dir / "complete.pdf")
+        print(f"✅ Conclusive report: {StubState.requests} requests, manufacturer {result.luminaire_manufacturer}")
+        assert StubState.requests == 0
+        assert (result.project_name, result.project_company) == ("Project 4", "Company 4")
+        
+        # No project label: one request, with local fields kept where the answer has none
+        write_pdf(work_dir / "partial.pdf", "Customer: Company 5\nDriver: Tridonic LC 25W\n"
+                                            "Luminaire: Zumtobel ONDARIA 3100 lm 27 W\nArea: 25 m2\n")
+        result = extractor.extract_focused_data(work_dir / "partial.pdf")
+        print(f"✅ Inconclusive report: {StubState.requests} request, project {result.project_name}, "
+              f"driver {result.driver_circuit_company}")
+        assert StubState.requests == 1
+        assert result.project_name == "Project 5"
+        assert result.driver_circuit_company == "Tridonic"
+    finally:
+        server.shutdown()
+        config.llm.base_url, config.llm.response_cache_dir, config.llm.company_local_confidence = settings
+
+def test_confidence_threshold():
+    """Local resolution below the configured confidence asks the LLM, at or above it does not"""
+    from core.config import config
+    from extractors.focused_extractor import FocusedExtractor
+    
+    StubState.requests = StubState.batched_requests = 0
+    StubState.malformed_batches = False
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubChatHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    settings = (config.llm.base_url, config.llm.response_cache_dir, config.llm.company_local_confidence)
+    try:
+        config.llm.base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+        work_dir = Path(tempfile.mkdtemp(prefix="company-threshold-"))
+        # Customer and manufacturer found, project name missing: confidence 2/3
+        write_pdf(work_dir / "two_of_three.pdf", "Customer: Company 6\n"
+                                                 "Luminaire: Zumtobel ONDARIA 3100 lm 27 W\nArea: 25 m2\n")
+        
+        for threshold, expected_requests in ((settings[2], 1), (0.6, 0), (1 / 3, 0), (1.0, 1)):
+            config.llm.company_local_confidence = threshold
+            config.llm.response_cache_dir = tempfile.mkdtemp(prefix="llm-cache-")
+            requests = StubState.requests
+            result = FocusedExtractor(api_key="test-key").extract_focused_data(work_dir / "two_of_three.pdf")
+            print(f"🎚️ Threshold {threshold:.2f}: {StubState.requests - requests} requests")
+            assert StubState.requests - requests == expected_requests, threshold
+            assert result.project_company == "Company 6"
+            assert (result.project_name == "Project 6") == bool(expected_requests)
+        assert 2 / 3 < settings[2] <= 1.0, "the default asks the LLM only when a field is missing"
+    finally:
+        server.shutdown()
+        config.llm.base_url, config.llm.response_cache_dir, config.llm.company_local_confidence = settings
+
+if __name__ == "__main__":
+    print("🧪 Company Index Test")
+    print("=" * 30)
+
+    try:
+        test_local_resolution()
+        test_llm_fallback()
+        test_confidence_threshold()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
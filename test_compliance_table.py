@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test that the compact compliance table gives back the results stored as ComplianceResult lists
+"""
+import sys
+import random
+from pathlib import Path
+from dataclasses import asdict
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+def make_results(rng: random.Random, standard, room_type):
+    from standards.standards_processor import ComplianceResult
+    
+    results = []
+    for parameter in rng.sample(["illuminance", "uniformity", "ugr", "power_density"], rng.randint(0, 4)):
+        required, actual = rng.uniform(0.4, 500), rng.uniform(0.3, 800)
+        results.append(ComplianceResult(
+            parameter=parameter, required_value=required, actual_value=actual,
+            unit=rng.choice(["lux", "", "W/m²"]), is_compliant=actual >= required,
+            compliance_percentage=actual / required * 100, deviation=actual - required,
+            room_type=room_type, standard=standard, notes=rng.choice(["", "Meets requirement"])
+        ))
+    return results
+
+def test_compliance_table():
+    """Results per room and standard, and the exported columns, match the per-room lists"""
+    from standards.standards_processor import (ComplianceTable, StandardType, RoomType,
+                                               compliance_dict_factory)
+    
+    rng = random.Random(3)
+    standards = [StandardType.EN_12464_1, StandardType.BREEAM, StandardType.IES]
+    table = ComplianceTable()
+    expected = {}
+    for room_index in range(300):
+        room_type = rng.choice(list(RoomType))
+        for standard in rng.sample(standards, rng.randint(1, 3)):
+            results = make_results(rng, standard, room_type)
+            expected[room_index, standard] = results
+            table.add_results(room_index, standard, results)
+    
+    for room_index in range(300):
+        for standard in standards + [StandardType.CIE]:
+            results = expected.get((room_index, standard), [])
+            assert table.results(room_index, standard) == results, (room_index, standard)
+            assert table.parameters(room_index, standard) == [result.parameter for result in results]
+    assert set(table.standards()) == {standard for _, standard in expected}
+    assert not table.has_standard(StandardType.CIE)
+    print(f"✅ {len(table)} results of 300 rooms match the per-room lists")
+    
+    # Exported columns carry the same records as asdict() of each result
+    columns = table.to_dict()
+    exported = sorted(tuple((name, values[row]) for name, values in columns.items())
+                      for row in range(len(table)))
+    reference = sorted(tuple(sorted({'room': room_index, **asdict(result),
+                                     'room_type': result.room_type.value,
+                                     'standard': result.standard.value}.items(),
+                                    key=lambda item: list(columns).index(item[0])))
+                       for (room_index, _), results in expected.items() for result in results)
+    assert exported == reference
+    assert compliance_dict_factory([('compliance_checks', table)]) == {'compliance_checks': columns}
+    print(f"📦 {table.nbytes} bytes in the table")
+
+if __name__ == "__main__":
+    print("🧪 Compliance Table Test")
+    print("=" * 30)
+
+    try:
+        test_compliance_table()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test incremental standards ingestion against full-document processing
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+# Keeps the context windows of the requirements on different pages apart
+FILLER = "\n".join(["Values apply to the task area and are maintained over time."] * 4)
+
+SHARED_PAGE = f"{FILLER}\nCorridor lighting\nMaintained illuminance 100 lux minimum\n{FILLER}"
+EN_PAGES = [
+    f"EN 12464-1 Light and lighting\nOffice lighting\nMaintained illuminance 500 lux minimum\n{FILLER}",
+    f"{FILLER}\nLighting of teaching areas\nThe following applies in every classroom",
+    f"Maintained illuminance 300 lux minimum\n{FILLER}"
+]
+BREEAM_PAGES = [f"{FILLER}\nBREEAM New Construction\nMeeting rooms\nMaintained illuminance 400 lux minimum\n{FILLER}"]
+
+def make_pdf(path: Path, pages):
+    import fitz
+    document = fitz.open()
+    for text in pages:
+        document.new_page().insert_text((50, 72), text, fontsize=11)
+    document.save(str(path))
+    document.close()
+
+def requirement_set(requirements):
+    return {(req.parameter, req.condition, req.room_type.value, req.value) for req in requirements}
+
+def requirements_by_room(requirements):
+    """Requirements as the standards database stores them"""
+    rooms = {}
+    for req in requirements:
+        rooms.setdefault(req.room_type.value, {})[f"{req.parameter}_{req.condition}"] = req.value
+    return rooms
+
+def database_requirements(processor, standard_key):
+    return processor.standards_database[standard_key]["requirements"]
+
+def test_incremental_ingestion():
+    """Shared pages reach every standard and requirements across page breaks are kept"""
+    from core.config import config
+    from standards.standards_processor import StandardsProcessor
+    
+    work_dir = Path(tempfile.mkdtemp(prefix="standards-"))
+    en_pdf, breeam_pdf = work_dir / "en_12464.pdf", work_dir / "breeam.pdf"
+    make_pdf(en_pdf, [SHARED_PAGE] + EN_PAGES)
+    make_pdf(breeam_pdf, [SHARED_PAGE] + BREEAM_PAGES)
+    
+    original = (config.standards.standards_db_path, config.standards.page_index_dir,
+                config.standards.incremental_ingestion)
+    try:
+        # Full-document processing as the reference
+        config.standards.incremental_ingestion = False
+        config.standards.standards_db_path = str(work_dir / "full_db.json")
+        config.standards.page_index_dir = str(work_dir / "full_index")
+        full = StandardsProcessor()
+        full_en = full.process_standards_document(en_pdf)
+        full_breeam = full.process_standards_document(breeam_pdf)
+        
+        config.standards.incremental_ingestion = True
+        config.standards.standards_db_path = str(work_dir / "db.json")
+        config.standards.page_index_dir = str(work_dir / "index")
+        processor = StandardsProcessor()
+        assert "BREEAM" in processor.standards_database  # from the default database
+        
+        en = processor.process_standards_document(en_pdf)
+        assert en.standard_type == full_en.standard_type and en.pages_reused == 0
+        assert requirement_set(en.requirements) == requirement_set(full_en.requirements)
+        print(f"📄 EN 12464-1: {len(en.requirements)} requirements, same as full processing")
+        
+        # The requirement after the page break belongs to the classroom announced before it
+        assert ('illuminance', 'minimum', 'educational', 300.0) in requirement_set(en.requirements)
+        
+        breeam = processor.process_standards_document(breeam_pdf)
+        print(f"♻️ BREEAM: {breeam.pages_reused}/{breeam.pages_total} pages reused")
+        assert breeam.pages_reused == 1
+        assert requirement_set(breeam.requirements) == requirement_set(full_breeam.requirements)
+        
+        # The shared page was first extracted for EN 12464-1 but reaches BREEAM as well
+        assert database_requirements(processor, "BREEAM") == database_requirements(full, "BREEAM")
+        assert database_requirements(processor, "BREEAM")["corridor"]["illuminance_minimum"] == 100.0
+        
+        # After a database reset every page is reused and the requirements still arrive
+        Path(config.standards.standards_db_path).unlink()
+        processor = StandardsProcessor()
+        processor.standards_database = {}
+        reset = processor.process_standards_document(en_pdf)
+        assert reset.pages_reused == reset.pages_total
+        assert database_requirements(processor, "EN_12464_1") == requirements_by_room(full_en.requirements)
+        print(f"🔁 After reset: {reset.pages_reused}/{reset.pages_total} pages reused, database restored")
+    finally:
+        (config.standards.standards_db_path, config.standards.page_index_dir,
+         config.standards.incremental_ingestion) = original
+
+if __name__ == "__main__":
+    print("🧪 Incremental Standards Ingestion Test")
+    print("=" * 30)
+
+    try:
+        test_incremental_ingestion()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test background analysis jobs: progress reporting, coalescing and per-type concurrency
+"""
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+REPORT = """Project: Job Queue {number}
+Customer: Company {number}
+Room {number}: Office
+Area: {area} m2
+Average illuminance: 520 lx
+Uniformity: 0.62
+UGR: 18.5
+"""
+
+def make_pdf(number: int) -> bytes:
+    import fitz
+    document = fitz.open()
+    document.new_page().insert_text((50, 72), REPORT.format(number=number, area=20 + number), fontsize=10)
+    return document.tobytes()
+
+def wait(queue, job_id: str, timeout: float = 120) -> list:
+    """Poll a job until it finishes; returns the progress values seen"""
+    seen = []
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = queue.get(job_id)
+        seen.append(job.progress)
+        if job.done:
+            return seen
+        time.sleep(0.02)
+    raise TimeoutError(f"job {job_id} did not finish")
+
+def test_job_queue():
+    """Jobs run in the background, report their stage and respect the per-type worker limit"""
+    from core.config import config
+    from analyzers.job_queue import JobQueue, COMPLETED
+    
+    work_dir = Path(tempfile.mkdtemp(prefix="job-queue-"))
+    settings = (config.web.job_db_path, config.web.job_results_dir, config.web.job_uploads_dir,
+                config.web.job_concurrency, config.dialux_output_dir, config.dialux.result_cache_dir)
+    config.web.job_db_path = str(work_dir / "jobs.db")
+    config.web.job_results_dir = str(work_dir / "results")
+    config.web.job_uploads_dir = str(work_dir / "uploads")
+    config.web.job_concurrency = {"fast": 1}
+    config.dialux_output_dir = str(work_dir / "exports")
+    config.dialux.result_cache_dir = str(work_dir / "cache")
+    
+    try:
+        queue = JobQueue()
+        try:
+            first_pdf, second_pdf = make_pdf(1), make_pdf(2)
+            first = queue.submit("fast", first_pdf, file_name="first.pdf")
+            second = queue.submit("fast", second_pdf, file_name="second.pdf")
+            duplicate = queue.submit("fast", second_pdf, file_name="second-again.pdf")
+            print(f"📥 Submitted {first.job_id[:8]} and {second.job_id[:8]}; duplicate got {duplicate.job_id[:8]}")
+            assert duplicate.job_id == second.job_id, "an identical queued upload should reuse its job"
+            
+            seen = wait(queue, first.job_id)
+            wait(queue, second.job_id)
+            first, second = queue.get(first.job_id), queue.get(second.job_id)
+            for job in (first, second):
+                print(f"✅ {job.file_name}: {job.status}, stage {job.stage}, "
+                      f"{job.finished_at - job.started_at:.2f}s in the worker")
+                assert job.status == COMPLETED, job.error
+                assert job.stage == "export" and job.progress == 1.0
+            assert seen == sorted(seen), "progress should never go backwards"
+            assert second.started_at >= first.finished_at - 0.05, "one fast worker should run jobs one at a time"
+            
+            result = queue.result(first.job_id)
+            print(f"📊 Result: project {result.report.project_name}, {result.report.total_rooms} rooms")
+            assert result.report is not None
+            assert not list(Path(config.web.job_uploads_dir).glob("*.pdf")), "finished uploads should be removed"
+            
+            # A finished document is analyzed again when resubmitted
+            again = queue.submit("fast", first_pdf, file_name="first.pdf")
+            assert again.job_id != first.job_id
+            wait(queue, again.job_id)
+            print(f"🔁 Resubmitted finished document as {again.job_id[:8]}: {queue.get(again.job_id).status}")
+        finally:
+            queue.shutdown()
+        
+        # Jobs of a server that stopped are failed on the next start
+        queue.store._execute("UPDATE jobs SET status = 'running', owner_pid = ? WHERE job_id = ?",
+                             (2 ** 22 + 1, first.job_id))
+        restarted = JobQueue()
+        print(f"🧹 After restart: {restarted.get(first.job_id).status} ({restarted.get(first.job_id).error})")
+        assert restarted.get(first.job_id).status == "failed"
+        restarted.shutdown()
+    finally:
+        (config.web.job_db_path, config.web.job_results_dir, config.web.job_uploads_dir,
+         config.web.job_concurrency, config.dialux_output_dir, config.dialux.result_cache_dir) = settings
+
+if __name__ == "__main__":
+    print("🧪 Job Queue Test")
+    print("=" * 30)
+
+    try:
+        test_job_queue()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
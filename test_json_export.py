@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test the streaming JSON encoder against asdict() followed by json.dumps
+"""
+import sys
+import json
+import tempfile
+from enum import Enum
+from pathlib import Path
+from datetime import datetime
+from dataclasses import asdict
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+def make_report():
+    import numpy as np
+    from analyzers.dialux_analyzer import DialuxAnalyzer, DialuxReport, DialuxReportType, DialuxRoom
+    from standards.standards_processor import ComplianceTable, StandardType, RoomType
+    
+    rooms = [
+        DialuxRoom("Office 1.01", 24.0, RoomType.OFFICE, illuminance_avg=520.0, uniformity=0.65, ugr=18.0),
+        DialuxRoom("Meeting", np.float64(30.5), RoomType.MEETING_ROOM, illuminance_avg=float('nan'),
+                   ugr=np.float32(17.5), power_density=np.int64(13)),
+        DialuxRoom("Corridor \"A\" – Nord", 12.0, RoomType.CORRIDOR, illuminance_avg=90.0, uniformity=0.35)
+    ]
+    analyzer = DialuxAnalyzer()
+    standards = [StandardType.EN_12464_1, StandardType.BREEAM]
+    checks = ComplianceTable()
+    compliance_by_standard = analyzer._check_compliance_all(rooms, standards, checks)
+    for index, room in enumerate(rooms):
+        room.compliance_results = checks.results(index, StandardType.EN_12464_1)
+    return DialuxReport(
+        "Fixture", DialuxReportType.LIGHTING_CALCULATION, len(rooms), np.float64(66.5), rooms=rooms,
+        overall_uniformity_avg=float('inf'), applicable_standards=standards,
+        best_matching_standard=StandardType.EN_12464_1, selected_standard=StandardType.EN_12464_1,
+        standards_compliance={room.name: 0.5 for room in rooms}, compliance_by_standard=compliance_by_standard,
+        standard_scores={"EN_12464_1": np.float64(0.75), "BREEAM": 0.5}, compliance_checks=checks,
+        processing_date=datetime(2024, 5, 1, 12, 30)
+    )
+
+def plain(value):
+    """asdict() output made JSON-ready: enums (also as keys) as values, numpy scalars as numbers"""
+    import numpy as np
+    
+    if isinstance(value, dict):
+        return {(key.value if isinstance(key, Enum) else key): plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [plain(item) for item in value]
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def canonical(text: str) -> str:
+    """Parsed JSON written back sorted, so NaN and Infinity compare equal"""
+    return json.dumps(json.loads(text), sort_keys=True)
+
+def test_json_export():
+    """Indented and compact output parse to the asdict-based document"""
+    from standards.standards_processor import StandardType, compliance_dict_factory
+    from utils.json_export import dumps_json, write_json
+    
+    report = make_report()
+    expected = json.dumps(plain(asdict(report, dict_factory=compliance_dict_factory)),
+                          indent=2, ensure_ascii=False)
+    for compact in (False, True):
+        text = dumps_json(report, compact=compact)
+        assert canonical(text) == canonical(expected), compact
+        assert ("\n" in text) != compact
+        print(f"✅ {'Compact' if compact else 'Indented'}: {len(text)} characters match asdict + json.dumps")
+        
+        path = Path(tempfile.mkdtemp(prefix="json-export-")) / "report.json"
+        write_json(report, path, compact=compact)
+        assert path.read_text(encoding='utf-8') == text
+    
+    # Enum keys are written as their value, also below the streamed depth of compact mode
+    nested = {'by_standard': {StandardType.BREEAM: {StandardType.EN_12464_1: [1, {StandardType.IES: 2}]}},
+              'flags': {True: None, 3: 1.5}}
+    expected = {'by_standard': {'BREEAM': {'EN_12464_1': [1, {'IES': 2}]}}, 'flags': {'true': None, '3': 1.5}}
+    for compact in (False, True):
+        assert json.loads(dumps_json(nested, compact=compact)) == expected
+        assert json.loads(dumps_json(nested, compact=compact)) == json.loads(json.dumps(plain(nested)))
+    print("🔑 Enum keys written as their values")
+
+if __name__ == "__main__":
+    print("🧪 Streaming JSON Export Test")
+    print("=" * 30)
+
+    try:
+        test_json_export()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test that Dialux tables are only extracted when the text has no rooms, and only from flagged pages
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+TEXT_ROOMS = [
+    "Project: Text Rooms\nRoom 1: Office\nArea: 24 m2\nAverage illuminance: 520 lx\nUGR: 18",
+    "Room 2: Corridor\nArea: 12 m2\nAverage illuminance: 140 lx"
+]
+TABLE_ONLY = [
+    "Project: Table Rooms\nLighting design summary\nCalculation performed with standard settings",
+    "Luminaire schedule\nManufacturer: Example Lighting",
+    "Results overview\nEm 512 lx, U0 0.67, UGR 18",
+    "Notes\nMaintenance factor 0.8"
+]
+
+def make_pdf(path: Path, pages):
+    import fitz
+    document = fitz.open()
+    for text in pages:
+        document.new_page().insert_text((50, 72), text, fontsize=10)
+    document.save(str(path))
+    document.close()
+
+def test_lazy_tables():
+    """Table extraction is skipped when text yields rooms and limited to pages with lighting values"""
+    from core.config import config
+    from analyzers.dialux_analyzer import DialuxAnalyzer
+    
+    work_dir = Path(tempfile.mkdtemp(prefix="lazy-tables-"))
+    text_pdf, table_pdf = work_dir / "text_rooms.pdf", work_dir / "table_rooms.pdf"
+    make_pdf(text_pdf, TEXT_ROOMS)
+    make_pdf(table_pdf, TABLE_ONLY)
+    
+    settings = (config.dialux.lazy_table_extraction, config.dialux.flag_table_pages)
+    try:
+        analyzer = DialuxAnalyzer()
+        calls = []
+        analyzer.table_extractor.extract_tables_from_pdf = lambda pdf_path, pages=None: calls.append(
+            (Path(pdf_path).name, pages)) or []
+        
+        def extract(pdf_path):
+            calls.clear()
+            stages = []
+            _, _, rooms, _ = analyzer._extract_report_rooms(pdf_path, stages.append)
+            return rooms, list(calls), stages
+        
+        config.dialux.lazy_table_extraction, config.dialux.flag_table_pages = True, True
+        rooms, table_calls, stages = extract(text_pdf)
+        assert rooms and table_calls == [] and "tables" not in stages
+        print(f"✅ {len(rooms)} rooms from text, no table extraction")
+        
+        rooms, table_calls, stages = extract(table_pdf)
+        assert table_calls == [("table_rooms.pdf", [3])] and "tables" in stages
+        print(f"📋 Text without rooms: tables extracted from pages {table_calls[0][1]}")
+        
+        # Without flagging every page is searched; without laziness tables are always extracted
+        config.dialux.flag_table_pages = False
+        assert extract(table_pdf)[1] == [("table_rooms.pdf", None)]
+        config.dialux.lazy_table_extraction = False
+        assert extract(text_pdf)[1] == [("text_rooms.pdf", None)]
+        
+        # Pages without lighting values are not flagged at all
+        config.dialux.lazy_table_extraction, config.dialux.flag_table_pages = True, True
+        text = "--- Page 1 ---\nCover\n--- Page 2 ---\nEm 300 lx\n--- Page 3 ---\nNotes"
+        assert analyzer._flag_room_table_pages(text) == [2]
+        assert analyzer._flag_room_table_pages("No page markers, 300 lx") is None
+        assert analyzer._extract_room_tables(table_pdf, "--- Page 1 ---\nCover") == []
+    finally:
+        config.dialux.lazy_table_extraction, config.dialux.flag_table_pages = settings
+
+if __name__ == "__main__":
+    print("🧪 Lazy Table Extraction Test")
+    print("=" * 30)
+
+    try:
+        test_lazy_tables()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
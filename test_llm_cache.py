@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test the LLM response cache: repeat extraction, offline mode, TTL and size eviction
+"""
+import sys
+import time
+import tempfile
+import threading
+from pathlib import Path
+from http.server import ThreadingHTTPServer
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from test_openai_chunked_extraction import StubChatHandler, StubState, PAGES
+
+def test_repeat_extraction():
+    """A second extraction of the same text is answered from the cache"""
+    from core.config import config
+    from extractors.llm_cache import LLMCacheMiss, get_response_cache
+    from extractors.openai_extractor import OpenAIIntelligentExtractor
+    
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubChatHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    settings = (config.llm.base_url, config.llm.chunk_chars, config.llm.response_cache_dir)
+    try:
+        config.llm.base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+        config.llm.chunk_chars = 1000
+        config.llm.response_cache_dir = tempfile.mkdtemp(prefix="llm-cache-")
+        
+        text = "\n\n".join(
+            f"--- Page {page} ---\n" + f"Office {(page + 1) // 2} illuminance values line\n" * 8
+            for page in range(1, PAGES + 1)
+        )
+        extractor = OpenAIIntelligentExtractor(api_key="test-key")
+        cache = get_response_cache()
+        assert cache.stats.hits == cache.stats.misses == 0, "a new cache directory should start a new cache"
+        
+        before = StubState.requests
+        start = time.time()
+        first = extractor._extract_with_openai(text)
+        cold = time.time() - start
+        requests = StubState.requests - before
+        
+        start = time.time()
+        second = extractor._extract_with_openai(text)
+        warm = time.time() - start
+        
+        print(f"✅ Cold run: {requests} requests in {cold:.2f}s; warm run: "
+              f"{StubState.requests - before - requests} requests in {warm:.3f}s")
+        print(f"📊 Cache stats: {cache.stats.to_dict()}")
+        assert StubState.requests - before == requests, "the warm run should not call the API"
+        assert [room.room_name for room in first['room_details']] == [room.room_name for room in second['room_details']]
+        assert cache.stats.hits == requests and cache.stats.misses == requests
+        assert abs(cache.stats.hit_rate - 0.5) < 1e-9
+        
+        # Offline mode serves the cached prompts and refuses new ones
+        cache.offline = True
+        try:
+            assert len(extractor._extract_with_openai(text)['room_details']) == len(first['room_details'])
+            try:
+                extractor._extract_with_openai(text.replace("Office", "Meeting room"))
+                raise AssertionError("offline extraction of an uncached text should fail")
+            except LLMCacheMiss as e:
+                print(f"✅ Offline miss: {e}")
+        finally:
+            cache.offline = False
+    finally:
+        server.shutdown()
+        config.llm.base_url, config.llm.chunk_chars, config.llm.response_cache_dir = settings
+
+def test_ttl_and_eviction():
+    """Expired entries are dropped and the least recently used ones evicted"""
+    from extractors.llm_cache import LLMResponseCache
+    
+    cache = LLMResponseCache(tempfile.mkdtemp(prefix="llm-cache-"), ttl_seconds=3600, max_bytes=2000)
+    keys = [cache.key("model", "1", [{"role": "user", "content": f"prompt {index}"}]) for index in range(7)]
+    for index, key in enumerate(keys):
+        if index == 4:
+            cache.get(keys[0])  # keep the first entry in use
+        cache.put(key, "x" * 300, "model", "1")
+        time.sleep(0.01)
+    
+    usage = cache.usage()
+    print(f"✅ {usage['entries']} of {len(keys)} entries kept in {usage['bytes']} bytes, "
+          f"{cache.stats.evictions} evicted")
+    assert usage['bytes'] <= cache.max_bytes
+    assert cache.get(keys[0]) is not None, "recently used entries should survive eviction"
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[-1]) is not None
+    
+    cache.ttl_seconds = 0
+    time.sleep(0.01)
+    assert cache.get(keys[-1]) is None
+    assert cache.stats.expired == 1
+    print("✅ Expired entry dropped")
+
+if __name__ == "__main__":
+    print("🧪 LLM Response Cache Test")
+    print("=" * 30)
+
+    try:
+        test_repeat_extraction()
+        test_ttl_and_eviction()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test the shared LLM client against a local mock chat-completions endpoint
+"""
+import sys
+import json
+import time
+import asyncio
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+RESPONSE_DELAY = 0.2
+
+class MockState:
+    """Requests seen by the mock endpoint"""
+    lock = threading.Lock()
+    requests = 0
+    rate_limited = 0
+    client_ports = set()
+    failures_left = {}  # prompt -> 429 responses still to send
+
+class MockChatHandler(BaseHTTPRequestHandler):
+    """Echoes the prompt back; answers 429 while a prompt has failures left"""
+    
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is visible
+    
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        prompt = body['messages'][-1]['content']
+        with MockState.lock:
+            MockState.requests += 1
+            MockState.client_ports.add(self.client_address[1])
+            rate_limited = MockState.failures_left.get(prompt, 0) > 0
+            if rate_limited:
+                MockState.failures_left[prompt] -= 1
+                MockState.rate_limited += 1
+        
+        if rate_limited:
+            payload = json.dumps({"error": {"message": "Rate limit reached", "type": "requests"}}).encode('utf-8')
+            self.send_response(429)
+            self.send_header('Retry-After', '0.05')
+        else:
+            time.sleep(RESPONSE_DELAY)
+            payload = json.dumps({
+                "id": "chatcmpl-mock",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body['model'],
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": f"echo: {prompt}"}}],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+            }).encode('utf-8')
+            self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def log_message(self, format, *args):
+        pass
+
+def messages(prompt: str):
+    return [{"role": "user", "content": prompt}]
+
+def test_llm_client():
+    """Test coalescing, retries, rate limiting and connection reuse"""
+    from core.config import config
+    from extractors.llm_client import get_llm_client
+    
+    MockState.requests = MockState.rate_limited = 0
+    MockState.client_ports = set()
+    MockState.failures_left = {}
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MockChatHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    settings = (config.llm.base_url, config.llm.model_requests_per_minute, config.llm.rate_limit_burst,
+                config.llm.backoff_base)
+    client = None
+    try:
+        config.llm.base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+        config.llm.model_requests_per_minute = {"slow-model": 600}
+        config.llm.rate_limit_burst = 1
+        config.llm.backoff_base = 0.05
+        
+        client = get_llm_client("test-key")
+        assert get_llm_client("test-key") is client, "the client should be shared"
+        
+        # Identical concurrent requests from several threads share one API call
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(client.complete("fast-model", messages("same"))))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        print(f"✅ 5 identical requests: {MockState.requests} API call, {client.stats.coalesced} coalesced")
+        assert results == ["echo: same"] * 5
+        assert MockState.requests == 1 and client.stats.coalesced == 4
+        
+        # 429 responses are retried after the server's Retry-After
+        MockState.failures_left["flaky"] = 2
+        assert client.complete("fast-model", messages("flaky")) == "echo: flaky"
+        print(f"✅ Rate limited twice, then answered after {client.stats.retries} retries")
+        assert client.stats.retries == 2 and client.stats.rate_limited == 2
+        
+        # 600 requests/minute with a burst of 1: one request every 0.1 s
+        async def burst():
+            return await asyncio.gather(*(client.complete_async("slow-model", messages(f"slow {index}"))
+                                          for index in range(6)))
+        start = time.time()
+        assert asyncio.run(burst()) == [f"echo: slow {index}" for index in range(6)]
+        elapsed = time.time() - start
+        print(f"✅ 6 requests at 10/s took {elapsed:.2f}s, {client.stats.throttle_seconds:.2f}s throttled")
+        assert elapsed >= 0.5
+        
+        # Callers on different event loops share the pool
+        requests_before = MockState.requests
+        for index in range(10):
+            asyncio.run(client.complete_async("fast-model", messages(f"loop {index}")))
+        print(f"✅ {MockState.requests - requests_before} sequential requests from separate loops, "
+              f"{len(MockState.client_ports)} connections opened in total")
+        assert len(MockState.client_ports) < MockState.requests
+        
+        print(f"📊 Client stats: {client.stats.to_dict()}")
+    finally:
+        if client is not None:
+            client.close()
+        server.shutdown()
+        (config.llm.base_url, config.llm.model_requests_per_minute, config.llm.rate_limit_burst,
+         config.llm.backoff_base) = settings
+
+if __name__ == "__main__":
+    print("🧪 Shared LLM Client Test")
+    print("=" * 30)
+
+    try:
+        test_llm_client()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test that one compliance pass over all standards matches checking each standard separately
+"""
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+def make_rooms():
+    from analyzers.dialux_analyzer import DialuxRoom
+    from standards.standards_processor import RoomType
+    
+    return [
+        DialuxRoom("Office 1.01", 24.0, RoomType.OFFICE, illuminance_avg=520, uniformity=0.65, ugr=18.0,
+                   power_density=9.5),
+        DialuxRoom("Office 1.02", 18.0, RoomType.OFFICE, illuminance_avg=420, uniformity=0.55, ugr=21.0),
+        DialuxRoom("Meeting", 30.0, RoomType.MEETING_ROOM, illuminance_avg=510, ugr=17.5, power_density=13.0),
+        DialuxRoom("Corridor", 12.0, RoomType.CORRIDOR, illuminance_avg=90, uniformity=0.35),
+        DialuxRoom("Workshop", 80.0, RoomType.INDUSTRIAL, illuminance_avg=310, ugr=26.0),
+        DialuxRoom("Storage", 10.0, RoomType.STORAGE)
+    ]
+
+def reference_compliance(analyzer, rooms, standard):
+    """The per-standard loop: every room checked against one standard at a time"""
+    results, rates = [], {}
+    for room in rooms:
+        room_compliance = analyzer.standards_processor.check_compliance(
+            analyzer._room_actual_values(room), room.room_type, standard)
+        results.append(room_compliance)
+        if room_compliance:
+            rates[room.name] = sum(1 for result in room_compliance if result.is_compliant) / len(room_compliance)
+        else:
+            rates[room.name] = 0.0
+    return results, rates
+
+def test_multi_standard_compliance():
+    """Rates and results per standard, and select_standard, match separate checks"""
+    from analyzers.dialux_analyzer import (DialuxAnalyzer, DialuxReport, DialuxReportType,
+                                           DialuxAnalysisResult)
+    from standards.standards_processor import ComplianceTable, StandardType
+    
+    analyzer = DialuxAnalyzer()
+    rooms = make_rooms()
+    applicable = analyzer._determine_applicable_standards(rooms)
+    standards = analyzer._standards_to_evaluate(applicable, [StandardType.CIE, StandardType.EN_12464_1])
+    print(f"📏 Evaluating {[standard.value for standard in standards]}")
+    assert standards[:len(applicable)] == applicable and standards.count(StandardType.EN_12464_1) == 1
+    
+    checks = ComplianceTable()
+    compliance_by_standard = analyzer._check_compliance_all(rooms, standards, checks)
+    for standard in standards:
+        results, rates = reference_compliance(analyzer, rooms, standard)
+        assert compliance_by_standard[standard.value] == rates, standard
+        for room_index in range(len(rooms)):
+            assert checks.results(room_index, standard) == results[room_index], (standard, room_index)
+    checked = sum(len(checks.results(i, s)) for i in range(len(rooms)) for s in standards)
+    print(f"✅ {checked} results in one pass match the per-standard checks")
+    assert checked > 0
+    
+    # Switching the displayed standard gives what analyzing for that standard alone would
+    scores = analyzer._score_standards(rooms, standards, checks)
+    best = analyzer._select_best_standard(applicable, scores)
+    report = DialuxReport("Fixture", DialuxReportType.LIGHTING_CALCULATION, len(rooms),
+                          sum(room.area for room in rooms), rooms=rooms, applicable_standards=applicable,
+                          best_matching_standard=best, compliance_by_standard=compliance_by_standard,
+                          standard_scores=scores, compliance_checks=checks)
+    analyzer._apply_standard(report, best)
+    result = DialuxAnalysisResult(report, analyzer._generate_compliance_summary(report), [], [], {})
+    
+    for standard in standards + [StandardType.ISO_8995]:
+        switched = analyzer.select_standard(result, standard.value)
+        
+        expected_rooms = make_rooms()
+        expected_results, expected_rates = reference_compliance(analyzer, expected_rooms, standard)
+        for room, room_results in zip(expected_rooms, expected_results):
+            room.compliance_results = room_results
+        expected = DialuxReport("Fixture", DialuxReportType.LIGHTING_CALCULATION, len(expected_rooms),
+                                0.0, rooms=expected_rooms, standards_compliance=expected_rates)
+        expected.overall_compliance_rate = (sum(expected_rates.values()) / len(expected_rates)
+                                            if expected_rates else 0.0)
+        
+        assert switched.report.selected_standard == standard
+        assert switched.report.standards_compliance == expected_rates
+        assert abs(switched.report.overall_compliance_rate - expected.overall_compliance_rate) < 1e-9
+        assert switched.compliance_summary == analyzer._generate_compliance_summary(expected)
+        assert switched.critical_issues == analyzer._identify_critical_issues(expected)
+        print(f"🔀 {standard.value}: {switched.report.overall_compliance_rate:.0%} compliance, "
+              f"score {switched.report.standard_scores[standard.value]:.2f}")
+
+if __name__ == "__main__":
+    print("🧪 Multi-Standard Compliance Test")
+    print("=" * 30)
+
+    try:
+        test_multi_standard_compliance()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
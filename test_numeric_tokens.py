@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test the numeric token pass of the focused extractor against the pattern lists it replaced
+"""
+import re
+import sys
+import random
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+# Patterns _extract_with_regex ran one by one before the token pass
+AREA_PATTERNS = [
+    r'area[:\s]*(\d+(?:\.\d+)?)\s*m[²2]',
+    r'(\d+(?:\.\d+)?)\s*m[²2]',
+    r'(\d+(?:\.\d+)?)\s*sqm',
+    r'(\d+(?:\.\d+)?)\s*square\s*meters?',
+    r'room[:\s]*(\d+(?:\.\d+)?)\s*m[²2]',
+    r'(\d+(?:\.\d+)?)\s*m\^2',
+    r'(\d+(?:\.\d+)?)\s*m\s*[²2]',
+    r'(\d+(?:\.\d+)?)\s*m2',
+    r'(\d+(?:\.\d+)?)\s*m\s*2',
+    r'(\d+(?:\.\d+)?)\s*sq\.?\s*m',
+    r'(\d+(?:\.\d+)?)\s*square\s*m',
+    r'(\d+(?:\.\d+)?)\s*m\s*square',
+    r'(\d+(?:\.\d+)?)\s*m[²2]\s*[^\d]',
+    r'(\d+(?:\.\d+)?)\s*m[²2]\s*$',
+    r'(\d+\.\d+)\s*m[²2]',
+    r'(\d+\.\d+)\s*sqm',
+    r'(\d{2,}(?:\.\d+)?)\s*m[²2]',
+    r'(\d{2,}(?:\.\d+)?)\s*sqm',
+    r'(\d{2,}(?:\.\d+)?)\s+(?=\d)',
+    r'(\d+(?:\.\d+)?)\s+(?=lux|lx)',
+    r'(\d+(?:\.\d+)?)\s+(?=uniformity|uniform)'
+]
+ILLUMINANCE_PATTERNS = [
+    r'illuminance[:\s]*(\d+(?:\.\d+)?)\s*lux',
+    r'(\d+(?:\.\d+)?)\s*lux',
+    r'lighting[:\s]*(\d+(?:\.\d+)?)\s*lux',
+    r'(\d+(?:\.\d+)?)\s*lx'
+]
+UNIFORMITY_PATTERNS = [
+    r'uniformity[:\s]*(\d+(?:\.\d+)?)',
+    r'u[:\s]*(\d+(?:\.\d+)?)',
+    r'uniform[:\s]*(\d+(?:\.\d+)?)'
+]
+UGR_PATTERNS = [
+    r'ugr[:\s]*(\d+(?:\.\d+)?)',
+    r'glare[:\s]*(\d+(?:\.\d+)?)'
+]
+
+def reference_values(text: str, patterns, low: float, high: float):
+    """
+    Values the old pattern list found, each number once and in document order
+    
+    Unlabelled patterns only match a number from its first digit, and never the
+    2 of a squared-metre unit; the old scans read both as numbers of their own.
+    """
+    values = {}
+    for pattern in patterns:
+        if pattern.startswith('('):
+            pattern = r'(?<![\d.^m])(?<!m )' + pattern
+        for match in re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE):
+            value = float(match.group(1))
+            if low <= value <= high:
+                values[match.start(1)] = value
+    return [values[start] for start in sorted(values)]
+
+LINE_FORMATS = [
+    lambda rng: f"Area: {rng.uniform(5, 400):.1f} m²",
+    lambda rng: (f"Room {rng.randint(1, 30)}: {rng.uniform(5, 400):.2f} "
+                 f"{rng.choice(['m2', 'm^2', 'sqm', 'm 2', 'sq. m'])}"),
+    lambda rng: f"Illuminance: {rng.randint(50, 1500)} {rng.choice(['lux', 'lx', 'Lux', 'LX'])}",
+    lambda rng: f"Lighting {rng.randint(50, 1500)}lux",
+    lambda rng: f"Uniformity: {rng.uniform(0.2, 0.95):.2f}",
+    lambda rng: f"{rng.uniform(0.2, 0.95):.2f} uniformity",
+    lambda rng: f"UGR: {rng.randint(10, 30)}",
+    lambda rng: f"Glare {rng.uniform(10, 30):.1f}",
+    lambda rng: (f"{rng.uniform(5, 400):.1f} {rng.randint(50, 1500)} {rng.uniform(0.2, 0.95):.2f} "
+                 f"{rng.randint(10, 30)}"),
+    lambda rng: f"{rng.randint(10, 400)} {rng.randint(50, 1500)} lux",
+    lambda rng: f"Maintenance factor {rng.uniform(0.5, 0.9):.2f}, height {rng.uniform(2, 4):.1f}",
+]
+
+def make_text(rng: random.Random) -> str:
+    return "\n".join(rng.choice(LINE_FORMATS)(rng) for _ in range(rng.randint(1, 12)))
+
+def test_numeric_tokens():
+    """Area, illuminance, uniformity and UGR values match the old pattern lists"""
+    from extractors.numeric_tokens import tokenize_numbers
+    from extractors.focused_extractor import FocusedExtractor
+    
+    extractor = FocusedExtractor.__new__(FocusedExtractor)
+    rng = random.Random(7)
+    texts = [make_text(rng) for _ in range(2000)]
+    for text in texts:
+        areas = reference_values(text, AREA_PATTERNS, 0.01, 1000000)
+        illuminance = reference_values(text, ILLUMINANCE_PATTERNS, 1, 10000)
+        uniformity = reference_values(text, UNIFORMITY_PATTERNS, 0.01, 1.0)
+        ugr = reference_values(text, UGR_PATTERNS, 1, 50)
+        
+        rooms = extractor._extract_with_regex(text)['rooms']
+        if areas:
+            assert [room['area'] for room in rooms] == sorted(set(areas), reverse=True)[:10], text
+        elif illuminance:
+            assert [room['illuminance_avg'] for room in rooms] == illuminance[:10], text
+        else:
+            continue
+        for key, values in (('illuminance_avg', illuminance), ('uniformity', uniformity), ('ugr', ugr)):
+            expected = [values[i] if i < len(values) else None for i in range(len(rooms))]
+            assert [room[key] for room in rooms] == expected, (key, text)
+    print(f"✅ {len(texts)} texts match the old area, illuminance, uniformity and UGR patterns")
+    
+    tokens = tokenize_numbers("Area: 24.5 m² at 500 lux, U0 0.65")
+    assert [(token.value, token.unit) for token in tokens] == [(24.5, 'm2'), (500.0, 'lux'), (0.0, ''), (0.65, '')]
+
+if __name__ == "__main__":
+    print("🧪 Numeric Token Test")
+    print("=" * 30)
+
+    try:
+        test_numeric_tokens()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test chunked OpenAI extraction against a local stub chat-completions server
+"""
+import re
+import sys
+import json
+import time
+import tempfile
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+PAGES = 12
+RESPONSE_DELAY = 0.2
+
+class StubState:
+    """Requests seen by the stub server"""
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    requests = 0
+    models = set()
+
+class StubChatHandler(BaseHTTPRequestHandler):
+    """Answers /v1/chat/completions with one room per page of the chunk"""
+    
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        with StubState.lock:
+            StubState.in_flight += 1
+            StubState.requests += 1
+            StubState.max_in_flight = max(StubState.max_in_flight, StubState.in_flight)
+            StubState.models.add(body['model'])
+        
+        time.sleep(RESPONSE_DELAY)
+        prompt = body['messages'][-1]['content']
+        pages = [int(number) for number in re.findall(r'^--- Page (\d+) ---$', prompt, re.MULTILINE)]
+        
+        # Every room spans two pages, so rooms repeat across chunk boundaries;
+        # the first page of a room has no UGR, the second one has
+        content = {
+            "project_metadata": {"project_name": "Stub Project" if 1 in pages else None,
+                                 "project_location": "Cairo" if PAGES in pages else None},
+            "company_info": {"luminaire_manufacturer": "Stub Lighting"},
+            "luminaire_details": [{"luminaire_model": "SL-100", "luminaire_type": "Panel",
+                                   "power_consumption": 36}],
+            "room_details": [
+                {"room_name": f"Office {(page + 1) // 2}", "room_type": "office",
+                 "area": 20.0 + (page + 1) // 2, "illuminance_avg": 500,
+                 "ugr": 18.5 if page % 2 == 0 else None}
+                for page in pages
+            ],
+            "confidence": 0.9
+        }
+        
+        payload = json.dumps({
+            "id": f"chatcmpl-{StubState.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body['model'],
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": "```json\n" + json.dumps(content) + "\n```"}}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        }).encode('utf-8')
+        
+        with StubState.lock:
+            StubState.in_flight -= 1
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def log_message(self, format, *args):
+        pass
+
+def test_chunked_extraction():
+    """Test chunking, the concurrency limit and merging of chunk results"""
+    from core.config import config
+    from extractors.openai_extractor import OpenAIIntelligentExtractor, chunk_pages
+    
+    StubState.in_flight = StubState.max_in_flight = StubState.requests = 0
+    StubState.models = set()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubChatHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    settings = (config.llm.base_url, config.llm.chunk_chars, config.llm.max_concurrency,
+                config.llm.response_cache_dir)
+    try:
+        config.llm.base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+        config.llm.chunk_chars = 1000
+        config.llm.max_concurrency = 2
+        config.llm.response_cache_dir = tempfile.mkdtemp(prefix="llm-cache-")
+        
+        text = "\n\n".join(
+            f"--- Page {page} ---\n" + f"Office {(page + 1) // 2} illuminance values line\n" * 8
+            for page in range(1, PAGES + 1)
+        )
+        chunks = chunk_pages(text, config.llm.chunk_chars)
+        print(f"📄 {PAGES} pages in {len(chunks)} chunks of at most {config.llm.chunk_chars} characters")
+        assert len(chunks) > config.llm.max_concurrency
+        assert all(len(chunk) <= config.llm.chunk_chars for chunk in chunks)
+        assert "".join(chunks) == text
+        assert all(chunk.startswith("--- Page") for chunk in chunks)
+        
+        extractor = OpenAIIntelligentExtractor(api_key="test-key")
+        start = time.time()
+        result = extractor._extract_with_openai(text)
+        elapsed = time.time() - start
+        
+        print(f"✅ {StubState.requests} requests in {elapsed:.2f}s, at most {StubState.max_in_flight} in flight")
+        assert StubState.requests == len(chunks)
+        assert StubState.max_in_flight == config.llm.max_concurrency
+        assert StubState.models == {config.llm.extraction_model}
+        
+        rooms = result['room_details']
+        print(f"🏠 {len(rooms)} rooms: {', '.join(room.room_name for room in rooms)}")
+        assert [room.room_name for room in rooms] == [f"Office {index}" for index in range(1, PAGES // 2 + 1)]
+        assert all(room.ugr == 18.5 for room in rooms), "values from both pages of a room should be merged"
+        assert len(result['luminaire_details']) == 1
+        assert result['project_metadata'].project_name == "Stub Project"
+        assert result['project_metadata'].project_location == "Cairo"
+        assert result['company_info'].luminaire_manufacturer == "Stub Lighting"
+        assert abs(result['confidence'] - 0.9) < 1e-9
+    finally:
+        server.shutdown()
+        (config.llm.base_url, config.llm.chunk_chars, config.llm.max_concurrency,
+         config.llm.response_cache_dir) = settings
+
+if __name__ == "__main__":
+    print("🧪 Chunked OpenAI Extraction Test")
+    print("=" * 35)
+
+    try:
+        test_chunked_extraction()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test page relevance ranking on a synthetic Dialux report whose room summaries come last
+"""
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+ROOMS = [f"Office {index}" for index in range(1, 9)]
+
+def build_report() -> str:
+    """Cover, contents and description pages first, then luminaires and room summaries"""
+    pages = [
+        "Project: Riverside Campus\nCustomer: Nile Holdings Ltd\nDesigner: Short Circuit Company\n"
+        "Date: 12.03.2024\n",
+        "Contents\n" + "".join(f"{index} Chapter {index} ........ {index + 2}\n" for index in range(1, 40)),
+    ]
+    description = ("The building is a four storey office block with a central atrium. The design follows "
+                   "the client brief and the general conditions agreed with the contractor. ") * 20
+    pages.extend(description for _ in range(8))
+    pages.append("Luminaire list\nManufacturer: Philips\nLuminaire: CoreLine Panel RC132V\n"
+                 "Luminous flux: 3400 lm\nPower: 28 W\nLuminous efficacy: 121 lm/W\n")
+    for index in range(0, len(ROOMS), 2):
+        pages.append("".join(
+            f"{name}\nArea: {20 + position * 3.5} m²\nAverage illuminance: {480 + position * 10} lux\n"
+            f"Uniformity U0: 0.6{position}\nUGR: 19\nWorkplane height 0.80 m\n\n"
+            for position, name in enumerate(ROOMS[index:index + 2], start=index)
+        ))
+    return "\n".join(f"--- Page {number} ---\n{page}" for number, page in enumerate(pages, start=1))
+
+def test_page_relevance():
+    """Test that room and company prompts get the pages that carry their data"""
+    from extractors.page_relevance import (ROOM_PROFILE, COMPANY_PROFILE, estimate_tokens,
+                                           score_pages, select_relevant_pages)
+    
+    text = build_report()
+    budget = 1500
+    print(f"📄 {len(score_pages(text, ROOM_PROFILE))} pages, {estimate_tokens(text)} estimated tokens")
+    
+    # Previous behavior: the first characters of the report
+    leading = text[:budget * 4]
+    selected = select_relevant_pages(text, ROOM_PROFILE, budget)
+    leading_rooms = sum(1 for name in ROOMS if name in leading)
+    selected_rooms = sum(1 for name in ROOMS if name in selected)
+    print(f"🏠 Leading {budget} tokens: {leading_rooms}/{len(ROOMS)} rooms")
+    print(f"🏠 Ranked pages: {selected_rooms}/{len(ROOMS)} rooms in {estimate_tokens(selected)} tokens")
+    assert estimate_tokens(selected) <= budget
+    assert selected_rooms == len(ROOMS)
+    assert "Riverside Campus" in selected, "the cover page should be kept for project metadata"
+    assert "CoreLine Panel" in selected, "the luminaire list should be kept"
+    assert "Chapter 12" not in selected and "central atrium" not in selected
+    
+    companies = select_relevant_pages(text, COMPANY_PROFILE, 100)
+    print(f"🏢 Company prompt: {estimate_tokens(companies)} tokens, starts with "
+          f"{companies.splitlines()[0]!r}")
+    assert estimate_tokens(companies) <= 100
+    assert "Nile Holdings Ltd" in companies
+    
+    # Short reports are sent whole
+    assert select_relevant_pages(text, ROOM_PROFILE, estimate_tokens(text)) == text
+
+if __name__ == "__main__":
+    print("🧪 Page Relevance Test")
+    print("=" * 30)
+
+    try:
+        test_page_relevance()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test the single-scan room parameter extraction against the per-parameter regexes it replaced
+"""
+import re
+import sys
+import random
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+# Patterns _extract_parameters_from_text ran one by one before the tokenized scan
+SECTION_PATTERNS = {
+    'illuminance_avg': [
+        r'(?:average|avg|mean|e\s*avg|em)[:\s]*(\d+(?:\.\d+)?)\s*(?:lux|lx)',
+        r'(\d+(?:\.\d+)?)\s*(?:lux|lx)\s*(?:average|avg|mean)',
+        r'illuminance[:\s]*(\d+(?:\.\d+)?)\s*(?:lux|lx)',
+        r'e[:\s]*(\d+(?:\.\d+)?)\s*(?:lux|lx)',
+        r'(\d+(?:\.\d+)?)\s*(?:lux|lx)(?:\s*\(avg\))?'
+    ],
+    'illuminance_min': [
+        r'(?:minimum|min|e\s*min)[:\s]*(\d+(?:\.\d+)?)\s*(?:lux|lx)',
+        r'(\d+(?:\.\d+)?)\s*(?:lux|lx)\s*(?:minimum|min)',
+        r'(\d+(?:\.\d+)?)\s*(?:lux|lx)\s*\(min\)'
+    ],
+    'illuminance_max': [
+        r'(?:maximum|max|e\s*max)[:\s]*(\d+(?:\.\d+)?)\s*(?:lux|lx)',
+        r'(\d+(?:\.\d+)?)\s*(?:lux|lx)\s*(?:maximum|max)',
+        r'(\d+(?:\.\d+)?)\s*(?:lux|lx)\s*\(max\)'
+    ],
+    'uniformity': [
+        r'(?:uniformity|uniform|u0)[:\s]*(\d+(?:\.\d+)?)',
+        r'(\d+(?:\.\d+)?)\s*(?:uniformity|uniform)',
+        r'(\d+(?:\.\d+)?)\s*\(uniformity\)',
+        r'u0[:\s]*(\d+(?:\.\d+)?)'
+    ],
+    'ugr': [
+        r'ugr[:\s]*(\d+(?:\.\d+)?)',
+        r'unified glare rating[:\s]*(\d+(?:\.\d+)?)',
+        r'glare[:\s]*(\d+(?:\.\d+)?)',
+        r'(\d+(?:\.\d+)?)\s*(?:ugr|glare)'
+    ],
+    'power_density': [
+        r'(\d+(?:\.\d+)?)\s*(?:w/m²|watt/m²|w/m2)',
+        r'power density[:\s]*(\d+(?:\.\d+)?)',
+        r'lighting power density[:\s]*(\d+(?:\.\d+)?)',
+        r'(\d+(?:\.\d+)?)\s*(?:w/m²|w/m2)'
+    ],
+    'color_temperature': [
+        r'(\d+(?:\.\d+)?)\s*(?:k|kelvin)',
+        r'color temperature[:\s]*(\d+(?:\.\d+)?)',
+        r'correlated color temperature[:\s]*(\d+(?:\.\d+)?)',
+        r'(\d+(?:\.\d+)?)\s*k'
+    ],
+    'cri': [
+        r'cri[:\s]*(\d+(?:\.\d+)?)',
+        r'color rendering index[:\s]*(\d+(?:\.\d+)?)',
+        r'ra[:\s]*(\d+(?:\.\d+)?)',
+        r'(\d+(?:\.\d+)?)\s*(?:cri|ra)'
+    ],
+    'luminous_efficacy': [
+        r'(\d+(?:\.\d+)?)\s*(?:lm/w|lumen/watt)',
+        r'luminous efficacy[:\s]*(\d+(?:\.\d+)?)',
+        r'efficacy[:\s]*(\d+(?:\.\d+)?)',
+        r'(\d+(?:\.\d+)?)\s*(?:lm/w)'
+    ],
+    'area': [
+        r'(\d+(?:\.\d+)?)\s*(?:m²|m2|square meter)',
+        r'area[:\s]*(\d+(?:\.\d+)?)',
+        r'surface[:\s]*(\d+(?:\.\d+)?)',
+        r'(\d+(?:\.\d+)?)\s*(?:m²|m2)'
+    ],
+    'mounting_height': [
+        r'(\d+(?:\.\d+)?)\s*(?:m|meter)',
+        r'height[:\s]*(\d+(?:\.\d+)?)',
+        r'mounting[:\s]*(\d+(?:\.\d+)?)',
+        r'(\d+(?:\.\d+)?)\s*m'
+    ]
+}
+
+def reference_parameters(text: str):
+    """
+    First match of the first matching pattern per parameter, as the old loop intended
+    
+    Patterns get the word boundaries the tokenizer applies, so a unit or label is
+    never read from inside another word (e.g. "m" from "m²", "e" from "illuminance").
+    """
+    parameters = {}
+    for parameter, patterns in SECTION_PATTERNS.items():
+        for pattern in patterns:
+            bounded = (r'\b' if pattern[0].isalpha() or pattern.startswith('(?:') else '') + pattern + r'(?![\w²/])'
+            match = re.search(bounded, text, re.IGNORECASE)
+            if match:
+                parameters[parameter] = float(match.group(1))
+                break
+    return parameters
+
+SECTION_FORMATS = [
+    lambda rng: (f"Area: {rng.uniform(5, 200):.1f} m²\nAverage illuminance: {rng.randint(100, 1000)} lux\n"
+                 f"E min: {rng.randint(50, 500)} lx\nE max: {rng.randint(600, 1500)} lx\n"
+                 f"Uniformity U0: {rng.uniform(0.3, 0.9):.2f}\nUGR: {rng.randint(13, 28)}\n"
+                 f"Power density: {rng.uniform(2, 15):.1f} W/m²\n"
+                 f"Color temperature: {rng.choice([3000, 4000])} K, CRI: {rng.choice([80, 90])}\n"
+                 f"Luminous efficacy: {rng.randint(80, 160)} lm/W, mounting height 2.8 m\n"),
+    lambda rng: (f"Em: {rng.randint(100, 1000)} lx\nEmin {rng.randint(50, 500)} lx\n"
+                 f"Emax {rng.randint(600, 1500)} lx\nU0 {rng.uniform(0.3, 0.9):.2f}\nUGR {rng.randint(13, 28)}\n"
+                 f"{rng.uniform(2, 15):.1f} W/m2\n{rng.uniform(5, 200):.1f} m2\nRa {rng.choice([80, 90])}\n"),
+    lambda rng: (f"Surface: {rng.uniform(5, 200):.1f}\nIlluminance {rng.randint(100, 1000)} lux\n"
+                 f"{rng.randint(50, 500)} lux (min)\n{rng.randint(600, 1500)} lux max\n"
+                 f"{rng.uniform(0.3, 0.9):.2f} uniformity\nGlare: {rng.randint(13, 28)}\n"
+                 f"{rng.randint(3000, 5000)} K\nHeight: {rng.uniform(2, 4):.1f}\n"),
+]
+
+def test_parameter_scan():
+    """The tokenized scan gives the values of the per-parameter regexes"""
+    from analyzers.dialux_analyzer import DialuxAnalyzer
+    
+    analyzer = DialuxAnalyzer()
+    rng = random.Random(3)
+    sections = [rng.choice(SECTION_FORMATS)(rng) for _ in range(300)]
+    for section in sections:
+        assert analyzer._extract_parameters_from_text(section) == reference_parameters(section), section
+    print(f"✅ {len(sections)} room sections match the per-parameter regexes")
+
+def test_token_boundaries():
+    """Units and labels are not read from inside other words"""
+    from analyzers.dialux_analyzer import DialuxAnalyzer
+    
+    analyzer = DialuxAnalyzer()
+    parameters = analyzer._extract_parameters_from_text("Area: 24.5 m²\nMaintained illuminance: 520 lux\nExtra 12")
+    print(f"🔤 {parameters}")
+    assert parameters['area'] == 24.5 and 'mounting_height' not in parameters
+    assert parameters['illuminance_avg'] == 520.0 and 'cri' not in parameters
+
+if __name__ == "__main__":
+    print("🧪 Room Parameter Scan Test")
+    print("=" * 30)
+
+    try:
+        test_parameter_scan()
+        test_token_boundaries()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Test that the shared pattern registry gives the same matches as the inline patterns it replaced
+"""
+import re
+import sys
+import random
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+# Room patterns DialuxAnalyzer searched per call before the registry
+DIALUX_ROOM_PATTERNS = {
+    'office': [r'office', r'workplace', r'work\s+place', r'desk', r'workstation'],
+    'meeting_room': [r'meeting', r'conference', r'boardroom', r'seminar'],
+    'corridor': [r'corridor', r'passage', r'circulation', r'hallway', r'aisle'],
+    'storage': [r'storage', r'warehouse', r'archive', r'stock', r'depot'],
+    'industrial': [r'industrial', r'factory', r'manufacturing', r'production', r'workshop'],
+    'retail': [r'retail', r'shop', r'store', r'commercial', r'showroom'],
+    'educational': [r'classroom', r'school', r'education', r'teaching', r'lecture'],
+    'healthcare': [r'hospital', r'medical', r'healthcare', r'clinic', r'treatment'],
+    'residential': [r'residential', r'home', r'apartment', r'dwelling', r'living'],
+    'outdoor': [r'outdoor', r'exterior', r'external', r'street', r'parking']
+}
+
+# Requirement patterns StandardsProcessor passed to re.finditer before the registry
+STANDARDS_PARAM_PATTERNS = {
+    'illuminance': [r'(\d+(?:\.\d+)?)\s*(?:lux|lx)', r'illuminance[:\s]*(\d+(?:\.\d+)?)',
+                    r'lighting level[:\s]*(\d+(?:\.\d+)?)',
+                    r'(\d+(?:\.\d+)?)\s*(?:lux|lx)\s*(?:minimum|min|maximum|max|average|avg)'],
+    'uniformity': [r'uniformity[:\s]*(\d+(?:\.\d+)?)', r'u0[:\s]*(\d+(?:\.\d+)?)',
+                   r'(\d+(?:\.\d+)?)\s*(?:uniformity|uniform)'],
+    'ugr': [r'ugr[:\s]*(\d+(?:\.\d+)?)', r'unified glare rating[:\s]*(\d+(?:\.\d+)?)',
+            r'glare[:\s]*(\d+(?:\.\d+)?)'],
+    'power_density': [r'(\d+(?:\.\d+)?)\s*(?:w/m²|watt/m²|w/m2)', r'power density[:\s]*(\d+(?:\.\d+)?)',
+                      r'lighting power density[:\s]*(\d+(?:\.\d+)?)'],
+    'color_temperature': [r'(\d+(?:\.\d+)?)\s*(?:k|kelvin)', r'color temperature[:\s]*(\d+(?:\.\d+)?)',
+                          r'correlated color temperature[:\s]*(\d+(?:\.\d+)?)'],
+    'cri': [r'cri[:\s]*(\d+(?:\.\d+)?)', r'color rendering index[:\s]*(\d+(?:\.\d+)?)',
+            r'ra[:\s]*(\d+(?:\.\d+)?)']
+}
+
+# Room patterns StandardsProcessor searched around each requirement
+STANDARDS_ROOM_PATTERNS = {
+    'office': [r'office', r'workplace', r'work\s+place', r'desk'],
+    'meeting_room': [r'meeting', r'conference', r'boardroom'],
+    'corridor': [r'corridor', r'passage', r'circulation', r'hallway'],
+    'storage': [r'storage', r'warehouse', r'archive'],
+    'industrial': [r'industrial', r'factory', r'manufacturing', r'production'],
+    'retail': [r'retail', r'shop', r'store', r'commercial'],
+    'educational': [r'classroom', r'school', r'education', r'teaching'],
+    'healthcare': [r'hospital', r'medical', r'healthcare', r'clinic'],
+    'residential': [r'residential', r'home', r'apartment', r'dwelling'],
+    'outdoor': [r'outdoor', r'exterior', r'external', r'street']
+}
+
+# Project name patterns DialuxAnalyzer searched per call before the registry
+PROJECT_PATTERNS = [r'project[:\s]+([^\n\r]+)', r'building[:\s]+([^\n\r]+)',
+                    r'facility[:\s]+([^\n\r]+)', r'title[:\s]+([^\n\r]+)']
+
+ROOM_NAMES = ["Office", "Open Work Place", "Seminar", "Aisle", "Stock Room", "Workshop", "Showroom",
+              "Lecture Hall", "Treatment", "Living", "Parking", "Lobby", "WORKSTATION", "Depot"]
+
+def generate_sections(count: int = 300, seed: int = 7):
+    rng = random.Random(seed)
+    return [
+        f"Room {i + 1}: {rng.choice(ROOM_NAMES)}\n"
+        f"Average illuminance: {rng.randint(100, 1000)} lux minimum\n"
+        f"Uniformity U0: {rng.uniform(0.3, 0.9):.2f}, UGR {rng.randint(13, 28)}\n"
+        f"Power density: {rng.uniform(2, 15):.1f} W/m², {rng.choice([3000, 4000])} K, Ra {rng.choice([80, 90])}\n"
+        for i in range(count)
+    ]
+
+def context_room_type(text: str, start: int, end: int):
+    """Room type from the 200 characters around a requirement, as StandardsProcessor searched it"""
+    from standards.standards_processor import RoomType
+    
+    context = text[max(0, start - 200):end + 200].lower()
+    return next((RoomType(room_type) for room_type, patterns in STANDARDS_ROOM_PATTERNS.items()
+                 if any(re.search(pattern, context) for pattern in patterns)), RoomType.OFFICE)
+
+def test_room_patterns():
+    """Room-type detection through the registry matches the per-call regex searches"""
+    from core.patterns import registry
+    from analyzers.dialux_analyzer import DialuxAnalyzer
+    from standards.standards_processor import RoomType
+    
+    families = registry.group('dialux.room')
+    assert {name: family.sources for name, family in families.items()} == DIALUX_ROOM_PATTERNS
+    
+    analyzer = DialuxAnalyzer()
+    sections = generate_sections()
+    for section in sections:
+        name, body = section.split("\n", 1)
+        text = f"{name} {body}".lower()
+        expected = next((RoomType(room_type) for room_type, patterns in DIALUX_ROOM_PATTERNS.items()
+                         if any(re.search(pattern, text) for pattern in patterns)), RoomType.OFFICE)
+        assert analyzer._determine_room_type(name, body) == expected, name
+        for family in families.values():
+            assert family.contains(text) == any(re.search(source, text) for source in family.sources)
+    print(f"✅ Room types of {len(sections)} sections match the inline patterns")
+
+def test_standards_patterns():
+    """Requirements found through the registry match re.finditer over the inline patterns"""
+    from core.patterns import registry
+    from standards.standards_processor import StandardsProcessor
+    
+    families = registry.group('standards.param')
+    assert {name: family.sources for name, family in families.items()} == STANDARDS_PARAM_PATTERNS
+    rooms = registry.group('standards.room')
+    assert {name: family.sources for name, family in rooms.items()} == STANDARDS_ROOM_PATTERNS
+    
+    processor = StandardsProcessor()
+    text = "\n".join(generate_sections(60))
+    for parameter, patterns in STANDARDS_PARAM_PATTERNS.items():
+        expected = [(float(match.group(1)), context_room_type(text, match.start(), match.end()))
+                    for pattern in patterns for match in re.finditer(pattern, text, re.IGNORECASE)]
+        actual = [(req.value, req.room_type)
+                  for req in processor._extract_parameter_requirements(text, parameter, '')]
+        assert actual == expected, parameter
+        print(f"📏 {parameter}: {len(actual)} requirements")
+
+def test_project_patterns():
+    """Project names found through the registry match the inline patterns"""
+    from core.patterns import registry
+    from analyzers.dialux_analyzer import DialuxAnalyzer
+    
+    assert registry.family('dialux.project').sources == PROJECT_PATTERNS
+    analyzer = DialuxAnalyzer()
+    texts = ["Project: Tower A\nBuilding: North", "TITLE: Lighting study\nFacility: Depot 4",
+             "Building: West wing", "No header here"] + [section for section in generate_sections(20)]
+    for text in texts:
+        match = next((m for m in (re.search(p, text, re.IGNORECASE) for p in PROJECT_PATTERNS) if m), None)
+        expected = match.group(1).strip() if match else "report"
+        assert analyzer._extract_project_name(text, "report.pdf") == expected, text
+    print(f"✅ Project names of {len(texts)} texts match the inline patterns")
+
+if __name__ == "__main__":
+    print("🧪 Pattern Registry Test")
+    print("=" * 30)
+
+    try:
+        test_room_patterns()
+        test_standards_patterns()
+        test_project_patterns()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test the columnar portfolio store against a pandas group-by over the same rooms
+"""
+import sys
+import random
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+ROOM_TYPES = ["office", "meeting_room", "corridor", "storage"]
+MANUFACTURERS = ["Philips", "Zumtobel", None]
+STANDARDS = ["EN_12464_1", "BREEAM"]
+PARAMETERS = ["illuminance", "uniformity", "ugr"]
+
+def make_reports(count: int, seed: int = 5):
+    """Reports in the dictionary form of batch result files"""
+    rng = random.Random(seed)
+    reports = []
+    for number in range(count):
+        rooms = []
+        for index in range(rng.randint(0, 6)):
+            results = [{
+                'parameter': parameter, 'standard': rng.choice(STANDARDS),
+                'required_value': 500.0, 'actual_value': rng.uniform(200, 800),
+                'compliance_percentage': rng.uniform(40, 160), 'is_compliant': rng.random() < 0.6
+            } for parameter in rng.sample(PARAMETERS, rng.randint(0, 3))]
+            rooms.append({
+                'name': f"Room {index}", 'room_type': rng.choice(ROOM_TYPES), 'area': rng.uniform(5, 80),
+                'illuminance_avg': rng.choice([None, rng.uniform(100, 900)]),
+                'ugr': rng.choice([None, rng.uniform(14, 28)]), 'compliance_results': results
+            })
+        reports.append({
+            'project_name': f"Project {number % 7}", 'luminaire_manufacturer': rng.choice(MANUFACTURERS),
+            'selected_standard': rng.choice(STANDARDS), 'rooms': rooms
+        })
+    return reports
+
+def label(value):
+    return value if value else "unknown"
+
+def reference_frames(reports):
+    """Row-oriented rooms and compliance checks as plain DataFrames"""
+    import numpy as np
+    import pandas as pd
+    
+    rooms, checks = [], []
+    for number, report in enumerate(reports):
+        context = {'project': report['project_name'], 'report': f"report-{number}",
+                   'manufacturer': label(report['luminaire_manufacturer'])}
+        for room in report['rooms']:
+            results = room['compliance_results']
+            rooms.append({**context, 'room_type': room['room_type'], 'standard': report['selected_standard'],
+                          'area': room['area'], 'ugr': room['ugr'] if room['ugr'] is not None else np.nan,
+                          'illuminance_avg': (room['illuminance_avg'] if room['illuminance_avg'] is not None
+                                              else np.nan),
+                          'compliance_rate': (sum(r['is_compliant'] for r in results) / len(results)
+                                              if results else np.nan)})
+            for result in results:
+                checks.append({**context, 'room_type': room['room_type'], 'standard': result['standard'],
+                               'parameter': result['parameter'], 'is_compliant': float(result['is_compliant']),
+                               'compliance_percentage': result['compliance_percentage']})
+    return pd.DataFrame(rooms), pd.DataFrame(checks)
+
+def assert_frames_match(actual, expected, by):
+    import numpy as np
+    
+    actual = actual.sort_values(by).reset_index(drop=True)
+    expected = expected.sort_values(by).reset_index(drop=True)
+    assert list(actual[by].itertuples(index=False)) == list(expected[by].itertuples(index=False))
+    for column in expected.columns.drop(by):
+        assert np.allclose(actual[column].astype(float), expected[column].astype(float), equal_nan=True), column
+
+def test_portfolio_store():
+    """Grouped statistics match pandas, also after reopening a store written in several parts"""
+    import pandas as pd
+    from analyzers.portfolio_store import PortfolioStore
+    
+    reports = make_reports(400)
+    store_dir = Path(tempfile.mkdtemp(prefix="portfolio-"))
+    store = PortfolioStore(store_dir)
+    for number, report in enumerate(reports):
+        assert store.add_report(report, report_id=f"report-{number}")
+        if number % 150 == 149:
+            store.flush()
+    store.flush()
+    assert not store.add_report(reports[0], report_id="report-0")
+    
+    rooms, checks = reference_frames(reports)
+    reopened = PortfolioStore(store_dir)
+    assert len(reopened.table('rooms')['area']) == len(rooms)
+    
+    for by in (['room_type'], ['project', 'manufacturer'], ['standard', 'room_type', 'report']):
+        for value in ('illuminance_avg', 'ugr', 'compliance_rate'):
+            grouped = rooms.groupby(by)[value]
+            expected = pd.DataFrame({
+                'count': grouped.count(), 'mean': grouped.mean(), 'std': grouped.std(ddof=0),
+                'median': grouped.median(), 'min': grouped.min(), 'max': grouped.max(),
+                'p90': grouped.quantile(0.9)
+            }).reset_index()
+            actual = reopened.room_statistics(value, by, ('count', 'mean', 'std', 'median', 'min', 'max', 'p90'))
+            assert_frames_match(actual, expected, by)
+        
+        by = [column for column in by if column != 'report'] + ['parameter']
+        grouped = checks.groupby(by)
+        expected = pd.DataFrame({
+            'checks': grouped['is_compliant'].count(), 'compliance_rate': grouped['is_compliant'].mean(),
+            'compliance_percentage_mean': grouped['compliance_percentage'].mean()
+        }).reset_index()
+        assert_frames_match(reopened.compliance_statistics(by), expected, by)
+        print(f"✅ Statistics by {', '.join(by)} match pandas")
+    
+    office = rooms[rooms['room_type'] == 'office'].groupby('project')['area'].sum()
+    actual = reopened.room_statistics('area', 'project', ('sum',), where={'room_type': 'office'})
+    actual = dict(zip(actual['project'], actual['sum']))
+    assert set(actual) == set(office.index)
+    assert all(abs(actual[project] - area) < 1e-6 for project, area in office.items())
+    print(f"📊 {len(rooms)} rooms and {len(checks)} checks in {len(reports)} reports")
+
+if __name__ == "__main__":
+    print("🧪 Portfolio Store Test")
+    print("=" * 30)
+
+    try:
+        test_portfolio_store()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
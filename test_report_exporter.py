@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test that the report exporter writes every format and only rewrites changed reports
+"""
+import sys
+import time
+import tempfile
+from pathlib import Path
+from datetime import datetime
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+FORMATS = ['json', 'csv', 'xlsx', 'pdf']
+
+def make_report():
+    from analyzers.dialux_analyzer import DialuxAnalyzer, DialuxReport, DialuxReportType, DialuxRoom
+    from standards.standards_processor import ComplianceTable, StandardType, RoomType
+    
+    rooms = [
+        DialuxRoom("Office 1.01", 24.0, RoomType.OFFICE, illuminance_avg=520.0, uniformity=0.65, ugr=18.0),
+        DialuxRoom("Corridor", 12.0, RoomType.CORRIDOR, illuminance_avg=90.0, uniformity=0.35)
+    ]
+    standards = [StandardType.EN_12464_1]
+    checks = ComplianceTable()
+    compliance_by_standard = DialuxAnalyzer()._check_compliance_all(rooms, standards, checks)
+    for index, room in enumerate(rooms):
+        room.compliance_results = checks.results(index, StandardType.EN_12464_1)
+    return DialuxReport(
+        "Exported Offices", DialuxReportType.LIGHTING_CALCULATION, len(rooms), 36.0, rooms=rooms,
+        applicable_standards=standards, selected_standard=StandardType.EN_12464_1,
+        compliance_by_standard=compliance_by_standard, compliance_checks=checks,
+        processing_date=datetime.now()
+    )
+
+def modification_times(paths):
+    return {export_format: Path(path).stat().st_mtime_ns for export_format, path in paths.items()}
+
+def test_report_exporter():
+    """All formats are written, unchanged reports are skipped and a changed room rewrites everything"""
+    from analyzers.report_exporter import ReportExporter, report_digest
+    
+    output_dir = Path(tempfile.mkdtemp(prefix="report-exporter-"))
+    exporter = ReportExporter(output_dir, workers=2)
+    report = make_report()
+    
+    paths = exporter.export(report, "offices", FORMATS)
+    exporter.wait()
+    assert sorted(paths) == sorted(FORMATS)
+    assert all(Path(path).exists() and Path(path).stat().st_size > 0 for path in paths.values())
+    written = modification_times(paths)
+    print(f"✅ {len(paths)} formats written to {output_dir}")
+    
+    # Re-analysis only changes the processing date, which is not part of the digest
+    time.sleep(0.05)
+    digest = report_digest(report)
+    report.processing_date = datetime(2030, 1, 1)
+    assert report_digest(report) == digest
+    assert exporter.export(report, "offices", FORMATS) == paths
+    exporter.wait()
+    assert modification_times(paths) == written
+    print("⏭️ Unchanged report left every export untouched")
+    
+    time.sleep(0.05)
+    report.rooms[1].illuminance_avg = 110.0
+    assert report_digest(report) != digest
+    exporter.export(report, "offices", FORMATS)
+    exporter.wait()
+    rewritten = modification_times(paths)
+    assert all(rewritten[export_format] > written[export_format] for export_format in FORMATS)
+    assert "110.0" in Path(paths['json']).read_text(encoding='utf-8')
+    print("🔁 Changed room value rewrote every format")
+    
+    # Exporters size their own pools
+    assert ReportExporter(output_dir, workers=1)._pool()._max_workers == 1
+    assert exporter._pool()._max_workers == 2
+
+if __name__ == "__main__":
+    print("🧪 Report Exporter Test")
+    print("=" * 30)
+
+    try:
+        test_report_exporter()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test the Dialux analysis result cache against uncached analysis and its key settings
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+REPORT = """Project: Cached Offices
+Room 1: Office
+Area: 24 m2
+Average illuminance: 520 lx
+Uniformity: 0.62
+UGR: 18.5
+Room 2: Corridor
+Area: 12 m2
+Average illuminance: 140 lx
+"""
+
+def make_pdf(path: Path):
+    import fitz
+    document = fitz.open()
+    document.new_page().insert_text((50, 72), REPORT, fontsize=10)
+    document.save(str(path))
+    document.close()
+
+def summary(result):
+    report = result.report
+    return (report.project_name, [(room.name, room.area, room.illuminance_avg, room.ugr) for room in report.rooms],
+            report.overall_compliance_rate, result.recommendations, result.critical_issues)
+
+def test_result_cache():
+    """Cached results match uncached analysis, and extraction settings are part of the key"""
+    from core.config import config
+    from analyzers.dialux_analyzer import DialuxAnalyzer
+    
+    work_dir = Path(tempfile.mkdtemp(prefix="result-cache-"))
+    pdf_path = work_dir / "offices.pdf"
+    make_pdf(pdf_path)
+    
+    settings = (config.dialux.dialux_output_dir, config.dialux.result_cache_dir,
+                config.dialux.result_cache_enabled, config.dialux.flag_table_pages, config.extraction.min_rows)
+    try:
+        config.dialux.dialux_output_dir = str(work_dir / "exports")
+        config.dialux.result_cache_dir = str(work_dir / "cache")
+        
+        config.dialux.result_cache_enabled = False
+        expected = summary(DialuxAnalyzer().analyze_dialux_report(pdf_path))
+        
+        config.dialux.result_cache_enabled = True
+        analyzer = DialuxAnalyzer()
+        extractions = []
+        extract = analyzer._extract_report_rooms
+        analyzer._extract_report_rooms = lambda *args: extractions.append(args) or extract(*args)
+        
+        assert summary(analyzer.analyze_dialux_report(pdf_path)) == expected
+        assert summary(analyzer.analyze_dialux_report(pdf_path)) == expected
+        assert len(extractions) == 1
+        print("✅ Cached result matches uncached analysis")
+        
+        # Settings that change room extraction start a new extraction
+        for name, change in (("flag_table_pages", lambda: setattr(config.dialux, 'flag_table_pages', False)),
+                             ("min_rows", lambda: setattr(config.extraction, 'min_rows', 3))):
+            key = analyzer._document_key(pdf_path)
+            change()
+            assert analyzer._document_key(pdf_path) != key, name
+            assert summary(analyzer.analyze_dialux_report(pdf_path)) == expected
+            print(f"🔑 {name} changes the document key")
+        assert len(extractions) == 3
+    finally:
+        (config.dialux.dialux_output_dir, config.dialux.result_cache_dir, config.dialux.result_cache_enabled,
+         config.dialux.flag_table_pages, config.extraction.min_rows) = settings
+
+if __name__ == "__main__":
+    print("🧪 Analysis Result Cache Test")
+    print("=" * 30)
+
+    try:
+        test_result_cache()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test the single-pass room sectioning against the per-line header scan it replaced
+"""
+import re
+import sys
+import random
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+# Header patterns the previous sectioner tried on every line, in order
+LEGACY_HEADER_PATTERNS = [
+    r'(?:room|space|area|zone)[:\s]+([^\n\r]+)',
+    r'([^\n\r]+)\s*\([^)]*room[^)]*\)',
+    r'([^\n\r]+)\s*\([^)]*space[^)]*\)',
+    r'building[:\s]+([^\n\r]+)',
+    r'floor[:\s]+([^\n\r]+)'
+]
+
+def legacy_sections(text: str):
+    """Sections as (name, stripped non-empty lines) from the per-line scan"""
+    sections = []
+    current_room = None
+    current_text = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        for pattern in LEGACY_HEADER_PATTERNS:
+            match = re.search(pattern, line, re.IGNORECASE)
+            if match:
+                if current_room:
+                    sections.append((current_room, '\n'.join(current_text)))
+                current_room = match.group(1).strip()
+                current_text = [line]
+                break
+        else:
+            if current_room:
+                current_text.append(line)
+    if current_room:
+        sections.append((current_room, '\n'.join(current_text)))
+    return sections
+
+def normalized_sections(text: str, sections):
+    return [(section.name, '\n'.join(line.strip() for line in text[section.start:section.end].split('\n')
+                                     if line.strip()))
+            for section in sections]
+
+HEADER_LINES = [
+    "Room 1.01: Office", "ROOM: Meeting", "Space 4", "Zone A - Lobby", "Area 12 Storage",
+    "Ground floor office (room 3)", "Open plan (space B) (Room 7)", "Kitchen (shared space)",
+    "Building: Tower North", "Floor: 2", "Level 2 (floor plan)", "Lab (room) area: 40 m2",
+    "Storage (rooms 1-3) space: left", "Corridor (", "Hall (x (room)", "  Room   :  Reception  ",
+    "Luminaire (manufacturer)", "Building floor: 3", "area:", "Room"
+]
+BODY_LINES = [
+    "Average illuminance: 520 lux", "Uniformity U0: 0.62", "UGR: 18", "Power density: 8.5 W/m²",
+    "", "   ", "Luminaire: Philips CoreLine", "Maintenance factor 0.8"
+]
+
+def fuzz_report(rng: random.Random, lines: int) -> str:
+    return "\n".join(rng.choice(HEADER_LINES) if rng.random() < 0.3 else rng.choice(BODY_LINES)
+                     for _ in range(lines))
+
+def test_room_sections():
+    """Names and contents of the sections match the per-line scan"""
+    from analyzers.dialux_analyzer import DialuxAnalyzer
+    
+    analyzer = DialuxAnalyzer()
+    rng = random.Random(11)
+    reports = [fuzz_report(rng, rng.randint(5, 80)) for _ in range(300)]
+    reports.append("\n".join(f"Room {i}: Office\nAverage illuminance: {400 + i} lux\n" for i in range(200)))
+    
+    compared = 0
+    for text in reports:
+        assert normalized_sections(text, analyzer._find_room_sections(text)) == legacy_sections(text), text
+        compared += len(legacy_sections(text))
+    print(f"✅ {compared} sections in {len(reports)} reports match the per-line scan")
+    assert compared > 0
+
+def test_long_lines():
+    """Long lines of parentheses without a closing bracket are sectioned in linear time"""
+    import time
+    from analyzers.dialux_analyzer import DialuxAnalyzer
+    
+    analyzer = DialuxAnalyzer()
+    text = "Room 1: Office\n" + "(" * 20000 + " room\n" + "x " * 20000 + "(space"
+    started = time.perf_counter()
+    sections = analyzer._find_room_sections(text)
+    elapsed = time.perf_counter() - started
+    print(f"⏱️ {len(text)} characters sectioned in {elapsed * 1000:.1f} ms")
+    assert elapsed < 1.0
+    
+    # No line after the first is a header, as the per-line scan finds on a shorter copy
+    assert [section.name for section in sections] == ["1: Office"] and sections[0].end == len(text)
+    short = text.replace("(" * 20000, "(" * 200).replace("x " * 20000, "x " * 200)
+    assert normalized_sections(short, analyzer._find_room_sections(short)) == legacy_sections(short)
+
+if __name__ == "__main__":
+    print("🧪 Room Sectioning Test")
+    print("=" * 30)
+
+    try:
+        test_room_sections()
+        test_long_lines()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
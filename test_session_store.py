@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test the bounded per-session upload and result store of the web front ends
+"""
+import gc
+import os
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+def test_session_store():
+    """Uploads and results stay within their budgets and the session directory is removed"""
+    import pandas as pd
+    from web.session_store import SessionStore
+    
+    root = Path(tempfile.mkdtemp(prefix="sessions-"))
+    store = SessionStore(root, max_upload_bytes=250_000, max_result_bytes=400_000)
+    
+    # Same content under two names is stored once
+    first = store.add_upload("a.pdf", b"a" * 100_000)
+    assert store.add_upload("copy-of-a.pdf", b"a" * 100_000) == first
+    assert store.upload_bytes == 100_000 and len(list(store.directory.iterdir())) == 1
+    assert store.result_key("dialux", "a.pdf") == store.result_key("dialux", "copy-of-a.pdf")
+    
+    frame = pd.DataFrame({"room": [f"Room {i}" for i in range(2000)], "lux": range(2000)})
+    store.put_result(store.result_key("tables", "a.pdf"), [frame], "tables · a.pdf", "a.pdf")
+    print(f"📦 Table result measured at {store.result_bytes:,} bytes")
+    assert store.result_bytes > 0
+    
+    # Uploads beyond the budget evict the least recently used one with its results
+    store.add_upload("b.pdf", b"b" * 100_000)
+    store.upload_path("a.pdf")
+    store.add_upload("c.pdf", b"c" * 100_000)
+    print(f"🧹 Uploads after eviction: {store.upload_names()}")
+    assert store.upload_names() == ["a.pdf", "copy-of-a.pdf", "c.pdf"]
+    assert store.upload_path("b.pdf") is None
+    assert store.upload_bytes == 200_000 and len(list(store.directory.iterdir())) == 2
+    
+    # Evicting an upload drops its results
+    store.put_result(store.result_key("pdf_extraction", "c.pdf"), "text", name="c.pdf")
+    store.add_upload("d.pdf", b"d" * 100_000)
+    store.add_upload("e.pdf", b"e" * 100_000)
+    assert store.upload_path("a.pdf") is None
+    assert not store.has_result(store.result_key("tables", "a.pdf"))
+    
+    # Results beyond the budget evict the least recently used ones
+    keys = [store.result_key("comparison", None, number) for number in range(6)]
+    for key in keys:
+        store.put_result(key, b"x" * 100_000)
+        store.get_result(keys[0])
+    print(f"📊 Footprint: {store.footprint()}")
+    assert store.result_bytes <= 400_000
+    assert store.has_result(keys[0]) and store.has_result(keys[-1]) and not store.has_result(keys[1])
+    assert store.footprint()["evicted_uploads"] == 3
+    
+    # New content under an existing name replaces the old file
+    store.add_upload("e.pdf", b"E" * 50_000)
+    assert len(list(store.directory.iterdir())) == 2
+    
+    # Stale directories of ended sessions are removed, live ones kept
+    stale = root / "stale-session"
+    stale.mkdir()
+    (stale / "old.pdf").write_bytes(b"old")
+    os.utime(stale, (time.time() - 7200, time.time() - 7200))
+    os.utime(store.directory, (time.time() - 7200, time.time() - 7200))
+    assert SessionStore.remove_stale(root, 3600) == 1
+    assert not stale.exists() and store.directory.exists()
+    
+    # The session directory goes away with the store
+    directory = store.directory
+    del store
+    gc.collect()
+    print(f"🗑️ Session directory removed: {not directory.exists()}")
+    assert not directory.exists()
+
+if __name__ == "__main__":
+    print("🧪 Session Store Test")
+    print("=" * 30)
+
+    try:
+        test_session_store()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
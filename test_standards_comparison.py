@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test that the cached all-pairs comparison matrix matches the pairwise comparison it replaced
+"""
+import sys
+import copy
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+FIXTURE_DATABASE = {
+    "EN_12464_1": {"requirements": {
+        "office": {"illuminance_minimum": 500, "uniformity_minimum": 0.6, "ugr_maximum": 19,
+                   "illuminance_min": 500, "ugr_max": 19, "illuminance_unit": "lux", "cri": 80},
+        "corridor": {"illuminance_minimum": 100, "uniformity_minimum": 0.4, "ugr_maximum": 28}
+    }},
+    "BREEAM": {"requirements": {
+        "office": {"illuminance_minimum": 500, "uniformity_minimum": 0.7, "ugr_maximum": 16,
+                   "illuminance_min": 400, "ugr_max": 22, "illuminance_unit": "lux", "cri": 90},
+        "corridor": {"illuminance_minimum": 150, "ugr_maximum": 25}
+    }},
+    "IES": {"requirements": {
+        "office": {"illuminance_minimum": 300, "uniformity_minimum": 0.0, "ugr_maximum": 22, "cri": 80},
+        "warehouse": {"illuminance_minimum": 200}
+    }}
+}
+
+def reference_comparisons(database, standard_a, standard_b, room_type):
+    """
+    The pairwise loop compare_standards used before the matrix
+    
+    Two documented changes are applied: non-numeric entries such as
+    *_unit are skipped instead of raising, and *_min/*_max keys count as
+    minimum/maximum requirements. The recommendation quotes the value of
+    the stricter standard.
+    """
+    from standards.standards_processor import StandardType, requirement_condition
+    
+    reqs_a = database[standard_a.value].get("requirements", {}).get(room_type.value, {})
+    reqs_b = database[standard_b.value].get("requirements", {}).get(room_type.value, {})
+    comparisons = {}
+    for param in set(reqs_a) & set(reqs_b):
+        value_a, value_b = reqs_a[param], reqs_b[param]
+        if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in (value_a, value_b)):
+            continue
+        difference = value_a - value_b
+        difference_percentage = (difference / value_b) * 100 if value_b != 0 else 0
+        condition = requirement_condition(param)
+        if condition == 'minimum':
+            more_strict = standard_a if value_a > value_b else standard_b
+        elif condition == 'maximum':
+            more_strict = standard_a if value_a < value_b else standard_b
+        else:
+            more_strict = standard_a
+        
+        strict_value = value_a if more_strict == standard_a else value_b
+        name = "EN 12464-1" if more_strict == StandardType.EN_12464_1 else more_strict.value
+        if abs(value_a - value_b) < 0.01:
+            recommendation = "Values are harmonized"
+        elif condition == 'minimum':
+            recommendation = f"Consider adopting {name} value ({float(strict_value)}) for better lighting quality"
+        elif condition == 'maximum':
+            recommendation = f"Consider adopting {name} value ({float(strict_value)}) for better energy efficiency"
+        else:
+            recommendation = "Consider harmonizing values for consistency"
+        comparisons[param] = (value_a, value_b, difference, difference_percentage, more_strict, recommendation)
+    return comparisons
+
+def test_comparison_matrix_matches_pairwise():
+    """Every pair of standards and room type gives the same comparisons as the pairwise loop"""
+    from standards.standards_processor import StandardsProcessor, StandardType, RoomType
+    
+    processor = StandardsProcessor()
+    processor.standards_database = copy.deepcopy(FIXTURE_DATABASE)
+    processor._mark_database_changed()
+    
+    standards = [StandardType(key) for key in FIXTURE_DATABASE]
+    compared = 0
+    for standard_a in standards:
+        for standard_b in standards:
+            for room_type in RoomType:
+                expected = reference_comparisons(FIXTURE_DATABASE, standard_a, standard_b, room_type)
+                actual = {c.parameter: c for c in processor.compare_standards(standard_a, standard_b, room_type)}
+                assert set(actual) == set(expected), (standard_a, standard_b, room_type)
+                for param, (value_a, value_b, difference, percentage, more_strict, recommendation) in expected.items():
+                    comparison = actual[param]
+                    assert (comparison.value_a, comparison.value_b) == (value_a, value_b)
+                    assert abs(comparison.difference - difference) < 1e-9
+                    assert abs(comparison.difference_percentage - percentage) < 1e-9
+                    assert comparison.more_strict == more_strict, (param, standard_a, standard_b)
+                    assert comparison.harmonization_recommendation == recommendation
+                    compared += 1
+    print(f"✅ {compared} comparisons match the pairwise loop")
+    assert compared > 0
+    
+    assert processor.compare_standards(StandardType.EN_12464_1, StandardType.CUSTOM, RoomType.OFFICE) == []
+
+def test_comparison_matrix_rebuilt_on_change():
+    """The matrix is reused until the database changes"""
+    from standards.standards_processor import StandardsProcessor, StandardType, RoomType
+    
+    processor = StandardsProcessor()
+    processor.standards_database = copy.deepcopy(FIXTURE_DATABASE)
+    processor._mark_database_changed()
+    
+    matrix = processor.get_comparison_matrix()
+    assert processor.get_comparison_matrix() is matrix
+    
+    processor.standards_database["BREEAM"]["requirements"]["office"]["illuminance_minimum"] = 750
+    processor._mark_database_changed()
+    assert processor.get_comparison_matrix() is not matrix
+    
+    comparisons = processor.compare_standards(StandardType.EN_12464_1, StandardType.BREEAM, RoomType.OFFICE)
+    illuminance = next(c for c in comparisons if c.parameter == "illuminance_minimum")
+    print(f"🔄 Rebuilt matrix: {illuminance.value_a} vs {illuminance.value_b}, stricter {illuminance.more_strict.value}")
+    assert illuminance.value_b == 750 and illuminance.more_strict == StandardType.BREEAM
+
+if __name__ == "__main__":
+    print("🧪 Standards Comparison Matrix Test")
+    print("=" * 30)
+
+    try:
+        test_comparison_matrix_matches_pairwise()
+        test_comparison_matrix_rebuilt_on_change()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
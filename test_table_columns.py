@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test that Dialux room tables are read per row from header-mapped columns
+"""
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+HEADERS = ["Room", "Em [lx]", "Emin [lx]", "Emax [lx]", "U0", "UGR"]
+ROWS = [
+    ["Office 1.01", "512", "341", "689", "0.67", "18.2"],
+    ["Meeting Room", "498,5", "310", "602", "0.62", "< 19"],
+    ["Corridor", "152", "71", "240", "0.47", "-"],
+    ["Storage", "", "", "", "", ""]
+]
+EXPECTED = {
+    "Office 1.01": dict(illuminance_avg=512, illuminance_min=341, illuminance_max=689, uniformity=0.67, ugr=18.2),
+    "Meeting Room": dict(illuminance_avg=498.5, illuminance_min=310, illuminance_max=602, uniformity=0.62, ugr=19),
+    "Corridor": dict(illuminance_avg=152, illuminance_min=71, illuminance_max=240, uniformity=0.47, ugr=None)
+}
+
+def room_values(room):
+    return dict(illuminance_avg=room.illuminance_avg, illuminance_min=room.illuminance_min,
+                illuminance_max=room.illuminance_max, uniformity=room.uniformity, ugr=room.ugr)
+
+def test_header_parameters():
+    """Minimum and maximum headers are not taken for the average illuminance"""
+    from analyzers.dialux_analyzer import DialuxAnalyzer
+    
+    analyzer = DialuxAnalyzer()
+    headers = {
+        "Em [lx]": "illuminance_avg", "E min [lx]": "illuminance_min", "E max [lx]": "illuminance_max",
+        "Min. illuminance (lx)": "illuminance_min", "Max. illuminance (lx)": "illuminance_max",
+        "Illuminance [lx]": "illuminance_avg", "E [lx]": "illuminance_avg", "Emin": "illuminance_min",
+        "Emax": "illuminance_max", "U0": "uniformity", "UGR": "ugr", "Area [m²]": "area", "Room": None
+    }
+    for header, parameter in headers.items():
+        assert analyzer._header_parameter(header) == parameter, header
+    print(f"✅ {len(headers)} headers mapped")
+
+def test_table_rooms():
+    """Every room row gets its own values, with the header as columns or as first row"""
+    import pandas as pd
+    from analyzers.dialux_analyzer import DialuxAnalyzer
+    
+    analyzer = DialuxAnalyzer()
+    tables = {
+        "header columns": pd.DataFrame(ROWS, columns=HEADERS),
+        "header row": pd.DataFrame([HEADERS] + ROWS),
+        "unitless header": pd.DataFrame(ROWS, columns=[header.split(" [")[0] for header in HEADERS])
+    }
+    for layout, df in tables.items():
+        rooms = analyzer._extract_room_data_from_table(df)
+        assert {room.name: room_values(room) for room in rooms} == EXPECTED, layout
+        print(f"📋 {layout}: {len(rooms)} rooms")
+    
+    # Without parameter headers the table text is scanned as before, once for all rooms
+    df = pd.DataFrame([["Office A", "Em 500 lux"], ["Office B", "Em 300 lux"]], columns=["Name", "Values"])
+    rooms = analyzer._extract_room_data_from_table(df)
+    assert [room.name for room in rooms] == ["Office A", "Office B"]
+    assert all(room.illuminance_avg == 500 for room in rooms)
+
+if __name__ == "__main__":
+    print("🧪 Dialux Table Columns Test")
+    print("=" * 30)
+
+    try:
+        test_header_parameters()
+        test_table_rooms()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
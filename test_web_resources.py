@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test that the web front ends share components across reruns and reuse results by upload hash
+"""
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+def make_pdf(path: Path, text: str):
+    import fitz
+    document = fitz.open()
+    document.new_page().insert_text((50, 72), text, fontsize=10)
+    document.save(str(path))
+    document.close()
+
+def test_web_resources():
+    """Components and results are reused until the upload content or a setting changes"""
+    from core.config import config
+    from extractors.pdf_extractor import PDFExtractor
+    from web.resources import clear_caches, config_fingerprint, get_component, run_cached
+    
+    work_dir = Path(tempfile.mkdtemp(prefix="web-resources-"))
+    upload = work_dir / "upload.pdf"
+    make_pdf(upload, "Project: Cached Upload\nRoom 1: Office\nArea: 24 m2\nAverage illuminance: 520 lx")
+    rerun_upload = work_dir / "rerun-copy.pdf"
+    shutil.copy(upload, rerun_upload)
+    other_upload = work_dir / "other.pdf"
+    make_pdf(other_upload, "Project: Other Upload\nRoom 1: Corridor\nArea: 12 m2")
+    
+    extractions = []
+    extract = PDFExtractor.extract_from_pdf
+    
+    def counting_extract(self, pdf_path):
+        extractions.append(Path(pdf_path).name)
+        return extract(self, pdf_path)
+    
+    dpi = config.extraction.ocr_dpi
+    clear_caches()
+    try:
+        PDFExtractor.extract_from_pdf = counting_extract
+        
+        # Reruns of the page get the same analyzer and extractor instances
+        fingerprint = config_fingerprint()
+        analyzer = get_component("standard")
+        extractor = get_component("pdf")
+        assert get_component("standard") is analyzer and get_component("pdf") is extractor
+        assert config_fingerprint() == fingerprint
+        print("✅ Components reused across reruns")
+        
+        # Results are keyed by content, so the same upload under another temp path is not extracted again
+        first = run_cached("pdf", upload)
+        assert run_cached("pdf", rerun_upload).text == first.text
+        assert extractions == ["upload.pdf"]
+        assert "Other Upload" in run_cached("pdf", other_upload).text
+        assert extractions == ["upload.pdf", "other.pdf"]
+        print(f"✅ {len(extractions)} extractions for 3 runs of 2 uploads")
+        
+        # A changed setting gives a new fingerprint, new components and new results
+        config.extraction.ocr_dpi = dpi + 100
+        assert config_fingerprint() != fingerprint
+        assert get_component("standard") is not analyzer and get_component("pdf") is not extractor
+        assert run_cached("pdf", upload).text == first.text
+        assert extractions == ["upload.pdf", "other.pdf", "upload.pdf"]
+        
+        config.extraction.ocr_dpi = dpi
+        assert config_fingerprint() == fingerprint and get_component("pdf") is extractor
+        print("🔑 Changed setting built new components and repeated the extraction")
+    finally:
+        PDFExtractor.extract_from_pdf = extract
+        config.extraction.ocr_dpi = dpi
+        clear_caches()
+
+if __name__ == "__main__":
+    print("🧪 Web Resources Test")
+    print("=" * 30)
+
+    try:
+        test_web_resources()
+        print("\n🎉 Test completed successfully!")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        print("\n❌ Test failed!")
+        sys.exit(1)
@@ -18,18 +18,14 @@ if __name__ == "__main__":
     import plotly.graph_objects as go
     from plotly.subplots import make_subplots
     import json
-    import tempfile
-    import shutil
     from typing import Dict, List, Any, Optional
     import logging
 
     # Import our modules with absolute imports
     from core.config import config
-    from extractors.pdf_extractor import PDFExtractor
-    from extractors.table_extractor import AdvancedTableExtractor
-    from standards.standards_processor import StandardsProcessor, StandardType, RoomType
-    from analyzers.dialux_analyzer import DialuxAnalyzer
-    from analyzers.fast_dialux_analyzer import FastDialuxAnalyzer
+    from standards.standards_processor import StandardType, RoomType
+    from web.resources import (get_component, run_cached, submit_upload, wait_for_job,
+                               get_session_store, show_session_footprint)
 
     logger = logging.getLogger(__name__)
 
@@ -173,15 +169,11 @@ if __name__ == "__main__":
         )
         
         if uploaded_file is not None:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                shutil.copyfileobj(uploaded_file, tmp_file)
-                tmp_path = tmp_file.name
-            
             try:
+                # Stored once per content in the session store, removed with the session
+                pdf_path = get_session_store().add_upload(uploaded_file.name, uploaded_file.getvalue())
                 with st.spinner("Extracting text and data from PDF..."):
-                    extractor = PDFExtractor()
-                    result = extractor.extract_from_pdf(tmp_path)
+                    result = run_cached("pdf", pdf_path)
                 
                 st.success("✅ PDF extraction completed!")
                 
@@ -215,9 +207,6 @@ if __name__ == "__main__":
                 
             except Exception as e:
                 st.error(f"❌ Extraction failed: {str(e)}")
-            finally:
-                # Clean up temp file
-                Path(tmp_path).unlink(missing_ok=True)
 
     def show_table_analysis_page():
         """Table analysis page"""
@@ -230,18 +219,15 @@ if __name__ == "__main__":
         )
         
         if uploaded_file is not None:
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                shutil.copyfileobj(uploaded_file, tmp_file)
-                tmp_path = tmp_file.name
-            
             try:
+                pdf_path = get_session_store().add_upload(uploaded_file.name, uploaded_file.getvalue())
                 with st.spinner("Analyzing tables in PDF..."):
-                    extractor = AdvancedTableExtractor()
-                    tables = extractor.extract_tables(tmp_path)
+                    tables = run_cached("tables", pdf_path)
                 
                 st.success(f"✅ Found {len(tables)} high-quality tables!")
                 
-                for i, table in enumerate(tables):
+                for i, extracted_table in enumerate(tables):
+                    table = extracted_table.dataframe
                     st.subheader(f"📋 Table {i+1}")
                     st.dataframe(table)
                     
@@ -256,8 +242,6 @@ if __name__ == "__main__":
                 
             except Exception as e:
                 st.error(f"❌ Table analysis failed: {str(e)}")
-            finally:
-                Path(tmp_path).unlink(missing_ok=True)
 
     def show_dialux_analysis_page():
         """Dialux analysis page"""
@@ -295,24 +279,18 @@ if __name__ == "__main__":
         )
         
         if uploaded_file is not None:
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                shutil.copyfileobj(uploaded_file, tmp_file)
-                tmp_path = tmp_file.name
-            
             try:
+                # Analyses run in background workers; the page polls the job's progress
                 if "Fast" in analysis_method:
-                    with st.spinner("⚡ Fast analysis in progress..."):
-                        analyzer = FastDialuxAnalyzer(api_key)
-                        result = analyzer.analyze_dialux_report(tmp_path)
+                    job_id = submit_upload("fast", uploaded_file, api_key=api_key)
                 elif "Enhanced" in analysis_method:
-                    with st.spinner("🤖 Enhanced analysis with OpenAI..."):
-                        from analyzers.enhanced_dialux_analyzer import EnhancedDialuxAnalyzer
-                        analyzer = EnhancedDialuxAnalyzer(api_key)
-                        result = analyzer.analyze_dialux_report(tmp_path)
+                    job_id = submit_upload("enhanced", uploaded_file, api_key=api_key)
                 else:
-                    with st.spinner("🔍 Standard analysis in progress..."):
-                        analyzer = DialuxAnalyzer()
-                        result = analyzer.analyze_dialux_report(tmp_path)
+                    job_id = submit_upload("standard", uploaded_file)
+                
+                result = wait_for_job(job_id)
+                if result is None:
+                    return
                 
                 # Show processing time
                 if hasattr(result, 'processing_time'):
@@ -538,15 +516,13 @@ if __name__ == "__main__":
                 
             except Exception as e:
                 st.error(f"❌ Dialux analysis failed: {str(e)}")
-            finally:
-                Path(tmp_path).unlink(missing_ok=True)
 
     def show_standards_page():
         """Standards information page"""
         st.header("📋 Lighting Standards")
         
         try:
-            processor = StandardsProcessor()
+            processor = get_component("standards_processor")
             standards = processor.get_available_standards()
             
             st.subheader("Available Standards")
@@ -575,6 +551,18 @@ if __name__ == "__main__":
         st.subheader("Configuration")
         st.info("Current configuration settings are loaded from the system defaults.")
         
+        # Analyzers are shared across sessions and rebuilt automatically when settings change
+        if st.button("🔄 Reload Analyzers"):
+            from web.resources import clear_caches
+            clear_caches()
+            st.success("✅ Analyzers and cached results cleared")
+        
+        st.subheader("Session Storage")
+        show_session_footprint()
+        if st.button("🧹 Clear Session Files"):
+            get_session_store().clear()
+            st.success("✅ Session uploads and results removed")
+        
         st.subheader("About")
         st.write("""
         **Unified Lighting Analyzer v1.0**